@@ -0,0 +1,62 @@
+# benchmarks/certificates.py
+# Usage (from the app directory):
+#   python -m Benchmarks.certificates [--count N] [--format png|pdf] [--target PER_SECOND]
+#
+# Renders --count certificates in this process (one core) the way a bulk issue after an
+# event does: one event and date, a different recipient, handle and ID on each. Exits
+# non-zero when the rate is below --target.
+import argparse
+import sys
+import time
+
+from Utils.certificate_renderer import get_certificate_renderer
+
+_FIRST_NAMES = ["Ada", "Grace", "Edsger", "Barbara", "Donald", "Frances", "Tony", "Radia", "Ken", "Margaret"]
+_LAST_NAMES = ["Lovelace", "Hopper", "Dijkstra", "Liskov", "Knuth", "Allen", "Hoare", "Perlman", "Thompson", "Hamilton"]
+
+
+def _values(index: int) -> dict:
+    first = _FIRST_NAMES[index % len(_FIRST_NAMES)]
+    last = _LAST_NAMES[(index // len(_FIRST_NAMES)) % len(_LAST_NAMES)]
+    return {
+        "recipient": f"{first} {last} {index}",
+        "handle": f"{first.lower()}-{last.lower()}-{index}",
+        "event": "Dijkstra Winter Hackathon 2026",
+        "description": "Dijkstra rank: Gold",
+        "issued_on": "16 October 2026",
+        "certificate_id": f"DJK-{index:016X}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.certificates")
+    parser.add_argument("--count", type=int, default=2_000, help="Certificates to render")
+    parser.add_argument("--format", choices=("png", "pdf"), default="pdf")
+    parser.add_argument("--target", type=float, default=300, help="Minimum certificates per second")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    renderer = get_certificate_renderer()
+    compiled = time.perf_counter() - started
+    render = renderer.render_png if args.format == "png" else renderer.render_pdf
+
+    values = [_values(index) for index in range(args.count)]
+    total_bytes = 0
+    started = time.perf_counter()
+    for certificate in values:
+        total_bytes += len(render(certificate))
+    elapsed = time.perf_counter() - started
+
+    rate = args.count / elapsed
+    print(f"template compiled in {compiled * 1000:.0f} ms: {renderer.snapshot()}")
+    print(
+        f"{args.count} {args.format} certificates in {elapsed:.2f}s: {rate:.0f}/s, "
+        f"{elapsed / args.count * 1000:.2f} ms and {total_bytes // args.count} bytes each"
+    )
+    if rate < args.target:
+        print(f"below the target of {args.target:.0f}/s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# benchmarks/serialization.py
+# Usage (from the app directory):
+#   python -m Benchmarks.serialization [--rows N] [--repeat N] [--target SPEEDUP]
+#
+# Encodes a page of --rows ORM rows, users and jobs, the three ways a list route can:
+#   stdlib   FastAPI validating against response_model and json.dumps, as routes did before
+#   orjson   the same validation, encoded by the app's default ORJSONResponse
+#   adapter  Utils.serialization.model_response: one cached TypeAdapter validation and
+#            pydantic-core JSON, as list routes do now
+# Checks that all three encode the same document, prints the best time per 1,000 rows of
+# each and exits non-zero when the adapter path is less than --target times faster than
+# stdlib.
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from Entities.OpportunityDTOs.jobs_entity import ReadJob
+from Entities.page_entity import Page
+from Entities.UserDTOs.user_entity import ReadUser
+from Schema.SQL.Enums.enums import Currency, EmploymentType, Tools, WorkLocationType
+from Schema.SQL.Models.models import Job, Rank, User
+from Utils.serialization import model_response
+
+_STARTED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _users(rows: int) -> List[User]:
+    ranks = list(Rank)
+    return [
+        User(
+            github_user_name=f"user-{index:06d}",
+            first_name="Ada",
+            middle_name="King" if index % 2 else None,
+            last_name=f"Lovelace {index}",
+            rank=ranks[index % len(ranks)],
+            streak=index % 365,
+            created_at=_STARTED + timedelta(minutes=index),
+            updated_at=_STARTED + timedelta(minutes=index, seconds=30),
+        )
+        for index in range(rows)
+    ]
+
+
+def _jobs(rows: int) -> List[Job]:
+    tools = list(Tools)
+    return [
+        Job(
+            title=f"Backend Engineer {index}",
+            department="Platform",
+            company_name="Dijkstra",
+            location="Remote",
+            location_type=list(WorkLocationType)[0],
+            employment_type=list(EmploymentType)[0],
+            experience_level="Mid",
+            experience_yoe=3.5,
+            posted_date=date(2026, 1, 1) + timedelta(days=index % 300),
+            salary_annual_min=90_000,
+            salary_annual_max=140_000,
+            salary_currency=list(Currency)[0],
+            description="Build and run the services behind the Dijkstra platform. " * 4,
+            featured=index % 7 == 0,
+            category="Engineering",
+            perks=["Remote", "Learning budget", "Health cover"],
+            technologies=[tools[index % len(tools)], tools[(index + 3) % len(tools)]],
+            organization=uuid.UUID(int=index % 50),
+            created_at=_STARTED + timedelta(minutes=index),
+            updated_at=_STARTED + timedelta(minutes=index, seconds=30),
+        )
+        for index in range(rows)
+    ]
+
+
+def _fastapi(response_type: Any, response_class: type) -> Callable[[Dict[str, Any]], bytes]:
+    field = create_model_field("Response", response_type, mode="serialization")
+
+    def encode(page: Dict[str, Any]) -> bytes:
+        content = asyncio.run(serialize_response(field=field, response_content=page))
+        return response_class(content).body
+
+    return encode
+
+
+def _best(encode: Callable[[Dict[str, Any]], bytes], page: Dict[str, Any], repeat: int) -> float:
+    encode(page)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.serialization")
+    parser.add_argument("--rows", type=int, default=1_000, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per path; the best is kept")
+    parser.add_argument("--target", type=float, default=1.5, help="Minimum speedup of adapter over stdlib")
+    args = parser.parse_args()
+
+    slowest = float("inf")
+    for name, response_type, rows in (
+        ("users", Page[ReadUser], _users(args.rows)),
+        ("jobs", Page[ReadJob], _jobs(args.rows)),
+    ):
+        page = {"items": rows, "next_cursor": "cursor"}
+        paths = {
+            "stdlib": _fastapi(response_type, JSONResponse),
+            "orjson": _fastapi(response_type, ORJSONResponse),
+            "adapter": lambda content, response_type=response_type: model_response(response_type, content).body,
+        }
+        bodies = {path: encode(page) for path, encode in paths.items()}
+        expected = json.loads(bodies["stdlib"])
+        for path, body in bodies.items():
+            if json.loads(body) != expected:
+                print(f"{name}: {path} encodes a different document than stdlib")
+                sys.exit(1)
+        times = {path: _best(encode, page, args.repeat) * 1_000 / args.rows * 1_000 for path, encode in paths.items()}
+        speedup = times["stdlib"] / times["adapter"]
+        slowest = min(slowest, speedup)
+        print(
+            f"{name}: ms per 1,000 rows: "
+            + ", ".join(f"{path} {elapsed:.2f}" for path, elapsed in times.items())
+            + f"; adapter is {speedup:.1f}x stdlib, {len(bodies['adapter']) // args.rows} bytes per row"
+        )
+    if slowest < args.target:
+        print(f"below the target speedup of {args.target:.1f}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
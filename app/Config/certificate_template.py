@@ -0,0 +1,39 @@
+# Certificate layout, compiled once by Utils.certificate_renderer
+#
+# Coordinates are pixels on the canvas, boxes are (left, top, right, bottom).
+# "static" is drawn into the background when the template is compiled; static text
+# may use {issuer}. "fields" are filled in per certificate: each value is centered
+# (or aligned) in its box, stepping the font down to min_size and then truncating
+# until it fits. Per-field rows are the only rows encoded on each render, so fields
+# are kept in a few narrow horizontal bands.
+
+CERTIFICATE_TEMPLATE = {
+    "name": "achievement",
+    # A4 landscape at 96 dpi; the PDF page is sized from the dpi
+    "size": (1123, 794),
+    "dpi": 96,
+    "background": "#fffdf6",
+    "static": [
+        {"type": "rect", "box": (24, 24, 1099, 770), "outline": "#1f3a5f", "width": 6},
+        {"type": "rect", "box": (38, 38, 1085, 756), "outline": "#c9a227", "width": 2},
+        {"type": "text", "text": "CERTIFICATE", "at": (561, 128), "size": 64, "bold": True, "color": "#1f3a5f"},
+        {"type": "text", "text": "OF ACHIEVEMENT", "at": (561, 188), "size": 24, "color": "#c9a227"},
+        {"type": "text", "text": "This certificate is proudly presented to", "at": (561, 256), "size": 22, "color": "#5b6470"},
+        {"type": "line", "points": (211, 384, 912, 384), "color": "#c9a227", "width": 2},
+        {"type": "text", "text": "for", "at": (561, 458), "size": 22, "color": "#5b6470"},
+        {"type": "line", "points": (150, 690, 420, 690), "color": "#1f3a5f", "width": 1},
+        {"type": "text", "text": "Date of Issue", "at": (285, 708), "size": 16, "color": "#5b6470"},
+        {"type": "text", "text": "{issuer}", "at": (838, 664), "size": 26, "bold": True, "color": "#1f3a5f"},
+        {"type": "line", "points": (703, 690, 973, 690), "color": "#1f3a5f", "width": 1},
+        {"type": "text", "text": "Issued by", "at": (838, 708), "size": 16, "color": "#5b6470"},
+    ],
+    "fields": [
+        {"name": "recipient", "box": (111, 286, 1012, 376), "size": 60, "min_size": 28, "bold": True, "color": "#1f3a5f"},
+        {"name": "handle", "box": (311, 392, 812, 428), "size": 22, "min_size": 16, "color": "#5b6470", "format": "@{}"},
+        {"name": "event", "box": (111, 480, 1012, 540), "size": 38, "min_size": 20, "bold": True, "color": "#22272e"},
+        {"name": "description", "box": (161, 548, 962, 590), "size": 20, "min_size": 14, "color": "#5b6470"},
+        {"name": "issued_on", "box": (150, 642, 420, 686), "size": 22, "min_size": 16, "color": "#22272e"},
+        {"name": "certificate_id", "box": (311, 728, 812, 752), "size": 14, "min_size": 12, "color": "#8a919a",
+         "format": "Certificate ID {}"},
+    ],
+}
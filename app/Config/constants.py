@@ -1,6 +1,20 @@
 # Controller Constants
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+STICKY_PRIMARY_COOKIE = "dijkstra_primary_until"
+# Upper bound on records accepted by one bulk create request
+BULK_CREATE_MAX_ROWS = 10_000
+# Upper bound on usernames accepted by one LeetCode batch request
+LEETCODE_BATCH_MAX_USERS = 10_000
+# Upper bound on usernames accepted by one GitHub statistics sync request
+GITHUB_SYNC_MAX_USERS = 1_000
+# Points returned by a contest history range query by default, and at most
+CONTEST_HISTORY_DEFAULT_POINTS = 500
+CONTEST_HISTORY_MAX_POINTS = 2_000
+# Upper bound on usernames accepted by one bulk certificate request
+CERTIFICATE_BULK_MAX_USERS = 10_000
 
 
 # Service Constants
 LEETCODE_API = "https://leetcode.com/graphql"
-GITHUB_API = "https://api.github.com"
\ No newline at end of file
+GITHUB_API = "https://api.github.com"
+GITHUB_GRAPHQL_API = "https://api.github.com/graphql"
\ No newline at end of file
@@ -76,4 +76,67 @@ lc_query = """
 
 
 
-# GitHub GraphQL Query
\ No newline at end of file
+# GitHub GraphQL Query
+# Statistics for one user. GitHubService batches many users into one request by
+# selecting this fragment under aliases (u0: user(login: $u0) { ...GitHubUserStats }).
+# contributionsCollection covers the last year.
+gh_user_stats_fragment = """
+        fragment GitHubUserStats on User {
+            login
+            name
+            bio
+            company
+            location
+            avatarUrl
+            websiteUrl
+            url
+            followers { totalCount }
+            following { totalCount }
+            organizations(first: 50) { nodes { login } }
+            pullRequests { totalCount }
+            issues { totalCount }
+            repositoriesContributedTo(first: 1, includeUserRepositories: false) { totalCount }
+            contributionsCollection {
+                totalCommitContributions
+                totalPullRequestContributions
+                totalIssueContributions
+                contributionCalendar { totalContributions }
+                commitContributionsByRepository(maxRepositories: 100) {
+                    repository { name owner { login } }
+                    contributions { totalCount }
+                }
+                pullRequestContributionsByRepository(maxRepositories: 100) {
+                    repository { name owner { login } }
+                    contributions { totalCount }
+                }
+                issueContributionsByRepository(maxRepositories: 100) {
+                    repository { name owner { login } }
+                    contributions { totalCount }
+                }
+            }
+            repositories(first: $repoPageSize, ownerAffiliations: OWNER, isFork: false, orderBy: {field: PUSHED_AT, direction: DESC}) {
+                ...GitHubRepositoryPage
+            }
+        }
+        """
+
+# One page of a user's own repositories; later pages are fetched with `after: $cN`
+gh_repository_page_fragment = """
+        fragment GitHubRepositoryPage on RepositoryConnection {
+            totalCount
+            pageInfo { hasNextPage endCursor }
+            nodes {
+                name
+                description
+                isPrivate
+                stargazerCount
+                forkCount
+                homepageUrl
+                openIssues: issues(states: OPEN) { totalCount }
+                licenseInfo { key }
+                readme: object(expression: "HEAD:README.md") { id }
+                repositoryTopics(first: 20) { nodes { topic { name } } }
+                languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+            }
+        }
+        """
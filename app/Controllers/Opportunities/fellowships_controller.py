@@ -1,13 +1,18 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 import logging
 
 from Entities.OpportunityDTOs.fellowships_entity import CreateFellowship, UpdateFellowship, ReadFellowship
-from Services.Opportunities.fellowships_service import FellowshipService
-from db import get_session
+from Entities.bulk_entity import BulkCreateResult
+from Entities.page_entity import Page
+from Config.constants import BULK_CREATE_MAX_ROWS
+from Services.Opportunities.fellowships_service import AsyncFellowshipService, FellowshipService
+from db import get_async_session, get_session
 from Settings.logging_config import setup_logging
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -23,6 +28,18 @@ def create_fellowship(fellowship_create: CreateFellowship, session: Session = De
     return fellowship
 
 
+@router.post("/bulk", response_model=BulkCreateResult)
+def bulk_create_fellowships(
+    fellowships_create: List[CreateFellowship] = Body(..., max_length=BULK_CREATE_MAX_ROWS),
+    session: Session = Depends(get_session),
+):
+    service = FellowshipService(session)
+    logger.info(f"Bulk creating Fellowships: {len(fellowships_create)} records")
+    result = service.bulk_create_fellowships(fellowships_create)
+    logger.info(f"Bulk created {result.created} fellowships, rejected {len(result.errors)}")
+    return result
+
+
 @router.get("/{fellowship_id}", response_model=ReadFellowship)
 def get_fellowship(fellowship_id: UUID, session: Session = Depends(get_session)):
     service = FellowshipService(session)
@@ -31,9 +48,10 @@ def get_fellowship(fellowship_id: UUID, session: Session = Depends(get_session))
     return fellowship
 
 
-@router.get("/", response_model=List[ReadFellowship])
+@router.get("/", response_model=Page[ReadFellowship])
 def list_fellowships(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = "created_at",
     order: str = "desc",
@@ -41,13 +59,14 @@ def list_fellowships(
     organization: Optional[UUID] = None,
     location: Optional[str] = None,
     featured: Optional[bool] = None,
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
     session: Session = Depends(get_session),
 ):
     service = FellowshipService(session)
     logger.info(f"Listing Fellowships: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}")
-    fellowships = service.list_fellowships(skip, limit, sort_by, order, title, organization, location, featured)
+    fellowships, next_cursor = service.list_fellowships(skip, limit, sort_by, order, title, organization, location, featured, cursor=cursor, use_cache=use_cache)
     logger.info(f"Returned {len(fellowships)} Fellowships")
-    return fellowships
+    return model_response(Page[ReadFellowship], {"items": fellowships, "next_cursor": next_cursor})
 
 
 @router.put("/{fellowship_id}", response_model=ReadFellowship)
@@ -74,4 +93,85 @@ def autocomplete_fellowships(query: str, field: str = "title", limit: int = 10,
     logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
     results = service.autocomplete_fellowships(query, field, limit)
     logger.info(f"Autocomplete returned {len(results)} results")
-    return results
+    return model_response(List[ReadFellowship], results)
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/fellowships", tags=["Fellowships"])
+
+
+@async_router.post("/", response_model=ReadFellowship)
+async def create_fellowship_async(fellowship_create: CreateFellowship, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Creating Fellowship: {fellowship_create.title}")
+    fellowship = await service.create_fellowship(fellowship_create)
+    logger.info(f"Fellowship created with ID: {fellowship.id}")
+    return fellowship
+
+
+@async_router.post("/bulk", response_model=BulkCreateResult)
+async def bulk_create_fellowships_async(
+    fellowships_create: List[CreateFellowship] = Body(..., max_length=BULK_CREATE_MAX_ROWS),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Bulk creating Fellowships: {len(fellowships_create)} records")
+    result = await service.bulk_create_fellowships(fellowships_create)
+    logger.info(f"Bulk created {result.created} fellowships, rejected {len(result.errors)}")
+    return result
+
+
+@async_router.get("/{fellowship_id}", response_model=ReadFellowship)
+async def get_fellowship_async(fellowship_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Fetching Fellowship with ID: {fellowship_id}")
+    return await service.get_fellowship(fellowship_id)
+
+
+@async_router.get("/", response_model=Page[ReadFellowship])
+async def list_fellowships_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = "created_at",
+    order: str = "desc",
+    title: Optional[str] = None,
+    organization: Optional[UUID] = None,
+    location: Optional[str] = None,
+    featured: Optional[bool] = None,
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Listing Fellowships: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}")
+    fellowships, next_cursor = await service.list_fellowships(skip, limit, sort_by, order, title, organization, location, featured, cursor=cursor, use_cache=use_cache)
+    logger.info(f"Returned {len(fellowships)} Fellowships")
+    return model_response(Page[ReadFellowship], {"items": fellowships, "next_cursor": next_cursor})
+
+
+@async_router.put("/{fellowship_id}", response_model=ReadFellowship)
+async def update_fellowship_async(fellowship_id: UUID, fellowship_update: UpdateFellowship, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Updating Fellowship ID: {fellowship_id} with data: {fellowship_update.dict(exclude_unset=True)}")
+    fellowship = await service.update_fellowship(fellowship_id, fellowship_update)
+    logger.info(f"Fellowship updated: {fellowship.id}")
+    return fellowship
+
+
+@async_router.delete("/{fellowship_id}", response_model=ReadFellowship)
+async def delete_fellowship_async(fellowship_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Deleting Fellowship ID: {fellowship_id}")
+    message = await service.delete_fellowship(fellowship_id)
+    logger.info(message)
+    return {"detail": message}
+
+
+@async_router.get("/autocomplete/", response_model=List[ReadFellowship])
+async def autocomplete_fellowships_async(query: str, field: str = "title", limit: int = 10, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncFellowshipService(session)
+    logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
+    results = await service.autocomplete_fellowships(query, field, limit)
+    logger.info(f"Autocomplete returned {len(results)} results")
+    return model_response(List[ReadFellowship], results)
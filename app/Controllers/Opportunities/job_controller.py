@@ -1,11 +1,16 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Entities.OpportunityDTOs.jobs_entity import CreateJob, UpdateJob, ReadJob
-from Services.Opportunities.jobs_service import JobService
+from Entities.bulk_entity import BulkCreateResult
+from Entities.page_entity import Page
+from Config.constants import BULK_CREATE_MAX_ROWS
+from Services.Opportunities.jobs_service import AsyncJobService, JobService
 from Settings.logging_config import setup_logging
-from db import get_session
+from db import get_async_session, get_session
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -21,6 +26,18 @@ def create_job(job_create: CreateJob, session: Session = Depends(get_session)):
     return job
 
 
+@router.post("/bulk", response_model=BulkCreateResult)
+def bulk_create_jobs(
+    jobs_create: List[CreateJob] = Body(..., max_length=BULK_CREATE_MAX_ROWS),
+    session: Session = Depends(get_session),
+):
+    service = JobService(session)
+    logger.info(f"Bulk creating Jobs: {len(jobs_create)} records")
+    result = service.bulk_create_jobs(jobs_create)
+    logger.info(f"Bulk created {result.created} jobs, rejected {len(result.errors)}")
+    return result
+
+
 @router.get("/{job_id}", response_model=ReadJob)
 def get_job(job_id: UUID, session: Session = Depends(get_session)):
     service = JobService(session)
@@ -28,9 +45,10 @@ def get_job(job_id: UUID, session: Session = Depends(get_session)):
     return service.get_job(job_id)
 
 
-@router.get("/", response_model=List[ReadJob])
+@router.get("/", response_model=Page[ReadJob])
 def list_jobs(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = Query("created_at", description="Field to sort by"),
     order: str = Query("desc", description="asc or desc"),
@@ -40,6 +58,7 @@ def list_jobs(
     location_type: Optional[str] = None,
     employment_type: Optional[str] = None,
     category: Optional[str] = None,
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
     session: Session = Depends(get_session),
 ):
     service = JobService(session)
@@ -48,7 +67,7 @@ def list_jobs(
         f"title={title}, organization={organization}, location={location}, "
         f"location_type={location_type}, employment_type={employment_type}, category={category}"
     )
-    jobs = service.list_jobs(
+    jobs, next_cursor = service.list_jobs(
         skip,
         limit,
         sort_by,
@@ -59,9 +78,11 @@ def list_jobs(
         location_type,
         employment_type,
         category,
+        cursor=cursor,
+        use_cache=use_cache,
     )
     logger.info(f"Returned {len(jobs)} jobs")
-    return jobs
+    return model_response(Page[ReadJob], {"items": jobs, "next_cursor": next_cursor})
 
 
 @router.get("/autocomplete/", response_model=List[ReadJob])
@@ -73,7 +94,7 @@ def autocomplete_jobs(
 ):
     service = JobService(session)
     logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
-    return service.autocomplete_jobs(query, field, limit)
+    return model_response(List[ReadJob], service.autocomplete_jobs(query, field, limit))
 
 
 @router.put("/{job_id}", response_model=ReadJob)
@@ -90,3 +111,104 @@ def delete_job(job_id: UUID, session: Session = Depends(get_session)):
     message = service.delete_job(job_id)
     logger.info(message)
     return {"detail": message}
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/jobs", tags=["Jobs"])
+
+
+@async_router.post("/", response_model=ReadJob)
+async def create_job_async(job_create: CreateJob, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncJobService(session)
+    logger.info(f"Creating Job: {job_create.title}")
+    job = await service.create_job(job_create)
+    logger.info(f"Created Job with ID: {job.id}")
+    return job
+
+
+@async_router.post("/bulk", response_model=BulkCreateResult)
+async def bulk_create_jobs_async(
+    jobs_create: List[CreateJob] = Body(..., max_length=BULK_CREATE_MAX_ROWS),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncJobService(session)
+    logger.info(f"Bulk creating Jobs: {len(jobs_create)} records")
+    result = await service.bulk_create_jobs(jobs_create)
+    logger.info(f"Bulk created {result.created} jobs, rejected {len(result.errors)}")
+    return result
+
+
+@async_router.get("/{job_id}", response_model=ReadJob)
+async def get_job_async(job_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncJobService(session)
+    logger.info(f"Fetching Job with ID: {job_id}")
+    return await service.get_job(job_id)
+
+
+@async_router.get("/", response_model=Page[ReadJob])
+async def list_jobs_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    title: Optional[str] = None,
+    organization: Optional[UUID] = None,
+    location: Optional[str] = None,
+    location_type: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    category: Optional[str] = None,
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncJobService(session)
+    logger.info(
+        f"Listing Jobs: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
+        f"title={title}, organization={organization}, location={location}, "
+        f"location_type={location_type}, employment_type={employment_type}, category={category}"
+    )
+    jobs, next_cursor = await service.list_jobs(
+        skip,
+        limit,
+        sort_by,
+        order,
+        title,
+        organization,
+        location,
+        location_type,
+        employment_type,
+        category,
+        cursor=cursor,
+        use_cache=use_cache,
+    )
+    logger.info(f"Returned {len(jobs)} jobs")
+    return model_response(Page[ReadJob], {"items": jobs, "next_cursor": next_cursor})
+
+
+@async_router.get("/autocomplete/", response_model=List[ReadJob])
+async def autocomplete_jobs_async(
+    query: str,
+    field: str = Query("title", description="Field to search against"),
+    limit: int = 10,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncJobService(session)
+    logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
+    return model_response(List[ReadJob], await service.autocomplete_jobs(query, field, limit))
+
+
+@async_router.put("/{job_id}", response_model=ReadJob)
+async def update_job_async(job_id: UUID, job_update: UpdateJob, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncJobService(session)
+    logger.info(f"Updating Job ID: {job_id} with data: {job_update.dict(exclude_unset=True)}")
+    return await service.update_job(job_id, job_update)
+
+
+@async_router.delete("/{job_id}", response_model=ReadJob)
+async def delete_job_async(job_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncJobService(session)
+    logger.info(f"Deleting Job ID: {job_id}")
+    message = await service.delete_job(job_id)
+    logger.info(message)
+    return {"detail": message}
@@ -1,12 +1,15 @@
 # controllers/organizations_controller.py
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Entities.OpportunityDTOs.organization_entity import CreateOrganization, UpdateOrganization, ReadOrganization
-from Services.Opportunities.organization_service import OrganizationService
+from Entities.page_entity import Page
+from Services.Opportunities.organization_service import AsyncOrganizationService, OrganizationService
 from Settings.logging_config import setup_logging
-from db import get_session
+from db import get_async_session, get_session
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -26,13 +29,21 @@ def get_organization(org_id: UUID, session: Session = Depends(get_session)):
     logger.info(f"Fetching organization with ID: {org_id}")
     return service.get_organization(org_id)
 
-@router.get("/", response_model=List[ReadOrganization])
-def list_organizations(skip: int = 0, limit: int = 20, session: Session = Depends(get_session)):
+@router.get("/", response_model=Page[ReadOrganization])
+def list_organizations(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
+    session: Session = Depends(get_session),
+):
     service = OrganizationService(session)
-    logger.info(f"Listing organizations: skip={skip}, limit={limit}")
-    orgs = service.list_organizations(skip=skip, limit=limit)
+    logger.info(f"Listing organizations: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}")
+    orgs, next_cursor = service.list_organizations(skip=skip, limit=limit, sort_by=sort_by, order=order, cursor=cursor, use_cache=use_cache)
     logger.info(f"Returned {len(orgs)} organizations")
-    return orgs
+    return model_response(Page[ReadOrganization], {"items": orgs, "next_cursor": next_cursor})
 
 @router.put("/{org_id}", response_model=ReadOrganization)
 def update_organization(org_id: UUID, org_update: UpdateOrganization, session: Session = Depends(get_session)):
@@ -49,3 +60,54 @@ def delete_organization(org_id: UUID, session: Session = Depends(get_session)):
     message = service.delete_organization(org_id)
     logger.info(message)
     return {"detail": message}
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/organizations", tags=["Organizations"])
+
+@async_router.post("/", response_model=ReadOrganization)
+async def create_organization_async(org_create: CreateOrganization, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncOrganizationService(session)
+    logger.info(f"Creating organization: {org_create.name}")
+    org = await service.create_organization(org_create)
+    logger.info(f"Created organization with ID: {org.id}")
+    return org
+
+@async_router.get("/{org_id}", response_model=ReadOrganization)
+async def get_organization_async(org_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncOrganizationService(session)
+    logger.info(f"Fetching organization with ID: {org_id}")
+    return await service.get_organization(org_id)
+
+@async_router.get("/", response_model=Page[ReadOrganization])
+async def list_organizations_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncOrganizationService(session)
+    logger.info(f"Listing organizations: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}")
+    orgs, next_cursor = await service.list_organizations(skip=skip, limit=limit, sort_by=sort_by, order=order, cursor=cursor, use_cache=use_cache)
+    logger.info(f"Returned {len(orgs)} organizations")
+    return model_response(Page[ReadOrganization], {"items": orgs, "next_cursor": next_cursor})
+
+@async_router.put("/{org_id}", response_model=ReadOrganization)
+async def update_organization_async(org_id: UUID, org_update: UpdateOrganization, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncOrganizationService(session)
+    logger.info(f"Updating organization ID: {org_id} with data: {org_update.dict(exclude_unset=True)}")
+    org = await service.update_organization(org_id, org_update)
+    logger.info(f"Updated organization ID: {org.id}")
+    return org
+
+@async_router.delete("/{org_id}", response_model=ReadOrganization)
+async def delete_organization_async(org_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncOrganizationService(session)
+    logger.info(f"Deleting organization ID: {org_id}")
+    message = await service.delete_organization(org_id)
+    logger.info(message)
+    return {"detail": message}
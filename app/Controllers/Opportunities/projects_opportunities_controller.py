@@ -1,12 +1,17 @@
 # controllers/projects_opportunities_controller.py
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Entities.OpportunityDTOs.projects_opportunities_entity import CreateProject, UpdateProject, ReadProject
-from Services.Opportunities.projects_opportunities_service import ProjectsOpportunitiesService
+from Entities.bulk_entity import BulkCreateResult
+from Entities.page_entity import Page
+from Config.constants import BULK_CREATE_MAX_ROWS
+from Services.Opportunities.projects_opportunities_service import AsyncProjectsOpportunitiesService, ProjectsOpportunitiesService
 from Settings.logging_config import setup_logging
-from db import get_session
+from db import get_async_session, get_session
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -19,15 +24,28 @@ def create_project(project_create: CreateProject, session: Session = Depends(get
     logger.info(f"Created project {project.id}")
     return project
 
+@router.post("/bulk", response_model=BulkCreateResult)
+def bulk_create_projects(
+    projects_create: List[CreateProject] = Body(..., max_length=BULK_CREATE_MAX_ROWS),
+    session: Session = Depends(get_session),
+):
+    service = ProjectsOpportunitiesService(session)
+    logger.info(f"Bulk creating Projects: {len(projects_create)} records")
+    result = service.bulk_create_projects(projects_create)
+    logger.info(f"Bulk created {result.created} projects, rejected {len(result.errors)}")
+    return result
+
+
 @router.get("/{project_id}", response_model=ReadProject)
 def get_project(project_id: UUID, session: Session = Depends(get_session)):
     service = ProjectsOpportunitiesService(session)
     project = service.get_project(project_id)
     return project
 
-@router.get("/", response_model=List[ReadProject])
+@router.get("/", response_model=Page[ReadProject])
 def list_projects(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = Query("created_at"),
     order: str = Query("desc"),
@@ -35,6 +53,7 @@ def list_projects(
     organization: Optional[UUID] = None,
     project_level: Optional[str] = None,
     difficulty: Optional[str] = None,
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
     session: Session = Depends(get_session)
 ):
     service = ProjectsOpportunitiesService(session)
@@ -44,7 +63,8 @@ def list_projects(
         "project_level": project_level,
         "difficulty": difficulty
     }
-    return service.list_projects(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order)
+    items, next_cursor = service.list_projects(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order, cursor=cursor, use_cache=use_cache)
+    return model_response(Page[ReadProject], {"items": items, "next_cursor": next_cursor})
 
 @router.get("/autocomplete/", response_model=List[ReadProject])
 def autocomplete_projects(
@@ -54,7 +74,7 @@ def autocomplete_projects(
     session: Session = Depends(get_session)
 ):
     service = ProjectsOpportunitiesService(session)
-    return service.autocomplete_projects(query, field, limit)
+    return model_response(List[ReadProject], service.autocomplete_projects(query, field, limit))
 
 @router.put("/{project_id}", response_model=ReadProject)
 def update_project(project_id: UUID, project_update: UpdateProject, session: Session = Depends(get_session)):
@@ -68,3 +88,78 @@ def delete_project(project_id: UUID, session: Session = Depends(get_session)):
     message = service.delete_project(project_id)
     logger.info(message)
     return {"detail": message}
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/projects/opportunities", tags=["ProjectsOpportunities"])
+
+@async_router.post("/", response_model=ReadProject)
+async def create_project_async(project_create: CreateProject, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProjectsOpportunitiesService(session)
+    project = await service.create_project(project_create)
+    logger.info(f"Created project {project.id}")
+    return project
+
+@async_router.post("/bulk", response_model=BulkCreateResult)
+async def bulk_create_projects_async(
+    projects_create: List[CreateProject] = Body(..., max_length=BULK_CREATE_MAX_ROWS),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncProjectsOpportunitiesService(session)
+    logger.info(f"Bulk creating Projects: {len(projects_create)} records")
+    result = await service.bulk_create_projects(projects_create)
+    logger.info(f"Bulk created {result.created} projects, rejected {len(result.errors)}")
+    return result
+
+
+@async_router.get("/{project_id}", response_model=ReadProject)
+async def get_project_async(project_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProjectsOpportunitiesService(session)
+    return await service.get_project(project_id)
+
+@async_router.get("/", response_model=Page[ReadProject])
+async def list_projects_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at"),
+    order: str = Query("desc"),
+    title: Optional[str] = None,
+    organization: Optional[UUID] = None,
+    project_level: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
+    session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncProjectsOpportunitiesService(session)
+    filters = {
+        "title": title,
+        "organization": organization,
+        "project_level": project_level,
+        "difficulty": difficulty
+    }
+    items, next_cursor = await service.list_projects(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order, cursor=cursor, use_cache=use_cache)
+    return model_response(Page[ReadProject], {"items": items, "next_cursor": next_cursor})
+
+@async_router.get("/autocomplete/", response_model=List[ReadProject])
+async def autocomplete_projects_async(
+    query: str,
+    field: str = Query("title"),
+    limit: int = 10,
+    session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncProjectsOpportunitiesService(session)
+    return model_response(List[ReadProject], await service.autocomplete_projects(query, field, limit))
+
+@async_router.put("/{project_id}", response_model=ReadProject)
+async def update_project_async(project_id: UUID, project_update: UpdateProject, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProjectsOpportunitiesService(session)
+    return await service.update_project(project_id, project_update)
+
+@async_router.delete("/{project_id}", response_model=ReadProject)
+async def delete_project_async(project_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProjectsOpportunitiesService(session)
+    message = await service.delete_project(project_id)
+    logger.info(message)
+    return {"detail": message}
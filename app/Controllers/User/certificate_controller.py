@@ -1,18 +1,164 @@
-from fastapi import APIRouter
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Entities.UserDTOs.certificate_entity import BulkCertificateRequest, CertificateRequest, ReadCertificateJob
 from Settings.logging_config import setup_logging
-from Services.User.certificate_service import CertificateGeneratorService
+from Services.User.certificate_job_service import certificate_jobs
+from Services.User.certificate_service import (
+    ZIP_MEDIA_TYPE, AsyncCertificateGeneratorService, BulkCertificateService, CertificateFile,
+    CertificateGeneratorService,
+)
+from db import get_async_session, get_session
 
 # Initialize logging
 logger = setup_logging()
 
 router = APIRouter(prefix="/Dijkstra/v1/certificate", tags=["Certificate"])
 
+
+def _download(certificate: CertificateFile) -> Response:
+    # Clients may keep the certificate but must revalidate it, which costs a 304 when unchanged
+    headers = {"ETag": certificate.etag, "Cache-Control": "private, no-cache"}
+    if certificate.not_modified:
+        return Response(status_code=304, headers=headers)
+    if certificate.path is not None:
+        # Sent from the store with sendfile where the server supports it
+        return FileResponse(certificate.path, media_type=certificate.media_type, filename=certificate.filename, headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{certificate.filename}"'
+    return Response(certificate.content, media_type=certificate.media_type, headers=headers)
+
+
+async def _job_events(job_id: str) -> StreamingResponse:
+    # Server-sent events: one per change in the job's progress, named after its status
+    updates = certificate_jobs.watch(job_id)
+    first = await anext(updates)  # CertificateJobNotFound is still a 404 here
+
+    async def events():
+        job = first
+        while job is not None:
+            yield f"event: {job['status']}\ndata: {ReadCertificateJob.model_validate(job).model_dump_json()}\n\n"
+            job = await anext(updates, None)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+async def _bulk_download(request: BulkCertificateRequest) -> StreamingResponse:
+    # No request session: the cohort is read page by page, in its own sessions, while the ZIP streams
+    stream = await BulkCertificateService(request).open()
+    return StreamingResponse(
+        stream, media_type=ZIP_MEDIA_TYPE, headers={"Content-Disposition": 'attachment; filename="certificates.zip"'},
+    )
+
+
 @router.get('/health', status_code=200)
 async def root():
     logger.info("Health Endpoint Triggered")
     return {"status": 200, 'message': 'Dijkstra Certificate Generator Health Endpoint Triggered!!!'}
 
+@router.get('/download/{userName}')
+def getDownloadCertificate(
+    userName: str,
+    request: Annotated[CertificateRequest, Query()],
+    if_none_match: Optional[str] = Header(None),
+    session: Session = Depends(get_session),
+):
+    logger.info("GET Request Certificate Download for user: " + userName)
+    service = CertificateGeneratorService(session)
+    return _download(service.mainCertificateGeneratorService(userName, request, if_none_match))
+
 @router.post('/download/{userName}')
-async def postDownloadCertificate(userName: str):
+def postDownloadCertificate(
+    userName: str,
+    request: CertificateRequest,
+    if_none_match: Optional[str] = Header(None),
+    session: Session = Depends(get_session),
+):
     logger.info("POST Request Certificate Download for user: " + userName)
-    return await CertificateGeneratorService.mainCertificateGeneratorService(userName)
\ No newline at end of file
+    service = CertificateGeneratorService(session)
+    return _download(service.mainCertificateGeneratorService(userName, request, if_none_match))
+
+@router.post('/bulk')
+async def postBulkCertificates(request: BulkCertificateRequest):
+    logger.info(f"POST Request Bulk Certificates for event: {request.event}")
+    return await _bulk_download(request)
+
+@router.post('/jobs', response_model=ReadCertificateJob, status_code=202)
+async def postCertificateJob(request: BulkCertificateRequest):
+    logger.info(f"POST Request Certificate Job for event: {request.event}")
+    return await certificate_jobs.submit(request)
+
+@router.get('/jobs/{job_id}', response_model=ReadCertificateJob)
+async def getCertificateJob(job_id: str):
+    logger.info("GET Request Certificate Job: " + job_id)
+    return await certificate_jobs.get(job_id)
+
+@router.get('/jobs/{job_id}/events')
+async def getCertificateJobEvents(job_id: str):
+    logger.info("GET Request Certificate Job Events: " + job_id)
+    return await _job_events(job_id)
+
+@router.get('/jobs/{job_id}/download')
+async def getCertificateJobDownload(job_id: str):
+    logger.info("GET Request Certificate Job Download: " + job_id)
+    return FileResponse(await certificate_jobs.result(job_id), media_type=ZIP_MEDIA_TYPE, filename="certificates.zip")
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/certificate", tags=["Certificate"])
+
+@async_router.get('/health', status_code=200)
+async def root_async():
+    logger.info("Health Endpoint Triggered")
+    return {"status": 200, 'message': 'Dijkstra Certificate Generator Health Endpoint Triggered!!!'}
+
+@async_router.get('/download/{userName}')
+async def getDownloadCertificate_async(
+    userName: str,
+    request: Annotated[CertificateRequest, Query()],
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+):
+    logger.info("GET Request Certificate Download for user: " + userName)
+    service = AsyncCertificateGeneratorService(session)
+    return _download(await service.mainCertificateGeneratorService(userName, request, if_none_match))
+
+@async_router.post('/download/{userName}')
+async def postDownloadCertificate_async(
+    userName: str,
+    request: CertificateRequest,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+):
+    logger.info("POST Request Certificate Download for user: " + userName)
+    service = AsyncCertificateGeneratorService(session)
+    return _download(await service.mainCertificateGeneratorService(userName, request, if_none_match))
+
+@async_router.post('/bulk')
+async def postBulkCertificates_async(request: BulkCertificateRequest):
+    logger.info(f"POST Request Bulk Certificates for event: {request.event}")
+    return await _bulk_download(request)
+
+@async_router.post('/jobs', response_model=ReadCertificateJob, status_code=202)
+async def postCertificateJob_async(request: BulkCertificateRequest):
+    logger.info(f"POST Request Certificate Job for event: {request.event}")
+    return await certificate_jobs.submit(request)
+
+@async_router.get('/jobs/{job_id}', response_model=ReadCertificateJob)
+async def getCertificateJob_async(job_id: str):
+    logger.info("GET Request Certificate Job: " + job_id)
+    return await certificate_jobs.get(job_id)
+
+@async_router.get('/jobs/{job_id}/events')
+async def getCertificateJobEvents_async(job_id: str):
+    logger.info("GET Request Certificate Job Events: " + job_id)
+    return await _job_events(job_id)
+
+@async_router.get('/jobs/{job_id}/download')
+async def getCertificateJobDownload_async(job_id: str):
+    logger.info("GET Request Certificate Job Download: " + job_id)
+    return FileResponse(await certificate_jobs.result(job_id), media_type=ZIP_MEDIA_TYPE, filename="certificates.zip")
@@ -0,0 +1,36 @@
+from typing import List
+from fastapi import APIRouter, Body, Depends
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Config.constants import GITHUB_SYNC_MAX_USERS
+from Entities.UserDTOs.github_entity import GitHubSyncResult
+from Services.User.github_service import AsyncGitHubStatsService, GitHubStatsService
+from Settings.logging_config import setup_logging
+from db import get_async_session, get_session
+
+logger = setup_logging()
+
+router = APIRouter(prefix="/Dijkstra/v1/statistics/github", tags=["Statistics"])
+
+@router.post("/sync", response_model=GitHubSyncResult)
+def sync_github_stats(userNames: List[str] = Body(..., max_length=GITHUB_SYNC_MAX_USERS), session: Session = Depends(get_session)):
+    service = GitHubStatsService(session)
+    logger.info(f"Syncing GitHub statistics for {len(userNames)} users")
+    result = service.sync_users(userNames)
+    logger.info(f"Synced {len(result.synced)} GitHub users and {result.projects} projects")
+    return result
+
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/statistics/github", tags=["Statistics"])
+
+@async_router.post("/sync", response_model=GitHubSyncResult)
+async def sync_github_stats_async(userNames: List[str] = Body(..., max_length=GITHUB_SYNC_MAX_USERS), session: AsyncSession = Depends(get_async_session)):
+    service = AsyncGitHubStatsService(session)
+    logger.info(f"Syncing GitHub statistics for {len(userNames)} users")
+    result = await service.sync_users(userNames)
+    logger.info(f"Synced {len(result.synced)} GitHub users and {result.projects} projects")
+    return result
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Config.constants import CONTEST_HISTORY_DEFAULT_POINTS, CONTEST_HISTORY_MAX_POINTS
+from Entities.UserDTOs.leetcode_entity import ContestHistorySeries
+from Services.User.leetcode_service import AsyncLeetcodeStatsService, LeetcodeStatsService
+from Settings.logging_config import setup_logging
+from db import get_async_session, get_session
+
+logger = setup_logging()
+
+router = APIRouter(prefix="/Dijkstra/v1/statistics/lc", tags=["Statistics"])
+
+@router.get("/{userName}/contest-history", response_model=ContestHistorySeries)
+def get_contest_history(
+    userName: str,
+    start: Optional[datetime] = Query(None),
+    end: Optional[datetime] = Query(None),
+    max_points: int = Query(CONTEST_HISTORY_DEFAULT_POINTS, ge=1, le=CONTEST_HISTORY_MAX_POINTS),
+    session: Session = Depends(get_session),
+):
+    service = LeetcodeStatsService(session)
+    logger.info(f"Fetching contest history for LeetCode user: {userName}")
+    return service.contest_history(userName, start, end, max_points)
+
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/statistics/lc", tags=["Statistics"])
+
+@async_router.get("/{userName}/contest-history", response_model=ContestHistorySeries)
+async def get_contest_history_async(
+    userName: str,
+    start: Optional[datetime] = Query(None),
+    end: Optional[datetime] = Query(None),
+    max_points: int = Query(CONTEST_HISTORY_DEFAULT_POINTS, ge=1, le=CONTEST_HISTORY_MAX_POINTS),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncLeetcodeStatsService(session)
+    logger.info(f"Fetching contest history for LeetCode user: {userName}")
+    return await service.contest_history(userName, start, end, max_points)
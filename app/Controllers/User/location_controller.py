@@ -2,11 +2,14 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Entities.UserDTOs.location_entity import CreateLocation, UpdateLocation, ReadLocation
-from Services.User.location_service import LocationService
+from Entities.page_entity import Page
+from Services.User.location_service import AsyncLocationService, LocationService
 from Settings.logging_config import setup_logging
-from db import get_session
+from db import get_async_session, get_session
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -27,9 +30,10 @@ def get_location(location_id: UUID, session: Session = Depends(get_session)):
     location = service.get_location(location_id)
     return location
 
-@router.get("/", response_model=List[ReadLocation])
+@router.get("/", response_model=Page[ReadLocation])
 def list_locations(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = Query("created_at", description="Field to sort by"),
     order: str = Query("desc", description="asc or desc"),
@@ -43,7 +47,7 @@ def list_locations(
         f"Listing Locations: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
         f"city={city}, state={state}, country={country}"
     )
-    locations = service.list_locations(
+    locations, next_cursor = service.list_locations(
         skip,
         limit,
         sort_by,
@@ -51,9 +55,10 @@ def list_locations(
         city,
         state,
         country,
+        cursor=cursor,
     )
     logger.info(f"Returned {len(locations)} locations")
-    return locations
+    return model_response(Page[ReadLocation], {"items": locations, "next_cursor": next_cursor})
 
 @router.get("/autocomplete/", response_model=List[ReadLocation])
 def autocomplete_locations(
@@ -66,7 +71,7 @@ def autocomplete_locations(
     logger.info(f"Location autocomplete query='{query}' field='{field}' limit={limit}")
     results = service.autocomplete_locations(query, field, limit)
     logger.info(f"Location autocomplete returned {len(results)} results")
-    return results
+    return model_response(List[ReadLocation], results)
 
 @router.put("/{location_id}", response_model=ReadLocation)
 def update_location(
@@ -84,4 +89,75 @@ def delete_location(location_id: UUID, session: Session = Depends(get_session)):
     logger.info(f"Deleting Location ID: {location_id}")
     message = service.delete_location(location_id)
     logger.info(message)
-    return {"detail": message}
\ No newline at end of file
+    return {"detail": message}
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/location", tags=["Locations"])
+
+@async_router.post("/", response_model=ReadLocation)
+async def create_location_async(location_create: CreateLocation, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncLocationService(session)
+    logger.info(f"Creating Location: {location_create.city}, {location_create.country}")
+    location = await service.create_location(location_create)
+    logger.info(f"Created Location with ID: {location.id}")
+    return location
+
+@async_router.get("/{location_id}", response_model=ReadLocation)
+async def get_location_async(location_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncLocationService(session)
+    logger.info(f"Fetching Location with ID: {location_id}")
+    return await service.get_location(location_id)
+
+@async_router.get("/", response_model=Page[ReadLocation])
+async def list_locations_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    country: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncLocationService(session)
+    logger.info(
+        f"Listing Locations: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
+        f"city={city}, state={state}, country={country}"
+    )
+    locations, next_cursor = await service.list_locations(skip, limit, sort_by, order, city, state, country, cursor=cursor)
+    logger.info(f"Returned {len(locations)} locations")
+    return model_response(Page[ReadLocation], {"items": locations, "next_cursor": next_cursor})
+
+@async_router.get("/autocomplete/", response_model=List[ReadLocation])
+async def autocomplete_locations_async(
+    query: str,
+    field: str = Query("city", description="Field to search against"),
+    limit: int = 10,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncLocationService(session)
+    logger.info(f"Location autocomplete query='{query}' field='{field}' limit={limit}")
+    results = await service.autocomplete_locations(query, field, limit)
+    logger.info(f"Location autocomplete returned {len(results)} results")
+    return model_response(List[ReadLocation], results)
+
+@async_router.put("/{location_id}", response_model=ReadLocation)
+async def update_location_async(
+    location_id: UUID, location_update: UpdateLocation, session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncLocationService(session)
+    logger.info(f"Updating Location ID: {location_id} with data: {location_update.dict(exclude_unset=True)}")
+    location = await service.update_location(location_id, location_update)
+    logger.info(f"Updated Location ID: {location.id}")
+    return location
+
+@async_router.delete("/{location_id}", response_model=ReadLocation)
+async def delete_location_async(location_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncLocationService(session)
+    logger.info(f"Deleting Location ID: {location_id}")
+    message = await service.delete_location(location_id)
+    logger.info(message)
+    return {"detail": message}
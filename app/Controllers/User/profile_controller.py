@@ -2,12 +2,16 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Entities.UserDTOs.profile_entity import CreateProfile, UpdateProfile, ReadProfile, ReadProfileWithUser
+from Entities.UserDTOs.profile_full_entity import ReadFullProfile
+from Entities.page_entity import Page
 
 from Settings.logging_config import setup_logging
-from Services.User.profile_service import ProfileService
-from db import get_session
+from Services.User.profile_service import AsyncProfileService, ProfileService
+from db import get_async_session, get_session
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -31,6 +35,13 @@ def get_profile(profile_id: UUID, session: Session = Depends(get_session)):
     return profile
 
 
+@router.get("/{profile_id}/full", response_model=ReadFullProfile)
+def get_full_profile(profile_id: UUID, session: Session = Depends(get_session)):
+    service = ProfileService(session)
+    logger.info(f"Fetching full Profile with ID: {profile_id}")
+    return service.get_full_profile(profile_id)
+
+
 @router.get("/user/{user_id}", response_model=ReadProfileWithUser)
 def get_profile_by_user_id(user_id: UUID, session: Session = Depends(get_session)):
     service = ProfileService(session)
@@ -39,9 +50,10 @@ def get_profile_by_user_id(user_id: UUID, session: Session = Depends(get_session
     return profile
 
 
-@router.get("/", response_model=List[ReadProfile])
+@router.get("/", response_model=Page[ReadProfile])
 def list_profiles(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = Query("created_at", description="Field to sort by"),
     order: str = Query("desc", description="asc or desc"),
@@ -53,15 +65,16 @@ def list_profiles(
         f"Listing Profiles: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
         f"user_id={user_id}"
     )
-    profiles = service.list_profiles(
+    profiles, next_cursor = service.list_profiles(
         skip,
         limit,
         sort_by,
         order,
         user_id,
+        cursor=cursor,
     )
     logger.info(f"Returned {len(profiles)} profiles")
-    return profiles
+    return model_response(Page[ReadProfile], {"items": profiles, "next_cursor": next_cursor})
 
 
 @router.put("/{profile_id}", response_model=ReadProfile)
@@ -81,4 +94,80 @@ def delete_profile(profile_id: UUID, session: Session = Depends(get_session)):
     logger.info(f"Deleting Profile ID: {profile_id}")
     message = service.delete_profile(profile_id)
     logger.info(message)
-    return {"detail": message}
\ No newline at end of file
+    return {"detail": message}
+
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/profile", tags=["Profiles"])
+
+
+@async_router.post("/", response_model=ReadProfile)
+async def create_profile_async(profile_create: CreateProfile, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProfileService(session)
+    logger.info(f"Creating Profile for user ID: {profile_create.user_id}")
+    profile = await service.create_profile(profile_create)
+    logger.info(f"Created Profile with ID: {profile.id}")
+    return profile
+
+
+@async_router.get("/{profile_id}", response_model=ReadProfileWithUser)
+async def get_profile_async(profile_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProfileService(session)
+    logger.info(f"Fetching Profile with ID: {profile_id}")
+    return await service.get_profile(profile_id)
+
+
+@async_router.get("/{profile_id}/full", response_model=ReadFullProfile)
+async def get_full_profile_async(profile_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProfileService(session)
+    logger.info(f"Fetching full Profile with ID: {profile_id}")
+    return await service.get_full_profile(profile_id)
+
+
+@async_router.get("/user/{user_id}", response_model=ReadProfileWithUser)
+async def get_profile_by_user_id_async(user_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProfileService(session)
+    logger.info(f"Fetching Profile for user ID: {user_id}")
+    return await service.get_profile_by_user_id(user_id)
+
+
+@async_router.get("/", response_model=Page[ReadProfile])
+async def list_profiles_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    user_id: Optional[UUID] = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncProfileService(session)
+    logger.info(
+        f"Listing Profiles: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
+        f"user_id={user_id}"
+    )
+    profiles, next_cursor = await service.list_profiles(skip, limit, sort_by, order, user_id, cursor=cursor)
+    logger.info(f"Returned {len(profiles)} profiles")
+    return model_response(Page[ReadProfile], {"items": profiles, "next_cursor": next_cursor})
+
+
+@async_router.put("/{profile_id}", response_model=ReadProfile)
+async def update_profile_async(
+    profile_id: UUID, profile_update: UpdateProfile, session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncProfileService(session)
+    logger.info(f"Updating Profile ID: {profile_id} with data: {profile_update.dict(exclude_unset=True)}")
+    profile = await service.update_profile(profile_id, profile_update)
+    logger.info(f"Updated Profile ID: {profile.id}")
+    return profile
+
+
+@async_router.delete("/{profile_id}", response_model=ReadProfile)
+async def delete_profile_async(profile_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncProfileService(session)
+    logger.info(f"Deleting Profile ID: {profile_id}")
+    message = await service.delete_profile(profile_id)
+    logger.info(message)
+    return {"detail": message}
@@ -1,4 +1,8 @@
-from fastapi import APIRouter
+import json
+from typing import List
+from fastapi import APIRouter, Body
+from fastapi.responses import StreamingResponse
+from Config.constants import LEETCODE_BATCH_MAX_USERS
 from Settings.logging_config import setup_logging
 from Services.User.github_service import GitHubService
 from Services.User.leetcode_service import LeetCodeService
@@ -21,4 +25,15 @@ async def getGitHubData(userName: str):
 @router.get('/lc/{userName}')
 async def getLeetCodeData(userName: str):
     logger.info("GET Request LeetCode Data for user: " + userName)
-    return await LeetCodeService.getAllLeetcodeData(userName)
\ No newline at end of file
+    return await LeetCodeService.getAllLeetcodeData(userName)
+
+@router.post('/lc/batch')
+async def getLeetCodeDataBatch(userNames: List[str] = Body(..., max_length=LEETCODE_BATCH_MAX_USERS)):
+    logger.info(f"POST Request LeetCode Data for {len(userNames)} users")
+
+    # One JSON object per line, written as soon as each username finishes
+    async def ndjson():
+        async for result in LeetCodeService.streamLeetcodeData(userNames):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
\ No newline at end of file
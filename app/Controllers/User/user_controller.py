@@ -4,11 +4,14 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Entities.UserDTOs.user_entity import CreateUser, UpdateUser, ReadUser
-from Services.User.user_service import UserService
+from Entities.page_entity import Page
+from Services.User.user_service import AsyncUserService, UserService
 from Settings.logging_config import setup_logging
-from db import get_session
+from db import get_async_session, get_session
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -40,9 +43,10 @@ def get_user_by_github_username(github_user_name: str, session: Session = Depend
     return user
 
 
-@router.get("/", response_model=List[ReadUser])
+@router.get("/", response_model=Page[ReadUser])
 def list_users(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = Query("created_at", description="Field to sort by"),
     order: str = Query("desc", description="asc or desc"),
@@ -52,6 +56,7 @@ def list_users(
     rank: Optional[str] = None,
     min_streak: Optional[int] = Query(None, ge=0),
     max_streak: Optional[int] = Query(None, ge=0),
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
     session: Session = Depends(get_session),
 ):
     service = UserService(session)
@@ -60,7 +65,7 @@ def list_users(
         f"first_name={first_name}, last_name={last_name}, github_user_name={github_user_name}, "
         f"rank={rank}, min_streak={min_streak}, max_streak={max_streak}"
     )
-    users = service.list_users(
+    users, next_cursor = service.list_users(
         skip,
         limit,
         sort_by,
@@ -71,9 +76,11 @@ def list_users(
         rank,
         min_streak,
         max_streak,
+        cursor=cursor,
+        use_cache=use_cache,
     )
     logger.info(f"Returned {len(users)} users")
-    return users
+    return model_response(Page[ReadUser], {"items": users, "next_cursor": next_cursor})
 
 
 @router.get("/autocomplete/", response_model=List[ReadUser])
@@ -87,7 +94,7 @@ def autocomplete_users(
     logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
     results = service.autocomplete_users(query, field, limit)
     logger.info(f"Autocomplete returned {len(results)} results")
-    return results
+    return model_response(List[ReadUser], results)
 
 
 @router.put("/{user_id}", response_model=ReadUser)
@@ -107,4 +114,107 @@ def delete_user(user_id: UUID, session: Session = Depends(get_session)):
     logger.info(f"Deleting User ID: {user_id}")
     message = service.delete_user(user_id)
     logger.info(message)
-    return {"detail": message}
\ No newline at end of file
+    return {"detail": message}
+
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/u", tags=["Users"])
+
+
+@async_router.post("/", response_model=ReadUser)
+async def create_user_async(user_create: CreateUser, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncUserService(session)
+    logger.info(f"Creating User: {user_create.github_user_name}")
+    user = await service.create_user(user_create)
+    logger.info(f"Created User with ID: {user.id}")
+    return user
+
+
+@async_router.get("/{user_id}", response_model=ReadUser)
+async def get_user_async(user_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncUserService(session)
+    logger.info(f"Fetching User with ID: {user_id}")
+    return await service.get_user(user_id)
+
+
+@async_router.get("/github/{github_user_name}", response_model=ReadUser)
+async def get_user_by_github_username_async(github_user_name: str, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncUserService(session)
+    logger.info(f"Fetching User with GitHub username: {github_user_name}")
+    return await service.get_user_by_github_username(github_user_name)
+
+
+@async_router.get("/", response_model=Page[ReadUser])
+async def list_users_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    github_user_name: Optional[str] = None,
+    rank: Optional[str] = None,
+    min_streak: Optional[int] = Query(None, ge=0),
+    max_streak: Optional[int] = Query(None, ge=0),
+    use_cache: bool = Query(True, description="Set to false to bypass the result cache"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncUserService(session)
+    logger.info(
+        f"Listing Users: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
+        f"first_name={first_name}, last_name={last_name}, github_user_name={github_user_name}, "
+        f"rank={rank}, min_streak={min_streak}, max_streak={max_streak}"
+    )
+    users, next_cursor = await service.list_users(
+        skip,
+        limit,
+        sort_by,
+        order,
+        first_name,
+        last_name,
+        github_user_name,
+        rank,
+        min_streak,
+        max_streak,
+        cursor=cursor,
+        use_cache=use_cache,
+    )
+    logger.info(f"Returned {len(users)} users")
+    return model_response(Page[ReadUser], {"items": users, "next_cursor": next_cursor})
+
+
+@async_router.get("/autocomplete/", response_model=List[ReadUser])
+async def autocomplete_users_async(
+    query: str,
+    field: str = Query("github_user_name", description="Field to search against"),
+    limit: int = 10,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncUserService(session)
+    logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
+    results = await service.autocomplete_users(query, field, limit)
+    logger.info(f"Autocomplete returned {len(results)} results")
+    return model_response(List[ReadUser], results)
+
+
+@async_router.put("/{user_id}", response_model=ReadUser)
+async def update_user_async(
+    user_id: UUID, user_update: UpdateUser, session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncUserService(session)
+    logger.info(f"Updating User ID: {user_id} with data: {user_update.dict(exclude_unset=True)}")
+    user = await service.update_user(user_id, user_update)
+    logger.info(f"Updated User ID: {user.id}")
+    return user
+
+
+@async_router.delete("/{user_id}", response_model=ReadUser)
+async def delete_user_async(user_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncUserService(session)
+    logger.info(f"Deleting User ID: {user_id}")
+    message = await service.delete_user(user_id)
+    logger.info(message)
+    return {"detail": message}
@@ -2,12 +2,15 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Settings.logging_config import setup_logging
 from Entities.UserDTOs.workexperience_entity import CreateWorkExperience, ReadWorkExperience, ReadWorkExperienceWithRelations, UpdateWorkExperience
-from Services.User.workexperience_service import WorkExperienceService
-from db import get_session
+from Entities.page_entity import Page
+from Services.User.workexperience_service import AsyncWorkExperienceService, WorkExperienceService
+from db import get_async_session, get_session
 from Schema.SQL.Enums.enums import EmploymentType, WorkLocationType, Domain
+from Utils.serialization import model_response
 
 logger = setup_logging()
 
@@ -38,12 +41,13 @@ def get_work_experiences_by_profile_id(profile_id: UUID, session: Session = Depe
     logger.info(f"Fetching Work Experiences for profile ID: {profile_id}")
     work_experiences = service.get_work_experiences_by_profile_id(profile_id)
     logger.info(f"Returned {len(work_experiences)} work experiences for profile {profile_id}")
-    return work_experiences
+    return model_response(List[ReadWorkExperience], work_experiences)
 
 
-@router.get("/", response_model=List[ReadWorkExperience])
+@router.get("/", response_model=Page[ReadWorkExperience])
 def list_work_experiences(
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
     limit: int = 20,
     sort_by: str = Query("created_at", description="Field to sort by"),
     order: str = Query("desc", description="asc or desc"),
@@ -67,7 +71,7 @@ def list_work_experiences(
         f"location_type={location_type}, currently_working={currently_working}, "
         f"start_date_after={start_date_after}, start_date_before={start_date_before}"
     )
-    work_experiences = service.list_work_experiences(
+    work_experiences, next_cursor = service.list_work_experiences(
         skip,
         limit,
         sort_by,
@@ -82,9 +86,10 @@ def list_work_experiences(
         currently_working,
         start_date_after,
         start_date_before,
+        cursor=cursor,
     )
     logger.info(f"Returned {len(work_experiences)} work experiences")
-    return work_experiences
+    return model_response(Page[ReadWorkExperience], {"items": work_experiences, "next_cursor": next_cursor})
 
 
 @router.get("/autocomplete/", response_model=List[ReadWorkExperience])
@@ -98,7 +103,7 @@ def autocomplete_work_experiences(
     logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
     results = service.autocomplete_work_experiences(query, field, limit)
     logger.info(f"Autocomplete returned {len(results)} results")
-    return results
+    return model_response(List[ReadWorkExperience], results)
 
 
 @router.put("/{work_experience_id}", response_model=ReadWorkExperience)
@@ -117,4 +122,119 @@ def delete_work_experience(work_experience_id: UUID, session: Session = Depends(
     logger.info(f"Deleting Work Experience ID: {work_experience_id}")
     message = service.delete_work_experience(work_experience_id)
     logger.info(f"Deleted Work Experience ID: {work_experience_id}")
-    return {"detail": message}
\ No newline at end of file
+    return {"detail": message}
+
+
+# ----------------------
+# Async routes (DB_MODE=async)
+# ----------------------
+async_router = APIRouter(prefix="/Dijkstra/v1/wp", tags=["Work Experiences"])
+
+
+@async_router.post("/", response_model=ReadWorkExperience)
+async def create_work_experience_async(work_experience_create: CreateWorkExperience, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncWorkExperienceService(session)
+    logger.info(f"Creating Work Experience: {work_experience_create.title} at {work_experience_create.company_name}")
+    work_experience = await service.create_work_experience(work_experience_create)
+    logger.info(f"Created Work Experience with ID: {work_experience.id}")
+    return work_experience
+
+
+@async_router.get("/{work_experience_id}", response_model=ReadWorkExperienceWithRelations)
+async def get_work_experience_async(work_experience_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncWorkExperienceService(session)
+    logger.info(f"Fetching Work Experience with ID: {work_experience_id}")
+    work_experience = await service.get_work_experience(work_experience_id)
+    logger.info(f"Fetched Work Experience: {work_experience.title} at {work_experience.company_name}")
+    return work_experience
+
+
+@async_router.get("/profile/{profile_id}", response_model=List[ReadWorkExperience])
+async def get_work_experiences_by_profile_id_async(profile_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncWorkExperienceService(session)
+    logger.info(f"Fetching Work Experiences for profile ID: {profile_id}")
+    work_experiences = await service.get_work_experiences_by_profile_id(profile_id)
+    logger.info(f"Returned {len(work_experiences)} work experiences for profile {profile_id}")
+    return model_response(List[ReadWorkExperience], work_experiences)
+
+
+@async_router.get("/", response_model=Page[ReadWorkExperience])
+async def list_work_experiences_async(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, description="Legacy offset paging, ignored when cursor is set"),
+    limit: int = 20,
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    order: str = Query("desc", description="asc or desc"),
+    profile_id: Optional[UUID] = None,
+    title: Optional[str] = None,
+    company_name: Optional[str] = None,
+    employment_type: Optional[EmploymentType] = None,
+    domain: Optional[List[Domain]] = Query(None),
+    location: Optional[UUID] = None,
+    location_type: Optional[WorkLocationType] = None,
+    currently_working: Optional[bool] = None,
+    start_date_after: Optional[str] = None,
+    start_date_before: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncWorkExperienceService(session)
+    logger.info(
+        f"Listing Work Experiences: skip={skip}, limit={limit}, sort_by={sort_by}, order={order}, "
+        f"profile_id={profile_id}, title={title}, company_name={company_name}, "
+        f"employment_type={employment_type}, domain={domain}, location={location}, "
+        f"location_type={location_type}, currently_working={currently_working}, "
+        f"start_date_after={start_date_after}, start_date_before={start_date_before}"
+    )
+    work_experiences, next_cursor = await service.list_work_experiences(
+        skip,
+        limit,
+        sort_by,
+        order,
+        profile_id,
+        title,
+        company_name,
+        employment_type,
+        domain,
+        location,
+        location_type,
+        currently_working,
+        start_date_after,
+        start_date_before,
+        cursor=cursor,
+    )
+    logger.info(f"Returned {len(work_experiences)} work experiences")
+    return model_response(Page[ReadWorkExperience], {"items": work_experiences, "next_cursor": next_cursor})
+
+
+@async_router.get("/autocomplete/", response_model=List[ReadWorkExperience])
+async def autocomplete_work_experiences_async(
+    query: str,
+    field: str = Query("title", description="Field to search against"),
+    limit: int = 10,
+    session: AsyncSession = Depends(get_async_session),
+):
+    service = AsyncWorkExperienceService(session)
+    logger.info(f"Autocomplete query='{query}' field='{field}' limit={limit}")
+    results = await service.autocomplete_work_experiences(query, field, limit)
+    logger.info(f"Autocomplete returned {len(results)} results")
+    return model_response(List[ReadWorkExperience], results)
+
+
+@async_router.put("/{work_experience_id}", response_model=ReadWorkExperience)
+async def update_work_experience_async(
+    work_experience_id: UUID, work_experience_update: UpdateWorkExperience, session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncWorkExperienceService(session)
+    logger.info(f"Updating Work Experience ID: {work_experience_id} with data: {work_experience_update.dict(exclude_unset=True)}")
+    work_experience = await service.update_work_experience(work_experience_id, work_experience_update)
+    logger.info(f"Updated Work Experience ID: {work_experience.id}")
+    return work_experience
+
+
+@async_router.delete("/{work_experience_id}", response_model=ReadWorkExperience)
+async def delete_work_experience_async(work_experience_id: UUID, session: AsyncSession = Depends(get_async_session)):
+    service = AsyncWorkExperienceService(session)
+    logger.info(f"Deleting Work Experience ID: {work_experience_id}")
+    message = await service.delete_work_experience(work_experience_id)
+    logger.info(f"Deleted Work Experience ID: {work_experience_id}")
+    return {"detail": message}
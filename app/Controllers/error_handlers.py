@@ -3,7 +3,11 @@ from fastapi import Request
 from Utils.error_codes import ErrorCodes
 from Utils.Exceptions.opportunities_exceptions import FellowshipNotFound, InvalidTools, JobNotFound, OrganizationNotFound, ProjectOpportunityNotFound
 from Utils.errors import raise_api_error
-from Utils.Exceptions.user_exceptions import LocationNotFound, ProfileNotFound, UserNotFound, WorkExperienceNotFound
+from Utils.Exceptions.user_exceptions import (
+    CertificateCohortEmpty, CertificateJobNotFound, CertificateJobNotReady, ContestHistoryNotFound, GitHubApiError,
+    GitHubUsernameNotFound, LocationNotFound, ProfileNotFound, UserNotFound, WorkExperienceNotFound,
+)
+from Utils.Exceptions.pagination_exceptions import InvalidCursor, InvalidSortField
 import logging
 
 logger = logging.getLogger(__name__)
@@ -80,6 +84,16 @@ def register_exception_handlers(app):
             status=404
         )
 
+    @app.exception_handler(GitHubUsernameNotFound)
+    async def github_username_not_found_handler(request: Request, exc: GitHubUsernameNotFound):
+        logger.warning(f"User not found: {exc.github_username}")
+        raise_api_error(
+            code=ErrorCodes.USER_USER_NF_A01,
+            error="User not found",
+            detail=str(exc),
+            status=404
+        )
+
     @app.exception_handler(ProfileNotFound)
     async def profile_not_found_handler(request: Request, exc: ProfileNotFound):
         logger.warning(f"Profile not found: {exc.profile_id}")
@@ -110,6 +124,76 @@ def register_exception_handlers(app):
             status=404
         )
 
+    @app.exception_handler(CertificateCohortEmpty)
+    async def certificate_cohort_empty_handler(request: Request, exc: CertificateCohortEmpty):
+        logger.warning(f"Certificate cohort empty: {exc.cohort}")
+        raise_api_error(
+            code=ErrorCodes.USER_CERT_NF_A01,
+            error="Certificate cohort empty",
+            detail=str(exc),
+            status=404
+        )
+
+    @app.exception_handler(CertificateJobNotFound)
+    async def certificate_job_not_found_handler(request: Request, exc: CertificateJobNotFound):
+        logger.warning(f"Certificate job not found: {exc.job_id}")
+        raise_api_error(
+            code=ErrorCodes.USER_CERT_NF_A02,
+            error="Certificate job not found",
+            detail=str(exc),
+            status=404
+        )
+
+    @app.exception_handler(CertificateJobNotReady)
+    async def certificate_job_not_ready_handler(request: Request, exc: CertificateJobNotReady):
+        logger.warning(f"Certificate job {exc.job_id} not ready: {exc.status}")
+        raise_api_error(
+            code=ErrorCodes.USER_CERT_VAL_A01,
+            error="Certificate job not ready",
+            detail=str(exc),
+            status=409
+        )
+
+    @app.exception_handler(GitHubApiError)
+    async def github_api_error_handler(request: Request, exc: GitHubApiError):
+        logger.error(f"GitHub API error: {exc.reason}")
+        raise_api_error(
+            code=ErrorCodes.USER_GITHUB_SRV_A01,
+            error="GitHub API error",
+            detail=str(exc),
+            status=502
+        )
+
+    @app.exception_handler(ContestHistoryNotFound)
+    async def contest_history_not_found_handler(request: Request, exc: ContestHistoryNotFound):
+        logger.warning(f"Contest history not found: {exc.lc_username}")
+        raise_api_error(
+            code=ErrorCodes.USER_LEETCODE_NF_A01,
+            error="Contest history not found",
+            detail=str(exc),
+            status=404
+        )
+
+    @app.exception_handler(InvalidCursor)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+        logger.warning(f"Invalid cursor: {exc.cursor}")
+        raise_api_error(
+            code=ErrorCodes.GEN_PAGE_VAL_A01,
+            error="Invalid cursor",
+            detail=str(exc),
+            status=400
+        )
+
+    @app.exception_handler(InvalidSortField)
+    async def invalid_sort_field_handler(request: Request, exc: InvalidSortField):
+        logger.warning(f"Invalid sort field: {exc.sort_by}")
+        raise_api_error(
+            code=ErrorCodes.GEN_PAGE_VAL_A02,
+            error="Invalid sort field",
+            detail=str(exc),
+            status=400
+        )
+
     @app.exception_handler(Exception)
     async def generic_handler(request: Request, exc: Exception):
         logger.error(f"Unhandled error: {str(exc)}")
@@ -1,5 +1,14 @@
 from fastapi import APIRouter
 from Settings.logging_config import setup_logging
+from db import get_pool_stats
+from Services.User.certificate_job_service import certificate_jobs
+from Services.User.Statistics.sync_scheduler import statistics_sync_scheduler
+from Utils.cache import get_cache_stats
+from Utils.certificate_renderer import get_certificate_renderer
+from Utils.circuit_breaker import get_circuit_stats
+from Utils.content_store import certificate_store
+from Utils.github_client import github_client
+from Utils.single_flight import get_single_flight_stats
 
 # Initialize logging
 logger = setup_logging()
@@ -9,4 +18,43 @@ router = APIRouter(prefix="/Dijkstra/v1", tags=["Main Controller"])
 @router.get('/health', status_code=200)
 async def root():
     logger.info("Health Endpoint Triggered")
-    return {"status": 200, 'message': 'Dijkstra Server Health Endpoint Triggered!!!'}
\ No newline at end of file
+    return {"status": 200, 'message': 'Dijkstra Server Health Endpoint Triggered!!!'}
+
+@router.get('/metrics/pool', status_code=200)
+async def pool_metrics():
+    logger.info("Pool Metrics Endpoint Triggered")
+    return get_pool_stats()
+
+@router.get('/metrics/cache', status_code=200)
+async def cache_metrics():
+    logger.info("Cache Metrics Endpoint Triggered")
+    return get_cache_stats()
+
+@router.get('/metrics/statistics-sync', status_code=200)
+async def statistics_sync_metrics():
+    logger.info("Statistics Sync Metrics Endpoint Triggered")
+    return statistics_sync_scheduler.snapshot()
+
+@router.get('/metrics/github', status_code=200)
+async def github_metrics():
+    logger.info("GitHub Metrics Endpoint Triggered")
+    return github_client.snapshot()
+
+@router.get('/metrics/single-flight', status_code=200)
+async def single_flight_metrics():
+    logger.info("Single Flight Metrics Endpoint Triggered")
+    return get_single_flight_stats()
+
+@router.get('/metrics/circuits', status_code=200)
+async def circuit_metrics():
+    logger.info("Circuit Metrics Endpoint Triggered")
+    return get_circuit_stats()
+
+@router.get('/metrics/certificates', status_code=200)
+async def certificate_metrics():
+    logger.info("Certificate Metrics Endpoint Triggered")
+    return {
+        "renderer": get_certificate_renderer().snapshot(),
+        "store": certificate_store.snapshot(),
+        "jobs": {**certificate_jobs.snapshot(), "queue": await certificate_jobs.counts()},
+    }
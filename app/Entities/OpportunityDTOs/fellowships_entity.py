@@ -1,7 +1,7 @@
 from typing import Optional, List
 from uuid import UUID
 from datetime import date, datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from Schema.SQL.Enums.enums import Tools
 
@@ -69,3 +69,5 @@ class ReadFellowship(BaseModel):
     technologies: Optional[List[Tools]]
     created_at: datetime
     updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,7 +2,7 @@
 from typing import Optional, List
 from uuid import UUID
 from datetime import date, datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from Schema.SQL.Models.models import WorkLocationType, EmploymentType, Currency, Tools
 
@@ -86,6 +86,5 @@ class ReadJob(BaseModel):
     updated_at: datetime
     technologies: Optional[List[Tools]] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
@@ -2,7 +2,7 @@
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class CreateOrganization(BaseModel):
     name: str
@@ -21,3 +21,5 @@ class ReadOrganization(BaseModel):
     repo_link: Optional[str]
     created_at: datetime
     updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
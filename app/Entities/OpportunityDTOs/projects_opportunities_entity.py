@@ -2,7 +2,7 @@
 from typing import List, Optional
 from uuid import UUID
 from datetime import date, datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from Schema.SQL.Enums.enums import ProjectLevel, Difficulty, Tools
 
 class CreateProject(BaseModel):
@@ -79,3 +79,5 @@ class ReadProject(BaseModel):
     topics: Optional[List[str]]
     created_at: datetime
     updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
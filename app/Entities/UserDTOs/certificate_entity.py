@@ -0,0 +1,59 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from Config.constants import CERTIFICATE_BULK_MAX_USERS
+from Schema.SQL.Models.models import Rank
+
+
+class CertificateFormat(str, Enum):
+    PDF = "pdf"
+    PNG = "png"
+
+class CertificateJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+# ----------------------
+# Input DTOs
+# ----------------------
+class CertificateRequest(BaseModel):
+    event: str = Field(max_length=200)
+    description: Optional[str] = Field(None, max_length=300)  # Defaults to the user's rank
+    issued_on: Optional[date] = None                           # Defaults to today (UTC)
+    format: CertificateFormat = CertificateFormat.PDF
+
+    @field_validator('event')
+    def event_must_not_be_empty(cls, v):
+        if not v.strip():
+            raise ValueError('event cannot be empty')
+        return v.strip()
+
+class BulkCertificateRequest(CertificateRequest):
+    # The cohort: these users, every user with this rank, or the listed users with it
+    github_user_names: Optional[List[str]] = Field(None, max_length=CERTIFICATE_BULK_MAX_USERS)
+    rank: Optional[Rank] = None
+
+    @model_validator(mode='after')
+    def cohort_must_be_given(self):
+        if self.github_user_names is None and self.rank is None:
+            raise ValueError('github_user_names or rank is required')
+        return self
+
+# ----------------------
+# Output DTOs
+# ----------------------
+class ReadCertificateJob(BaseModel):
+    id: str
+    status: CertificateJobStatus
+    progress: int                       # Users rendered or skipped so far
+    total: Optional[int] = None         # Users in the cohort, once counted
+    result_bytes: Optional[int] = None  # Size of the ZIP, once done
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
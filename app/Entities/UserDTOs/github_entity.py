@@ -0,0 +1,11 @@
+from typing import List
+from pydantic import BaseModel
+
+# ----------------------
+# Output DTOs
+# ----------------------
+class GitHubSyncResult(BaseModel):
+    synced: List[str]           # GitHub logins whose statistics were stored
+    not_found: List[str]        # Requested usernames GitHub does not know
+    without_profile: List[str]  # Stored, but no Dijkstra profile to attach their projects to
+    projects: int               # Project rows inserted or refreshed
@@ -0,0 +1,13 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+# ----------------------
+# Output DTOs
+# ----------------------
+class ContestHistorySeries(BaseModel):
+    username: str
+    total_contests: int               # Attended contests within the requested range
+    downsampled: bool                 # Points are the last contest of each time bucket
+    timestamps: List[int]             # Contest start times, epoch seconds
+    ratings: List[Optional[float]]    # Contest rating after each contest
+    rankings: List[Optional[int]]     # Placement in each contest
@@ -1,7 +1,7 @@
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 
 # ----------------------
 # Input DTOs
@@ -35,8 +35,7 @@ class ReadProfile(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----------------------
@@ -45,8 +44,7 @@ class ReadProfile(BaseModel):
 class ReadProfileWithUser(ReadProfile):
     user: Optional['ReadUser'] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Import here to avoid circular imports
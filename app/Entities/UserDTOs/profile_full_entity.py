@@ -0,0 +1,224 @@
+from typing import List, Optional
+from uuid import UUID
+from datetime import date, datetime
+from pydantic import BaseModel, ConfigDict
+
+from Schema.SQL.Enums.enums import (
+    Cause, CertificationType, Domain, LeetcodeTagCategory,
+    TestScoreType, Tools, WorkLocationType,
+)
+from Entities.UserDTOs.location_entity import ReadLocation
+from Entities.UserDTOs.profile_entity import ReadProfile
+from Entities.UserDTOs.user_entity import ReadUser
+from Entities.UserDTOs.workexperience_entity import ReadWorkExperience
+
+# ----------------------
+# Output DTOs for the profile aggregate (GET /profile/{id}/full)
+# ----------------------
+class ReadEducation(BaseModel):
+    id: UUID
+    profile_id: UUID
+    school: str
+    school_type: str
+    degree: str
+    field: str
+    currently_studying: bool
+    location: UUID
+    location_type: Optional[WorkLocationType]
+    start_date: date
+    end_date: Optional[date]
+    description_general: str
+    description_detailed: Optional[str]
+    description_less: Optional[str]
+    work_done: Optional[str]
+    school_score_multiplier: Optional[float]
+    tools_used: Optional[List[Tools]]
+    location_rel: Optional[ReadLocation] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadWorkExperienceWithLocation(ReadWorkExperience):
+    location_rel: Optional[ReadLocation] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadCertification(BaseModel):
+    id: UUID
+    profile_id: UUID
+    name: str
+    type: Optional[CertificationType]
+    issuing_organization: str
+    issue_date: date
+    expiry_date: Optional[date]
+    credential_id: str
+    credential_url: str
+    tools: Optional[List[Tools]]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadTestScore(BaseModel):
+    id: UUID
+    profile_id: UUID
+    title: str
+    type: Optional[TestScoreType]
+    score: str
+    test_date: date
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadVolunteering(BaseModel):
+    id: UUID
+    profile_id: UUID
+    organization: str
+    role: str
+    cause: Optional[Cause]
+    start_date: date
+    end_date: Optional[date]
+    currently_volunteering: bool
+    description: Optional[str]
+    tools: Optional[List[Tools]]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadPublication(BaseModel):
+    id: UUID
+    profile_id: UUID
+    title: str
+    publisher: str
+    authors: List[str]
+    publication_date: date
+    publication_url: str
+    description: str
+    tools: Optional[List[Tools]]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadProject(BaseModel):
+    id: UUID
+    profile_id: UUID
+    name: str
+    organization: Optional[str]
+    owner: str
+    private: bool
+    github_stars: int
+    github_about: Optional[str]
+    github_open_issues: int
+    github_forks: int
+    description: str
+    domain: Optional[Domain]
+    topics: Optional[List[str]]
+    tools: List[Tools]
+    readme: bool
+    license: bool
+    landing_page: bool
+    landing_page_link: Optional[str]
+    docs_page: bool
+    docs_page_link: Optional[str]
+    own_domain_name: bool
+    domain_name: Optional[str]
+    total_lines_contributed: Optional[int]
+    improper_uploads: Optional[bool]
+    complexity_rating: Optional[float]
+    testing_framework_present: bool
+    testing_framework: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadLeetcodeBadge(BaseModel):
+    id: UUID
+    name: Optional[str]
+    icon: Optional[str]
+    hover_text: Optional[str]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadLeetcodeTag(BaseModel):
+    id: UUID
+    tag_category: Optional[LeetcodeTagCategory]
+    tag_name: Optional[str]
+    problems_solved: Optional[int]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadLeetcode(BaseModel):
+    id: UUID
+    profile_id: UUID
+    lc_username: Optional[str]
+    real_name: Optional[str]
+    about_me: Optional[str]
+    school: Optional[str]
+    websites: Optional[str]
+    country: Optional[str]
+    company: Optional[str]
+    job_title: Optional[str]
+    skill_tags: Optional[List[str]]
+    ranking: Optional[int]
+    avatar: Optional[str]
+    reputation: Optional[int]
+    solution_count: Optional[int]
+    total_problems_solved: Optional[int]
+    easy_problems_solved: Optional[int]
+    medium_problems_solved: Optional[int]
+    hard_problems_solved: Optional[int]
+    language_problem_count: Optional[List[str]]
+    attended_contests: Optional[int]
+    competition_rating: Optional[float]
+    global_ranking: Optional[int]
+    total_participants: Optional[int]
+    top_percentage: Optional[float]
+    competition_badge: Optional[str]
+    badges: List[ReadLeetcodeBadge] = []
+    tags: List[ReadLeetcodeTag] = []
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReadResume(BaseModel):
+    id: UUID
+    profile_id: Optional[UUID]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ----------------------
+# Aggregate Output DTO
+# ----------------------
+class ReadFullProfile(ReadProfile):
+    user_rel: Optional[ReadUser] = None
+    education: List[ReadEducation] = []
+    work_experience: List[ReadWorkExperienceWithLocation] = []
+    certifications: List[ReadCertification] = []
+    test_scores: List[ReadTestScore] = []
+    volunteering: List[ReadVolunteering] = []
+    publications: List[ReadPublication] = []
+    projects: List[ReadProject] = []
+    leetcode: Optional[ReadLeetcode] = None
+    resume: Optional[ReadResume] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,7 @@
 from typing import Optional, List
 from uuid import UUID
 from datetime import date, datetime
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from Schema.SQL.Enums.enums import EmploymentType, WorkLocationType, Domain, Tools
 
@@ -136,8 +136,7 @@ class ReadWorkExperience(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----------------------
@@ -147,8 +146,7 @@ class ReadWorkExperienceWithRelations(ReadWorkExperience):
     profile: Optional['ReadProfile'] = None
     location_rel: Optional['ReadLocation'] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Import here to avoid circular imports
@@ -0,0 +1,25 @@
+# schemas/bulk_schema.py
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel
+
+
+# ----------------------
+# Output DTOs
+# ----------------------
+class BulkCreatedRow(BaseModel):
+    index: int          # Position of the record in the request payload
+    id: UUID
+
+
+class BulkRowError(BaseModel):
+    index: int          # Position of the record in the request payload
+    code: str
+    error: str
+    detail: str
+
+
+class BulkCreateResult(BaseModel):
+    created: int
+    items: List[BulkCreatedRow]
+    errors: List[BulkRowError]
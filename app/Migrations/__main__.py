@@ -0,0 +1,46 @@
+# migrations/__main__.py
+# Usage (from the app directory):
+#   python -m Migrations upgrade [--to VERSION]
+#   python -m Migrations status
+import argparse
+import asyncio
+
+from db import ASYNC_DB, async_engine, engine
+from Migrations.runner import status, upgrade
+
+
+def _run(fn):
+    # Use whichever driver this deployment is configured for
+    if not ASYNC_DB:
+        with engine.connect() as connection:
+            return fn(connection)
+
+    async def run_async():
+        try:
+            async with async_engine.connect() as connection:
+                return await connection.run_sync(fn)
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run_async())
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m Migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = commands.add_parser("upgrade", help="Apply pending migrations")
+    upgrade_parser.add_argument("--to", type=int, default=None, help="Stop at this version")
+    commands.add_parser("status", help="List migrations and when they were applied")
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        version = _run(lambda connection: upgrade(connection, args.to))
+        print(f"Database schema is at version {version}")
+    else:
+        for row in _run(status):
+            applied = row["applied_at"] or "pending"
+            print(f"{row['version']:>4}  {applied!s:<32}  {row['description']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# migrations/runner.py
+import importlib
+import pkgutil
+from types import ModuleType
+from typing import List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection
+
+from Migrations import versions
+from Settings.logging_config import setup_logging
+
+logger = setup_logging()
+
+_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+# Serialises concurrent `upgrade` runs (e.g. several replicas deploying at once) on PostgreSQL
+_ADVISORY_LOCK_KEY = 5_318_008
+
+
+def load_migrations() -> List[ModuleType]:
+    """
+    Imports every module in Migrations/versions, ordered by VERSION.
+    Versions must be unique and contiguous from 1. v0001 creates fresh databases
+    from the current models, so every later upgrade must skip whatever already
+    exists and must not assume a table it did not create is there.
+    """
+    modules = [
+        importlib.import_module(f"{versions.__name__}.{info.name}")
+        for info in pkgutil.iter_modules(versions.__path__)
+    ]
+    modules.sort(key=lambda module: module.VERSION)
+    expected = list(range(1, len(modules) + 1))
+    found = [module.VERSION for module in modules]
+    if found != expected:
+        raise RuntimeError(f"Migration versions must be contiguous from 1, found {found}")
+    return modules
+
+
+def latest_version() -> int:
+    return len(load_migrations())
+
+
+def current_version(connection: Connection) -> int:
+    if not inspect(connection).has_table(schema_version.name):
+        return 0
+    return connection.execute(select(func.max(schema_version.c.version))).scalar() or 0
+
+
+def ensure_schema_version(connection: Connection):
+    """
+    Startup check: a single query against schema_version instead of
+    introspecting every table. Refuses to start on an outdated schema.
+    """
+    current = current_version(connection)
+    latest = latest_version()
+    if current < latest:
+        raise RuntimeError(
+            f"Database schema is at version {current}, this build expects {latest}. "
+            "Run `python -m Migrations upgrade` from the app directory."
+        )
+    if current > latest:
+        # Expected briefly during rolling deploys, when a newer build has already migrated
+        logger.warning(f"Database schema version {current} is newer than this build ({latest})")
+    logger.info(f"Database schema version {current} verified")
+
+
+def upgrade(connection: Connection, target: Optional[int] = None) -> int:
+    """
+    Applies pending migrations up to ``target`` (default: latest), each in its
+    own transaction together with its schema_version row. Returns the version
+    the database ends up at.
+    """
+    migrations = load_migrations()
+    target = target if target is not None else len(migrations)
+
+    _metadata.create_all(connection, checkfirst=True)
+    applied = current_version(connection)
+    connection.commit()
+
+    for migration in migrations:
+        if migration.VERSION <= applied or migration.VERSION > target:
+            continue
+        with connection.begin():
+            if connection.dialect.name == "postgresql":
+                connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+                # Another process may have applied it while we waited for the lock
+                if current_version(connection) >= migration.VERSION:
+                    continue
+            logger.info(f"Applying migration {migration.VERSION}: {migration.DESCRIPTION}")
+            migration.upgrade(connection)
+            connection.execute(
+                schema_version.insert().values(version=migration.VERSION, description=migration.DESCRIPTION)
+            )
+        applied = migration.VERSION
+
+    return current_version(connection)
+
+
+def status(connection: Connection) -> List[dict]:
+    applied = {}
+    if inspect(connection).has_table(schema_version.name):
+        applied = {row.version: row.applied_at for row in connection.execute(select(schema_version))}
+    return [
+        {"version": migration.VERSION, "description": migration.DESCRIPTION, "applied_at": applied.get(migration.VERSION)}
+        for migration in load_migrations()
+    ]
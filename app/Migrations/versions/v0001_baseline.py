@@ -0,0 +1,15 @@
+# migrations/versions/v0001_baseline.py
+from sqlmodel import SQLModel
+
+VERSION = 1
+DESCRIPTION = "Baseline schema (tables as previously created by create_all)"
+
+
+def upgrade(connection):
+    from Schema.SQL.Models import models  # Register every table on the metadata
+
+    # checkfirst leaves existing tables alone, so databases that were bootstrapped
+    # by the old create_all startup are simply stamped at version 1. A fresh
+    # database gets the current models here, later versions included, which is
+    # why every later migration has to be idempotent.
+    SQLModel.metadata.create_all(connection, checkfirst=True)
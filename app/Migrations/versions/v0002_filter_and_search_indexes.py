@@ -0,0 +1,58 @@
+# migrations/versions/v0002_filter_and_search_indexes.py
+from sqlalchemy import text
+
+VERSION = 2
+DESCRIPTION = "B-tree indexes on foreign keys, filter and keyset columns; pg_trgm GIN indexes for ilike search"
+
+# (index name, table, columns) for equality filters and foreign keys.
+# Profile.user_id is not listed: its unique constraint already provides an index.
+BTREE_INDEXES = [
+    ("ix_jobs_organization", "Jobs", "organization"),
+    ("ix_jobs_location_type", "Jobs", "location_type"),
+    ("ix_jobs_employment_type", "Jobs", "employment_type"),
+    ("ix_jobs_category", "Jobs", "category"),
+    ("ix_fellowships_organization", "Fellowships", "organization"),
+    ("ix_projects_opportunities_organization", "ProjectsOpportunities", "organization"),
+    ("ix_work_experience_profile_id", "WorkExperience", "profile_id"),
+    ("ix_work_experience_location", "WorkExperience", "location"),
+    ("ix_user_rank", "User", "rank"),
+    # Keyset pagination walks (created_at, id) on every list endpoint
+    ("ix_jobs_created_at_id", "Jobs", "created_at, id"),
+    ("ix_fellowships_created_at_id", "Fellowships", "created_at, id"),
+    ("ix_projects_opportunities_created_at_id", "ProjectsOpportunities", "created_at, id"),
+    ("ix_organizations_created_at_id", "Organizations", "created_at, id"),
+    ("ix_user_created_at_id", "User", "created_at, id"),
+    ("ix_profile_created_at_id", "Profile", "created_at, id"),
+    ("ix_location_created_at_id", "Location", "created_at, id"),
+    ("ix_work_experience_created_at_id", "WorkExperience", "created_at, id"),
+]
+
+# Columns searched with ilike('%q%') by the list filters and autocomplete defaults.
+# A leading wildcard cannot use a B-tree, a trigram GIN index can.
+TRGM_INDEXES = [
+    ("ix_jobs_title_trgm", "Jobs", "title"),
+    ("ix_jobs_location_trgm", "Jobs", "location"),
+    ("ix_fellowships_title_trgm", "Fellowships", "title"),
+    ("ix_fellowships_location_trgm", "Fellowships", "location"),
+    ("ix_projects_opportunities_title_trgm", "ProjectsOpportunities", "title"),
+    ("ix_user_first_name_trgm", "User", "first_name"),
+    ("ix_user_last_name_trgm", "User", "last_name"),
+    ("ix_user_github_user_name_trgm", "User", "github_user_name"),
+    ("ix_location_city_trgm", "Location", "city"),
+    ("ix_location_state_trgm", "Location", "state"),
+    ("ix_location_country_trgm", "Location", "country"),
+    ("ix_work_experience_title_trgm", "WorkExperience", "title"),
+    ("ix_work_experience_company_name_trgm", "WorkExperience", "company_name"),
+]
+
+
+def upgrade(connection):
+    for name, table, columns in BTREE_INDEXES:
+        connection.execute(text(f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" ({columns})'))
+
+    # pg_trgm is PostgreSQL only; other dialects (local sqlite) just get the B-tree indexes
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for name, table, column in TRGM_INDEXES:
+        connection.execute(text(f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" USING gin ({column} gin_trgm_ops)'))
@@ -0,0 +1,33 @@
+# migrations/versions/v0003_server_side_timestamps.py
+from sqlmodel import SQLModel
+from sqlalchemy import inspect, text
+
+VERSION = 3
+DESCRIPTION = "Database-side created_at/updated_at defaults, updated_at NOT NULL"
+
+_UTC_NOW = "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+def upgrade(connection):
+    # SQLite cannot alter column defaults; databases created by v0001 from the
+    # current models already carry them, so only PostgreSQL needs the ALTERs.
+    if connection.dialect.name != "postgresql":
+        return
+
+    from Schema.SQL.Models import models  # Register every table on the metadata
+
+    inspector = inspect(connection)
+    for table in SQLModel.metadata.sorted_tables:
+        if "created_at" not in table.c or "updated_at" not in table.c:
+            continue
+        # Tables added by later migrations (StatisticsSync, ...) do not exist yet
+        # on a database stamped at v0001 by the old create_all startup
+        if not inspector.has_table(table.name):
+            continue
+        connection.execute(text(f'UPDATE "{table.name}" SET updated_at = created_at WHERE updated_at IS NULL'))
+        connection.execute(text(
+            f'ALTER TABLE "{table.name}" '
+            f"ALTER COLUMN created_at SET DEFAULT {_UTC_NOW}, "
+            f"ALTER COLUMN updated_at SET DEFAULT {_UTC_NOW}, "
+            f"ALTER COLUMN updated_at SET NOT NULL"
+        ))
@@ -0,0 +1,16 @@
+# migrations/versions/v0004_statistics_sync.py
+from sqlalchemy import text
+
+VERSION = 4
+DESCRIPTION = "StatisticsSync table holding the background statistics scheduler's per-user state"
+
+
+def upgrade(connection):
+    from Schema.SQL.Models.models import StatisticsSync
+
+    StatisticsSync.__table__.create(connection, checkfirst=True)
+    # The scheduler claims due rows per source, oldest next_attempt_at first
+    connection.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_statistics_sync_source_next_attempt_at '
+        'ON "StatisticsSync" (source, next_attempt_at)'
+    ))
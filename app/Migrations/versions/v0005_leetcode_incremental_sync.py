@@ -0,0 +1,28 @@
+# migrations/versions/v0005_leetcode_incremental_sync.py
+from sqlalchemy import inspect, text
+
+VERSION = 5
+DESCRIPTION = "Leetcode.sync_hashes; unique (leetcode_id, tag_category, tag_name) on LeetcodeTags for upserts"
+
+
+def upgrade(connection):
+    # Databases created from the current models already have the column
+    if "sync_hashes" not in {column["name"] for column in inspect(connection).get_columns("Leetcode")}:
+        connection.execute(text('ALTER TABLE "Leetcode" ADD COLUMN sync_hashes JSON'))
+
+    # Keep one row per tag before the unique index goes on
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(
+            'DELETE FROM "LeetcodeTags" a USING "LeetcodeTags" b '
+            "WHERE a.leetcode_id = b.leetcode_id AND a.tag_category IS NOT DISTINCT FROM b.tag_category "
+            "AND a.tag_name IS NOT DISTINCT FROM b.tag_name AND a.ctid < b.ctid"
+        ))
+    else:
+        connection.execute(text(
+            'DELETE FROM "LeetcodeTags" WHERE rowid NOT IN '
+            '(SELECT MAX(rowid) FROM "LeetcodeTags" GROUP BY leetcode_id, tag_category, tag_name)'
+        ))
+    connection.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_leetcode_tags_leetcode_id_category_name "
+        'ON "LeetcodeTags" (leetcode_id, tag_category, tag_name)'
+    ))
@@ -0,0 +1,15 @@
+# migrations/versions/v0006_leetcode_contest_history.py
+from sqlalchemy import text
+
+VERSION = 6
+DESCRIPTION = "LeetcodeContestHistory table; Leetcode lookups by lower(lc_username)"
+
+
+def upgrade(connection):
+    from Schema.SQL.Models.models import LeetcodeContestHistory
+
+    LeetcodeContestHistory.__table__.create(connection, checkfirst=True)
+    # Contest history is requested by LeetCode username, case-insensitively
+    connection.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_leetcode_lower_lc_username ON "Leetcode" (lower(lc_username))'
+    ))
@@ -0,0 +1,25 @@
+# migrations/versions/v0007_profile_foreign_key_indexes.py
+from sqlalchemy import text
+
+VERSION = 7
+DESCRIPTION = "B-tree indexes on the profile_id and leetcode_id foreign keys read by the full profile load"
+
+# (index name, table, columns). GET /profile/{id}/full selects each collection with
+# WHERE <fk> IN (...). WorkExperience.profile_id is indexed by v0002, and
+# LeetcodeTags.leetcode_id leads v0005's unique (leetcode_id, tag_category, tag_name).
+BTREE_INDEXES = [
+    ("ix_education_profile_id", "Education", "profile_id"),
+    ("ix_certifications_profile_id", "Certifications", "profile_id"),
+    ("ix_test_scores_profile_id", "TestScores", "profile_id"),
+    ("ix_volunteering_profile_id", "Volunteering", "profile_id"),
+    ("ix_publications_profile_id", "Publications", "profile_id"),
+    ("ix_projects_profile_id", "Projects", "profile_id"),
+    ("ix_leetcode_profile_id", "Leetcode", "profile_id"),
+    ("ix_resume_profile_id", "Resume", "profile_id"),
+    ("ix_leetcode_badges_leetcode_id", "LeetcodeBadges", "leetcode_id"),
+]
+
+
+def upgrade(connection):
+    for name, table, columns in BTREE_INDEXES:
+        connection.execute(text(f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" ({columns})'))
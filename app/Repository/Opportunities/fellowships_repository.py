@@ -1,9 +1,41 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlmodel import Session, select
-from sqlalchemy import desc, asc
+from sqlmodel import Session, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from Schema.SQL.Models.models import Fellowship
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
+
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at")
+
+
+def _build_list_statement(
+    title: Optional[str] = None,
+    organization: Optional[UUID] = None,
+    location: Optional[str] = None,
+    featured: Optional[bool] = None,
+):
+    statement = select(Fellowship)
+
+    # Filtering
+    if title:
+        statement = statement.where(Fellowship.title.ilike(f"%{title}%"))
+    if organization:
+        statement = statement.where(Fellowship.organization == organization)
+    if location:
+        statement = statement.where(Fellowship.location.ilike(f"%{location}%"))
+    if featured is not None:
+        statement = statement.where(Fellowship.featured == featured)
+
+    return statement
+
+
+def _build_autocomplete_statement(query: str, field: str = "title", limit: int = 10):
+    field_column = getattr(Fellowship, field, Fellowship.title)
+    return select(Fellowship).where(field_column.ilike(f"%{query}%")).limit(limit)
 
 
 class FellowshipRepository:
@@ -12,11 +44,26 @@ class FellowshipRepository:
 
     def create(self, fellowship: Fellowship) -> Fellowship:
         try:
-            self.session.add(fellowship)
+            fellowship = self.session.exec(insert_returning(fellowship)).scalar_one()
             self.session.commit()
-            self.session.refresh(fellowship)
             return fellowship
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+    def bulk_create(self, fellowships: List[dict]) -> List[UUID]:
+        """
+        Inserts every row in one transaction. SQLAlchemy batches the executemany
+        into multi-row INSERT ... RETURNING statements; ids come back in input order.
+        """
+        if not fellowships:
+            return []
+        try:
+            statement = insert(Fellowship).returning(Fellowship.id, sort_by_parameter_order=True)
+            ids = self.session.exec(statement, params=fellowships).scalars().all()
+            self.session.commit()
+            return ids
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -34,43 +81,101 @@ class FellowshipRepository:
         organization: Optional[UUID] = None,
         location: Optional[str] = None,
         featured: Optional[bool] = None,
-    ) -> List[Fellowship]:
-        statement = select(Fellowship)
-
-        # Filtering
-        if title:
-            statement = statement.where(Fellowship.title.ilike(f"%{title}%"))
-        if organization:
-            statement = statement.where(Fellowship.organization == organization)
-        if location:
-            statement = statement.where(Fellowship.location.ilike(f"%{location}%"))
-        if featured is not None:
-            statement = statement.where(Fellowship.featured == featured)
-
-        # Sorting
-        sort_column = getattr(Fellowship, sort_by, Fellowship.created_at)
-        statement = statement.order_by(desc(sort_column) if order.lower() == "desc" else asc(sort_column))
-
-        # Pagination
-        statement = statement.offset(skip).limit(limit)
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Fellowship], Optional[str]]:
+        statement = _build_list_statement(title, organization, location, featured)
 
-        return self.session.exec(statement).all()
+        # Keyset pagination; skip is only honoured for legacy clients without a cursor
+        statement = apply_keyset(statement, Fellowship, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
-    def update(self, fellowship: Fellowship) -> Fellowship:
-        self.session.add(fellowship)
-        self.session.commit()
-        self.session.refresh(fellowship)
-        return fellowship
+    def update(self, fellowship_id: UUID, update_data: dict) -> Optional[Fellowship]:
+        try:
+            fellowship = self.session.exec(update_returning(Fellowship, fellowship_id, update_data)).scalar_one_or_none()
+            self.session.commit()
+            return fellowship
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
 
-    def delete(self, fellowship: Fellowship):
+    def delete(self, fellowship_id: UUID) -> bool:
         try:
-            self.session.delete(fellowship)
+            deleted_id = self.session.exec(delete_returning(Fellowship, fellowship_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
     def autocomplete(self, query: str, field: str = "title", limit: int = 10) -> List[Fellowship]:
-        field_column = getattr(Fellowship, field, Fellowship.title)
-        statement = select(Fellowship).where(field_column.ilike(f"%{query}%")).limit(limit)
+        statement = _build_autocomplete_statement(query, field, limit)
         return self.session.exec(statement).all()
+
+
+class AsyncFellowshipRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, fellowship: Fellowship) -> Fellowship:
+        try:
+            fellowship = (await self.session.exec(insert_returning(fellowship))).scalar_one()
+            await self.session.commit()
+            return fellowship
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def bulk_create(self, fellowships: List[dict]) -> List[UUID]:
+        if not fellowships:
+            return []
+        try:
+            statement = insert(Fellowship).returning(Fellowship.id, sort_by_parameter_order=True)
+            ids = (await self.session.exec(statement, params=fellowships)).scalars().all()
+            await self.session.commit()
+            return ids
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, fellowship_id: UUID) -> Optional[Fellowship]:
+        statement = select(Fellowship).where(Fellowship.id == fellowship_id)
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        title: Optional[str] = None,
+        organization: Optional[UUID] = None,
+        location: Optional[str] = None,
+        featured: Optional[bool] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Fellowship], Optional[str]]:
+        statement = _build_list_statement(title, organization, location, featured)
+        statement = apply_keyset(statement, Fellowship, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def update(self, fellowship_id: UUID, update_data: dict) -> Optional[Fellowship]:
+        try:
+            fellowship = (await self.session.exec(update_returning(Fellowship, fellowship_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return fellowship
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, fellowship_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(Fellowship, fellowship_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def autocomplete(self, query: str, field: str = "title", limit: int = 10) -> List[Fellowship]:
+        statement = _build_autocomplete_statement(query, field, limit)
+        return (await self.session.exec(statement)).all()
@@ -1,11 +1,53 @@
 # repositories/jobs_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlmodel import Session, select
-from sqlalchemy import asc, desc
+from sqlmodel import Session, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from Schema.SQL.Models.models import Job
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at")
+
+
+def _build_list_statement(
+    title: Optional[str] = None,
+    organization: Optional[UUID] = None,
+    location: Optional[str] = None,
+    location_type: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    category: Optional[str] = None,
+):
+    statement = select(Job)
+
+    # Filtering
+    if title:
+        statement = statement.where(Job.title.ilike(f"%{title}%"))
+    if organization:
+        statement = statement.where(Job.organization == organization)
+    if location:
+        statement = statement.where(Job.location.ilike(f"%{location}%"))
+    if location_type:
+        statement = statement.where(Job.location_type == location_type)
+    if employment_type:
+        statement = statement.where(Job.employment_type == employment_type)
+    if category:
+        statement = statement.where(Job.category == category)
+
+    return statement
+
+
+def _build_autocomplete_statement(query: str, field: str = "title", limit: int = 10):
+    field_column = getattr(Job, field, Job.title)
+    return (
+        select(Job)
+        .where(field_column.ilike(f"%{query}%"))
+        .limit(limit)
+    )
+
 
 class JobRepository:
     def __init__(self, session: Session):
@@ -13,11 +55,26 @@ class JobRepository:
 
     def create(self, job: Job) -> Job:
         try:
-            self.session.add(job)
+            job = self.session.exec(insert_returning(job)).scalar_one()
             self.session.commit()
-            self.session.refresh(job)
             return job
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+    def bulk_create(self, jobs: List[dict]) -> List[UUID]:
+        """
+        Inserts every row in one transaction. SQLAlchemy batches the executemany
+        into multi-row INSERT ... RETURNING statements; ids come back in input order.
+        """
+        if not jobs:
+            return []
+        try:
+            statement = insert(Job).returning(Job.id, sort_by_parameter_order=True)
+            ids = self.session.exec(statement, params=jobs).scalars().all()
+            self.session.commit()
+            return ids
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -37,61 +94,110 @@ class JobRepository:
         location_type: Optional[str] = None,
         employment_type: Optional[str] = None,
         category: Optional[str] = None,
-    ) -> List[Job]:
-        statement = select(Job)
-
-        # Filtering
-        if title:
-            statement = statement.where(Job.title.ilike(f"%{title}%"))
-        if organization:
-            statement = statement.where(Job.organization == organization)
-        if location:
-            statement = statement.where(Job.location.ilike(f"%{location}%"))
-        if location_type:
-            statement = statement.where(Job.location_type == location_type)
-        if employment_type:
-            statement = statement.where(Job.employment_type == employment_type)
-        if category:
-            statement = statement.where(Job.category == category)
-
-        # Sorting
-        sort_column = getattr(Job, sort_by, Job.created_at)
-        if order.lower() == "desc":
-            statement = statement.order_by(desc(sort_column))
-        else:
-            statement = statement.order_by(asc(sort_column))
-
-        # Pagination
-        statement = statement.offset(skip).limit(limit)
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Job], Optional[str]]:
+        statement = _build_list_statement(
+            title, organization, location, location_type, employment_type, category
+        )
 
-        return self.session.exec(statement).all()
+        # Keyset pagination; skip is only honoured for legacy clients without a cursor
+        statement = apply_keyset(statement, Job, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
     def autocomplete(self, query: str, field: str = "title", limit: int = 10) -> List[Job]:
         """
         Autocomplete based on a given field (default: title).
         """
-        field_column = getattr(Job, field, Job.title)
-        statement = (
-            select(Job)
-            .where(field_column.ilike(f"%{query}%"))
-            .limit(limit)
-        )
+        statement = _build_autocomplete_statement(query, field, limit)
         return self.session.exec(statement).all()
 
-    def update(self, job: Job) -> Job:
+    def update(self, job_id: UUID, update_data: dict) -> Optional[Job]:
         try:
-            self.session.add(job)
+            job = self.session.exec(update_returning(Job, job_id, update_data)).scalar_one_or_none()
             self.session.commit()
-            self.session.refresh(job)
             return job
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
-    def delete(self, job: Job):
+    def delete(self, job_id: UUID) -> bool:
         try:
-            self.session.delete(job)
+            deleted_id = self.session.exec(delete_returning(Job, job_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
             raise
+
+
+class AsyncJobRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, job: Job) -> Job:
+        try:
+            job = (await self.session.exec(insert_returning(job))).scalar_one()
+            await self.session.commit()
+            return job
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def bulk_create(self, jobs: List[dict]) -> List[UUID]:
+        if not jobs:
+            return []
+        try:
+            statement = insert(Job).returning(Job.id, sort_by_parameter_order=True)
+            ids = (await self.session.exec(statement, params=jobs)).scalars().all()
+            await self.session.commit()
+            return ids
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, job_id: UUID) -> Optional[Job]:
+        statement = select(Job).where(Job.id == job_id)
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        title: Optional[str] = None,
+        organization: Optional[UUID] = None,
+        location: Optional[str] = None,
+        location_type: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Job], Optional[str]]:
+        statement = _build_list_statement(
+            title, organization, location, location_type, employment_type, category
+        )
+        statement = apply_keyset(statement, Job, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def autocomplete(self, query: str, field: str = "title", limit: int = 10) -> List[Job]:
+        statement = _build_autocomplete_statement(query, field, limit)
+        return (await self.session.exec(statement)).all()
+
+    async def update(self, job_id: UUID, update_data: dict) -> Optional[Job]:
+        try:
+            job = (await self.session.exec(update_returning(Job, job_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return job
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, job_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(Job, job_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
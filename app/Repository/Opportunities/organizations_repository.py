@@ -1,34 +1,97 @@
 # repositories/organizations_repository.py
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Schema.SQL.Models.models import Organization
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at")
 
 class OrganizationRepository:
     def __init__(self, session: Session):
         self.session = session
 
     def create(self, organization: Organization) -> Organization:
-        self.session.add(organization)
+        organization = self.session.exec(insert_returning(organization)).scalar_one()
         self.session.commit()
-        self.session.refresh(organization)
         return organization
 
     def get(self, organization_id: UUID) -> Optional[Organization]:
         statement = select(Organization).where(Organization.id == organization_id)
         return self.session.exec(statement).first()
 
-    def list(self, skip: int = 0, limit: int = 100) -> List[Organization]:
-        statement = select(Organization).offset(skip).limit(limit)
-        return self.session.exec(statement).all()
+    def list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Organization], Optional[str]]:
+        statement = apply_keyset(select(Organization), Organization, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
+
+    def existing_ids(self, organization_ids: Iterable[UUID]) -> Set[UUID]:
+        """
+        Returns which of the given ids exist, using a single IN query.
+        """
+        organization_ids = set(organization_ids)
+        if not organization_ids:
+            return set()
+        statement = select(Organization.id).where(Organization.id.in_(organization_ids))
+        return set(self.session.exec(statement).all())
 
-    def update(self, organization: Organization) -> Organization:
-        self.session.add(organization)
+    def update(self, organization_id: UUID, update_data: dict) -> Optional[Organization]:
+        organization = self.session.exec(update_returning(Organization, organization_id, update_data)).scalar_one_or_none()
         self.session.commit()
-        self.session.refresh(organization)
         return organization
 
-    def delete(self, organization: Organization):
-        self.session.delete(organization)
+    def delete(self, organization_id: UUID) -> bool:
+        deleted_id = self.session.exec(delete_returning(Organization, organization_id)).scalar_one_or_none()
         self.session.commit()
+        return deleted_id is not None
+
+class AsyncOrganizationRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, organization: Organization) -> Organization:
+        organization = (await self.session.exec(insert_returning(organization))).scalar_one()
+        await self.session.commit()
+        return organization
+
+    async def get(self, organization_id: UUID) -> Optional[Organization]:
+        statement = select(Organization).where(Organization.id == organization_id)
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Organization], Optional[str]]:
+        statement = apply_keyset(select(Organization), Organization, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def existing_ids(self, organization_ids: Iterable[UUID]) -> Set[UUID]:
+        organization_ids = set(organization_ids)
+        if not organization_ids:
+            return set()
+        statement = select(Organization.id).where(Organization.id.in_(organization_ids))
+        return set((await self.session.exec(statement)).all())
+
+    async def update(self, organization_id: UUID, update_data: dict) -> Optional[Organization]:
+        organization = (await self.session.exec(update_returning(Organization, organization_id, update_data))).scalar_one_or_none()
+        await self.session.commit()
+        return organization
+
+    async def delete(self, organization_id: UUID) -> bool:
+        deleted_id = (await self.session.exec(delete_returning(Organization, organization_id))).scalar_one_or_none()
+        await self.session.commit()
+        return deleted_id is not None
@@ -1,21 +1,63 @@
 # repositories/projects_opportunities_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlmodel import Session, select
+from sqlmodel import Session, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Schema.SQL.Models.models import ProjectsOpportunities
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
 from sqlalchemy.exc import SQLAlchemyError
 
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at")
+
+
+def _build_list_statement(filters: dict = {}):
+    statement = select(ProjectsOpportunities)
+
+    for field, value in filters.items():
+        if value is not None:
+            column = getattr(ProjectsOpportunities, field, None)
+            if column is not None:
+                statement = statement.where(column == value)
+
+    return statement
+
+
+def _build_autocomplete_statement(query: str, field: str = "title", limit: int = 10):
+    column = getattr(ProjectsOpportunities, field, None)
+    if column is None:
+        column = ProjectsOpportunities.title
+    return select(ProjectsOpportunities).where(column.ilike(f"%{query}%")).limit(limit)
+
+
 class ProjectsOpportunitiesRepository:
     def __init__(self, session: Session):
         self.session = session
 
     def create(self, project: ProjectsOpportunities) -> ProjectsOpportunities:
         try:
-            self.session.add(project)
+            project = self.session.exec(insert_returning(project)).scalar_one()
             self.session.commit()
-            self.session.refresh(project)
             return project
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+    def bulk_create(self, projects: List[dict]) -> List[UUID]:
+        """
+        Inserts every row in one transaction. SQLAlchemy batches the executemany
+        into multi-row INSERT ... RETURNING statements; ids come back in input order.
+        """
+        if not projects:
+            return []
+        try:
+            statement = insert(ProjectsOpportunities).returning(ProjectsOpportunities.id, sort_by_parameter_order=True)
+            ids = self.session.exec(statement, params=projects).scalars().all()
+            self.session.commit()
+            return ids
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -29,45 +71,96 @@ class ProjectsOpportunitiesRepository:
         limit: int = 100,
         filters: dict = {},
         sort_by: str = "created_at",
-        order: str = "desc"
-    ) -> List[ProjectsOpportunities]:
-        statement = select(ProjectsOpportunities)
-        
-        for field, value in filters.items():
-            if value is not None:
-                column = getattr(ProjectsOpportunities, field, None)
-                if column is not None:
-                    statement = statement.where(column == value)
-        
-        if order.lower() == "desc":
-            statement = statement.order_by(getattr(ProjectsOpportunities, sort_by).desc())
-        else:
-            statement = statement.order_by(getattr(ProjectsOpportunities, sort_by).asc())
-        
-        statement = statement.offset(skip).limit(limit)
-        return self.session.exec(statement).all()
+        order: str = "desc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProjectsOpportunities], Optional[str]]:
+        statement = _build_list_statement(filters)
+        statement = apply_keyset(statement, ProjectsOpportunities, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
     def autocomplete(self, query: str, field: str = "title", limit: int = 10):
-        column = getattr(ProjectsOpportunities, field, None)
-        if column is None:
-            column = ProjectsOpportunities.title
-        statement = select(ProjectsOpportunities).where(column.ilike(f"%{query}%")).limit(limit)
+        statement = _build_autocomplete_statement(query, field, limit)
         return self.session.exec(statement).all()
 
-    def update(self, project: ProjectsOpportunities) -> ProjectsOpportunities:
+    def update(self, project_id: UUID, update_data: dict) -> Optional[ProjectsOpportunities]:
         try:
-            self.session.add(project)
+            project = self.session.exec(update_returning(ProjectsOpportunities, project_id, update_data)).scalar_one_or_none()
             self.session.commit()
-            self.session.refresh(project)
             return project
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
-    def delete(self, project: ProjectsOpportunities):
+    def delete(self, project_id: UUID) -> bool:
         try:
-            self.session.delete(project)
+            deleted_id = self.session.exec(delete_returning(ProjectsOpportunities, project_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
             raise
+
+
+class AsyncProjectsOpportunitiesRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, project: ProjectsOpportunities) -> ProjectsOpportunities:
+        try:
+            project = (await self.session.exec(insert_returning(project))).scalar_one()
+            await self.session.commit()
+            return project
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def bulk_create(self, projects: List[dict]) -> List[UUID]:
+        if not projects:
+            return []
+        try:
+            statement = insert(ProjectsOpportunities).returning(ProjectsOpportunities.id, sort_by_parameter_order=True)
+            ids = (await self.session.exec(statement, params=projects)).scalars().all()
+            await self.session.commit()
+            return ids
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, project_id: UUID) -> Optional[ProjectsOpportunities]:
+        statement = select(ProjectsOpportunities).where(ProjectsOpportunities.id == project_id)
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict = {},
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProjectsOpportunities], Optional[str]]:
+        statement = _build_list_statement(filters)
+        statement = apply_keyset(statement, ProjectsOpportunities, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def autocomplete(self, query: str, field: str = "title", limit: int = 10):
+        statement = _build_autocomplete_statement(query, field, limit)
+        return (await self.session.exec(statement)).all()
+
+    async def update(self, project_id: UUID, update_data: dict) -> Optional[ProjectsOpportunities]:
+        try:
+            project = (await self.session.exec(update_returning(ProjectsOpportunities, project_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return project
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, project_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(ProjectsOpportunities, project_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
@@ -0,0 +1,143 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func
+from sqlmodel import Session, insert, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from Schema.SQL.Models.models import Github, Profile, Projects, User
+from Utils.Helpers.github_helpers import PROJECT_SYNC_COLUMNS
+from Utils.returning import insert_values
+from sqlalchemy.exc import SQLAlchemyError
+
+
+def _profile_ids_statement(user_names: Iterable[str]):
+    # GitHub logins are case-insensitive, and users may have registered in any case
+    return (
+        select(func.lower(User.github_user_name), Profile.id)
+        .join(Profile, Profile.user_id == User.id)
+        .where(func.lower(User.github_user_name).in_([name.lower() for name in user_names]))
+    )
+
+
+def _existing_github_statement(user_names: List[str]):
+    return select(Github.user_name, Github.id).where(Github.user_name.in_(user_names))
+
+
+def _stored_github_statement(user_name: str):
+    return select(Github).where(func.lower(Github.user_name) == user_name.lower()).limit(1)
+
+
+def _stored_projects_statement(owner: str):
+    return select(Projects).where(Projects.owner == owner).order_by(Projects.name)
+
+
+def _existing_projects_statement(owners: List[str]):
+    return select(Projects.owner, Projects.name, Projects.id).where(Projects.owner.in_(owners))
+
+
+def _split_github_rows(rows: List[dict], existing: Dict[str, UUID]) -> Tuple[List[dict], List[dict]]:
+    inserts = [insert_values(Github(**row)) for row in rows if row["user_name"] not in existing]
+    updates = [{"id": existing[row["user_name"]], **row} for row in rows if row["user_name"] in existing]
+    return inserts, updates
+
+
+def _split_project_rows(rows: List[dict], existing: Dict[Tuple[str, str], UUID]) -> Tuple[List[dict], List[dict]]:
+    inserts, updates = [], []
+    for row in rows:
+        project_id = existing.get((row["owner"], row["name"]))
+        if project_id is None:
+            inserts.append(insert_values(Projects(**row)))
+        else:
+            # Hand-curated columns (description, domain, tools, ...) are left alone
+            updates.append({"id": project_id, **{column: row[column] for column in PROJECT_SYNC_COLUMNS}})
+    return inserts, updates
+
+
+class GithubRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def profile_ids(self, user_names: Iterable[str]) -> Dict[str, UUID]:
+        """
+        Profile id per lower-cased GitHub username, for users that have a profile.
+        """
+        return dict(self.session.exec(_profile_ids_statement(user_names)).all())
+
+    def stored_stats(self, user_name: str) -> Optional[Tuple[Github, List[Projects]]]:
+        """
+        The stored Github row for ``user_name`` (case-insensitive) and its Projects.
+        """
+        github = self.session.exec(_stored_github_statement(user_name)).first()
+        if github is None:
+            return None
+        return github, self.session.exec(_stored_projects_statement(github.user_name)).all()
+
+    def save_stats(self, github_rows: List[dict], project_rows: List[dict]) -> int:
+        """
+        Upserts Github rows by user_name and their Projects by (owner, name) in one
+        transaction: one lookup per table, then executemany INSERTs for new rows and
+        bulk UPDATEs by primary key for existing ones. Returns the projects written.
+        """
+        if not github_rows:
+            return 0
+        try:
+            existing = dict(self.session.exec(_existing_github_statement([row["user_name"] for row in github_rows])).all())
+            inserts, updates = _split_github_rows(github_rows, existing)
+            if inserts:
+                self.session.exec(insert(Github), params=inserts)
+            if updates:
+                self.session.exec(update(Github), params=updates)
+
+            if project_rows:
+                owners = list({row["owner"] for row in project_rows})
+                existing = {(owner, name): project_id for owner, name, project_id in self.session.exec(_existing_projects_statement(owners)).all()}
+                inserts, updates = _split_project_rows(project_rows, existing)
+                if inserts:
+                    self.session.exec(insert(Projects), params=inserts)
+                if updates:
+                    self.session.exec(update(Projects), params=updates)
+
+            self.session.commit()
+            return len(project_rows)
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+
+class AsyncGithubRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def profile_ids(self, user_names: Iterable[str]) -> Dict[str, UUID]:
+        return dict((await self.session.exec(_profile_ids_statement(user_names))).all())
+
+    async def stored_stats(self, user_name: str) -> Optional[Tuple[Github, List[Projects]]]:
+        github = (await self.session.exec(_stored_github_statement(user_name))).first()
+        if github is None:
+            return None
+        return github, (await self.session.exec(_stored_projects_statement(github.user_name))).all()
+
+    async def save_stats(self, github_rows: List[dict], project_rows: List[dict]) -> int:
+        if not github_rows:
+            return 0
+        try:
+            existing = dict((await self.session.exec(_existing_github_statement([row["user_name"] for row in github_rows]))).all())
+            inserts, updates = _split_github_rows(github_rows, existing)
+            if inserts:
+                await self.session.exec(insert(Github), params=inserts)
+            if updates:
+                await self.session.exec(update(Github), params=updates)
+
+            if project_rows:
+                owners = list({row["owner"] for row in project_rows})
+                existing = {(owner, name): project_id for owner, name, project_id in (await self.session.exec(_existing_projects_statement(owners))).all()}
+                inserts, updates = _split_project_rows(project_rows, existing)
+                if inserts:
+                    await self.session.exec(insert(Projects), params=inserts)
+                if updates:
+                    await self.session.exec(update(Projects), params=updates)
+
+            await self.session.commit()
+            return len(project_rows)
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
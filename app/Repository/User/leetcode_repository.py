@@ -0,0 +1,242 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func
+from sqlmodel import Session, delete, insert, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from Schema.SQL.Models.models import Leetcode, LeetcodeBadges, LeetcodeContestHistory, LeetcodeTags
+from Utils.Helpers.leetcode_helpers import LEETCODE_SECTIONS, _diff_badges, _diff_tags, _history_values, _section_hashes
+from Utils.returning import insert_values, upsert
+from sqlalchemy.exc import SQLAlchemyError
+
+TAG_CONFLICT_COLUMNS = ["leetcode_id", "tag_category", "tag_name"]
+
+
+def _existing_leetcode_statement(profile_ids: List[UUID]):
+    return select(Leetcode.profile_id, Leetcode.id, Leetcode.sync_hashes).where(Leetcode.profile_id.in_(profile_ids))
+
+
+def _contest_history_statement(lc_username: str):
+    return (
+        select(LeetcodeContestHistory)
+        .join(Leetcode, Leetcode.id == LeetcodeContestHistory.leetcode_id)
+        .where(func.lower(Leetcode.lc_username) == lc_username.lower())
+        .limit(1)
+    )
+
+
+def _stored_leetcode_statement(lc_username: str):
+    return select(Leetcode).where(func.lower(Leetcode.lc_username) == lc_username.lower()).limit(1)
+
+
+def _plan_stats(entries: List[dict], existing: Dict[UUID, Tuple[UUID, dict]]):
+    """
+    Compares each entry ({"profile_id", "leetcode", "badges", "tags", "history"}) with the
+    stored section hashes. Returns the Leetcode rows to insert, the partial updates by
+    primary key (changed sections plus the new hashes), and the entries per Leetcode id
+    whose badges, tags and contest history need diffing. Entries where nothing changed
+    produce nothing.
+    """
+    inserts, updates, badge_entries, tag_entries, history_entries = [], [], {}, {}, {}
+    for entry in entries:
+        hashes = _section_hashes(entry)
+        leetcode_id, stored = existing.get(entry["profile_id"], (None, None))
+        if leetcode_id is None:
+            row = insert_values(Leetcode(profile_id=entry["profile_id"], sync_hashes=hashes, **entry["leetcode"]))
+            inserts.append(row)
+            badge_entries[row["id"]] = tag_entries[row["id"]] = entry
+            if "history" in hashes:
+                history_entries[row["id"]] = entry
+            continue
+
+        stored = stored or {}
+        changed = [section for section, digest in hashes.items() if stored.get(section) != digest]
+        if not changed:
+            continue
+        # A fetch without contest history keeps the stored history hash
+        values = {"id": leetcode_id, "sync_hashes": {**stored, **hashes}}
+        for section in changed:
+            values.update({column: entry["leetcode"][column] for column in LEETCODE_SECTIONS.get(section, ())})
+        updates.append(values)
+        if "badges" in changed:
+            badge_entries[leetcode_id] = entry
+        if "tags" in changed:
+            tag_entries[leetcode_id] = entry
+        if "history" in changed:
+            history_entries[leetcode_id] = entry
+    return inserts, updates, badge_entries, tag_entries, history_entries
+
+
+def _plan_children(badge_entries: Dict[UUID, dict], tag_entries: Dict[UUID, dict], stored_badges: List, stored_tags: List):
+    """
+    Minimal child row changes: badge ids to delete and rows to insert, tag ids to
+    delete and rows to upsert (new tags and changed counts).
+    """
+    badges_by_owner, tags_by_owner = {}, {}
+    for row in stored_badges:
+        badges_by_owner.setdefault(row.leetcode_id, []).append(row)
+    for row in stored_tags:
+        tags_by_owner.setdefault(row.leetcode_id, []).append(row)
+
+    badge_deletes, badge_inserts, tag_deletes, tag_upserts = [], [], [], []
+    for leetcode_id, entry in badge_entries.items():
+        deletes, new = _diff_badges(badges_by_owner.get(leetcode_id, []), entry["badges"])
+        badge_deletes.extend(deletes)
+        badge_inserts.extend(insert_values(LeetcodeBadges(leetcode_id=leetcode_id, **badge)) for badge in new)
+    for leetcode_id, entry in tag_entries.items():
+        deletes, changed = _diff_tags(tags_by_owner.get(leetcode_id, []), entry["tags"])
+        tag_deletes.extend(deletes)
+        tag_upserts.extend(insert_values(LeetcodeTags(leetcode_id=leetcode_id, **tag)) for tag in changed)
+    return badge_deletes, badge_inserts, tag_deletes, tag_upserts
+
+
+def _plan_history(history_entries: Dict[UUID, dict], stored_history: List):
+    """
+    LeetcodeContestHistory rows to insert for users without one, and updates by primary
+    key that append the contests newer than each stored row's last_start_time.
+    """
+    stored_by_owner = {row.leetcode_id: row for row in stored_history}
+    inserts, updates = [], []
+    for leetcode_id, entry in history_entries.items():
+        stored = stored_by_owner.get(leetcode_id)
+        values = _history_values(stored, entry["history"])
+        if values is None:
+            continue
+        if stored is None:
+            inserts.append(insert_values(LeetcodeContestHistory(leetcode_id=leetcode_id, **values)))
+        else:
+            updates.append({"id": stored.id, **values})
+    return inserts, updates
+
+
+class LeetcodeRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save_stats(self, entries: List[dict]) -> int:
+        """
+        Stores each profile's LeetCode data in one transaction, writing only what
+        changed: Leetcode columns of changed sections, minimal badge and tag
+        insert/delete sets, with tags upserted on (leetcode_id, tag_category, tag_name),
+        and newly attended contests appended to LeetcodeContestHistory.
+        Returns the number of profiles that had changes.
+        """
+        if not entries:
+            return 0
+        try:
+            existing = {
+                profile_id: (leetcode_id, hashes)
+                for profile_id, leetcode_id, hashes in self.session.exec(_existing_leetcode_statement([entry["profile_id"] for entry in entries])).all()
+            }
+            inserts, updates, badge_entries, tag_entries, history_entries = _plan_stats(entries, existing)
+            if not (inserts or updates):
+                return 0
+
+            stored_badges = stored_tags = []
+            if badge_entries:
+                stored_badges = self.session.exec(select(LeetcodeBadges).where(LeetcodeBadges.leetcode_id.in_(list(badge_entries)))).all()
+            if tag_entries:
+                stored_tags = self.session.exec(select(LeetcodeTags).where(LeetcodeTags.leetcode_id.in_(list(tag_entries)))).all()
+            badge_deletes, badge_inserts, tag_deletes, tag_upserts = _plan_children(badge_entries, tag_entries, stored_badges, stored_tags)
+            stored_history = []
+            if history_entries:
+                stored_history = self.session.exec(select(LeetcodeContestHistory).where(LeetcodeContestHistory.leetcode_id.in_(list(history_entries)))).all()
+            history_inserts, history_updates = _plan_history(history_entries, stored_history)
+
+            if inserts:
+                self.session.exec(insert(Leetcode), params=inserts)
+            if updates:
+                self.session.exec(update(Leetcode), params=updates)
+            if badge_deletes:
+                self.session.exec(delete(LeetcodeBadges).where(LeetcodeBadges.id.in_(badge_deletes)))
+            if badge_inserts:
+                self.session.exec(insert(LeetcodeBadges), params=badge_inserts)
+            if tag_deletes:
+                self.session.exec(delete(LeetcodeTags).where(LeetcodeTags.id.in_(tag_deletes)))
+            if tag_upserts:
+                statement = upsert(self.session.get_bind().dialect.name, LeetcodeTags, TAG_CONFLICT_COLUMNS, ["problems_solved"])
+                self.session.exec(statement, params=tag_upserts)
+            if history_inserts:
+                self.session.exec(insert(LeetcodeContestHistory), params=history_inserts)
+            if history_updates:
+                self.session.exec(update(LeetcodeContestHistory), params=history_updates)
+            self.session.commit()
+            return len(inserts) + len(updates)
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+    def contest_history(self, lc_username: str) -> Optional[LeetcodeContestHistory]:
+        return self.session.exec(_contest_history_statement(lc_username)).first()
+
+    def stored_stats(self, lc_username: str) -> Optional[Tuple[Leetcode, List[LeetcodeBadges], List[LeetcodeTags]]]:
+        """
+        The stored Leetcode row for ``lc_username`` (case-insensitive) with its badges and tags.
+        """
+        leetcode = self.session.exec(_stored_leetcode_statement(lc_username)).first()
+        if leetcode is None:
+            return None
+        badges = self.session.exec(select(LeetcodeBadges).where(LeetcodeBadges.leetcode_id == leetcode.id)).all()
+        tags = self.session.exec(select(LeetcodeTags).where(LeetcodeTags.leetcode_id == leetcode.id)).all()
+        return leetcode, badges, tags
+
+
+class AsyncLeetcodeRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save_stats(self, entries: List[dict]) -> int:
+        if not entries:
+            return 0
+        try:
+            existing = {
+                profile_id: (leetcode_id, hashes)
+                for profile_id, leetcode_id, hashes in (await self.session.exec(_existing_leetcode_statement([entry["profile_id"] for entry in entries]))).all()
+            }
+            inserts, updates, badge_entries, tag_entries, history_entries = _plan_stats(entries, existing)
+            if not (inserts or updates):
+                return 0
+
+            stored_badges = stored_tags = []
+            if badge_entries:
+                stored_badges = (await self.session.exec(select(LeetcodeBadges).where(LeetcodeBadges.leetcode_id.in_(list(badge_entries))))).all()
+            if tag_entries:
+                stored_tags = (await self.session.exec(select(LeetcodeTags).where(LeetcodeTags.leetcode_id.in_(list(tag_entries))))).all()
+            badge_deletes, badge_inserts, tag_deletes, tag_upserts = _plan_children(badge_entries, tag_entries, stored_badges, stored_tags)
+            stored_history = []
+            if history_entries:
+                stored_history = (await self.session.exec(select(LeetcodeContestHistory).where(LeetcodeContestHistory.leetcode_id.in_(list(history_entries))))).all()
+            history_inserts, history_updates = _plan_history(history_entries, stored_history)
+
+            if inserts:
+                await self.session.exec(insert(Leetcode), params=inserts)
+            if updates:
+                await self.session.exec(update(Leetcode), params=updates)
+            if badge_deletes:
+                await self.session.exec(delete(LeetcodeBadges).where(LeetcodeBadges.id.in_(badge_deletes)))
+            if badge_inserts:
+                await self.session.exec(insert(LeetcodeBadges), params=badge_inserts)
+            if tag_deletes:
+                await self.session.exec(delete(LeetcodeTags).where(LeetcodeTags.id.in_(tag_deletes)))
+            if tag_upserts:
+                statement = upsert(self.session.get_bind().dialect.name, LeetcodeTags, TAG_CONFLICT_COLUMNS, ["problems_solved"])
+                await self.session.exec(statement, params=tag_upserts)
+            if history_inserts:
+                await self.session.exec(insert(LeetcodeContestHistory), params=history_inserts)
+            if history_updates:
+                await self.session.exec(update(LeetcodeContestHistory), params=history_updates)
+            await self.session.commit()
+            return len(inserts) + len(updates)
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def contest_history(self, lc_username: str) -> Optional[LeetcodeContestHistory]:
+        return (await self.session.exec(_contest_history_statement(lc_username))).first()
+
+    async def stored_stats(self, lc_username: str) -> Optional[Tuple[Leetcode, List[LeetcodeBadges], List[LeetcodeTags]]]:
+        leetcode = (await self.session.exec(_stored_leetcode_statement(lc_username))).first()
+        if leetcode is None:
+            return None
+        badges = (await self.session.exec(select(LeetcodeBadges).where(LeetcodeBadges.leetcode_id == leetcode.id))).all()
+        tags = (await self.session.exec(select(LeetcodeTags).where(LeetcodeTags.leetcode_id == leetcode.id))).all()
+        return leetcode, badges, tags
@@ -1,21 +1,54 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlmodel import Session, select
-from sqlalchemy import asc, desc
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Schema.SQL.Models.models import Location
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
 from sqlalchemy.exc import SQLAlchemyError
 
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at", "city", "country")
+
+
+def _build_list_statement(
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    country: Optional[str] = None,
+):
+    statement = select(Location)
+
+    # Filtering
+    if city:
+        statement = statement.where(Location.city.ilike(f"%{city}%"))
+    if state:
+        statement = statement.where(Location.state.ilike(f"%{state}%"))
+    if country:
+        statement = statement.where(Location.country.ilike(f"%{country}%"))
+
+    return statement
+
+
+def _build_autocomplete_statement(query: str, field: str = "city", limit: int = 10):
+    field_column = getattr(Location, field, Location.city)
+    return (
+        select(Location)
+        .where(field_column.ilike(f"%{query}%"))
+        .limit(limit)
+    )
+
+
 class LocationRepository:
     def __init__(self, session: Session):
         self.session = session
 
     def create(self, location: Location) -> Location:
         try:
-            self.session.add(location)
+            location = self.session.exec(insert_returning(location)).scalar_one()
             self.session.commit()
-            self.session.refresh(location)
             return location
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -32,55 +65,91 @@ class LocationRepository:
         city: Optional[str] = None,
         state: Optional[str] = None,
         country: Optional[str] = None,
-    ) -> List[Location]:
-        statement = select(Location)
-
-        # Filtering
-        if city:
-            statement = statement.where(Location.city.ilike(f"%{city}%"))
-        if state:
-            statement = statement.where(Location.state.ilike(f"%{state}%"))
-        if country:
-            statement = statement.where(Location.country.ilike(f"%{country}%"))
-
-        # Sorting
-        sort_column = getattr(Location, sort_by, Location.created_at)
-        if order.lower() == "desc":
-            statement = statement.order_by(desc(sort_column))
-        else:
-            statement = statement.order_by(asc(sort_column))
-
-        # Pagination
-        statement = statement.offset(skip).limit(limit)
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
+        statement = _build_list_statement(city, state, country)
 
-        return self.session.exec(statement).all()
+        # Keyset pagination; skip is only honoured for legacy clients without a cursor
+        statement = apply_keyset(statement, Location, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
     def autocomplete(self, query: str, field: str = "city", limit: int = 10) -> List[Location]:
         """
         Autocomplete based on a given field (default: city).
         """
-        field_column = getattr(Location, field, Location.city)
-        statement = (
-            select(Location)
-            .where(field_column.ilike(f"%{query}%"))
-            .limit(limit)
-        )
+        statement = _build_autocomplete_statement(query, field, limit)
         return self.session.exec(statement).all()
 
-    def update(self, location: Location) -> Location:
+    def update(self, location_id: UUID, update_data: dict) -> Optional[Location]:
         try:
-            self.session.add(location)
+            location = self.session.exec(update_returning(Location, location_id, update_data)).scalar_one_or_none()
             self.session.commit()
-            self.session.refresh(location)
             return location
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
-    def delete(self, location: Location):
+    def delete(self, location_id: UUID) -> bool:
         try:
-            self.session.delete(location)
+            deleted_id = self.session.exec(delete_returning(Location, location_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
-            raise
\ No newline at end of file
+            raise
+
+
+class AsyncLocationRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, location: Location) -> Location:
+        try:
+            location = (await self.session.exec(insert_returning(location))).scalar_one()
+            await self.session.commit()
+            return location
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, location_id: UUID) -> Optional[Location]:
+        statement = select(Location).where(Location.id == location_id)
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        country: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
+        statement = _build_list_statement(city, state, country)
+        statement = apply_keyset(statement, Location, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def autocomplete(self, query: str, field: str = "city", limit: int = 10) -> List[Location]:
+        statement = _build_autocomplete_statement(query, field, limit)
+        return (await self.session.exec(statement)).all()
+
+    async def update(self, location_id: UUID, update_data: dict) -> Optional[Location]:
+        try:
+            location = (await self.session.exec(update_returning(Location, location_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return location
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, location_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(Location, location_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
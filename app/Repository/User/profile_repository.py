@@ -1,9 +1,59 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlmodel import Session, select
-from sqlalchemy import asc, desc
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from Schema.SQL.Models.models import Profile
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from Schema.SQL.Models.models import Education, Leetcode, Profile, WorkExperience
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
+
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at")
+
+
+def _build_list_statement(
+    user_id: Optional[UUID] = None,
+):
+    statement = select(Profile)
+
+    # Filtering
+    if user_id:
+        statement = statement.where(Profile.user_id == user_id)
+
+    return statement
+
+
+def _build_full_statement(profile_id: UUID):
+    """
+    Loads the whole profile aggregate in 10 queries whatever the row counts: one for the
+    profile with its user, leetcode and resume joined, one per collection (locations are
+    joined in), and one each for the leetcode badges and tags. raiseload("*") turns any
+    relationship left off this list into an error instead of a silent lazy load per row.
+    """
+    return (
+        select(Profile)
+        .where(Profile.id == profile_id)
+        .options(
+            joinedload(Profile.user_rel).raiseload("*"),
+            selectinload(Profile.education).options(joinedload(Education.location_rel).raiseload("*"), raiseload("*")),
+            selectinload(Profile.work_experience).options(joinedload(WorkExperience.location_rel).raiseload("*"), raiseload("*")),
+            selectinload(Profile.certifications).raiseload("*"),
+            selectinload(Profile.test_scores).raiseload("*"),
+            selectinload(Profile.volunteering).raiseload("*"),
+            selectinload(Profile.publications).raiseload("*"),
+            selectinload(Profile.projects).raiseload("*"),
+            joinedload(Profile.leetcode).options(
+                selectinload(Leetcode.badges).raiseload("*"),
+                selectinload(Leetcode.tags).raiseload("*"),
+                raiseload("*"),
+            ),
+            joinedload(Profile.resume).raiseload("*"),
+            raiseload("*"),
+        )
+    )
+
 
 class ProfileRepository:
     def __init__(self, session: Session):
@@ -11,11 +61,10 @@ class ProfileRepository:
 
     def create(self, profile: Profile) -> Profile:
         try:
-            self.session.add(profile)
+            profile = self.session.exec(insert_returning(profile)).scalar_one()
             self.session.commit()
-            self.session.refresh(profile)
             return profile
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -34,44 +83,94 @@ class ProfileRepository:
         sort_by: str = "created_at",
         order: str = "desc",
         user_id: Optional[UUID] = None,
-    ) -> List[Profile]:
-        statement = select(Profile)
-
-        # Filtering
-        if user_id:
-            statement = statement.where(Profile.user_id == user_id)
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Profile], Optional[str]]:
+        statement = _build_list_statement(user_id)
 
-        # Sorting
-        sort_column = getattr(Profile, sort_by, Profile.created_at)
-        if order.lower() == "desc":
-            statement = statement.order_by(desc(sort_column))
-        else:
-            statement = statement.order_by(asc(sort_column))
+        # Keyset pagination; skip is only honoured for legacy clients without a cursor
+        statement = apply_keyset(statement, Profile, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
 
-        # Pagination
-        statement = statement.offset(skip).limit(limit)
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
-        return self.session.exec(statement).all()
-
-    def update(self, profile: Profile) -> Profile:
+    def update(self, profile_id: UUID, update_data: dict) -> Optional[Profile]:
         try:
-            self.session.add(profile)
+            profile = self.session.exec(update_returning(Profile, profile_id, update_data)).scalar_one_or_none()
             self.session.commit()
-            self.session.refresh(profile)
             return profile
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
-    def delete(self, profile: Profile):
+    def delete(self, profile_id: UUID) -> bool:
         try:
-            self.session.delete(profile)
+            deleted_id = self.session.exec(delete_returning(Profile, profile_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
     # Secondary Methods
+    def get_full(self, profile_id: UUID) -> Optional[Profile]:
+        return self.session.exec(_build_full_statement(profile_id)).unique().first()
+
     def get_with_user_details(self, profile_id: UUID) -> Optional[Profile]:
         statement = select(Profile).where(Profile.id == profile_id)
-        return self.session.exec(statement).first()
\ No newline at end of file
+        return self.session.exec(statement).first()
+
+
+class AsyncProfileRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, profile: Profile) -> Profile:
+        try:
+            profile = (await self.session.exec(insert_returning(profile))).scalar_one()
+            await self.session.commit()
+            return profile
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, profile_id: UUID) -> Optional[Profile]:
+        statement = select(Profile).where(Profile.id == profile_id)
+        return (await self.session.exec(statement)).first()
+
+    async def get_by_user_id(self, user_id: UUID) -> Optional[Profile]:
+        statement = select(Profile).where(Profile.user_id == user_id)
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        user_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Profile], Optional[str]]:
+        statement = _build_list_statement(user_id)
+        statement = apply_keyset(statement, Profile, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def update(self, profile_id: UUID, update_data: dict) -> Optional[Profile]:
+        try:
+            profile = (await self.session.exec(update_returning(Profile, profile_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return profile
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, profile_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(Profile, profile_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    # Secondary Methods
+    async def get_full(self, profile_id: UUID) -> Optional[Profile]:
+        return (await self.session.exec(_build_full_statement(profile_id))).unique().first()
@@ -0,0 +1,158 @@
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+from sqlalchemy import func, or_
+from sqlmodel import Session, insert, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from Schema.SQL.Enums.enums import SyncSource
+from Schema.SQL.Models.models import Links, Profile, StatisticsSync
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+
+def _missing_links_statement(source: SyncSource):
+    tracked = select(StatisticsSync.links_id).where(StatisticsSync.source == source)
+    return select(Links.id).where(Links.id.not_in(tracked))
+
+
+def _new_state_rows(links_ids, source: SyncSource) -> List[dict]:
+    return [{"id": uuid4(), "links_id": links_id, "source": source, "consecutive_failures": 0} for links_id in links_ids]
+
+
+def _is_due(now: datetime):
+    return or_(StatisticsSync.next_attempt_at.is_(None), StatisticsSync.next_attempt_at <= now)
+
+
+def _count_due_statement(source: SyncSource, now: datetime):
+    return select(func.count()).select_from(StatisticsSync).where(StatisticsSync.source == source, _is_due(now))
+
+
+def _claim_statement(source: SyncSource, limit: int, now: datetime, lease_until: datetime):
+    # SKIP LOCKED lets concurrent workers claim disjoint rows; the repeated due check
+    # makes a row another worker claimed first drop out of this UPDATE
+    due = (
+        select(StatisticsSync.id)
+        .where(StatisticsSync.source == source, _is_due(now))
+        .order_by(StatisticsSync.next_attempt_at.asc().nulls_first())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(StatisticsSync)
+        .where(StatisticsSync.id.in_(due.scalar_subquery()), _is_due(now))
+        .values(next_attempt_at=lease_until, last_attempt_at=now)
+        .returning(StatisticsSync.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _claimed_statement(ids):
+    # Users without a profile come back with profile_id None
+    return (
+        select(
+            StatisticsSync.id,
+            StatisticsSync.consecutive_failures,
+            Links.github_user_name,
+            Links.leetcode_user_name,
+            Profile.id.label("profile_id"),
+        )
+        .join(Links, Links.id == StatisticsSync.links_id)
+        .outerjoin(Profile, Profile.user_id == Links.user_id)
+        .where(StatisticsSync.id.in_(ids))
+    )
+
+
+class StatisticsSyncRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def track_new_links(self, source: SyncSource) -> int:
+        """
+        Adds a state row, due immediately, for every Links row ``source`` does not track yet.
+        """
+        try:
+            rows = _new_state_rows(self.session.exec(_missing_links_statement(source)).all(), source)
+            if rows:
+                self.session.exec(insert(StatisticsSync), params=rows)
+            self.session.commit()
+            return len(rows)
+        except IntegrityError:
+            # Another worker added them first
+            self.session.rollback()
+            return 0
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+    def count_due(self, source: SyncSource, now: datetime) -> int:
+        return self.session.exec(_count_due_statement(source, now)).one()
+
+    def claim(self, source: SyncSource, limit: int, now: datetime, lease_until: datetime) -> List:
+        """
+        Leases up to ``limit`` due rows (oldest first) until ``lease_until`` and returns
+        them with their usernames and profile id.
+        """
+        try:
+            ids = self.session.exec(_claim_statement(source, limit, now, lease_until)).scalars().all()
+            self.session.commit()
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+        if not ids:
+            return []
+        return self.session.exec(_claimed_statement(ids)).all()
+
+    def finish(self, results: List[dict]):
+        """
+        Bulk UPDATE by primary key of the claimed rows with their outcome.
+        """
+        if not results:
+            return
+        try:
+            self.session.exec(update(StatisticsSync), params=results)
+            self.session.commit()
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+
+class AsyncStatisticsSyncRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def track_new_links(self, source: SyncSource) -> int:
+        try:
+            rows = _new_state_rows((await self.session.exec(_missing_links_statement(source))).all(), source)
+            if rows:
+                await self.session.exec(insert(StatisticsSync), params=rows)
+            await self.session.commit()
+            return len(rows)
+        except IntegrityError:
+            await self.session.rollback()
+            return 0
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def count_due(self, source: SyncSource, now: datetime) -> int:
+        return (await self.session.exec(_count_due_statement(source, now))).one()
+
+    async def claim(self, source: SyncSource, limit: int, now: datetime, lease_until: datetime) -> List:
+        try:
+            ids = (await self.session.exec(_claim_statement(source, limit, now, lease_until))).scalars().all()
+            await self.session.commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+        if not ids:
+            return []
+        return (await self.session.exec(_claimed_statement(ids))).all()
+
+    async def finish(self, results: List[dict]):
+        if not results:
+            return
+        try:
+            await self.session.exec(update(StatisticsSync), params=results)
+            await self.session.commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
@@ -1,23 +1,86 @@
 # Repository/users_repository.py
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlmodel import Session, select
-from sqlalchemy import asc, desc
+from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Schema.SQL.Models.models import User
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
 from sqlalchemy.exc import SQLAlchemyError
 
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at", "first_name", "last_name", "github_user_name")
+
+
+def _build_list_statement(
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    github_user_name: Optional[str] = None,
+    rank: Optional[str] = None,
+    min_streak: Optional[int] = None,
+    max_streak: Optional[int] = None,
+):
+    statement = select(User)
+
+    # Filtering
+    if first_name:
+        statement = statement.where(User.first_name.ilike(f"%{first_name}%"))
+    if last_name:
+        statement = statement.where(User.last_name.ilike(f"%{last_name}%"))
+    if github_user_name:
+        statement = statement.where(User.github_user_name.ilike(f"%{github_user_name}%"))
+    if rank:
+        statement = statement.where(User.rank == rank)
+    if min_streak is not None:
+        statement = statement.where(User.streak >= min_streak)
+    if max_streak is not None:
+        statement = statement.where(User.streak <= max_streak)
+
+    return statement
+
+
+def _build_autocomplete_statement(query: str, field: str = "github_user_name", limit: int = 10):
+    field_column = getattr(User, field, User.github_user_name)
+    return (
+        select(User)
+        .where(field_column.ilike(f"%{query}%"))
+        .limit(limit)
+    )
+
+
+def _build_cohort_statement(
+    github_user_names: Optional[List[str]], rank: Optional[str], after: Optional[str], limit: int,
+):
+    # One page of a certificate cohort, in github_user_name order after ``after``
+    statement = select(User)
+    if github_user_names is not None:
+        statement = statement.where(User.github_user_name.in_(github_user_names))
+    if rank:
+        statement = statement.where(User.rank == rank)
+    if after is not None:
+        statement = statement.where(User.github_user_name > after)
+    return statement.order_by(User.github_user_name).limit(limit)
+
+
+def _build_cohort_count_statement(rank: Optional[str]):
+    statement = select(func.count()).select_from(User)
+    if rank:
+        statement = statement.where(User.rank == rank)
+    return statement
+
+
 class UserRepository:
     def __init__(self, session: Session):
         self.session = session
 
     def create(self, user: User) -> User:
         try:
-            self.session.add(user)
+            user = self.session.exec(insert_returning(user)).scalar_one()
             self.session.commit()
-            self.session.refresh(user)
             return user
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -29,6 +92,15 @@ class UserRepository:
         statement = select(User).where(User.github_user_name == github_user_name)
         return self.session.exec(statement).first()
 
+    def cohort(
+        self, github_user_names: Optional[List[str]], rank: Optional[str], after: Optional[str], limit: int,
+    ) -> List[User]:
+        statement = _build_cohort_statement(github_user_names, rank, after, limit)
+        return list(self.session.exec(statement).all())
+
+    def count_cohort(self, rank: Optional[str]) -> int:
+        return self.session.exec(_build_cohort_count_statement(rank)).one()
+
     def list(
         self,
         skip: int = 0,
@@ -41,61 +113,111 @@ class UserRepository:
         rank: Optional[str] = None,
         min_streak: Optional[int] = None,
         max_streak: Optional[int] = None,
-    ) -> List[User]:
-        statement = select(User)
-
-        # Filtering
-        if first_name:
-            statement = statement.where(User.first_name.ilike(f"%{first_name}%"))
-        if last_name:
-            statement = statement.where(User.last_name.ilike(f"%{last_name}%"))
-        if github_user_name:
-            statement = statement.where(User.github_user_name.ilike(f"%{github_user_name}%"))
-        if rank:
-            statement = statement.where(User.rank == rank)
-        if min_streak is not None:
-            statement = statement.where(User.streak >= min_streak)
-        if max_streak is not None:
-            statement = statement.where(User.streak <= max_streak)
-
-        # Sorting
-        sort_column = getattr(User, sort_by, User.created_at)
-        if order.lower() == "desc":
-            statement = statement.order_by(desc(sort_column))
-        else:
-            statement = statement.order_by(asc(sort_column))
-
-        # Pagination
-        statement = statement.offset(skip).limit(limit)
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[User], Optional[str]]:
+        statement = _build_list_statement(
+            first_name, last_name, github_user_name, rank, min_streak, max_streak
+        )
 
-        return self.session.exec(statement).all()
+        # Keyset pagination; skip is only honoured for legacy clients without a cursor
+        statement = apply_keyset(statement, User, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
     def autocomplete(self, query: str, field: str = "github_user_name", limit: int = 10) -> List[User]:
         """
         Autocomplete based on a given field (default: github_user_name).
         """
-        field_column = getattr(User, field, User.github_user_name)
-        statement = (
-            select(User)
-            .where(field_column.ilike(f"%{query}%"))
-            .limit(limit)
-        )
+        statement = _build_autocomplete_statement(query, field, limit)
         return self.session.exec(statement).all()
 
-    def update(self, user: User) -> User:
+    def update(self, user_id: UUID, update_data: dict) -> Optional[User]:
         try:
-            self.session.add(user)
+            user = self.session.exec(update_returning(User, user_id, update_data)).scalar_one_or_none()
             self.session.commit()
-            self.session.refresh(user)
             return user
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
-    def delete(self, user: User):
+    def delete(self, user_id: UUID) -> bool:
         try:
-            self.session.delete(user)
+            deleted_id = self.session.exec(delete_returning(User, user_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
             raise
+
+
+class AsyncUserRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, user: User) -> User:
+        try:
+            user = (await self.session.exec(insert_returning(user))).scalar_one()
+            await self.session.commit()
+            return user
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, user_id: UUID) -> Optional[User]:
+        statement = select(User).where(User.id == user_id)
+        return (await self.session.exec(statement)).first()
+
+    async def get_by_github_username(self, github_user_name: str) -> Optional[User]:
+        statement = select(User).where(User.github_user_name == github_user_name)
+        return (await self.session.exec(statement)).first()
+
+    async def cohort(
+        self, github_user_names: Optional[List[str]], rank: Optional[str], after: Optional[str], limit: int,
+    ) -> List[User]:
+        statement = _build_cohort_statement(github_user_names, rank, after, limit)
+        return list((await self.session.exec(statement)).all())
+
+    async def count_cohort(self, rank: Optional[str]) -> int:
+        return (await self.session.exec(_build_cohort_count_statement(rank))).one()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        github_user_name: Optional[str] = None,
+        rank: Optional[str] = None,
+        min_streak: Optional[int] = None,
+        max_streak: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[User], Optional[str]]:
+        statement = _build_list_statement(
+            first_name, last_name, github_user_name, rank, min_streak, max_streak
+        )
+        statement = apply_keyset(statement, User, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def autocomplete(self, query: str, field: str = "github_user_name", limit: int = 10) -> List[User]:
+        statement = _build_autocomplete_statement(query, field, limit)
+        return (await self.session.exec(statement)).all()
+
+    async def update(self, user_id: UUID, update_data: dict) -> Optional[User]:
+        try:
+            user = (await self.session.exec(update_returning(User, user_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return user
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, user_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(User, user_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
@@ -1,10 +1,66 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlmodel import Session, select
-from sqlalchemy import asc, desc
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
 from Schema.SQL.Models.models import WorkExperience
 from Schema.SQL.Enums.enums import EmploymentType, WorkLocationType, Domain, Tools
+from Utils.pagination import apply_keyset, build_page
+from Utils.returning import delete_returning, insert_returning, update_returning
+
+
+# Non-nullable columns only, so (sort column, id) is a total order for keyset paging
+SORTABLE_FIELDS = ("created_at", "updated_at", "title", "company_name", "start_date")
+
+
+def _build_list_statement(
+    profile_id: Optional[UUID] = None,
+    title: Optional[str] = None,
+    company_name: Optional[str] = None,
+    employment_type: Optional[EmploymentType] = None,
+    domain: Optional[List[Domain]] = None,
+    location: Optional[UUID] = None,
+    location_type: Optional[WorkLocationType] = None,
+    currently_working: Optional[bool] = None,
+    start_date_after: Optional[str] = None,
+    start_date_before: Optional[str] = None,
+):
+    statement = select(WorkExperience)
+
+    # Filtering
+    if profile_id:
+        statement = statement.where(WorkExperience.profile_id == profile_id)
+    if title:
+        statement = statement.where(WorkExperience.title.ilike(f"%{title}%"))
+    if company_name:
+        statement = statement.where(WorkExperience.company_name.ilike(f"%{company_name}%"))
+    if employment_type:
+        statement = statement.where(WorkExperience.employment_type == employment_type)
+    if domain:
+        statement = statement.where(WorkExperience.domain.contains(domain))
+    if location:
+        statement = statement.where(WorkExperience.location == location)
+    if location_type:
+        statement = statement.where(WorkExperience.location_type == location_type)
+    if currently_working is not None:
+        statement = statement.where(WorkExperience.currently_working == currently_working)
+    if start_date_after:
+        statement = statement.where(WorkExperience.start_date >= start_date_after)
+    if start_date_before:
+        statement = statement.where(WorkExperience.start_date <= start_date_before)
+
+    return statement
+
+
+def _build_autocomplete_statement(query: str, field: str = "title", limit: int = 10):
+    field_column = getattr(WorkExperience, field, WorkExperience.title)
+    return (
+        select(WorkExperience)
+        .where(field_column.ilike(f"%{query}%"))
+        .limit(limit)
+    )
+
 
 class WorkExperienceRepository:
     def __init__(self, session: Session):
@@ -12,11 +68,10 @@ class WorkExperienceRepository:
 
     def create(self, work_experience: WorkExperience) -> WorkExperience:
         try:
-            self.session.add(work_experience)
+            work_experience = self.session.exec(insert_returning(work_experience)).scalar_one()
             self.session.commit()
-            self.session.refresh(work_experience)
             return work_experience
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             self.session.rollback()
             raise
 
@@ -40,42 +95,17 @@ class WorkExperienceRepository:
         currently_working: Optional[bool] = None,
         start_date_after: Optional[str] = None,
         start_date_before: Optional[str] = None,
-    ) -> List[WorkExperience]:
-        statement = select(WorkExperience)
-
-        # Filtering
-        if profile_id:
-            statement = statement.where(WorkExperience.profile_id == profile_id)
-        if title:
-            statement = statement.where(WorkExperience.title.ilike(f"%{title}%"))
-        if company_name:
-            statement = statement.where(WorkExperience.company_name.ilike(f"%{company_name}%"))
-        if employment_type:
-            statement = statement.where(WorkExperience.employment_type == employment_type)
-        if domain:
-            statement = statement.where(WorkExperience.domain.contains(domain))
-        if location:
-            statement = statement.where(WorkExperience.location == location)
-        if location_type:
-            statement = statement.where(WorkExperience.location_type == location_type)
-        if currently_working is not None:
-            statement = statement.where(WorkExperience.currently_working == currently_working)
-        if start_date_after:
-            statement = statement.where(WorkExperience.start_date >= start_date_after)
-        if start_date_before:
-            statement = statement.where(WorkExperience.start_date <= start_date_before)
-
-        # Sorting
-        sort_column = getattr(WorkExperience, sort_by, WorkExperience.created_at)
-        if order.lower() == "desc":
-            statement = statement.order_by(desc(sort_column))
-        else:
-            statement = statement.order_by(asc(sort_column))
-
-        # Pagination
-        statement = statement.offset(skip).limit(limit)
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkExperience], Optional[str]]:
+        statement = _build_list_statement(
+            profile_id, title, company_name, employment_type, domain,
+            location, location_type, currently_working, start_date_after, start_date_before,
+        )
 
-        return self.session.exec(statement).all()
+        # Keyset pagination; skip is only honoured for legacy clients without a cursor
+        statement = apply_keyset(statement, WorkExperience, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+
+        return build_page(self.session.exec(statement).all(), sort_by, order, limit)
 
     def get_by_profile_id(self, profile_id: UUID) -> List[WorkExperience]:
         statement = select(WorkExperience).where(WorkExperience.profile_id == profile_id)
@@ -85,28 +115,97 @@ class WorkExperienceRepository:
         """
         Autocomplete based on a given field (default: title).
         """
-        field_column = getattr(WorkExperience, field, WorkExperience.title)
-        statement = (
-            select(WorkExperience)
-            .where(field_column.ilike(f"%{query}%"))
-            .limit(limit)
-        )
+        statement = _build_autocomplete_statement(query, field, limit)
         return self.session.exec(statement).all()
 
-    def update(self, work_experience: WorkExperience) -> WorkExperience:
+    def update(self, work_experience_id: UUID, update_data: dict) -> Optional[WorkExperience]:
         try:
-            self.session.add(work_experience)
+            work_experience = self.session.exec(update_returning(WorkExperience, work_experience_id, update_data)).scalar_one_or_none()
             self.session.commit()
-            self.session.refresh(work_experience)
             return work_experience
         except SQLAlchemyError:
             self.session.rollback()
             raise
 
-    def delete(self, work_experience: WorkExperience):
+    def delete(self, work_experience_id: UUID) -> bool:
         try:
-            self.session.delete(work_experience)
+            deleted_id = self.session.exec(delete_returning(WorkExperience, work_experience_id)).scalar_one_or_none()
             self.session.commit()
+            return deleted_id is not None
         except SQLAlchemyError:
             self.session.rollback()
-            raise
\ No newline at end of file
+            raise
+
+
+class AsyncWorkExperienceRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, work_experience: WorkExperience) -> WorkExperience:
+        try:
+            work_experience = (await self.session.exec(insert_returning(work_experience))).scalar_one()
+            await self.session.commit()
+            return work_experience
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def get(self, work_experience_id: UUID) -> Optional[WorkExperience]:
+        # location_rel is serialized by ReadWorkExperienceWithRelations and cannot lazy load under asyncio
+        statement = (
+            select(WorkExperience)
+            .where(WorkExperience.id == work_experience_id)
+            .options(selectinload(WorkExperience.location_rel))
+        )
+        return (await self.session.exec(statement)).first()
+
+    async def list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        profile_id: Optional[UUID] = None,
+        title: Optional[str] = None,
+        company_name: Optional[str] = None,
+        employment_type: Optional[EmploymentType] = None,
+        domain: Optional[List[Domain]] = None,
+        location: Optional[UUID] = None,
+        location_type: Optional[WorkLocationType] = None,
+        currently_working: Optional[bool] = None,
+        start_date_after: Optional[str] = None,
+        start_date_before: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkExperience], Optional[str]]:
+        statement = _build_list_statement(
+            profile_id, title, company_name, employment_type, domain,
+            location, location_type, currently_working, start_date_after, start_date_before,
+        )
+        statement = apply_keyset(statement, WorkExperience, SORTABLE_FIELDS, sort_by, order, cursor, skip, limit)
+        return build_page((await self.session.exec(statement)).all(), sort_by, order, limit)
+
+    async def get_by_profile_id(self, profile_id: UUID) -> List[WorkExperience]:
+        statement = select(WorkExperience).where(WorkExperience.profile_id == profile_id)
+        return (await self.session.exec(statement)).all()
+
+    async def autocomplete(self, query: str, field: str = "title", limit: int = 10) -> List[WorkExperience]:
+        statement = _build_autocomplete_statement(query, field, limit)
+        return (await self.session.exec(statement)).all()
+
+    async def update(self, work_experience_id: UUID, update_data: dict) -> Optional[WorkExperience]:
+        try:
+            work_experience = (await self.session.exec(update_returning(WorkExperience, work_experience_id, update_data))).scalar_one_or_none()
+            await self.session.commit()
+            return work_experience
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+    async def delete(self, work_experience_id: UUID) -> bool:
+        try:
+            deleted_id = (await self.session.exec(delete_returning(WorkExperience, work_experience_id))).scalar_one_or_none()
+            await self.session.commit()
+            return deleted_id is not None
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
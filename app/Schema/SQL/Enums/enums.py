@@ -200,3 +200,8 @@ class TestScoreType(str, Enum):
     TENTH = "TENTH"
     TWELFTH = "TWELFTH"
 
+
+# SYNC_SOURCE
+class SyncSource(str, Enum):
+    GITHUB = "GITHUB"
+    LEETCODE = "LEETCODE"
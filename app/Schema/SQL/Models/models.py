@@ -1,24 +1,51 @@
 from typing import List, Optional
-from datetime import date, datetime, timezone
+from datetime import date, datetime
 
 from uuid import UUID, uuid4
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import ARRAY, Column, Enum as SQLEnum, String, Integer, BigInteger, Float
+from sqlalchemy import ARRAY, JSON, Column, DateTime, Enum as SQLEnum, String, Integer, BigInteger, Float, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 
 from Schema.SQL.Enums.enums import (
     Difficulty, ProjectLevel, Rank, Tools, WorkLocationType,
     EmploymentType, Currency, Cause, CertificationType, Domain,
-    LeetcodeTagCategory, Status, TestScoreType
+    LeetcodeTagCategory, Status, SyncSource, TestScoreType
 )
 
-# Base class with UUID PK and timestamps
+# Current UTC time evaluated by the database, for timestamp defaults
+class utcnow(FunctionElement):
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+# Same text format SQLAlchemy binds datetimes with on SQLite, so stored values compare correctly
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))"
+
+# Base class with UUID PK and timestamps.
+# The timestamps are filled in by the database (server default on insert, SET on update)
+# and read back with RETURNING, so writes never need a refresh.
 class UUIDBaseTable(SQLModel):
     id: UUID = Field(default_factory=uuid4, primary_key=True, nullable=False)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        sa_column_kwargs={"onupdate": datetime.now(timezone.utc)}
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow()}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
     )
 
 # -------------------------------------------------------------------------
@@ -314,6 +341,10 @@ class Leetcode(UUIDBaseTable, table=True):
     total_participants: Optional[int] = None
     top_percentage: Optional[float] = None
     competition_badge: Optional[str] = None
+    # Hash of each lc_query section as last stored, so unchanged sections are not rewritten
+    sync_hashes: Optional[dict] = Field(
+        default=None, sa_column=Column(JSON)
+    )
 
     # Relationships
     profile_rel: Profile = Relationship(back_populates="leetcode")
@@ -339,6 +370,9 @@ class LeetcodeBadges(UUIDBaseTable, table=True):
 # -------------------------------------------------------------------------
 class LeetcodeTags(UUIDBaseTable, table=True):
     __tablename__ = "LeetcodeTags"
+    __table_args__ = (
+        Index("uq_leetcode_tags_leetcode_id_category_name", "leetcode_id", "tag_category", "tag_name", unique=True),
+    )
 
     leetcode_id: UUID = Field(foreign_key="Leetcode.id", nullable=False)
     tag_category: Optional[LeetcodeTagCategory] = Field(
@@ -350,6 +384,32 @@ class LeetcodeTags(UUIDBaseTable, table=True):
     # Relationships
     leetcode_rel: Leetcode = Relationship(back_populates="tags")
 
+# -------------------------------------------------------------------------
+# LeetcodeContestHistory model
+# -------------------------------------------------------------------------
+# Attended contests of one Leetcode row as parallel arrays ordered by start time, one row
+# per user instead of one per contest. New contests are appended past last_start_time.
+class LeetcodeContestHistory(UUIDBaseTable, table=True):
+    __tablename__ = "LeetcodeContestHistory"
+
+    leetcode_id: UUID = Field(foreign_key="Leetcode.id", nullable=False, unique=True)
+    start_times: List[int] = Field(
+        sa_column=Column(ARRAY(BigInteger), nullable=False)
+    )
+    ratings: List[float] = Field(
+        sa_column=Column(ARRAY(Float), nullable=False)
+    )
+    rankings: List[int] = Field(
+        sa_column=Column(ARRAY(Integer), nullable=False)
+    )
+    problems_solved: List[int] = Field(
+        sa_column=Column(ARRAY(Integer), nullable=False)
+    )
+    finish_times: List[int] = Field(
+        sa_column=Column(ARRAY(Integer), nullable=False)
+    )
+    last_start_time: int = Field(sa_column=Column(BigInteger, nullable=False))
+
 # -------------------------------------------------------------------------
 # Github model
 # -------------------------------------------------------------------------
@@ -401,6 +461,26 @@ class Links(UUIDBaseTable, table=True):
     # Relationships
     user_rel: Optional[User] = Relationship(back_populates="links")
 
+# -------------------------------------------------------------------------
+# StatisticsSync model
+# -------------------------------------------------------------------------
+# Background refresh state of one Links row against one upstream (GitHub, LeetCode).
+# A row is due once next_attempt_at has passed; claiming it pushes next_attempt_at
+# out by a lease, so a crashed or restarted worker's claims simply fall due again.
+class StatisticsSync(UUIDBaseTable, table=True):
+    __tablename__ = "StatisticsSync"
+    __table_args__ = (UniqueConstraint("links_id", "source", name="uq_statistics_sync_links_id_source"),)
+
+    links_id: UUID = Field(foreign_key="Links.id", nullable=False)
+    source: SyncSource = Field(
+        sa_column=Column(SQLEnum(SyncSource, name="SYNC_SOURCE"), nullable=False)
+    )
+    next_attempt_at: Optional[datetime] = None
+    last_attempt_at: Optional[datetime] = None
+    last_synced_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    consecutive_failures: int = Field(default=0, nullable=False)
+
 # -------------------------------------------------------------------------
 # Blog model
 # -------------------------------------------------------------------------
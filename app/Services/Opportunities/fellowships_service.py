@@ -1,19 +1,30 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Schema.SQL.Models.models import Fellowship, Organization
-from Repository.Opportunities.fellowships_repository import FellowshipRepository
+from Repository.Opportunities.organizations_repository import AsyncOrganizationRepository, OrganizationRepository
+from Repository.Opportunities.fellowships_repository import AsyncFellowshipRepository, FellowshipRepository
+from Entities.bulk_entity import BulkCreateResult
 from Entities.OpportunityDTOs.fellowships_entity import CreateFellowship, UpdateFellowship
 from Schema.SQL.Enums.enums import Tools
 from Utils.Exceptions.opportunities_exceptions import FellowshipNotFound, OrganizationNotFound
-from Utils.Helpers.opportunities_helpers import _validate_tools
+from Utils.Helpers.opportunities_helpers import _bulk_result, _prepare_bulk_rows, _validate_tools
+from Utils.cache import cached, cached_async, list_cache_key, register_cache
+from Utils.session_routing import bound_to_replica
+from Settings.cache_config import LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS
+
+# list_fellowships pages keyed by the normalized query; cleared by every fellowship write
+_list_cache = register_cache("fellowships.list", LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS)
 
 
 class FellowshipService:
     def __init__(self, session: Session):
         self.session = session
         self.repo = FellowshipRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+        self.org_repo = OrganizationRepository(session)
 
     def create_fellowship(self, fellowship_create: CreateFellowship) -> Fellowship:
         # Check organization exists
@@ -25,7 +36,20 @@ class FellowshipService:
         _validate_tools(fellowship_create.technologies, "technologies")
         
         fellowship = Fellowship(**fellowship_create.dict(exclude_unset=True))
-        return self.repo.create(fellowship)
+        fellowship = self.repo.create(fellowship)
+        _list_cache.clear()
+        return fellowship
+
+    def bulk_create_fellowships(self, fellowships_create: List[CreateFellowship]) -> BulkCreateResult:
+        """
+        Validates the whole batch up front (one IN query for organizations),
+        inserts the valid rows in a single transaction and reports the rest per row.
+        """
+        existing_orgs = self.org_repo.existing_ids(fellowship.organization for fellowship in fellowships_create)
+        rows, indexes, errors = _prepare_bulk_rows(fellowships_create, Fellowship, existing_orgs, ("technologies",))
+        ids = self.repo.bulk_create(rows)
+        _list_cache.clear()
+        return _bulk_result(indexes, ids, errors)
 
     def get_fellowship(self, fellowship_id: UUID) -> Optional[Fellowship]:
         fellowship = self.repo.get(fellowship_id)
@@ -43,29 +67,121 @@ class FellowshipService:
         organization: Optional[UUID] = None,
         location: Optional[str] = None,
         featured: Optional[bool] = None,
-    ) -> List[Fellowship]:
-        return self.repo.list(skip, limit, sort_by, order, title, organization, location, featured)
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Tuple[List[Fellowship], Optional[str]]:
+        key = list_cache_key(
+            skip=skip, limit=limit, sort_by=sort_by, order=order, title=title,
+            organization=organization, location=location, featured=featured, cursor=cursor,
+        )
+        return cached(
+            _list_cache,
+            key,
+            lambda: self.repo.list(skip, limit, sort_by, order, title, organization, location, featured, cursor=cursor),
+            use_cache,
+            fill=self.fill_cache,
+        )
 
     def update_fellowship(self, fellowship_id: UUID, fellowship_update: UpdateFellowship) -> Optional[Fellowship]:
-        fellowship = self.repo.get(fellowship_id)
-        if not fellowship:
-            raise FellowshipNotFound(fellowship_id)
         update_data = fellowship_update.dict(exclude_unset=True)
 
         # Validate tools if present
         if "technologies" in update_data:
             _validate_tools(update_data["technologies"], "technologies")
-        
-        for key, value in update_data.items():
-            setattr(fellowship, key, value)
-        return self.repo.update(fellowship)
 
-    def delete_fellowship(self, fellowship_id: UUID) -> Optional[str]:
-        fellowship = self.repo.get(fellowship_id)
+        fellowship = self.repo.update(fellowship_id, update_data)
+        _list_cache.clear()
         if not fellowship:
             raise FellowshipNotFound(fellowship_id)
-        self.repo.delete(fellowship)
+        return fellowship
+
+    def delete_fellowship(self, fellowship_id: UUID) -> Optional[str]:
+        if not self.repo.delete(fellowship_id):
+            raise FellowshipNotFound(fellowship_id)
+        _list_cache.clear()
         return f"Fellowship {fellowship_id} deleted successfully"
 
     def autocomplete_fellowships(self, query: str, field: str = "title", limit: int = 10) -> List[Fellowship]:
         return self.repo.autocomplete(query, field, limit)
+
+
+class AsyncFellowshipService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = AsyncFellowshipRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+        self.org_repo = AsyncOrganizationRepository(session)
+
+    async def create_fellowship(self, fellowship_create: CreateFellowship) -> Fellowship:
+        # Check organization exists
+        org = await self.session.get(Organization, fellowship_create.organization)
+        if not org:
+            raise OrganizationNotFound(fellowship_create.organization)
+
+        # Validate tools
+        _validate_tools(fellowship_create.technologies, "technologies")
+
+        fellowship = Fellowship(**fellowship_create.dict(exclude_unset=True))
+        fellowship = await self.repo.create(fellowship)
+        _list_cache.clear()
+        return fellowship
+
+    async def bulk_create_fellowships(self, fellowships_create: List[CreateFellowship]) -> BulkCreateResult:
+        existing_orgs = await self.org_repo.existing_ids(fellowship.organization for fellowship in fellowships_create)
+        rows, indexes, errors = _prepare_bulk_rows(fellowships_create, Fellowship, existing_orgs, ("technologies",))
+        ids = await self.repo.bulk_create(rows)
+        _list_cache.clear()
+        return _bulk_result(indexes, ids, errors)
+
+    async def get_fellowship(self, fellowship_id: UUID) -> Optional[Fellowship]:
+        fellowship = await self.repo.get(fellowship_id)
+        if not fellowship:
+            raise FellowshipNotFound(fellowship_id)
+        return fellowship
+
+    async def list_fellowships(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        title: Optional[str] = None,
+        organization: Optional[UUID] = None,
+        location: Optional[str] = None,
+        featured: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Tuple[List[Fellowship], Optional[str]]:
+        key = list_cache_key(
+            skip=skip, limit=limit, sort_by=sort_by, order=order, title=title,
+            organization=organization, location=location, featured=featured, cursor=cursor,
+        )
+        return await cached_async(
+            _list_cache,
+            key,
+            lambda: self.repo.list(skip, limit, sort_by, order, title, organization, location, featured, cursor=cursor),
+            use_cache,
+            fill=self.fill_cache,
+        )
+
+    async def update_fellowship(self, fellowship_id: UUID, fellowship_update: UpdateFellowship) -> Optional[Fellowship]:
+        update_data = fellowship_update.dict(exclude_unset=True)
+
+        # Validate tools if present
+        if "technologies" in update_data:
+            _validate_tools(update_data["technologies"], "technologies")
+
+        fellowship = await self.repo.update(fellowship_id, update_data)
+        _list_cache.clear()
+        if not fellowship:
+            raise FellowshipNotFound(fellowship_id)
+        return fellowship
+
+    async def delete_fellowship(self, fellowship_id: UUID) -> Optional[str]:
+        if not await self.repo.delete(fellowship_id):
+            raise FellowshipNotFound(fellowship_id)
+        _list_cache.clear()
+        return f"Fellowship {fellowship_id} deleted successfully"
+
+    async def autocomplete_fellowships(self, query: str, field: str = "title", limit: int = 10) -> List[Fellowship]:
+        return await self.repo.autocomplete(query, field, limit)
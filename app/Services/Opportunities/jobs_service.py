@@ -1,19 +1,35 @@
 # services/jobs_service.py
 from uuid import UUID
 from sqlmodel import Session, select
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional, Tuple
 
-from Repository.Opportunities.jobs_repository import JobRepository
+from Repository.Opportunities.organizations_repository import AsyncOrganizationRepository, OrganizationRepository
+from Repository.Opportunities.jobs_repository import AsyncJobRepository, JobRepository
+from Entities.bulk_entity import BulkCreateResult
 from Entities.OpportunityDTOs.jobs_entity import CreateJob, UpdateJob
 from Schema.SQL.Models.models import Job, Organization
+from Settings.cache_config import (
+    ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_NEGATIVE_TTL_SECONDS, ENTITY_CACHE_TTL_SECONDS,
+    LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS,
+)
 from Utils.Exceptions.opportunities_exceptions import JobNotFound, OrganizationNotFound
-from Utils.Helpers.opportunities_helpers import _validate_tools
+from Utils.Helpers.opportunities_helpers import _bulk_result, _prepare_bulk_rows, _validate_tools
+from Utils.cache import cached, cached_async, list_cache_key, register_cache
+from Utils.session_routing import bound_to_replica
+
+# list_jobs pages keyed by the normalized query; cleared by every job write
+_list_cache = register_cache("jobs.list", LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS)
+# get_job rows by id, misses included; dropped by the matching write
+_entity_cache = register_cache("jobs.entity", ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_TTL_SECONDS)
 
 
 class JobService:
     def __init__(self, session: Session):
         self.session = session
         self.repo = JobRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+        self.org_repo = OrganizationRepository(session)
 
     def create_job(self, job_create: CreateJob) -> Job:
         # Check organization exists
@@ -25,10 +41,27 @@ class JobService:
         _validate_tools(job_create.technologies, "technologies")
         
         job = Job(**job_create.dict(exclude_unset=True))
-        return self.repo.create(job)
+        job = self.repo.create(job)
+        _list_cache.clear()
+        _entity_cache.invalidate(job.id)
+        return job
+
+    def bulk_create_jobs(self, jobs_create: List[CreateJob]) -> BulkCreateResult:
+        """
+        Validates the whole batch up front (one IN query for organizations),
+        inserts the valid rows in a single transaction and reports the rest per row.
+        """
+        existing_orgs = self.org_repo.existing_ids(job.organization for job in jobs_create)
+        rows, indexes, errors = _prepare_bulk_rows(jobs_create, Job, existing_orgs, ("technologies",))
+        ids = self.repo.bulk_create(rows)
+        _list_cache.clear()
+        return _bulk_result(indexes, ids, errors)
 
     def get_job(self, job_id: UUID) -> Optional[Job]:
-        job = self.repo.get(job_id)
+        job = cached(
+            _entity_cache, job_id, lambda: self.repo.get(job_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS, fill=self.fill_cache,
+        )
         if not job:
             raise JobNotFound(job_id)
         return job
@@ -45,11 +78,14 @@ class JobService:
         location_type: Optional[str] = None,
         employment_type: Optional[str] = None,
         category: Optional[str] = None,
-    ) -> List[Job]:
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Tuple[List[Job], Optional[str]]:
         """
         Supports pagination, filtering, and sorting.
+        Pages are served from the list cache unless use_cache is False.
         """
-        return self.repo.list(
+        params = dict(
             skip=skip,
             limit=limit,
             sort_by=sort_by,
@@ -60,6 +96,14 @@ class JobService:
             location_type=location_type,
             employment_type=employment_type,
             category=category,
+            cursor=cursor,
+        )
+        return cached(
+            _list_cache,
+            list_cache_key(**params),
+            lambda: self.repo.list(**params),
+            use_cache,
+            fill=self.fill_cache,
         )
 
     def autocomplete_jobs(
@@ -74,22 +118,123 @@ class JobService:
         return self.repo.autocomplete(query=query, field=field, limit=limit)
 
     def update_job(self, job_id: UUID, job_update: UpdateJob) -> Optional[Job]:
-        job = self.repo.get(job_id)
-        if not job:
-            raise JobNotFound(job_id)
         update_data = job_update.dict(exclude_unset=True)
 
         # Validate tools if present
         if "technologies" in update_data:
             _validate_tools(update_data["technologies"], "technologies")
 
-        for key, value in update_data.items():
-            setattr(job, key, value)
-        return self.repo.update(job)
+        job = self.repo.update(job_id, update_data)
+        _list_cache.clear()
+        _entity_cache.invalidate(job_id)
+        if not job:
+            raise JobNotFound(job_id)
+        return job
 
     def delete_job(self, job_id: UUID) -> Optional[str]:
-        job = self.repo.get(job_id)
+        deleted = self.repo.delete(job_id)
+        _entity_cache.invalidate(job_id)
+        if not deleted:
+            raise JobNotFound(job_id)
+        _list_cache.clear()
+        return f"Job {job_id} deleted successfully"
+
+
+class AsyncJobService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = AsyncJobRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+        self.org_repo = AsyncOrganizationRepository(session)
+
+    async def create_job(self, job_create: CreateJob) -> Job:
+        # Check organization exists
+        org = await self.session.get(Organization, job_create.organization)
+        if not org:
+            raise OrganizationNotFound(job_create.organization)
+
+        # Validate tools
+        _validate_tools(job_create.technologies, "technologies")
+
+        job = Job(**job_create.dict(exclude_unset=True))
+        job = await self.repo.create(job)
+        _list_cache.clear()
+        _entity_cache.invalidate(job.id)
+        return job
+
+    async def bulk_create_jobs(self, jobs_create: List[CreateJob]) -> BulkCreateResult:
+        existing_orgs = await self.org_repo.existing_ids(job.organization for job in jobs_create)
+        rows, indexes, errors = _prepare_bulk_rows(jobs_create, Job, existing_orgs, ("technologies",))
+        ids = await self.repo.bulk_create(rows)
+        _list_cache.clear()
+        return _bulk_result(indexes, ids, errors)
+
+    async def get_job(self, job_id: UUID) -> Optional[Job]:
+        job = await cached_async(
+            _entity_cache, job_id, lambda: self.repo.get(job_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS, fill=self.fill_cache,
+        )
         if not job:
             raise JobNotFound(job_id)
-        self.repo.delete(job)
+        return job
+
+    async def list_jobs(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        title: Optional[str] = None,
+        organization: Optional[UUID] = None,
+        location: Optional[str] = None,
+        location_type: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Tuple[List[Job], Optional[str]]:
+        params = dict(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            title=title,
+            organization=organization,
+            location=location,
+            location_type=location_type,
+            employment_type=employment_type,
+            category=category,
+            cursor=cursor,
+        )
+        return await cached_async(
+            _list_cache,
+            list_cache_key(**params),
+            lambda: self.repo.list(**params),
+            use_cache,
+            fill=self.fill_cache,
+        )
+
+    async def autocomplete_jobs(self, query: str, field: str = "title", limit: int = 10) -> List[Job]:
+        return await self.repo.autocomplete(query=query, field=field, limit=limit)
+
+    async def update_job(self, job_id: UUID, job_update: UpdateJob) -> Optional[Job]:
+        update_data = job_update.dict(exclude_unset=True)
+
+        # Validate tools if present
+        if "technologies" in update_data:
+            _validate_tools(update_data["technologies"], "technologies")
+
+        job = await self.repo.update(job_id, update_data)
+        _list_cache.clear()
+        _entity_cache.invalidate(job_id)
+        if not job:
+            raise JobNotFound(job_id)
+        return job
+
+    async def delete_job(self, job_id: UUID) -> Optional[str]:
+        deleted = await self.repo.delete(job_id)
+        _entity_cache.invalidate(job_id)
+        if not deleted:
+            raise JobNotFound(job_id)
+        _list_cache.clear()
         return f"Job {job_id} deleted successfully"
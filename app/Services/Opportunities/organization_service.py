@@ -1,41 +1,133 @@
 # services/organization_service.py
+from typing import Optional
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from Repository.Opportunities.organizations_repository import OrganizationRepository
+from Repository.Opportunities.organizations_repository import AsyncOrganizationRepository, OrganizationRepository
 from Entities.OpportunityDTOs.organization_entity import CreateOrganization, UpdateOrganization
 from Schema.SQL.Models.models import Organization
+from Settings.cache_config import (
+    ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_NEGATIVE_TTL_SECONDS, ENTITY_CACHE_TTL_SECONDS,
+    LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS,
+)
 from Utils.Exceptions.opportunities_exceptions import OrganizationNotFound
+from Utils.cache import cached, cached_async, list_cache_key, register_cache
+from Utils.session_routing import bound_to_replica
+
+# list_organizations pages keyed by the normalized query; cleared by every organization write
+_list_cache = register_cache("organizations.list", LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS)
+# get_organization rows by id, misses included; dropped by the matching write
+_entity_cache = register_cache("organizations.entity", ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_TTL_SECONDS)
 
 class OrganizationService:
     def __init__(self, session: Session):
         self.repo = OrganizationRepository(session)
+        self.fill_cache = not bound_to_replica(session)
 
     def create_organization(self, org_create: CreateOrganization) -> Organization:
         org = Organization(**org_create.dict(exclude_unset=True))
-        return self.repo.create(org)
+        org = self.repo.create(org)
+        _list_cache.clear()
+        _entity_cache.invalidate(org.id)
+        return org
 
     def get_organization(self, org_id: UUID) -> Organization:
-        org = self.repo.get(org_id)
+        org = cached(
+            _entity_cache, org_id, lambda: self.repo.get(org_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS, fill=self.fill_cache,
+        )
         if not org:
             raise OrganizationNotFound(org_id)
         return org
 
-    def list_organizations(self, skip: int = 0, limit: int = 100):
-        return self.repo.list(skip, limit)
+    def list_organizations(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ):
+        key = list_cache_key(skip=skip, limit=limit, sort_by=sort_by, order=order, cursor=cursor)
+        return cached(
+            _list_cache,
+            key,
+            lambda: self.repo.list(skip, limit, sort_by, order, cursor),
+            use_cache,
+            fill=self.fill_cache,
+        )
 
     def update_organization(self, org_id: UUID, org_update: UpdateOrganization) -> Organization:
-        org = self.repo.get(org_id)
+        update_data = org_update.dict(exclude_unset=True)
+        org = self.repo.update(org_id, update_data)
+        _list_cache.clear()
+        _entity_cache.invalidate(org_id)
         if not org:
             raise OrganizationNotFound(org_id)
-        update_data = org_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(org, key, value)
-        return self.repo.update(org)
+        return org
 
     def delete_organization(self, org_id: UUID):
-        org = self.repo.get(org_id)
+        deleted = self.repo.delete(org_id)
+        _entity_cache.invalidate(org_id)
+        if not deleted:
+            raise OrganizationNotFound(org_id)
+        _list_cache.clear()
+        return f"Organization {org_id} deleted successfully"
+
+class AsyncOrganizationService:
+    def __init__(self, session: AsyncSession):
+        self.repo = AsyncOrganizationRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+
+    async def create_organization(self, org_create: CreateOrganization) -> Organization:
+        org = Organization(**org_create.dict(exclude_unset=True))
+        org = await self.repo.create(org)
+        _list_cache.clear()
+        _entity_cache.invalidate(org.id)
+        return org
+
+    async def get_organization(self, org_id: UUID) -> Organization:
+        org = await cached_async(
+            _entity_cache, org_id, lambda: self.repo.get(org_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS, fill=self.fill_cache,
+        )
+        if not org:
+            raise OrganizationNotFound(org_id)
+        return org
+
+    async def list_organizations(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ):
+        key = list_cache_key(skip=skip, limit=limit, sort_by=sort_by, order=order, cursor=cursor)
+        return await cached_async(
+            _list_cache,
+            key,
+            lambda: self.repo.list(skip, limit, sort_by, order, cursor),
+            use_cache,
+            fill=self.fill_cache,
+        )
+
+    async def update_organization(self, org_id: UUID, org_update: UpdateOrganization) -> Organization:
+        update_data = org_update.dict(exclude_unset=True)
+        org = await self.repo.update(org_id, update_data)
+        _list_cache.clear()
+        _entity_cache.invalidate(org_id)
         if not org:
             raise OrganizationNotFound(org_id)
-        self.repo.delete(org)
-        return f"Organization {org_id} deleted successfully"
\ No newline at end of file
+        return org
+
+    async def delete_organization(self, org_id: UUID):
+        deleted = await self.repo.delete(org_id)
+        _entity_cache.invalidate(org_id)
+        if not deleted:
+            raise OrganizationNotFound(org_id)
+        _list_cache.clear()
+        return f"Organization {org_id} deleted successfully"
@@ -1,18 +1,29 @@
 # services/projects_opportunities_service.py
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Schema.SQL.Models.models import Organization, ProjectsOpportunities
-from Repository.Opportunities.projects_opportunities_repository import ProjectsOpportunitiesRepository
+from Repository.Opportunities.organizations_repository import AsyncOrganizationRepository, OrganizationRepository
+from Repository.Opportunities.projects_opportunities_repository import AsyncProjectsOpportunitiesRepository, ProjectsOpportunitiesRepository
+from Entities.bulk_entity import BulkCreateResult
 from Entities.OpportunityDTOs.projects_opportunities_entity import CreateProject, UpdateProject
 from Schema.SQL.Enums.enums import Tools
 from Utils.Exceptions.opportunities_exceptions import OrganizationNotFound, ProjectOpportunityNotFound
-from Utils.Helpers.opportunities_helpers import _validate_tools
+from Utils.Helpers.opportunities_helpers import _bulk_result, _prepare_bulk_rows, _validate_tools
+from Utils.cache import cached, cached_async, list_cache_key, register_cache
+from Utils.session_routing import bound_to_replica
+from Settings.cache_config import LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS
+
+# list_projects pages keyed by the normalized query; cleared by every project write
+_list_cache = register_cache("projects.list", LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS)
 
 class ProjectsOpportunitiesService:
     def __init__(self, session: Session):
         self.session = session
         self.repo = ProjectsOpportunitiesRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+        self.org_repo = OrganizationRepository(session)
 
     def create_project(self, project_create: CreateProject) -> ProjectsOpportunities:
         # Check organization exists
@@ -25,7 +36,20 @@ class ProjectsOpportunitiesService:
         _validate_tools(project_create.frameworks, "frameworks")
         
         project = ProjectsOpportunities(**project_create.dict(exclude_unset=True))
-        return self.repo.create(project)
+        project = self.repo.create(project)
+        _list_cache.clear()
+        return project
+
+    def bulk_create_projects(self, projects_create: List[CreateProject]) -> BulkCreateResult:
+        """
+        Validates the whole batch up front (one IN query for organizations),
+        inserts the valid rows in a single transaction and reports the rest per row.
+        """
+        existing_orgs = self.org_repo.existing_ids(project.organization for project in projects_create)
+        rows, indexes, errors = _prepare_bulk_rows(projects_create, ProjectsOpportunities, existing_orgs, ("languages", "frameworks"))
+        ids = self.repo.bulk_create(rows)
+        _list_cache.clear()
+        return _bulk_result(indexes, ids, errors)
 
     def get_project(self, project_id: UUID) -> ProjectsOpportunities:
         project = self.repo.get(project_id)
@@ -39,17 +63,23 @@ class ProjectsOpportunitiesService:
         limit: int = 100,
         filters: dict = {},
         sort_by: str = "created_at",
-        order: str = "desc"
+        order: str = "desc",
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
     ):
-        return self.repo.list(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order)
+        key = list_cache_key(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order, cursor=cursor)
+        return cached(
+            _list_cache,
+            key,
+            lambda: self.repo.list(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order, cursor=cursor),
+            use_cache,
+            fill=self.fill_cache,
+        )
 
     def autocomplete_projects(self, query: str, field: str = "title", limit: int = 10):
         return self.repo.autocomplete(query, field, limit)
 
     def update_project(self, project_id: UUID, project_update: UpdateProject) -> ProjectsOpportunities:
-        project = self.repo.get(project_id)
-        if not project:
-            raise ProjectOpportunityNotFound(project_id)
         update_data = project_update.dict(exclude_unset=True)
 
          # Validate tools if present
@@ -58,13 +88,92 @@ class ProjectsOpportunitiesService:
         if "frameworks" in update_data:
             _validate_tools(update_data["frameworks"], "frameworks")
 
-        for key, value in update_data.items():
-            setattr(project, key, value)
-        return self.repo.update(project)
+        project = self.repo.update(project_id, update_data)
+        _list_cache.clear()
+        if not project:
+            raise ProjectOpportunityNotFound(project_id)
+        return project
 
     def delete_project(self, project_id: UUID) -> Optional[str] :
-        project = self.repo.get(project_id)
+        if not self.repo.delete(project_id):
+            raise ProjectOpportunityNotFound(project_id)
+        _list_cache.clear()
+        return f"Project {project_id} deleted successfully"
+
+class AsyncProjectsOpportunitiesService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = AsyncProjectsOpportunitiesRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+        self.org_repo = AsyncOrganizationRepository(session)
+
+    async def create_project(self, project_create: CreateProject) -> ProjectsOpportunities:
+        # Check organization exists
+        org = await self.session.get(Organization, project_create.organization)
+        if not org:
+            raise OrganizationNotFound(project_create.organization)
+
+        # Validate tools
+        _validate_tools(project_create.languages, "languages")
+        _validate_tools(project_create.frameworks, "frameworks")
+
+        project = ProjectsOpportunities(**project_create.dict(exclude_unset=True))
+        project = await self.repo.create(project)
+        _list_cache.clear()
+        return project
+
+    async def bulk_create_projects(self, projects_create: List[CreateProject]) -> BulkCreateResult:
+        existing_orgs = await self.org_repo.existing_ids(project.organization for project in projects_create)
+        rows, indexes, errors = _prepare_bulk_rows(projects_create, ProjectsOpportunities, existing_orgs, ("languages", "frameworks"))
+        ids = await self.repo.bulk_create(rows)
+        _list_cache.clear()
+        return _bulk_result(indexes, ids, errors)
+
+    async def get_project(self, project_id: UUID) -> ProjectsOpportunities:
+        project = await self.repo.get(project_id)
+        if not project:
+            raise ProjectOpportunityNotFound(project_id)
+        return project
+
+    async def list_projects(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict = {},
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ):
+        key = list_cache_key(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order, cursor=cursor)
+        return await cached_async(
+            _list_cache,
+            key,
+            lambda: self.repo.list(skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order, cursor=cursor),
+            use_cache,
+            fill=self.fill_cache,
+        )
+
+    async def autocomplete_projects(self, query: str, field: str = "title", limit: int = 10):
+        return await self.repo.autocomplete(query, field, limit)
+
+    async def update_project(self, project_id: UUID, project_update: UpdateProject) -> ProjectsOpportunities:
+        update_data = project_update.dict(exclude_unset=True)
+
+        # Validate tools if present
+        if "languages" in update_data:
+            _validate_tools(update_data["languages"], "languages")
+        if "frameworks" in update_data:
+            _validate_tools(update_data["frameworks"], "frameworks")
+
+        project = await self.repo.update(project_id, update_data)
+        _list_cache.clear()
         if not project:
             raise ProjectOpportunityNotFound(project_id)
-        self.repo.delete(project)
+        return project
+
+    async def delete_project(self, project_id: UUID) -> Optional[str]:
+        if not await self.repo.delete(project_id):
+            raise ProjectOpportunityNotFound(project_id)
+        _list_cache.clear()
         return f"Project {project_id} deleted successfully"
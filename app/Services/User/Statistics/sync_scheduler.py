@@ -0,0 +1,223 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from Settings.logging_config import setup_logging
+
+from db import call_in_session
+from Repository.User.statistics_sync_repository import AsyncStatisticsSyncRepository, StatisticsSyncRepository
+from Schema.SQL.Enums.enums import SyncSource
+from Services.User.github_service import AsyncGitHubStatsService, GitHubService, GitHubStatsService
+from Services.User.leetcode_service import AsyncLeetcodeStatsService, LeetCodeService, LeetcodeStatsService
+from Settings.http_config import GITHUB_GRAPHQL_BATCH_SIZE
+from Settings.scheduler_config import (
+    STATS_SYNC_GITHUB_CONCURRENCY, STATS_SYNC_INTERVAL_SECONDS, STATS_SYNC_LEASE_SECONDS,
+    STATS_SYNC_LEETCODE_BATCH_SIZE, STATS_SYNC_LEETCODE_CONCURRENCY, STATS_SYNC_POLL_SECONDS,
+    STATS_SYNC_RETRY_SECONDS, STATS_SYNC_WINDOW_SECONDS,
+)
+from Utils.Exceptions.user_exceptions import GitHubApiError
+
+logger = setup_logging()
+
+# (sync class, async class) pairs; the scheduler uses whichever DB_MODE selects
+_STATE = (StatisticsSyncRepository, AsyncStatisticsSyncRepository)
+_GITHUB = (GitHubStatsService, AsyncGitHubStatsService)
+_LEETCODE = (LeetcodeStatsService, AsyncLeetcodeStatsService)
+
+# Batch size and batches in flight per upstream
+_LIMITS = {
+    SyncSource.GITHUB: (GITHUB_GRAPHQL_BATCH_SIZE, STATS_SYNC_GITHUB_CONCURRENCY),
+    SyncSource.LEETCODE: (STATS_SYNC_LEETCODE_BATCH_SIZE, STATS_SYNC_LEETCODE_CONCURRENCY),
+}
+
+# Stored error messages are truncated to this many characters
+_MAX_ERROR_LENGTH = 500
+
+
+def _utc_now() -> datetime:
+    # Naive UTC, like the server-side timestamp defaults
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _outcome(claim, error: Optional[str], now: datetime) -> Dict[str, Any]:
+    """
+    StatisticsSync update for one claimed row. Successes are due again after the
+    interval; failures back off exponentially from the retry delay, capped at the interval.
+    """
+    if error is None:
+        return {
+            "id": claim.id,
+            "last_synced_at": now,
+            "next_attempt_at": now + timedelta(seconds=STATS_SYNC_INTERVAL_SECONDS),
+            "last_error": None,
+            "consecutive_failures": 0,
+        }
+    failures = claim.consecutive_failures + 1
+    delay = min(STATS_SYNC_INTERVAL_SECONDS, STATS_SYNC_RETRY_SECONDS * 2 ** (failures - 1))
+    return {
+        "id": claim.id,
+        "next_attempt_at": now + timedelta(seconds=delay),
+        "last_error": error[:_MAX_ERROR_LENGTH],
+        "consecutive_failures": failures,
+    }
+
+
+class StatisticsSyncScheduler:
+    """
+    Keeps Github, Projects, Leetcode, LeetcodeBadges, LeetcodeTags and LeetcodeContestHistory
+    up to date for every user in Links, in the background of the API process.
+
+    Each cycle tracks new Links rows, then works through the users that are due, per
+    upstream: batches are claimed from StatisticsSync and started at an even pace, so
+    the cycle's work is spread over STATS_SYNC_WINDOW_SECONDS with a bounded number of
+    batches in flight. All progress lives in StatisticsSync, so a restarted process (or
+    another worker) carries on where this one stopped.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.cycles = 0
+        self.last_cycle_started_at: Optional[datetime] = None
+        self.last_cycle_finished_at: Optional[datetime] = None
+        self.synced = {source: 0 for source in SyncSource}
+        self.failed = {source: 0 for source in SyncSource}
+        self.in_flight = {source: 0 for source in SyncSource}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Statistics sync scheduler started")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Statistics sync scheduler stopped")
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.error(f"Statistics sync cycle failed: {e}")
+            await asyncio.sleep(STATS_SYNC_POLL_SECONDS)
+
+    async def run_cycle(self):
+        self.last_cycle_started_at = _utc_now()
+        for source in SyncSource:
+            added = await call_in_session(_STATE, "track_new_links", source)
+            if added:
+                logger.info(f"Statistics sync now tracks {added} more users for {source.value}")
+        await asyncio.gather(*(self._drain(source) for source in SyncSource))
+        self.cycles += 1
+        self.last_cycle_finished_at = _utc_now()
+
+    async def _drain(self, source: SyncSource):
+        batch_size, concurrency = _LIMITS[source]
+        due = await call_in_session(_STATE, "count_due", source, _utc_now())
+        if not due:
+            return
+        # Batch starts are spaced so the users due now take about one window
+        spacing = STATS_SYNC_WINDOW_SECONDS * batch_size / due
+        logger.info(f"Statistics sync: {due} {source.value} users due, a batch every {spacing:.1f}s")
+
+        slots = asyncio.Semaphore(concurrency)
+        batches = []
+        remaining = due
+        try:
+            while remaining > 0:
+                await slots.acquire()
+                now = _utc_now()
+                claims = await call_in_session(_STATE, "claim", source, batch_size, now, now + timedelta(seconds=STATS_SYNC_LEASE_SECONDS))
+                if not claims:
+                    slots.release()
+                    break
+                remaining -= len(claims)
+                batches.append(asyncio.create_task(self._run_batch(source, claims, slots)))
+                if remaining > 0:
+                    await asyncio.sleep(spacing)
+        except asyncio.CancelledError:
+            # Shutting down; unfinished claims fall due again once their lease expires
+            for batch in batches:
+                batch.cancel()
+            raise
+        await asyncio.gather(*batches)
+
+    async def _run_batch(self, source: SyncSource, claims: List, slots: asyncio.Semaphore):
+        self.in_flight[source] += len(claims)
+        try:
+            sync = self._sync_github if source == SyncSource.GITHUB else self._sync_leetcode
+            try:
+                errors = await sync(claims)
+            except Exception as e:
+                logger.warning(f"Statistics sync batch for {source.value} failed: {e}")
+                errors = {claim.id: str(e) or type(e).__name__ for claim in claims}
+            now = _utc_now()
+            await call_in_session(_STATE, "finish", [_outcome(claim, errors.get(claim.id), now) for claim in claims])
+            failed = sum(1 for claim in claims if errors.get(claim.id))
+            self.failed[source] += failed
+            self.synced[source] += len(claims) - failed
+        finally:
+            self.in_flight[source] -= len(claims)
+            slots.release()
+
+    async def _sync_github(self, claims: List) -> Dict[Any, str]:
+        """
+        One GraphQL batch for every claimed user, stored in one transaction.
+        Returns the error per failed claim id.
+        """
+        try:
+            users = await GitHubService.fetchUsersStats([claim.github_user_name for claim in claims])
+        except GitHubApiError as e:
+            return {claim.id: e.reason for claim in claims}
+        await call_in_session(_GITHUB, "store", users)
+        found = {name.lower() for name, user in users.items() if user}
+        return {
+            claim.id: "GitHub user not found"
+            for claim in claims if claim.github_user_name.lower() not in found
+        }
+
+    async def _sync_leetcode(self, claims: List) -> Dict[Any, str]:
+        errors, profiles = {}, {}
+        for claim in claims:
+            if claim.profile_id is None:
+                errors[claim.id] = "No profile to store LeetCode statistics on"
+                continue
+            payload, ok = await LeetCodeService.fetchLeetcodeData(claim.leetcode_user_name, include_history=True)
+            data = payload["leetcode"]
+            if not ok or "error" in data:
+                errors[claim.id] = str(data.get("error"))
+            elif data.get("profile") is None:
+                errors[claim.id] = "LeetCode user not found"
+            else:
+                profiles[claim.profile_id] = data
+        if profiles:
+            await call_in_session(_LEETCODE, "store", profiles)
+        return errors
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "cycles": self.cycles,
+            "last_cycle_started_at": self.last_cycle_started_at,
+            "last_cycle_finished_at": self.last_cycle_finished_at,
+            "sources": {
+                source.value: {
+                    "synced": self.synced[source],
+                    "failed": self.failed[source],
+                    "in_flight": self.in_flight[source],
+                }
+                for source in SyncSource
+            },
+        }
+
+
+statistics_sync_scheduler = StatisticsSyncScheduler()
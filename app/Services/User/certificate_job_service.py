@@ -0,0 +1,231 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import anyio
+
+from Entities.UserDTOs.certificate_entity import BulkCertificateRequest
+from Services.User.certificate_service import BulkCertificateService
+from Settings.certificate_config import (
+    CERTIFICATE_JOB_DIR, CERTIFICATE_JOB_LEASE_SECONDS, CERTIFICATE_JOB_MAX_ATTEMPTS, CERTIFICATE_JOB_RETENTION_SECONDS,
+    CERTIFICATE_JOB_WORKERS,
+)
+from Settings.logging_config import setup_logging
+from Utils.Exceptions.user_exceptions import CertificateCohortEmpty, CertificateJobNotFound, CertificateJobNotReady
+from Utils.job_queue import DONE, FAILED, JobQueue
+
+logger = setup_logging()
+
+# Idle workers look for queued jobs this often; a job submitted to this process wakes them at once
+_POLL_SECONDS = 1.0
+# Progress is written (and the lease renewed) at most this often while a job runs
+_PROGRESS_SECONDS = 1.0
+# Subscribers see changes this often, and the current state at least this often
+_WATCH_SECONDS = 0.5
+_WATCH_HEARTBEAT_SECONDS = 15.0
+# Expired jobs and their ZIPs are looked for this often
+_PURGE_SECONDS = 600
+
+_TERMINAL = (DONE, FAILED)
+
+
+class _LeaseLost(Exception):
+    pass
+
+
+class CertificateJobRunner:
+    """
+    Accepts bulk certificate requests as jobs and runs them in the background of the API
+    process, CERTIFICATE_JOB_WORKERS at a time. A job streams the bulk ZIP, rendered by
+    the certificate pool, into a file next to the queue and records its progress as it
+    goes. Jobs are persisted in the queue before they are acknowledged, so a restarted
+    process (or another one sharing CERTIFICATE_JOB_DIR) runs whatever was left: jobs
+    interrupted by a shutdown go back to the queue at once, and those of a process that
+    died are reclaimed once their lease expires. Either way a job starts over.
+    """
+
+    def __init__(self):
+        self.queue = JobQueue(os.path.join(CERTIFICATE_JOB_DIR, "jobs.sqlite3"), CERTIFICATE_JOB_MAX_ATTEMPTS)
+        self.results_dir = os.path.join(CERTIFICATE_JOB_DIR, "results")
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._purged_at = float("-inf")
+        self.running: Dict[str, int] = {}
+        self.completed = 0
+        self.failed = 0
+
+    async def _call(self, method: str, *args) -> Any:
+        # SQLite calls block; keep them off the event loop
+        return await anyio.to_thread.run_sync(getattr(self.queue, method), *args)
+
+    # ----------------------
+    # Lifecycle
+    # ----------------------
+    def start(self):
+        if self._tasks or CERTIFICATE_JOB_WORKERS <= 0:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(CERTIFICATE_JOB_WORKERS)]
+        logger.info(f"Certificate job runner started with {CERTIFICATE_JOB_WORKERS} workers as {self.owner}")
+
+    async def stop(self):
+        if not self._tasks:
+            return
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Certificate job runner stopped")
+
+    # ----------------------
+    # API
+    # ----------------------
+    async def submit(self, request: BulkCertificateRequest) -> Dict[str, Any]:
+        job = await self._call("submit", request.model_dump_json())
+        logger.info(f"Certificate job {job['id']} queued")
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    async def get(self, job_id: str) -> Dict[str, Any]:
+        job = await self._call("get", job_id)
+        if job is None:
+            raise CertificateJobNotFound(job_id)
+        return job
+
+    async def result(self, job_id: str) -> str:
+        """Path of the job's ZIP; CertificateJobNotReady until the job is done."""
+        job = await self.get(job_id)
+        if job["status"] != DONE or not os.path.exists(job["result_path"]):
+            raise CertificateJobNotReady(job_id, job["status"])
+        return job["result_path"]
+
+    async def watch(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        The job's state whenever its status or progress changes, and at least every
+        _WATCH_HEARTBEAT_SECONDS, ending with its final state. Raises
+        CertificateJobNotFound before yielding anything if there is no such job.
+        """
+        job = await self.get(job_id)
+        while True:
+            yield job
+            if job["status"] in _TERMINAL:
+                return
+            seen, sent_at = (job["status"], job["progress"], job["total"]), time.monotonic()
+            while True:
+                await asyncio.sleep(_WATCH_SECONDS)
+                job = await self._call("get", job_id)
+                if job is None:
+                    return
+                if (job["status"], job["progress"], job["total"]) != seen:
+                    break
+                if time.monotonic() - sent_at >= _WATCH_HEARTBEAT_SECONDS:
+                    break
+
+    # ----------------------
+    # Workers
+    # ----------------------
+    async def _work(self):
+        while True:
+            try:
+                job = await self._call("claim", self.owner, CERTIFICATE_JOB_LEASE_SECONDS)
+                if job is not None:
+                    await self._run(job)
+                    continue
+                await self._purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Certificate job worker failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), _POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _run(self, job: Dict[str, Any]):
+        job_id = job["id"]
+        path = os.path.join(self.results_dir, f"{job_id}.zip")
+        partial = path + ".part"
+        service = BulkCertificateService(BulkCertificateRequest.model_validate_json(job["payload"]))
+        self.running[job_id] = 0
+        logger.info(f"Certificate job {job_id} started, attempt {job['attempts']}")
+        try:
+            total = await service.count()
+            await self._progress(job_id, 0, total)
+            try:
+                stream = await service.open()
+            except CertificateCohortEmpty as e:
+                await self._call("fail", job_id, self.owner, str(e))
+                self.failed += 1
+                return
+
+            os.makedirs(self.results_dir, exist_ok=True)
+            size = 0
+            reported_at = time.monotonic()
+            try:
+                with open(partial, "wb") as out:
+                    async for chunk in stream:
+                        await anyio.to_thread.run_sync(out.write, chunk)
+                        size += len(chunk)
+                        self.running[job_id] = service.processed
+                        if time.monotonic() - reported_at >= _PROGRESS_SECONDS:
+                            await self._progress(job_id, service.processed, total)
+                            reported_at = time.monotonic()
+            finally:
+                # Stopping early cancels the batches still queued in the pool
+                await stream.aclose()
+            os.replace(partial, path)
+            if not await self._call("finish", job_id, self.owner, path, size):
+                raise _LeaseLost()
+            self.completed += 1
+            logger.info(f"Certificate job {job_id} done: {service.rendered} rendered, {len(service.skipped)} skipped, {size} bytes")
+        except _LeaseLost:
+            logger.warning(f"Certificate job {job_id} lost its lease to another worker; dropping this run")
+        except asyncio.CancelledError:
+            # Shutting down: back to the queue, for this or another process to start over
+            await asyncio.shield(self._call("release", job_id, self.owner))
+            raise
+        except Exception as e:
+            logger.error(f"Certificate job {job_id} failed: {e}")
+            await self._call("fail", job_id, self.owner, str(e) or type(e).__name__)
+            self.failed += 1
+        finally:
+            self.running.pop(job_id, None)
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    async def _progress(self, job_id: str, progress: int, total: Optional[int]):
+        if not await self._call("progress", job_id, self.owner, progress, total, CERTIFICATE_JOB_LEASE_SECONDS):
+            raise _LeaseLost()
+
+    async def _purge(self):
+        if time.monotonic() - self._purged_at < _PURGE_SECONDS:
+            return
+        self._purged_at = time.monotonic()
+        expired = await self._call("purge", time.time() - CERTIFICATE_JOB_RETENTION_SECONDS)
+        for job in expired:
+            if job["result_path"] and os.path.exists(job["result_path"]):
+                os.remove(job["result_path"])
+        if expired:
+            logger.info(f"Purged {len(expired)} expired certificate jobs")
+
+    async def counts(self) -> Dict[str, int]:
+        """Jobs in the queue per status, across every process sharing it."""
+        return await self._call("counts")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "owner": self.owner,
+            "workers": len(self._tasks),
+            "running": dict(self.running),
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+certificate_jobs = CertificateJobRunner()
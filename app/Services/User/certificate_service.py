@@ -1,10 +1,236 @@
+import asyncio
+import hashlib
+from datetime import date, datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+import anyio
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from db import call_in_session
+from Entities.UserDTOs.certificate_entity import BulkCertificateRequest, CertificateFormat, CertificateRequest
+from Repository.User.user_repository import AsyncUserRepository, UserRepository
+from Schema.SQL.Models.models import Rank, User
+from Settings.certificate_config import CERTIFICATE_BULK_BATCH_SIZE
 from Settings.logging_config import setup_logging
+from Utils.certificate_pool import CertificateJob, get_certificate_pool, pool_workers, render_batch
+from Utils.certificate_renderer import PDF_MEDIA_TYPE, PNG_MEDIA_TYPE, get_certificate_renderer
+from Utils.content_store import certificate_store
+from Utils.Exceptions.user_exceptions import CertificateCohortEmpty, GitHubUsernameNotFound
+from Utils.zip_stream import ZipStream
 
 logger = setup_logging()
 
+ZIP_MEDIA_TYPE = "application/zip"
+# Users read from the database at a time while a bulk download streams
+_COHORT_PAGE_SIZE = 500
+
+
+def _certificate_id(user: User, event: str, issued_on: date) -> str:
+    # Stable for a user, event and date, so a certificate downloaded twice carries one ID
+    digest = hashlib.sha256(f"{user.id}|{event}|{issued_on.isoformat()}".encode()).hexdigest()[:16].upper()
+    return "DJK-" + "-".join(digest[i:i + 4] for i in range(0, 16, 4))
+
+
+def _certificate_values(user: User, request: CertificateRequest) -> Dict[str, Optional[str]]:
+    issued_on = request.issued_on or datetime.now(timezone.utc).date()
+    description = request.description
+    if description is None and user.rank and user.rank != Rank.UNRANKED:
+        description = f"Dijkstra rank: {user.rank.value.title()}"
+    return {
+        "recipient": " ".join(part for part in (user.first_name, user.middle_name, user.last_name) if part),
+        "handle": user.github_user_name,
+        "event": request.event,
+        "description": description,
+        "issued_on": f"{issued_on.day} {issued_on:%B %Y}",
+        "certificate_id": _certificate_id(user, request.event, issued_on),
+    }
+
+
+def _certificate_job(user: User, request: CertificateRequest) -> CertificateJob:
+    values = _certificate_values(user, request)
+    return f"{user.github_user_name}-certificate.{request.format.value}", values, f"{request.event} - {values['recipient']}"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as If-None-Match calls for
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class CertificateFile:
+    """
+    ``user``'s certificate for ``request``, identified by the hash of its rendering
+    inputs, which is also its ETag. ``load`` fills in ``path`` when the certificate
+    store already holds it, else renders it into ``content`` and stores it for the
+    next download.
+    """
+
+    def __init__(self, user: User, request: CertificateRequest):
+        renderer = get_certificate_renderer()
+        self.format = request.format.value
+        self.filename, self._values, self._title = _certificate_job(user, request)
+        self.media_type = PNG_MEDIA_TYPE if request.format == CertificateFormat.PNG else PDF_MEDIA_TYPE
+        self.key = renderer.cache_key(self.format, self._values, self._title)
+        self.etag = f'"{self.key}"'
+        self.not_modified = False
+        self.path: Optional[str] = None
+        self.content: Optional[bytes] = None
+
+    def check(self, if_none_match: Optional[str]) -> bool:
+        """Whether the client's copy is current, in which case nothing needs loading."""
+        self.not_modified = _etag_matches(if_none_match, self.etag)
+        return self.not_modified
+
+    def load(self):
+        # Blocking: a file stat, or a render and a file write
+        suffix = "." + self.format
+        self.path = certificate_store.get(self.key, suffix)
+        if self.path is not None:
+            return
+        renderer = get_certificate_renderer()
+        if self.format == CertificateFormat.PNG.value:
+            self.content = renderer.render_png(self._values)
+        else:
+            self.content = renderer.render_pdf(self._values, self._title)
+        # This response sends the bytes already in memory; later ones send the file
+        certificate_store.put(self.key, self.content, suffix)
+
+
 class CertificateGeneratorService:
-    @staticmethod
-    async def mainCertificateGeneratorService(userName: str):
-        # Placeholder for the actual certificate generation logic
-        logger.info(f"Generating certificate for user: {userName}")
-        return {"message": f"Certificate generated for {userName}"}
\ No newline at end of file
+    def __init__(self, session: Session):
+        self.repo = UserRepository(session)
+
+    def mainCertificateGeneratorService(
+        self, userName: str, request: CertificateRequest, if_none_match: Optional[str] = None,
+    ) -> CertificateFile:
+        user = self.repo.get_by_github_username(userName)
+        if not user:
+            raise GitHubUsernameNotFound(userName)
+        certificate = CertificateFile(user, request)
+        if not certificate.check(if_none_match):
+            logger.info(f"Generating {request.format.value} certificate for user: {userName}")
+            certificate.load()
+        return certificate
+
+
+class AsyncCertificateGeneratorService:
+    def __init__(self, session: AsyncSession):
+        self.repo = AsyncUserRepository(session)
+
+    async def mainCertificateGeneratorService(
+        self, userName: str, request: CertificateRequest, if_none_match: Optional[str] = None,
+    ) -> CertificateFile:
+        user = await self.repo.get_by_github_username(userName)
+        if not user:
+            raise GitHubUsernameNotFound(userName)
+        certificate = CertificateFile(user, request)
+        if not certificate.check(if_none_match):
+            logger.info(f"Generating {request.format.value} certificate for user: {userName}")
+            # Disk I/O and a few milliseconds of CPU, kept off the event loop
+            await anyio.to_thread.run_sync(certificate.load)
+        return certificate
+
+
+class BulkCertificateService:
+    """
+    Certificates for a cohort as a streamed ZIP. Users are read a page at a time, in
+    their own sessions, and rendered in batches by the process pool with at most two
+    batches per worker in flight. Each certificate goes out as soon as its batch is
+    done, so memory stays flat however large the cohort is. Listed usernames that do
+    not exist (or lack the requested rank) are named in skipped.txt.
+    """
+
+    def __init__(self, request: BulkCertificateRequest):
+        self.request = request
+        self.rendered = 0
+        self.skipped: List[str] = []
+
+    @property
+    def processed(self) -> int:
+        return self.rendered + len(self.skipped)
+
+    async def count(self) -> int:
+        """Users the cohort covers, counting listed usernames that turn out to be skipped."""
+        if self.request.github_user_names is not None:
+            return len(set(self.request.github_user_names))
+        return await call_in_session((UserRepository, AsyncUserRepository), "count_cohort", self.request.rank)
+
+    def _cohort(self) -> str:
+        names = self.request.github_user_names
+        parts = [f"{len(names)} listed usernames"] if names is not None else []
+        if self.request.rank:
+            parts.append(f"rank {self.request.rank.value}")
+        return " with ".join(parts)
+
+    async def _pages(self) -> AsyncIterator[List[User]]:
+        names, rank = self.request.github_user_names, self.request.rank
+        if names is not None:
+            ordered = sorted(set(names))
+            for start in range(0, len(ordered), _COHORT_PAGE_SIZE):
+                chunk = ordered[start:start + _COHORT_PAGE_SIZE]
+                users = await call_in_session((UserRepository, AsyncUserRepository), "cohort", chunk, rank, None, len(chunk))
+                found = {user.github_user_name for user in users}
+                self.skipped.extend(name for name in chunk if name not in found)
+                yield users
+            return
+
+        after = None
+        while True:
+            users = await call_in_session((UserRepository, AsyncUserRepository), "cohort", None, rank, after, _COHORT_PAGE_SIZE)
+            if users:
+                yield users
+            if len(users) < _COHORT_PAGE_SIZE:
+                return
+            after = users[-1].github_user_name
+
+    async def open(self) -> AsyncIterator[bytes]:
+        """
+        Reads up to the first user of the cohort, raising CertificateCohortEmpty if there
+        is none, and returns the ZIP stream. Called before the response starts, so an
+        empty cohort is still a 404.
+        """
+        pages = self._pages()
+        async for users in pages:
+            if users:
+                return self._stream(users, pages)
+        raise CertificateCohortEmpty(self._cohort())
+
+    def _archive(self, archive: ZipStream, done: Set[asyncio.Future]) -> bytes:
+        chunks = []
+        for batch in done:
+            for name, content in batch.result():
+                chunks.append(archive.add(name, content))
+                self.rendered += 1
+        return b"".join(chunks)
+
+    async def _stream(self, first: List[User], pages: AsyncIterator[List[User]]) -> AsyncIterator[bytes]:
+        pool = get_certificate_pool()
+        window = 2 * pool_workers()
+        file_format = self.request.format.value
+        archive = ZipStream()
+        in_flight: Set[asyncio.Future] = set()
+        try:
+            users: Optional[List[User]] = first
+            while users is not None:
+                for start in range(0, len(users), CERTIFICATE_BULK_BATCH_SIZE):
+                    jobs = [_certificate_job(user, self.request) for user in users[start:start + CERTIFICATE_BULK_BATCH_SIZE]]
+                    in_flight.add(asyncio.wrap_future(pool.submit(render_batch, file_format, jobs)))
+                    if len(in_flight) >= window:
+                        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        yield self._archive(archive, done)
+                users = await anext(pages, None)
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                yield self._archive(archive, done)
+            if self.skipped:
+                yield archive.add("skipped.txt", ("\n".join(self.skipped) + "\n").encode())
+            yield archive.close()
+            logger.info(f"Bulk certificates for {self._cohort()}: {self.rendered} rendered, {len(self.skipped)} skipped")
+        finally:
+            # The client went away: drop batches no worker has started
+            for batch in in_flight:
+                batch.cancel()
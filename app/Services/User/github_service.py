@@ -1,150 +1,182 @@
-import os
-from typing import Dict
-import os
-from typing import Dict, Any
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional
+import anyio
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Settings.logging_config import setup_logging
 
+from db import call_in_session
+from Entities.UserDTOs.github_entity import GitHubSyncResult
+from Repository.User.github_repository import AsyncGithubRepository, GithubRepository
+from Settings.http_config import (
+    GITHUB_GRAPHQL_BATCH_SIZE, GITHUB_ORG, GITHUB_REPOS_PAGE_SIZE, UPSTREAM_CIRCUIT_FAILURE_THRESHOLD,
+    UPSTREAM_CIRCUIT_RESET_SECONDS,
+)
+from Utils.circuit_breaker import register_circuit, stale_marker
+from Utils.Exceptions.user_exceptions import GitHubApiError
+from Utils.Helpers.github_helpers import (
+    _persisted_summary, _prepare_sync, _repository_page_query, _summarize_user, _user_batch_query,
+)
+from Utils.github_client import github_client
+from Utils.single_flight import register_single_flight
+
 logger = setup_logging()
-load_dotenv()
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 
-HEADERS = {
-    "Accept": "application/vnd.github+json",
-    "Authorization": f"Bearer {GITHUB_TOKEN}" if GITHUB_TOKEN else ""
-}
+# Concurrent lookups of the same login share one upstream call
+_user_flight = register_single_flight("github.user")
+# Opens after repeated failed calls, so a GitHub outage stops holding requests for a timeout each
+_upstream_circuit = register_circuit("github", UPSTREAM_CIRCUIT_FAILURE_THRESHOLD, UPSTREAM_CIRCUIT_RESET_SECONDS)
+
+_CIRCUIT_OPEN = "GitHub is unavailable (circuit open)"
 
 class GitHubService:
   @staticmethod
-  def getAllGitHubData(username: str) -> Dict[str, Any]:
-    
-#   General Data
-# - UserName
-# - Full Name
-# - Avatar Img Link
-# - Bio
-# - Followers
-# - Following
-# - Current Company
-# - Current Location
-# - Time Zone
-# - Websites/Links (Array)
-# - Organizations List (Array) [FK to Organizations Table]
-
-# Dijkstra Specific Statistics
-# - Team (List of Objects)
-#      - Team Name
-#      - Team Link
-#      - Superior
-# - Repositories Contributed to (List) - Repository list (all of these stats need to be specific to Repo within Dijkstra)
-#     - Lines Added
-#     - Lines Removed
-#     - Frameworks present in Repo (We assume that this is what the user has worked with)
-#     - Languages Used (By User) : List
-#          - Language Name
-#          - Language Percentage Used
-#          - Total Lines contributed with said Language
-#     - PR's raised
-#     - Commits
-#     - Issues Created
-# - Total PR's
-# - Total Lines contributed
-# - Total Commits
-# - Total Issues Created
-# - Start Date
-# - Time Period (Start Date to Last Contribution)
-# - Dijkstra Rank (Say Gold)
-# - Repositories Forked
-
-# Overall GitHub Statistics
-# - Total Lines Contributed
-# - Total PR's raised
-# - Total Issues Created
-# - Total Repos (forked/private)
-# - Total Commits
-# - Languages Used (By User) : List
-#          - Language Name
-#          - Language Percentage Used
-#          - Total Lines contributed with said Language
-# - Contribution Graph Link
-
-    return {
-      "general_data": {
-          "username": "johndoe",
-          "full_name": "John Doe",
-          "avatar_img_link": "https://avatars.githubusercontent.com/u/123456?v=4",
-          "bio": "Software engineer passionate about open source and education.",
-          "followers": 150,
-          "following": 45,
-          "current_company": "Dijkstra",
-          "current_location": "Zurich, Switzerland",
-          "time_zone": "CET",
-          "websites_links": ["https://johndoe.dev", "https://github.com/johndoe"],
-          "organizations_list": ["Dijkstra", "Python Software Foundation"]
-      },
-      "dijkstra_statistics": {
-          "team": [
-              {
-                  "team_name": "Backend Wizards",
-                  "team_link": "https://github.com/orgs/Dijkstra/teams/backend-wizards",
-                  "superior": "Alice Smith"
-              },
-              {
-                  "team_name": "Frontend Ninjas",
-                  "team_link": "https://github.com/orgs/Dijkstra/teams/frontend-ninjas",
-                  "superior": "Bob Johnson"
-              }
-          ],
-          "repositories_contributed_to": [
-              {
-                  "repo_name": "dijkstra-core",
-                  "lines_added": 1200,
-                  "lines_removed": 300,
-                  "frameworks_present": ["FastAPI", "React"],
-                  "languages_used": [
-                      {"language_name": "Python", "percentage_used": 70, "total_lines": 840},
-                      {"language_name": "TypeScript", "percentage_used": 30, "total_lines": 360}
-                  ],
-                  "prs_raised": 10,
-                  "commits": 25,
-                  "issues_created": 5
-              },
-              {
-                  "repo_name": "dijkstra-frontend",
-                  "lines_added": 800,
-                  "lines_removed": 200,
-                  "frameworks_present": ["Next.js", "TailwindCSS"],
-                  "languages_used": [
-                      {"language_name": "TypeScript", "percentage_used": 90, "total_lines": 720},
-                      {"language_name": "CSS", "percentage_used": 10, "total_lines": 80}
-                  ],
-                  "prs_raised": 7,
-                  "commits": 18,
-                  "issues_created": 3
-              }
-          ],
-          "total_prs": 17,
-          "total_lines_contributed": 2500,
-          "total_commits": 43,
-          "total_issues_created": 8,
-          "start_date": "2023-01-15",
-          "time_period": "2023-01-15 to 2025-08-13",
-          "dijkstra_rank": "Gold",
-          "repositories_forked": ["dijkstra-utils", "dijkstra-docs"]
-      },
-      "overall_github_statistics": {
-          "total_lines_contributed": 10000,
-          "total_prs_raised": 75,
-          "total_issues_created": 20,
-          "total_repos": 30,
-          "total_commits": 150,
-          "languages_used": [
-              {"language_name": "Python", "percentage_used": 60, "total_lines": 6000},
-              {"language_name": "TypeScript", "percentage_used": 30, "total_lines": 3000},
-              {"language_name": "CSS", "percentage_used": 10, "total_lines": 1000}
-          ],
-          "contribution_graph_link": "https://github.com/johndoe"
-      }
-  }
+  async def getAllGitHubData(username: str) -> Dict[str, Any]:
+    """
+    General data, Dijkstra (GITHUB_ORG) contributions, overall statistics and
+    repositories for one user. Contribution counts cover the last year, and
+    lines contributed are not exposed by the GitHub API.
+    """
+    # Logins are case-insensitive
+    return await _user_flight.run(username.lower(), lambda: GitHubService._fetchUserSummary(username))
+
+  @staticmethod
+  async def _fetchUserSummary(username: str) -> Dict[str, Any]:
+    try:
+      users = await GitHubService.fetchUsersStats([username])
+    except GitHubApiError as e:
+      logger.warning(f"GitHub request failed for user {username}: {e.reason}")
+      # While GitHub is down, the statistics stored by the sync are better than nothing
+      if not _upstream_circuit.closed:
+        try:
+          stored = await call_in_session((GitHubStatsService, AsyncGitHubStatsService), "stored", username)
+        except SQLAlchemyError as db_error:
+          logger.warning(f"Stored GitHub statistics unavailable for user {username}: {db_error}")
+          stored = None
+        if stored is not None:
+          return stored
+      return {"github": {"error": e.reason}}
+
+    user = users[username]
+    if user is None:
+      return {"github": {"error": f"GitHub user '{username}' not found"}}
+    return _summarize_user(user, GITHUB_ORG)
+
+  @staticmethod
+  async def fetchUsersStats(usernames: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    GitHubUserStats per distinct username (None for unknown logins), with all repository
+    pages merged in. Users go GITHUB_GRAPHQL_BATCH_SIZE per request as aliases, and
+    further repository pages are fetched the same way for every user that has more.
+    Requests run one after another, as GitHub asks of GraphQL clients.
+    """
+    # Logins are case-insensitive; each one is fetched once
+    names = list({name.lower(): name for name in usernames}.values())
+    users: Dict[str, Optional[Dict[str, Any]]] = {}
+    for start in range(0, len(names), GITHUB_GRAPHQL_BATCH_SIZE):
+      batch = names[start:start + GITHUB_GRAPHQL_BATCH_SIZE]
+      variables = {f"u{i}": name for i, name in enumerate(batch)}
+      data = await GitHubService._graphql(_user_batch_query(len(batch)), variables)
+      for i, name in enumerate(batch):
+        users[name] = data.get(f"u{i}")
+
+    pending = [name for name, user in users.items() if user and user["repositories"]["pageInfo"]["hasNextPage"]]
+    while pending:
+      more = []
+      for start in range(0, len(pending), GITHUB_GRAPHQL_BATCH_SIZE):
+        batch = pending[start:start + GITHUB_GRAPHQL_BATCH_SIZE]
+        variables = {}
+        for i, name in enumerate(batch):
+          variables[f"u{i}"] = name
+          variables[f"c{i}"] = users[name]["repositories"]["pageInfo"]["endCursor"]
+        data = await GitHubService._graphql(_repository_page_query(len(batch)), variables)
+        for i, name in enumerate(batch):
+          page = (data.get(f"u{i}") or {}).get("repositories")
+          repositories = users[name]["repositories"]
+          if page is None:
+            repositories["pageInfo"]["hasNextPage"] = False
+            continue
+          repositories["nodes"].extend(page["nodes"])
+          repositories["pageInfo"] = page["pageInfo"]
+          if page["pageInfo"]["hasNextPage"]:
+            more.append(name)
+      pending = more
+    return users
+
+  @staticmethod
+  async def _graphql(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    if not _upstream_circuit.allow():
+      raise GitHubApiError(_CIRCUIT_OPEN)
+    try:
+      # Token choice and pacing against the rate limit are up to the client
+      payload = await github_client.graphql(query, {**variables, "repoPageSize": GITHUB_REPOS_PAGE_SIZE})
+    except GitHubApiError:
+      # The rate limit governor gave up, or GitHub rate limited every token; neither is GitHub failing
+      raise
+    except Exception as e:
+      _upstream_circuit.record_failure()
+      raise GitHubApiError(str(e)) from e
+    _upstream_circuit.record_success()
+
+    # An unknown login comes back as a NOT_FOUND error next to the other aliases' data
+    errors = [error for error in payload.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+    if errors or payload.get("data") is None:
+      raise GitHubApiError(errors[0].get("message") if errors else "response carried no data")
+    return payload["data"]
+
+
+def _stored_summary(stored) -> Optional[Dict[str, Any]]:
+  if stored is None:
+    return None
+  github, projects = stored
+  return {**_persisted_summary(github, projects), "stale": stale_marker("database", github.updated_at, _CIRCUIT_OPEN)}
+
+
+class GitHubStatsService:
+  def __init__(self, session: Session):
+    self.session = session
+    self.repo = GithubRepository(session)
+
+  def sync_users(self, usernames: List[str]) -> GitHubSyncResult:
+    """
+    Fetches statistics for every username and stores them in Github, along with
+    each user's repositories in Projects, in one transaction.
+    """
+    # Sync routes run in the threadpool; the fetch goes back to the event loop
+    users = anyio.from_thread.run(GitHubService.fetchUsersStats, usernames)
+    return self.store(users)
+
+  def store(self, users: Dict[str, Optional[Dict[str, Any]]]) -> GitHubSyncResult:
+    """
+    Stores users already fetched with GitHubService.fetchUsersStats.
+    """
+    profile_ids = self.repo.profile_ids(user["login"] for user in users.values() if user)
+    github_rows, project_rows, result = _prepare_sync(users, profile_ids, GITHUB_ORG)
+    result.projects = self.repo.save_stats(github_rows, project_rows)
+    return result
+
+  def stored(self, username: str) -> Optional[Dict[str, Any]]:
+    """
+    The statistics last stored for ``username``, shaped like getAllGitHubData's
+    result and marked stale, or None when the sync has never stored the user.
+    """
+    return _stored_summary(self.repo.stored_stats(username))
+
+
+class AsyncGitHubStatsService:
+  def __init__(self, session: AsyncSession):
+    self.session = session
+    self.repo = AsyncGithubRepository(session)
+
+  async def sync_users(self, usernames: List[str]) -> GitHubSyncResult:
+    users = await GitHubService.fetchUsersStats(usernames)
+    return await self.store(users)
 
+  async def store(self, users: Dict[str, Optional[Dict[str, Any]]]) -> GitHubSyncResult:
+    profile_ids = await self.repo.profile_ids(user["login"] for user in users.values() if user)
+    github_rows, project_rows, result = _prepare_sync(users, profile_ids, GITHUB_ORG)
+    result.projects = await self.repo.save_stats(github_rows, project_rows)
+    return result
 
+  async def stored(self, username: str) -> Optional[Dict[str, Any]]:
+    return _stored_summary(await self.repo.stored_stats(username))
@@ -1,36 +1,218 @@
-import requests
-from typing import Dict, Any
+import asyncio
+from datetime import datetime, timezone
+from sqlalchemy.exc import SQLAlchemyError
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from uuid import UUID
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Settings.logging_config import setup_logging
 
+from db import call_in_session
 from Config.constants import LEETCODE_API
 from Config.queries import lc_query
+from Entities.UserDTOs.leetcode_entity import ContestHistorySeries
+from Repository.User.leetcode_repository import AsyncLeetcodeRepository, LeetcodeRepository
+from Settings.cache_config import (
+    LEETCODE_CACHE_FAILURE_TTL_SECONDS, LEETCODE_CACHE_MAX_ENTRIES,
+    LEETCODE_CACHE_MAX_STALE_SECONDS, LEETCODE_CACHE_TTL_SECONDS,
+)
+from Utils.cache import StaleWhileRevalidateCache, register_cache
+from Settings.http_config import (
+    LEETCODE_BATCH_CONCURRENCY, LEETCODE_MAX_RPS, UPSTREAM_CIRCUIT_FAILURE_THRESHOLD, UPSTREAM_CIRCUIT_RESET_SECONDS,
+)
+from Utils.circuit_breaker import register_circuit, stale_marker
+from Utils.Exceptions.user_exceptions import ContestHistoryNotFound
+from Utils.Helpers.leetcode_helpers import (
+    _badge_rows, _contest_points, _contest_series, _leetcode_row, _persisted_leetcode, _tag_rows,
+)
+from Utils.http_client import request_with_retries
+from Utils.rate_limit import AsyncTokenBucket
 
 
 logger = setup_logging()
 
+# Parsed lc_query responses keyed by username
+_lc_cache = register_cache(
+    "leetcode.profile",
+    LEETCODE_CACHE_MAX_ENTRIES,
+    LEETCODE_CACHE_TTL_SECONDS,
+    cache_class=StaleWhileRevalidateCache,
+    max_stale=LEETCODE_CACHE_MAX_STALE_SECONDS,
+    failure_ttl=LEETCODE_CACHE_FAILURE_TTL_SECONDS,
+)
+# Shared by every upstream call in this process, whichever route made it
+_upstream_limit = AsyncTokenBucket(LEETCODE_MAX_RPS)
+# Opens after repeated failed calls, so a LeetCode outage stops holding requests for a timeout each
+_upstream_circuit = register_circuit("leetcode", UPSTREAM_CIRCUIT_FAILURE_THRESHOLD, UPSTREAM_CIRCUIT_RESET_SECONDS)
+
+_CIRCUIT_OPEN = "LeetCode is unavailable (circuit open)"
+
 class LeetCodeService:
     @staticmethod
-    def getAllLeetcodeData(userName: str) -> Dict[str, Any]:        
+    async def getAllLeetcodeData(userName: str) -> Dict[str, Any]:
+        """
+        Cached LeetCode profile and contest ranking for ``userName``. While the LeetCode
+        circuit is not closed, the cached copy, or else the statistics stored by the
+        sync, is returned with a "stale" marker instead.
+        """
+        payload = await _lc_cache.get_or_fetch(userName, lambda: LeetCodeService.fetchLeetcodeData(userName))
+        if _upstream_circuit.closed:
+            return payload
+        if "error" not in payload["leetcode"]:
+            fetched_at = _lc_cache.fetched_at(userName)
+            as_of = datetime.fromtimestamp(fetched_at, timezone.utc) if fetched_at else None
+            return {**payload, "stale": stale_marker("cache", as_of, _CIRCUIT_OPEN)}
+        try:
+            stored = await call_in_session((LeetcodeStatsService, AsyncLeetcodeStatsService), "stored", userName)
+        except SQLAlchemyError as e:
+            logger.warning(f"Stored LeetCode statistics unavailable for user {userName}: {e}")
+            stored = None
+        return stored or payload
+
+    @staticmethod
+    async def streamLeetcodeData(userNames: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Looks up every username (duplicates once) with at most LEETCODE_BATCH_CONCURRENCY
+        in flight, yielding {"username": ..., "leetcode": ...} as each one finishes,
+        so a slow user never holds back the rest of the batch.
+        """
+        names = iter(dict.fromkeys(userNames))
+        total = len(dict.fromkeys(userNames))
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            # Workers share one iterator; next() never awaits, so each name is taken once
+            for name in names:
+                try:
+                    data = await LeetCodeService.getAllLeetcodeData(name)
+                except Exception as e:
+                    data = {"leetcode": {"error": str(e)}}
+                await results.put({"username": name, **data})
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, min(LEETCODE_BATCH_CONCURRENCY, total)))]
         try:
-            response = requests.post(
+            for _ in range(total):
+                yield await results.get()
+        finally:
+            # Client went away or the batch is done; started fetches still fill the cache
+            for task in workers:
+                task.cancel()
+
+    @staticmethod
+    async def fetchLeetcodeData(userName: str, include_history: bool = False) -> Tuple[Dict[str, Any], bool]:
+        """
+        Runs lc_query against leetcode.com. Returns (payload, ok); ok is False when
+        the request itself failed (network error, timeout, non-2xx, unreadable body),
+        as opposed to LeetCode answering with GraphQL errors. With include_history the
+        payload also carries the attended contests, packed by _contest_points.
+        """
+        if not _upstream_circuit.allow():
+            return {"leetcode": {"error": _CIRCUIT_OPEN}}, False
+        try:
+            # A read-only GraphQL query, so it is safe to retry; each attempt counts against the limit
+            response = await request_with_retries(
+                "POST",
                 LEETCODE_API,
+                limiter=_upstream_limit,
                 json={"query": lc_query, "variables": {"username": userName}},
-                timeout=20
             )
+            response.raise_for_status()
             data = response.json()
+        except Exception as e:
+            _upstream_circuit.record_failure()
+            logger.warning(f"LeetCode request failed for user {userName}: {e}")
+            return {"leetcode": {"error": str(e)}}, False
+        # GraphQL errors (an unknown user, say) still mean LeetCode is up
+        _upstream_circuit.record_success()
 
-            if "errors" in data:
-                return {"leetcode": {"error": data["errors"]}}
+        if "errors" in data:
+            return {"leetcode": {"error": data["errors"]}}, True
 
-            result_data = data.get("data", {})
+        result_data = data.get("data", {})
 
-            return {
-                "leetcode": {
-                    "profile": result_data.get("matchedUser"),
-                    "contestRanking": result_data.get("userContestRanking"),
-                    # "contestHistory": result_data.get("userContestRankingHistory")
-                }
-            }
+        leetcode = {
+            "profile": result_data.get("matchedUser"),
+            "contestRanking": result_data.get("userContestRanking"),
+        }
+        if include_history:
+            leetcode["contestHistory"] = _contest_points(result_data.get("userContestRankingHistory"))
+        return {"leetcode": leetcode}, True
 
-        except Exception as e:
-            return {"leetcode": {"error": str(e)}}
\ No newline at end of file
+
+def _stats_entries(profiles: Dict[UUID, Dict[str, Any]]) -> List[dict]:
+    # profiles maps a profile id to fetchLeetcodeData's {"profile", "contestRanking", "contestHistory"} section
+    return [
+        {
+            "profile_id": profile_id,
+            "leetcode": _leetcode_row(data["profile"], data.get("contestRanking")),
+            "badges": _badge_rows(data["profile"]),
+            "tags": _tag_rows(data["profile"]),
+            "history": data.get("contestHistory"),
+        }
+        for profile_id, data in profiles.items()
+    ]
+
+
+def _epoch(moment: Optional[datetime]) -> Optional[int]:
+    # Naive datetimes are taken as UTC
+    if moment is None:
+        return None
+    return int(moment.replace(tzinfo=moment.tzinfo or timezone.utc).timestamp())
+
+
+def _stored_payload(stored) -> Optional[Dict[str, Any]]:
+    if stored is None:
+        return None
+    leetcode, badges, tags = stored
+    return {
+        "leetcode": _persisted_leetcode(leetcode, badges, tags),
+        "stale": stale_marker("database", leetcode.updated_at, _CIRCUIT_OPEN),
+    }
+
+
+def _series(lc_username: str, history, start: Optional[datetime], end: Optional[datetime], max_points: int) -> ContestHistorySeries:
+    if history is None:
+        raise ContestHistoryNotFound(lc_username)
+    return ContestHistorySeries(username=lc_username, **_contest_series(history, _epoch(start), _epoch(end), max_points))
+
+
+class LeetcodeStatsService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.repo = LeetcodeRepository(session)
+
+    def store(self, profiles: Dict[UUID, Dict[str, Any]]) -> int:
+        """
+        Stores fetched LeetCode data in Leetcode, LeetcodeBadges, LeetcodeTags and
+        LeetcodeContestHistory, one transaction for every profile given.
+        """
+        return self.repo.save_stats(_stats_entries(profiles))
+
+    def contest_history(self, lc_username: str, start: Optional[datetime], end: Optional[datetime], max_points: int) -> ContestHistorySeries:
+        """
+        Stored rating and ranking series of ``lc_username`` between start and end,
+        downsampled to at most max_points.
+        """
+        return _series(lc_username, self.repo.contest_history(lc_username), start, end, max_points)
+
+    def stored(self, lc_username: str) -> Optional[Dict[str, Any]]:
+        """
+        The statistics last stored for ``lc_username``, shaped like getAllLeetcodeData's
+        payload and marked stale, or None when the sync has never stored the user.
+        """
+        return _stored_payload(self.repo.stored_stats(lc_username))
+
+
+class AsyncLeetcodeStatsService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = AsyncLeetcodeRepository(session)
+
+    async def store(self, profiles: Dict[UUID, Dict[str, Any]]) -> int:
+        return await self.repo.save_stats(_stats_entries(profiles))
+
+    async def contest_history(self, lc_username: str, start: Optional[datetime], end: Optional[datetime], max_points: int) -> ContestHistorySeries:
+        return _series(lc_username, await self.repo.contest_history(lc_username), start, end, max_points)
+
+    async def stored(self, lc_username: str) -> Optional[Dict[str, Any]]:
+        return _stored_payload(await self.repo.stored_stats(lc_username))
@@ -1,23 +1,37 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from Entities.UserDTOs.location_entity import CreateLocation, UpdateLocation
 from Schema.SQL.Models.models import Location
-from Repository.User.location_repository import LocationRepository
+from Repository.User.location_repository import AsyncLocationRepository, LocationRepository
+from Settings.cache_config import ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_NEGATIVE_TTL_SECONDS, ENTITY_CACHE_TTL_SECONDS
 from Utils.Exceptions.user_exceptions import LocationNotFound
+from Utils.cache import cached, cached_async, register_cache
+from Utils.session_routing import bound_to_replica
+
+# get_location rows by id, misses included; dropped by the matching write
+_entity_cache = register_cache("locations.entity", ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_TTL_SECONDS)
 
 class LocationService:
     def __init__(self, session: Session):
         self.repo = LocationRepository(session)
+        self.fill_cache = not bound_to_replica(session)
 
     def create_location(self, location_create: CreateLocation) -> Location:
         location = Location(**location_create.dict(exclude_unset=True))
-        return self.repo.create(location)
+        location = self.repo.create(location)
+        _entity_cache.invalidate(location.id)
+        return location
 
     def get_location(self, location_id: UUID) -> Optional[Location]:
-        location = self.repo.get(location_id)
+        location = cached(
+            _entity_cache, location_id, lambda: self.repo.get(location_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+            fill=self.fill_cache,
+        )
         if not location:
-            return LocationNotFound(location_id)
+            raise LocationNotFound(location_id)
         return location
 
     def list_locations(
@@ -29,7 +43,8 @@ class LocationService:
         city: Optional[str] = None,
         state: Optional[str] = None,
         country: Optional[str] = None,
-    ) -> List[Location]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
         """
         Supports pagination, filtering, and sorting.
         """
@@ -41,6 +56,7 @@ class LocationService:
             city=city,
             state=state,
             country=country,
+            cursor=cursor,
         )
 
     def autocomplete_locations(
@@ -55,18 +71,77 @@ class LocationService:
         return self.repo.autocomplete(query=query, field=field, limit=limit)
 
     def update_location(self, location_id: UUID, location_update: UpdateLocation) -> Optional[Location]:
-        location = self.repo.get(location_id)
-        if not location:
-            return LocationNotFound(location_id)
-        
         update_data = location_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(location, key, value)
-        return self.repo.update(location)
+        location = self.repo.update(location_id, update_data)
+        _entity_cache.invalidate(location_id)
+        if not location:
+            raise LocationNotFound(location_id)
+        return location
 
     def delete_location(self, location_id: UUID) -> Optional[str]:
-        location = self.repo.get(location_id)
+        deleted = self.repo.delete(location_id)
+        _entity_cache.invalidate(location_id)
+        if not deleted:
+            raise LocationNotFound(location_id)
+        return f"Location {location_id} deleted successfully"
+
+class AsyncLocationService:
+    def __init__(self, session: AsyncSession):
+        self.repo = AsyncLocationRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+
+    async def create_location(self, location_create: CreateLocation) -> Location:
+        location = Location(**location_create.dict(exclude_unset=True))
+        location = await self.repo.create(location)
+        _entity_cache.invalidate(location.id)
+        return location
+
+    async def get_location(self, location_id: UUID) -> Optional[Location]:
+        location = await cached_async(
+            _entity_cache, location_id, lambda: self.repo.get(location_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+            fill=self.fill_cache,
+        )
         if not location:
-            return LocationNotFound(location_id)
-        self.repo.delete(location)
-        return f"Location {location_id} deleted successfully"
\ No newline at end of file
+            raise LocationNotFound(location_id)
+        return location
+
+    async def list_locations(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        country: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
+        return await self.repo.list(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            city=city,
+            state=state,
+            country=country,
+            cursor=cursor,
+        )
+
+    async def autocomplete_locations(self, query: str, field: str = "city", limit: int = 10) -> List[Location]:
+        return await self.repo.autocomplete(query=query, field=field, limit=limit)
+
+    async def update_location(self, location_id: UUID, location_update: UpdateLocation) -> Optional[Location]:
+        update_data = location_update.dict(exclude_unset=True)
+        location = await self.repo.update(location_id, update_data)
+        _entity_cache.invalidate(location_id)
+        if not location:
+            raise LocationNotFound(location_id)
+        return location
+
+    async def delete_location(self, location_id: UUID) -> Optional[str]:
+        deleted = await self.repo.delete(location_id)
+        _entity_cache.invalidate(location_id)
+        if not deleted:
+            raise LocationNotFound(location_id)
+        return f"Location {location_id} deleted successfully"
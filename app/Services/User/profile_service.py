@@ -1,11 +1,12 @@
 from uuid import UUID
 from sqlmodel import Session, select
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional, Tuple
 
 
 from Entities.UserDTOs.profile_entity import CreateProfile, UpdateProfile
 from Schema.SQL.Models.models import Profile, User
-from Repository.User.profile_repository import ProfileRepository
+from Repository.User.profile_repository import AsyncProfileRepository, ProfileRepository
 from Utils.Exceptions.user_exceptions import ProfileAlreadyExists, ProfileNotFound, ProfileNotFound, UserNotFound
 
 class ProfileService:
@@ -30,13 +31,13 @@ class ProfileService:
     def get_profile(self, profile_id: UUID) -> Optional[Profile]:
         profile = self.repo.get(profile_id)
         if not profile:
-            return ProfileNotFound(profile_id)
+            raise ProfileNotFound(profile_id)
         return profile
 
     def get_profile_by_user_id(self, user_id: UUID) -> Optional[Profile]:
         profile = self.repo.get_by_user_id(user_id)
         if not profile:
-            return ProfileNotFound(user_id)
+            raise ProfileNotFound(user_id)
         return profile
 
     def list_profiles(
@@ -46,7 +47,8 @@ class ProfileService:
         sort_by: str = "created_at",
         order: str = "desc",
         user_id: Optional[UUID] = None,
-    ) -> List[Profile]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Profile], Optional[str]]:
         """
         Supports pagination, filtering, and sorting.
         """
@@ -56,41 +58,122 @@ class ProfileService:
             sort_by=sort_by,
             order=order,
             user_id=user_id,
+            cursor=cursor,
         )
 
     def update_profile(self, profile_id: UUID, profile_update: UpdateProfile) -> Optional[Profile]:
-        profile = self.repo.get(profile_id)
-        if not profile:
-            return ProfileNotFound(profile_id)
-
         # Check if user_id is being updated and if the new user exists
-        if profile_update.user_id and profile_update.user_id != profile.user_id:
+        if profile_update.user_id:
             user = self.session.get(User, profile_update.user_id)
             if not user:
                 raise UserNotFound(profile_update.user_id)
 
-            # Check if profile already exists for the new user
+            # Check if another profile already exists for the new user
             existing_profile = self.repo.get_by_user_id(profile_update.user_id)
-            if existing_profile:
+            if existing_profile and existing_profile.id != profile_id:
                 raise ProfileAlreadyExists(profile_update.user_id)
 
         update_data = profile_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(profile, key, value)
-        return self.repo.update(profile)
+        profile = self.repo.update(profile_id, update_data)
+        if not profile:
+            raise ProfileNotFound(profile_id)
+        return profile
 
     def delete_profile(self, profile_id: UUID) -> Optional[str]:
-        profile = self.repo.get(profile_id)
-        if not profile:
-            return ProfileNotFound(profile_id)
-        self.repo.delete(profile)
+        if not self.repo.delete(profile_id):
+            raise ProfileNotFound(profile_id)
         return f"Profile with ID {profile_id} deleted successfully."
 
     # Secondary Methods
+    def get_full_profile(self, profile_id: UUID) -> Profile:
+        profile = self.repo.get_full(profile_id)
+        if not profile:
+            raise ProfileNotFound(profile_id)
+        return profile
+
     def get_profile_with_user_details(self, profile_id: UUID) -> Optional[Profile]:
         profile = self.repo.get_with_user_details(profile_id)
         if profile:
             # This will load the user relationship if it's not already loaded
             # You might need to adjust this based on your actual relationship setup
             return profile
-        return None
\ No newline at end of file
+        return None
+
+class AsyncProfileService:
+    def __init__(self, session: AsyncSession):
+        self.repo = AsyncProfileRepository(session)
+        self.session = session
+
+    async def create_profile(self, profile_create: CreateProfile) -> Profile:
+        # Check if user exists
+        user = await self.session.get(User, profile_create.user_id)
+        if not user:
+            raise UserNotFound(profile_create.user_id)
+
+        # Check if profile already exists for this user
+        existing_profile = await self.repo.get_by_user_id(profile_create.user_id)
+        if existing_profile:
+            raise ProfileAlreadyExists(profile_create.user_id)
+
+        profile = Profile(**profile_create.dict(exclude_unset=True))
+        return await self.repo.create(profile)
+
+    async def get_profile(self, profile_id: UUID) -> Optional[Profile]:
+        profile = await self.repo.get(profile_id)
+        if not profile:
+            raise ProfileNotFound(profile_id)
+        return profile
+
+    async def get_profile_by_user_id(self, user_id: UUID) -> Optional[Profile]:
+        profile = await self.repo.get_by_user_id(user_id)
+        if not profile:
+            raise ProfileNotFound(user_id)
+        return profile
+
+    async def list_profiles(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        user_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Profile], Optional[str]]:
+        return await self.repo.list(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            user_id=user_id,
+            cursor=cursor,
+        )
+
+    async def update_profile(self, profile_id: UUID, profile_update: UpdateProfile) -> Optional[Profile]:
+        # Check if user_id is being updated and if the new user exists
+        if profile_update.user_id:
+            user = await self.session.get(User, profile_update.user_id)
+            if not user:
+                raise UserNotFound(profile_update.user_id)
+
+            # Check if another profile already exists for the new user
+            existing_profile = await self.repo.get_by_user_id(profile_update.user_id)
+            if existing_profile and existing_profile.id != profile_id:
+                raise ProfileAlreadyExists(profile_update.user_id)
+
+        update_data = profile_update.dict(exclude_unset=True)
+        profile = await self.repo.update(profile_id, update_data)
+        if not profile:
+            raise ProfileNotFound(profile_id)
+        return profile
+
+    async def delete_profile(self, profile_id: UUID) -> Optional[str]:
+        if not await self.repo.delete(profile_id):
+            raise ProfileNotFound(profile_id)
+        return f"Profile with ID {profile_id} deleted successfully."
+
+    # Secondary Methods
+    async def get_full_profile(self, profile_id: UUID) -> Profile:
+        profile = await self.repo.get_full(profile_id)
+        if not profile:
+            raise ProfileNotFound(profile_id)
+        return profile
@@ -1,17 +1,41 @@
 # Services/users_service.py
 
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlmodel import Session
-from Repository.User.user_repository import UserRepository
+from sqlmodel.ext.asyncio.session import AsyncSession
+from Repository.User.user_repository import AsyncUserRepository, UserRepository
 from Entities.UserDTOs.user_entity import CreateUser, UpdateUser
 from Schema.SQL.Models.models import User
+from Settings.cache_config import (
+    ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_NEGATIVE_TTL_SECONDS, ENTITY_CACHE_TTL_SECONDS,
+    LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS,
+)
+from Utils.cache import cached, cached_async, list_cache_key, register_cache
+from Utils.session_routing import bound_to_replica
 from Utils.Exceptions.user_exceptions import GitHubUsernameAlreadyExists, GitHubUsernameNotFound, UserNotFound
 
+# list_users pages keyed by the normalized query; cleared by every user write
+_list_cache = register_cache("users.list", LIST_CACHE_MAX_ENTRIES, LIST_CACHE_TTL_SECONDS)
+# Single users keyed by ("id", user_id) and ("github_user_name", name), misses included
+_entity_cache = register_cache("users.entity", ENTITY_CACHE_MAX_ENTRIES, ENTITY_CACHE_TTL_SECONDS)
+
+
+def _invalidate_user(user_id: UUID, github_user_name: Optional[str] = None):
+    """
+    Drops every cached lookup of ``user_id``, under its id or any username it was
+    found by, plus the entry for ``github_user_name`` (which may be a cached miss).
+    """
+    _entity_cache.invalidate_where(
+        lambda key, user: key in (("id", user_id), ("github_user_name", github_user_name))
+        or (user is not None and user.id == user_id)
+    )
+
 
 class UserService:
     def __init__(self, session: Session):
         self.repo = UserRepository(session)
+        self.fill_cache = not bound_to_replica(session)
 
     def create_user(self, user_create: CreateUser) -> User:
         # Check if github username already exists
@@ -20,18 +44,31 @@ class UserService:
             raise GitHubUsernameAlreadyExists(user_create.github_user_name)
         
         user = User(**user_create.dict(exclude_unset=True))
-        return self.repo.create(user)
+        user = self.repo.create(user)
+        _list_cache.clear()
+        _invalidate_user(user.id, user.github_user_name)
+        return user
 
     def get_user(self, user_id: UUID) -> Optional[User]:
-        user = self.repo.get(user_id)
+        user = cached(
+            _entity_cache, ("id", user_id), lambda: self.repo.get(user_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+            fill=self.fill_cache,
+        )
         if not user:
-            return UserNotFound(user_id)
+            raise UserNotFound(user_id)
         return user
 
     def get_user_by_github_username(self, github_user_name: str) -> Optional[User]:
-        user = self.repo.get_by_github_username(github_user_name)
+        user = cached(
+            _entity_cache,
+            ("github_user_name", github_user_name),
+            lambda: self.repo.get_by_github_username(github_user_name),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+            fill=self.fill_cache,
+        )
         if not user:
-            return GitHubUsernameNotFound(github_user_name)
+            raise GitHubUsernameNotFound(github_user_name)
         return user
 
     def list_users(
@@ -46,11 +83,14 @@ class UserService:
         rank: Optional[str] = None,
         min_streak: Optional[int] = None,
         max_streak: Optional[int] = None,
-    ) -> List[User]:
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Tuple[List[User], Optional[str]]:
         """
         Supports pagination, filtering, and sorting.
+        Pages are served from the list cache unless use_cache is False.
         """
-        return self.repo.list(
+        params = dict(
             skip=skip,
             limit=limit,
             sort_by=sort_by,
@@ -61,6 +101,14 @@ class UserService:
             rank=rank,
             min_streak=min_streak,
             max_streak=max_streak,
+            cursor=cursor,
+        )
+        return cached(
+            _list_cache,
+            list_cache_key(**params),
+            lambda: self.repo.list(**params),
+            use_cache,
+            fill=self.fill_cache,
         )
 
     def autocomplete_users(
@@ -75,24 +123,125 @@ class UserService:
         return self.repo.autocomplete(query=query, field=field, limit=limit)
 
     def update_user(self, user_id: UUID, user_update: UpdateUser) -> Optional[User]:
-        user = self.repo.get(user_id)
-        if not user:
-            return UserNotFound(user_id)
-        
-        # Check if github username is being updated and if it already exists
-        if user_update.github_user_name and user_update.github_user_name != user.github_user_name:
+        # Check if github username is being updated and if another user already has it
+        if user_update.github_user_name:
             existing_user = self.repo.get_by_github_username(user_update.github_user_name)
-            if existing_user:
+            if existing_user and existing_user.id != user_id:
                 raise GitHubUsernameAlreadyExists(user_update.github_user_name)
-        
+
         update_data = user_update.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(user, key, value)
-        return self.repo.update(user)
+        user = self.repo.update(user_id, update_data)
+        _list_cache.clear()
+        _invalidate_user(user_id, update_data.get("github_user_name"))
+        if not user:
+            raise UserNotFound(user_id)
+        return user
 
     def delete_user(self, user_id: UUID) -> Optional[str]:
-        user = self.repo.get(user_id)
+        deleted = self.repo.delete(user_id)
+        _invalidate_user(user_id)
+        if not deleted:
+            raise UserNotFound(user_id)
+        _list_cache.clear()
+        return f"User {user_id} deleted successfully"
+
+class AsyncUserService:
+    def __init__(self, session: AsyncSession):
+        self.repo = AsyncUserRepository(session)
+        self.fill_cache = not bound_to_replica(session)
+
+    async def create_user(self, user_create: CreateUser) -> User:
+        # Check if github username already exists
+        existing_user = await self.repo.get_by_github_username(user_create.github_user_name)
+        if existing_user:
+            raise GitHubUsernameAlreadyExists(user_create.github_user_name)
+
+        user = User(**user_create.dict(exclude_unset=True))
+        user = await self.repo.create(user)
+        _list_cache.clear()
+        _invalidate_user(user.id, user.github_user_name)
+        return user
+
+    async def get_user(self, user_id: UUID) -> Optional[User]:
+        user = await cached_async(
+            _entity_cache, ("id", user_id), lambda: self.repo.get(user_id),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+            fill=self.fill_cache,
+        )
         if not user:
-            return UserNotFound(user_id)
-        self.repo.delete(user)
-        return f"User {user_id} deleted successfully"
\ No newline at end of file
+            raise UserNotFound(user_id)
+        return user
+
+    async def get_user_by_github_username(self, github_user_name: str) -> Optional[User]:
+        user = await cached_async(
+            _entity_cache,
+            ("github_user_name", github_user_name),
+            lambda: self.repo.get_by_github_username(github_user_name),
+            negative_ttl=ENTITY_CACHE_NEGATIVE_TTL_SECONDS,
+            fill=self.fill_cache,
+        )
+        if not user:
+            raise GitHubUsernameNotFound(github_user_name)
+        return user
+
+    async def list_users(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        github_user_name: Optional[str] = None,
+        rank: Optional[str] = None,
+        min_streak: Optional[int] = None,
+        max_streak: Optional[int] = None,
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Tuple[List[User], Optional[str]]:
+        params = dict(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            first_name=first_name,
+            last_name=last_name,
+            github_user_name=github_user_name,
+            rank=rank,
+            min_streak=min_streak,
+            max_streak=max_streak,
+            cursor=cursor,
+        )
+        return await cached_async(
+            _list_cache,
+            list_cache_key(**params),
+            lambda: self.repo.list(**params),
+            use_cache,
+            fill=self.fill_cache,
+        )
+
+    async def autocomplete_users(self, query: str, field: str = "github_user_name", limit: int = 10) -> List[User]:
+        return await self.repo.autocomplete(query=query, field=field, limit=limit)
+
+    async def update_user(self, user_id: UUID, user_update: UpdateUser) -> Optional[User]:
+        # Check if github username is being updated and if another user already has it
+        if user_update.github_user_name:
+            existing_user = await self.repo.get_by_github_username(user_update.github_user_name)
+            if existing_user and existing_user.id != user_id:
+                raise GitHubUsernameAlreadyExists(user_update.github_user_name)
+
+        update_data = user_update.dict(exclude_unset=True)
+        user = await self.repo.update(user_id, update_data)
+        _list_cache.clear()
+        _invalidate_user(user_id, update_data.get("github_user_name"))
+        if not user:
+            raise UserNotFound(user_id)
+        return user
+
+    async def delete_user(self, user_id: UUID) -> Optional[str]:
+        deleted = await self.repo.delete(user_id)
+        _invalidate_user(user_id)
+        if not deleted:
+            raise UserNotFound(user_id)
+        _list_cache.clear()
+        return f"User {user_id} deleted successfully"
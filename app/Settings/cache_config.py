@@ -0,0 +1,31 @@
+# cache_config.py
+
+import os
+from dotenv import load_dotenv
+
+from Settings.database_config import _env_bool
+
+load_dotenv()
+
+# Master switch for the in-process caches; when off every lookup goes to the database
+CACHE_ENABLED = _env_bool("CACHE_ENABLED", True)
+
+# List endpoint result cache, one per entity type. Caches are per worker process,
+# so the TTL also bounds how long another worker's writes can go unseen.
+LIST_CACHE_MAX_ENTRIES = int(os.getenv("LIST_CACHE_MAX_ENTRIES", "512"))
+LIST_CACHE_TTL_SECONDS = float(os.getenv("LIST_CACHE_TTL_SECONDS", "30"))
+
+# Read-through cache for single rows looked up by primary key (and github_user_name).
+# Lookups that find nothing are cached for the shorter negative TTL, so repeated
+# probes for missing ids or usernames are absorbed without hiding new rows for long.
+ENTITY_CACHE_MAX_ENTRIES = int(os.getenv("ENTITY_CACHE_MAX_ENTRIES", "10000"))
+ENTITY_CACHE_TTL_SECONDS = float(os.getenv("ENTITY_CACHE_TTL_SECONDS", "300"))
+ENTITY_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("ENTITY_CACHE_NEGATIVE_TTL_SECONDS", "5"))
+
+# LeetCode GraphQL responses per username (stale-while-revalidate). Within the TTL the
+# cached copy is served as is; after it, the stale copy is served while one background
+# refresh runs. Upstream failures are cached briefly so an outage isn't retried per request.
+LEETCODE_CACHE_MAX_ENTRIES = int(os.getenv("LEETCODE_CACHE_MAX_ENTRIES", "5000"))
+LEETCODE_CACHE_TTL_SECONDS = float(os.getenv("LEETCODE_CACHE_TTL_SECONDS", "600"))
+LEETCODE_CACHE_MAX_STALE_SECONDS = float(os.getenv("LEETCODE_CACHE_MAX_STALE_SECONDS", "86400"))
+LEETCODE_CACHE_FAILURE_TTL_SECONDS = float(os.getenv("LEETCODE_CACHE_FAILURE_TTL_SECONDS", "30"))
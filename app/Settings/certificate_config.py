@@ -0,0 +1,50 @@
+# certificate_config.py
+
+import os
+import tempfile
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# TrueType/OpenType fonts for certificate text. Empty uses the font bundled with Pillow,
+# which covers Latin scripts only; the bold font falls back to the regular one.
+CERTIFICATE_FONT_PATH = os.getenv("CERTIFICATE_FONT_PATH", "")
+CERTIFICATE_BOLD_FONT_PATH = os.getenv("CERTIFICATE_BOLD_FONT_PATH", "")
+
+# Image stretched over the whole canvas under the template's static elements; empty
+# draws them on the template's plain background colour.
+CERTIFICATE_BACKGROUND_PATH = os.getenv("CERTIFICATE_BACKGROUND_PATH", "")
+
+# Shown as the issuing organization on every certificate
+CERTIFICATE_ISSUER = os.getenv("CERTIFICATE_ISSUER", "Dijkstra")
+
+# zlib level for the per-certificate rows. The static rows are compressed once, at 9.
+CERTIFICATE_COMPRESS_LEVEL = int(os.getenv("CERTIFICATE_COMPRESS_LEVEL", "1"))
+
+# Bulk downloads and jobs render in a pool of worker processes: 0 uses one per CPU core
+# but one, leaving a core to the API. Certificates are handed to the workers in batches,
+# and at most two batches per worker are in flight, so memory stays flat however large
+# the cohort is. Pool workers run at CERTIFICATE_BULK_NICE, so the OS schedules request
+# handling ahead of rendering when both want the CPU.
+CERTIFICATE_BULK_WORKERS = int(os.getenv("CERTIFICATE_BULK_WORKERS", "0"))
+CERTIFICATE_BULK_BATCH_SIZE = int(os.getenv("CERTIFICATE_BULK_BATCH_SIZE", "16"))
+CERTIFICATE_BULK_NICE = int(os.getenv("CERTIFICATE_BULK_NICE", "10"))
+
+# Certificate jobs: bulk renders accepted at once and run in the background. The queue
+# is a SQLite file in CERTIFICATE_JOB_DIR, with the finished ZIPs next to it, so jobs
+# survive a restart. Each API process runs up to CERTIFICATE_JOB_WORKERS jobs at a
+# time (0 accepts jobs but leaves running them to other processes). A job whose worker
+# stops renewing its lease is picked up again after CERTIFICATE_JOB_LEASE_SECONDS, up
+# to CERTIFICATE_JOB_MAX_ATTEMPTS times. Finished jobs and their ZIPs are deleted after
+# CERTIFICATE_JOB_RETENTION_SECONDS.
+CERTIFICATE_JOB_DIR = os.getenv("CERTIFICATE_JOB_DIR", os.path.join(tempfile.gettempdir(), "dijkstra-certificate-jobs"))
+CERTIFICATE_JOB_WORKERS = int(os.getenv("CERTIFICATE_JOB_WORKERS", "1"))
+CERTIFICATE_JOB_LEASE_SECONDS = int(os.getenv("CERTIFICATE_JOB_LEASE_SECONDS", "60"))
+CERTIFICATE_JOB_MAX_ATTEMPTS = int(os.getenv("CERTIFICATE_JOB_MAX_ATTEMPTS", "3"))
+CERTIFICATE_JOB_RETENTION_SECONDS = int(os.getenv("CERTIFICATE_JOB_RETENTION_SECONDS", "86400"))
+
+# Rendered certificates are kept on disk, keyed by a hash of the template and the values
+# they were rendered from, and later downloads are sent straight from the file. The
+# least recently downloaded are deleted past CERTIFICATE_CACHE_MAX_BYTES; 0 disables it.
+CERTIFICATE_CACHE_DIR = os.getenv("CERTIFICATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "dijkstra-certificates"))
+CERTIFICATE_CACHE_MAX_BYTES = int(os.getenv("CERTIFICATE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
@@ -0,0 +1,40 @@
+# database_config.py
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Statement logging is opt-in; echo=True on every query is far too noisy for production
+DB_ECHO = _env_bool("DB_ECHO", False)
+
+# Pool sizing: each worker process can hold up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+
+# Behind PgBouncer (transaction pooling) the bouncer owns the pool, so we open a
+# connection per checkout and must not rely on server-side prepared statements.
+DB_PGBOUNCER = _env_bool("DB_PGBOUNCER", False)
+
+# Read replicas: comma separated URLs. GET/HEAD requests read from these (round robin),
+# everything else and every flush goes to POSTGRES_URL.
+DB_REPLICA_URLS = [url.strip() for url in os.getenv("POSTGRES_REPLICA_URLS", "").split(",") if url.strip()]
+
+# Read-your-writes: clients that send the opt-in header on a write are pinned to the
+# primary for this many seconds afterwards (via a cookie), so they never read replica lag.
+DB_STICKY_PRIMARY_SECONDS = int(os.getenv("DB_STICKY_PRIMARY_SECONDS", "5"))
+
+# Startup only verifies the schema version; set this to apply pending migrations
+# on boot instead (handy locally, prefer `python -m Migrations upgrade` in deploys).
+DB_AUTO_MIGRATE = _env_bool("DB_AUTO_MIGRATE", False)
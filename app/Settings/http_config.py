@@ -0,0 +1,51 @@
+# http_config.py
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Per-phase timeouts (seconds) for outbound calls to LeetCode and GitHub.
+# "pool" is how long a request may wait for a free connection from the shared client.
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("HTTP_WRITE_TIMEOUT", "10"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "5"))
+
+# Keep-alive pool shared by every outbound request in a worker process
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# Retries for transport errors and 429/502/503/504, with full-jitter exponential backoff
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.5"))
+HTTP_RETRY_BACKOFF_MAX = float(os.getenv("HTTP_RETRY_BACKOFF_MAX", "8"))
+
+# Circuit breaker per upstream (LeetCode, GitHub): failed calls in a row that open it,
+# and seconds until a single half-open probe is let through.
+UPSTREAM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("UPSTREAM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+UPSTREAM_CIRCUIT_RESET_SECONDS = float(os.getenv("UPSTREAM_CIRCUIT_RESET_SECONDS", "30"))
+
+# LeetCode upstream budget: requests per second across the whole worker process
+# (cache hits are free, retries are not), and concurrent lookups per batch request (at least 1).
+LEETCODE_MAX_RPS = float(os.getenv("LEETCODE_MAX_RPS", "5"))
+LEETCODE_BATCH_CONCURRENCY = int(os.getenv("LEETCODE_BATCH_CONCURRENCY", "8"))
+
+# GitHub GraphQL statistics: users fetched per request (as aliases), repositories per
+# page, and the organization whose repositories count as Dijkstra contributions.
+GITHUB_GRAPHQL_BATCH_SIZE = int(os.getenv("GITHUB_GRAPHQL_BATCH_SIZE", "20"))
+GITHUB_REPOS_PAGE_SIZE = int(os.getenv("GITHUB_REPOS_PAGE_SIZE", "50"))
+GITHUB_ORG = os.getenv("GITHUB_ORG", "")
+
+# GitHub tokens, comma separated; every call goes out on the token with the most budget
+# left. GITHUB_TOKEN alone still works as a pool of one.
+GITHUB_TOKENS = [
+    token.strip() for token in os.getenv("GITHUB_TOKENS", os.getenv("GITHUB_TOKEN", "")).split(",") if token.strip()
+]
+# Points kept back on each token for anything else sharing it, the most points one
+# token may spend in a burst, and how long a call may wait for a budget to reset
+# before failing instead.
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "100"))
+GITHUB_RATE_LIMIT_BURST = float(os.getenv("GITHUB_RATE_LIMIT_BURST", "500"))
+GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS", "60"))
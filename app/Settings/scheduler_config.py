@@ -0,0 +1,32 @@
+# scheduler_config.py
+
+import os
+from dotenv import load_dotenv
+
+from Settings.database_config import _env_bool
+
+load_dotenv()
+
+# Background refresh of the Github, Projects, Leetcode, LeetcodeBadges and LeetcodeTags
+# tables for every user in Links. Off by default so local runs never call upstream APIs.
+STATS_SYNC_ENABLED = _env_bool("STATS_SYNC_ENABLED", False)
+
+# Each user is refreshed once per interval. The users due in a cycle are spread over
+# the window instead of being fetched in one burst; the poll sets how often new work is looked for.
+STATS_SYNC_INTERVAL_SECONDS = float(os.getenv("STATS_SYNC_INTERVAL_SECONDS", "86400"))
+STATS_SYNC_WINDOW_SECONDS = float(os.getenv("STATS_SYNC_WINDOW_SECONDS", "3600"))
+STATS_SYNC_POLL_SECONDS = float(os.getenv("STATS_SYNC_POLL_SECONDS", "300"))
+
+# A claimed user is not handed out again for the lease, so work lost to a crash or
+# restart is picked up once it expires. Failures back off exponentially from the retry
+# delay, up to the interval.
+STATS_SYNC_LEASE_SECONDS = float(os.getenv("STATS_SYNC_LEASE_SECONDS", "900"))
+STATS_SYNC_RETRY_SECONDS = float(os.getenv("STATS_SYNC_RETRY_SECONDS", "900"))
+
+# Users are claimed and stored in batches: GITHUB_GRAPHQL_BATCH_SIZE for GitHub (one
+# GraphQL request), STATS_SYNC_LEETCODE_BATCH_SIZE for LeetCode (fetched one by one).
+# The concurrency settings bound the batches in flight per upstream; LEETCODE_MAX_RPS
+# still caps LeetCode requests across the process.
+STATS_SYNC_LEETCODE_BATCH_SIZE = int(os.getenv("STATS_SYNC_LEETCODE_BATCH_SIZE", "10"))
+STATS_SYNC_GITHUB_CONCURRENCY = int(os.getenv("STATS_SYNC_GITHUB_CONCURRENCY", "1"))
+STATS_SYNC_LEETCODE_CONCURRENCY = int(os.getenv("STATS_SYNC_LEETCODE_CONCURRENCY", "4"))
@@ -0,0 +1,15 @@
+# Utils/Exceptions/pagination_exceptions.py
+
+class ServiceError(Exception):
+    """Base service exception"""
+
+class InvalidCursor(ServiceError):
+    def __init__(self, cursor):
+        super().__init__("Cursor is malformed or was issued for a different sort order.")
+        self.cursor = cursor
+
+class InvalidSortField(ServiceError):
+    def __init__(self, sort_by, allowed):
+        super().__init__(f"Cannot sort by {sort_by}. Must be one of {list(allowed)}")
+        self.sort_by = sort_by
+        self.allowed = allowed
@@ -36,4 +36,30 @@ class GitHubUsernameNotFound(ServiceError):
 class GitHubUsernameAlreadyExists(ServiceError):
     def __init__(self, github_username):
         super().__init__(f"User with GitHub username '{github_username}' already exists.")
-        self.github_username = github_username
\ No newline at end of file
+        self.github_username = github_username
+
+class ContestHistoryNotFound(ServiceError):
+    def __init__(self, lc_username):
+        super().__init__(f"No contest history is stored for LeetCode user '{lc_username}'.")
+        self.lc_username = lc_username
+
+class CertificateCohortEmpty(ServiceError):
+    def __init__(self, cohort):
+        super().__init__(f"No users match the certificate cohort ({cohort}).")
+        self.cohort = cohort
+
+class CertificateJobNotFound(ServiceError):
+    def __init__(self, job_id):
+        super().__init__(f"Certificate job {job_id} not found. Finished jobs are kept for a limited time.")
+        self.job_id = job_id
+
+class CertificateJobNotReady(ServiceError):
+    def __init__(self, job_id, status):
+        super().__init__(f"Certificate job {job_id} is {status}; its ZIP is available once it is done.")
+        self.job_id = job_id
+        self.status = status
+
+class GitHubApiError(ServiceError):
+    def __init__(self, reason):
+        super().__init__(f"GitHub API request failed: {reason}")
+        self.reason = reason
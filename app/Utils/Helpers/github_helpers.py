@@ -0,0 +1,285 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from uuid import UUID
+
+from Config.queries import gh_repository_page_fragment, gh_user_stats_fragment
+from Entities.UserDTOs.github_entity import GitHubSyncResult
+from Schema.SQL.Enums.enums import Tools
+
+# GitHub linguist names that map onto a Tools value
+_LANGUAGE_TOOLS = {
+    "Java": Tools.JAVA,
+    "C": Tools.C,
+    "C++": Tools.CPP,
+    "Python": Tools.PYTHON,
+    "C#": Tools.CSHARP,
+    "Rust": Tools.RUST,
+    "JavaScript": Tools.JAVASCRIPT,
+    "TypeScript": Tools.TYPESCRIPT,
+    "Go": Tools.GO,
+    "Groovy": Tools.GROOVY,
+    "Ruby": Tools.RUBY,
+    "Swift": Tools.SWIFT,
+    "Vue": Tools.VUEJS,
+    "Svelte": Tools.SVELTE,
+    "Dockerfile": Tools.DOCKER,
+    "Markdown": Tools.MARKDOWN,
+    "HTML": Tools.HTML,
+    "CSS": Tools.CSS,
+}
+
+# Homepages on these hosts are landing pages, but not the owner's own domain
+_HOSTED_SUFFIXES = (
+    "github.io", "vercel.app", "netlify.app", "herokuapp.com", "pages.dev",
+    "web.app", "firebaseapp.com", "onrender.com", "railway.app",
+)
+
+# Projects columns refreshed from GitHub on every sync. The rest (description,
+# domain, tools, docs and testing details, ratings) is only seeded on insert and
+# then curated by hand.
+PROJECT_SYNC_COLUMNS = (
+    "private", "github_stars", "github_about", "github_open_issues", "github_forks", "topics",
+    "readme", "license", "landing_page", "landing_page_link", "own_domain_name", "domain_name",
+)
+
+_REPOSITORIES_ARGS = "ownerAffiliations: OWNER, isFork: false, orderBy: {field: PUSHED_AT, direction: DESC}"
+
+# Asked for in every query; GitHubClient tracks the points each one costs
+_RATE_LIMIT_FIELD = "rateLimit { cost }"
+
+def _user_batch_query(count: int) -> str:
+    """
+    One query for ``count`` users, aliased u0..u{count-1}, with logins passed as variables.
+    """
+    params = ", ".join(f"$u{i}: String!" for i in range(count))
+    users = "\n".join(f"u{i}: user(login: $u{i}) {{ ...GitHubUserStats }}" for i in range(count))
+    return f"query({params}, $repoPageSize: Int!) {{\n{_RATE_LIMIT_FIELD}\n{users}\n}}\n{gh_user_stats_fragment}\n{gh_repository_page_fragment}"
+
+def _repository_page_query(count: int) -> str:
+    """
+    Next repository page for ``count`` users at once; user i resumes after cursor $c{i}.
+    """
+    params = ", ".join(f"$u{i}: String!, $c{i}: String!" for i in range(count))
+    users = "\n".join(
+        f"u{i}: user(login: $u{i}) {{ repositories(first: $repoPageSize, after: $c{i}, {_REPOSITORIES_ARGS}) {{ ...GitHubRepositoryPage }} }}"
+        for i in range(count)
+    )
+    return f"query({params}, $repoPageSize: Int!) {{\n{_RATE_LIMIT_FIELD}\n{users}\n}}\n{gh_repository_page_fragment}"
+
+def _own_domain(homepage: Optional[str]) -> Optional[str]:
+    host = urlparse(homepage).hostname if homepage else None
+    if not host or host.endswith(_HOSTED_SUFFIXES):
+        return None
+    return host
+
+def _summarize_repository(repo: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": repo["name"],
+        "description": repo.get("description"),
+        "private": repo["isPrivate"],
+        "stars": repo["stargazerCount"],
+        "forks": repo["forkCount"],
+        "open_issues": repo["openIssues"]["totalCount"],
+        "homepage": repo.get("homepageUrl") or None,
+        "license": repo.get("licenseInfo") is not None,
+        "readme": repo.get("readme") is not None,
+        "topics": [node["topic"]["name"] for node in repo["repositoryTopics"]["nodes"]],
+        "languages": {edge["node"]["name"]: edge["size"] for edge in repo["languages"]["edges"]},
+    }
+
+def _contributions_by_repository(collection: Dict[str, Any], org: str) -> List[Dict[str, Any]]:
+    """
+    Commits, PRs and issues per repository owned by ``org`` (case-insensitive).
+    """
+    counts = defaultdict(lambda: {"commits": 0, "prs_raised": 0, "issues_created": 0})
+    for field, key in (
+        ("commitContributionsByRepository", "commits"),
+        ("pullRequestContributionsByRepository", "prs_raised"),
+        ("issueContributionsByRepository", "issues_created"),
+    ):
+        for item in collection[field]:
+            repository = item["repository"]
+            if repository["owner"]["login"].lower() == org.lower():
+                counts[repository["name"]][key] += item["contributions"]["totalCount"]
+    return [{"repo_name": name, **stats} for name, stats in counts.items()]
+
+def _summarize_user(user: Dict[str, Any], org: str) -> Dict[str, Any]:
+    """
+    Shapes one GitHubUserStats result (with every repository page merged in)
+    into the statistics returned by the API and stored by the sync.
+    """
+    collection = user["contributionsCollection"]
+    repositories = [_summarize_repository(repo) for repo in user["repositories"]["nodes"]]
+
+    language_bytes = defaultdict(int)
+    for repo in repositories:
+        for language, size in repo["languages"].items():
+            language_bytes[language] += size
+    total_bytes = sum(language_bytes.values())
+    languages_used = [
+        {"language_name": language, "percentage_used": round(size * 100 / total_bytes, 2), "total_bytes": size}
+        for language, size in sorted(language_bytes.items(), key=lambda item: item[1], reverse=True)
+    ]
+
+    dijkstra_statistics = None
+    if org:
+        contributed = _contributions_by_repository(collection, org)
+        dijkstra_statistics = {
+            "organization": org,
+            "repositories_contributed_to": contributed,
+            "total_prs": sum(repo["prs_raised"] for repo in contributed),
+            "total_commits": sum(repo["commits"] for repo in contributed),
+            "total_issues_created": sum(repo["issues_created"] for repo in contributed),
+        }
+
+    return {
+        "general_data": {
+            "username": user["login"],
+            "full_name": user.get("name"),
+            "avatar_img_link": user.get("avatarUrl"),
+            "bio": user.get("bio"),
+            "followers": user["followers"]["totalCount"],
+            "following": user["following"]["totalCount"],
+            "current_company": user.get("company"),
+            "current_location": user.get("location"),
+            "time_zone": None,  # Not exposed by the GitHub API
+            "websites_links": [link for link in (user.get("websiteUrl"), user.get("url")) if link],
+            "organizations_list": [org_node["login"] for org_node in user["organizations"]["nodes"]],
+        },
+        "dijkstra_statistics": dijkstra_statistics,
+        "overall_github_statistics": {
+            "total_prs_raised": user["pullRequests"]["totalCount"],
+            "total_issues_created": user["issues"]["totalCount"],
+            "total_repos": user["repositories"]["totalCount"],
+            "repositories_contributed_to": user["repositoriesContributedTo"]["totalCount"],
+            # The contributions API only reaches back one year
+            "total_commits_last_year": collection["totalCommitContributions"],
+            "total_contributions_last_year": collection["contributionCalendar"]["totalContributions"],
+            "languages_used": languages_used,
+            "contribution_graph_link": user.get("url"),
+        },
+        "repositories": repositories,
+    }
+
+def _github_row(summary: Dict[str, Any]) -> Dict[str, Any]:
+    general = summary["general_data"]
+    overall = summary["overall_github_statistics"]
+    return {
+        "user_name": general["username"],
+        "github_bio": general["bio"],
+        "followers": general["followers"],
+        "following": general["following"],
+        "repositories": overall["total_repos"],
+        "current_work": general["current_company"],
+        "current_location": general["current_location"],
+        "avatar": general["avatar_img_link"],
+        "websites": general["websites_links"],
+        "organization": general["organizations_list"],
+        "total_prs_raised": overall["total_prs_raised"],
+        "total_issues_created": overall["total_issues_created"],
+        "total_repos": overall["total_repos"] + overall["repositories_contributed_to"],
+        "total_commits": overall["total_commits_last_year"],
+        "contribution_graph_link": overall["contribution_graph_link"],
+    }
+
+def _persisted_summary(github: Any, projects: List[Any]) -> Dict[str, Any]:
+    """
+    _summarize_user's shape rebuilt from a stored Github row and its Projects, for
+    serving when GitHub is down. Organization contributions, language bytes and the
+    contribution calendar are not stored, so they come back empty.
+    """
+    return {
+        "general_data": {
+            "username": github.user_name,
+            "full_name": None,
+            "avatar_img_link": github.avatar,
+            "bio": github.github_bio,
+            "followers": github.followers,
+            "following": github.following,
+            "current_company": github.current_work,
+            "current_location": github.current_location,
+            "time_zone": github.current_timezone,
+            "websites_links": github.websites or [],
+            "organizations_list": github.organization or [],
+        },
+        "dijkstra_statistics": None,
+        "overall_github_statistics": {
+            "total_prs_raised": github.total_prs_raised,
+            "total_issues_created": github.total_issues_created,
+            "total_repos": github.repositories,
+            "repositories_contributed_to": (
+                github.total_repos - github.repositories
+                if github.total_repos is not None and github.repositories is not None else None
+            ),
+            "total_commits_last_year": github.total_commits,
+            "total_contributions_last_year": None,
+            "languages_used": [],
+            "contribution_graph_link": github.contribution_graph_link,
+        },
+        "repositories": [
+            {
+                "name": project.name,
+                "description": project.github_about,
+                "private": project.private,
+                "stars": project.github_stars,
+                "forks": project.github_forks,
+                "open_issues": project.github_open_issues,
+                "homepage": project.landing_page_link,
+                "license": project.license,
+                "readme": project.readme,
+                "topics": project.topics or [],
+                "languages": {},
+            }
+            for project in projects
+        ],
+    }
+
+def _project_rows(summary: Dict[str, Any], profile_id: UUID) -> List[Dict[str, Any]]:
+    owner = summary["general_data"]["username"]
+    rows = []
+    for repo in summary["repositories"]:
+        domain_name = _own_domain(repo["homepage"])
+        rows.append({
+            "profile_id": profile_id,
+            "name": repo["name"],
+            "owner": owner,
+            "private": repo["private"],
+            "github_stars": repo["stars"],
+            "github_about": repo["description"],
+            "github_open_issues": repo["open_issues"],
+            "github_forks": repo["forks"],
+            "description": repo["description"] or "",
+            "topics": repo["topics"],
+            "tools": list(dict.fromkeys(_LANGUAGE_TOOLS[lang] for lang in repo["languages"] if lang in _LANGUAGE_TOOLS)),
+            "readme": repo["readme"],
+            "license": repo["license"],
+            "landing_page": repo["homepage"] is not None,
+            "landing_page_link": repo["homepage"],
+            "docs_page": False,
+            "own_domain_name": domain_name is not None,
+            "domain_name": domain_name,
+            "testing_framework_present": False,
+        })
+    return rows
+
+def _prepare_sync(users: Dict[str, Optional[Dict[str, Any]]], profile_ids: Dict[str, UUID], org: str) -> Tuple[List[dict], List[dict], GitHubSyncResult]:
+    """
+    Turns fetched users (None when GitHub has no such login) into Github and
+    Projects rows. Projects need a profile, so they are skipped for users without one.
+    """
+    github_rows, project_rows = [], []
+    result = GitHubSyncResult(synced=[], not_found=[], without_profile=[], projects=0)
+    for name, user in users.items():
+        if user is None:
+            result.not_found.append(name)
+            continue
+        summary = _summarize_user(user, org)
+        github_rows.append(_github_row(summary))
+        result.synced.append(user["login"])
+        profile_id = profile_ids.get(user["login"].lower())
+        if profile_id is None:
+            result.without_profile.append(user["login"])
+            continue
+        project_rows.extend(_project_rows(summary, profile_id))
+    return github_rows, project_rows, result
@@ -0,0 +1,252 @@
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from Schema.SQL.Enums.enums import LeetcodeTagCategory
+
+_TAG_CATEGORIES = {
+    "fundamental": LeetcodeTagCategory.FUNDAMENTAL,
+    "intermediate": LeetcodeTagCategory.INTERMEDIATE,
+    "advanced": LeetcodeTagCategory.ADVANCED,
+}
+
+# Leetcode columns filled from each lc_query section. A section whose hash matches the
+# stored one is not written at all; badges and tags are sections of their own.
+LEETCODE_SECTIONS = {
+    "profile": (
+        "lc_username", "real_name", "about_me", "school", "websites", "country", "company",
+        "job_title", "skill_tags", "ranking", "avatar", "reputation", "solution_count",
+    ),
+    "submissions": (
+        "total_problems_solved", "easy_problems_solved", "medium_problems_solved",
+        "hard_problems_solved", "language_problem_count",
+    ),
+    "contest": (
+        "attended_contests", "competition_rating", "global_ranking", "total_participants",
+        "top_percentage", "competition_badge",
+    ),
+}
+
+# LeetcodeContestHistory arrays, in the order of the values in each contest point
+CONTEST_HISTORY_COLUMNS = ("start_times", "ratings", "rankings", "problems_solved", "finish_times")
+
+def _solved_by_difficulty(user: Dict[str, Any]) -> Dict[str, int]:
+    stats = (user.get("submitStatsGlobal") or {}).get("acSubmissionNum") or []
+    return {item["difficulty"]: item["count"] for item in stats}
+
+def _leetcode_row(user: Dict[str, Any], contest: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Leetcode columns from lc_query's matchedUser and userContestRanking.
+    """
+    profile = user.get("profile") or {}
+    solved = _solved_by_difficulty(user)
+    contest = contest or {}
+    return {
+        "lc_username": user["username"],
+        "real_name": profile.get("realName"),
+        "about_me": profile.get("aboutMe"),
+        "school": profile.get("school"),
+        "websites": ", ".join(profile.get("websites") or []) or None,
+        "country": profile.get("countryName"),
+        "company": profile.get("company"),
+        "job_title": profile.get("jobTitle"),
+        "skill_tags": profile.get("skillTags") or [],
+        "ranking": profile.get("ranking"),
+        "avatar": profile.get("userAvatar"),
+        "reputation": profile.get("reputation"),
+        "solution_count": profile.get("solutionCount"),
+        "total_problems_solved": solved.get("All"),
+        "easy_problems_solved": solved.get("Easy"),
+        "medium_problems_solved": solved.get("Medium"),
+        "hard_problems_solved": solved.get("Hard"),
+        "language_problem_count": [
+            f"{item['languageName']}:{item['problemsSolved']}" for item in user.get("languageProblemCount") or []
+        ],
+        "attended_contests": contest.get("attendedContestsCount"),
+        "competition_rating": contest.get("rating"),
+        "global_ranking": contest.get("globalRanking"),
+        "total_participants": contest.get("totalParticipants"),
+        "top_percentage": contest.get("topPercentage"),
+        "competition_badge": (contest.get("badge") or {}).get("name"),
+    }
+
+def _persisted_leetcode(leetcode: Any, badges: List[Any], tags: List[Any]) -> Dict[str, Any]:
+    """
+    The inverse of _leetcode_row, _badge_rows and _tag_rows: stored rows shaped like
+    fetchLeetcodeData's {"profile", "contestRanking"}, for serving when LeetCode is down.
+    """
+    solved = (
+        ("All", leetcode.total_problems_solved), ("Easy", leetcode.easy_problems_solved),
+        ("Medium", leetcode.medium_problems_solved), ("Hard", leetcode.hard_problems_solved),
+    )
+    tag_counts = {key: [] for key in _TAG_CATEGORIES}
+    categories = {category.value: key for key, category in _TAG_CATEGORIES.items()}
+    for tag in tags:
+        key = categories.get(_tag_key(tag.tag_category, tag.tag_name)[0])
+        if key is not None:
+            tag_counts[key].append({"tagName": tag.tag_name, "problemsSolved": tag.problems_solved})
+    contest = None
+    if leetcode.attended_contests is not None:
+        contest = {
+            "attendedContestsCount": leetcode.attended_contests,
+            "rating": leetcode.competition_rating,
+            "globalRanking": leetcode.global_ranking,
+            "totalParticipants": leetcode.total_participants,
+            "topPercentage": leetcode.top_percentage,
+            "badge": {"name": leetcode.competition_badge} if leetcode.competition_badge else None,
+        }
+    return {
+        "profile": {
+            "username": leetcode.lc_username,
+            "profile": {
+                "realName": leetcode.real_name,
+                "aboutMe": leetcode.about_me,
+                "school": leetcode.school,
+                "websites": leetcode.websites.split(", ") if leetcode.websites else [],
+                "countryName": leetcode.country,
+                "company": leetcode.company,
+                "jobTitle": leetcode.job_title,
+                "skillTags": leetcode.skill_tags or [],
+                "ranking": leetcode.ranking,
+                "userAvatar": leetcode.avatar,
+                "reputation": leetcode.reputation,
+                "solutionCount": leetcode.solution_count,
+            },
+            "submitStatsGlobal": {
+                "acSubmissionNum": [{"difficulty": difficulty, "count": count} for difficulty, count in solved if count is not None]
+            },
+            "languageProblemCount": [
+                {"languageName": name, "problemsSolved": int(count)}
+                for name, count in (item.rsplit(":", 1) for item in leetcode.language_problem_count or [])
+            ],
+            "badges": [{"name": badge.name, "icon": badge.icon, "hoverText": badge.hover_text} for badge in badges],
+            "tagProblemCounts": tag_counts,
+        },
+        "contestRanking": contest,
+    }
+
+def _badge_rows(user: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"name": badge.get("name"), "icon": badge.get("icon"), "hover_text": badge.get("hoverText")}
+        for badge in user.get("badges") or []
+    ]
+
+def _tag_rows(user: Dict[str, Any]) -> List[Dict[str, Any]]:
+    counts = user.get("tagProblemCounts") or {}
+    return [
+        {"tag_category": category, "tag_name": tag["tagName"], "problems_solved": tag["problemsSolved"]}
+        for key, category in _TAG_CATEGORIES.items()
+        for tag in counts.get(key) or []
+    ]
+
+def _contest_points(history: Optional[List[Dict[str, Any]]]) -> List[List[Any]]:
+    """
+    Attended contests from lc_query's userContestRankingHistory, oldest first, as
+    [start_time, rating, ranking, problems_solved, finish_time]. LeetCode lists every
+    contest since the user signed up, so the ones they skipped are dropped.
+    """
+    points = [
+        [
+            contest["contest"]["startTime"], contest.get("rating"), contest.get("ranking"),
+            contest.get("problemsSolved"), contest.get("finishTimeInSeconds"),
+        ]
+        for contest in history or [] if contest.get("attended")
+    ]
+    return sorted(points, key=lambda point: point[0])
+
+def _history_values(stored: Optional[Any], points: List[List[Any]]) -> Optional[Dict[str, Any]]:
+    """
+    LeetcodeContestHistory columns with the points newer than the stored last_start_time
+    appended, or None when there are none. Stored contests are never rewritten.
+    """
+    last = stored.last_start_time if stored else None
+    new = [point for point in points if last is None or point[0] > last]
+    if not new:
+        return None
+    values = {
+        column: (list(getattr(stored, column)) if stored else []) + [point[i] for point in new]
+        for i, column in enumerate(CONTEST_HISTORY_COLUMNS)
+    }
+    values["last_start_time"] = new[-1][0]
+    return values
+
+def _contest_series(history: Any, start: Optional[int], end: Optional[int], max_points: int) -> Dict[str, Any]:
+    """
+    Rating and ranking series of the contests started within [start, end] (epoch seconds).
+    Longer ranges are split into max_points equal time buckets, each represented by its
+    last contest, i.e. the rating the user held at the end of the bucket.
+    """
+    times = history.start_times
+    lo = bisect_left(times, start) if start is not None else 0
+    hi = bisect_right(times, end) if end is not None else len(times)
+    picked = list(range(lo, hi))
+    downsampled = len(picked) > max_points
+    if downsampled:
+        first, span = times[lo], times[hi - 1] - times[lo] + 1
+        buckets = {}
+        for i in picked:
+            buckets[(times[i] - first) * max_points // span] = i
+        picked = list(buckets.values())
+    return {
+        "total_contests": hi - lo,
+        "downsampled": downsampled,
+        "timestamps": [times[i] for i in picked],
+        "ratings": [history.ratings[i] for i in picked],
+        "rankings": [history.rankings[i] for i in picked],
+    }
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+def _badge_key(badge: Dict[str, Any]) -> Tuple:
+    return (badge["name"], badge["icon"], badge["hover_text"])
+
+def _tag_key(category: Optional[LeetcodeTagCategory], tag_name: Optional[str]) -> Tuple:
+    return (LeetcodeTagCategory(category).value if category else None, tag_name)
+
+def _section_hashes(entry: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Hash per section of a normalized entry. Badges and tags are sorted first,
+    so upstream reordering alone never counts as a change.
+    """
+    row = entry["leetcode"]
+    hashes = {section: _digest([row[column] for column in columns]) for section, columns in LEETCODE_SECTIONS.items()}
+    hashes["badges"] = _digest(sorted(_badge_key(badge) for badge in entry["badges"]))
+    hashes["tags"] = _digest(sorted(
+        _tag_key(tag["tag_category"], tag["tag_name"]) + (tag["problems_solved"],) for tag in entry["tags"]
+    ))
+    # Only entries fetched with their contest history carry it
+    if entry.get("history") is not None:
+        hashes["history"] = _digest(entry["history"])
+    return hashes
+
+def _diff_badges(stored: List[Any], badges: List[Dict[str, Any]]) -> Tuple[List[UUID], List[Dict[str, Any]]]:
+    """
+    Stored badge ids to delete and new badges to insert; badges present on both sides are kept.
+    """
+    wanted = {_badge_key(badge): badge for badge in badges}
+    kept = set()
+    deletes = []
+    for row in stored:
+        key = (row.name, row.icon, row.hover_text)
+        if key in wanted and key not in kept:
+            kept.add(key)
+        else:
+            deletes.append(row.id)
+    return deletes, [badge for key, badge in wanted.items() if key not in kept]
+
+def _diff_tags(stored: List[Any], tags: List[Dict[str, Any]]) -> Tuple[List[UUID], List[Dict[str, Any]]]:
+    """
+    Stored tag ids to delete, and the tags to upsert: new ones and those whose count changed.
+    """
+    wanted = {_tag_key(tag["tag_category"], tag["tag_name"]): tag for tag in tags}
+    current = {_tag_key(row.tag_category, row.tag_name): row for row in stored}
+    deletes = [row.id for key, row in current.items() if key not in wanted]
+    upserts = [
+        tag for key, tag in wanted.items()
+        if key not in current or current[key].problems_solved != tag["problems_solved"]
+    ]
+    return deletes, upserts
@@ -1,8 +1,59 @@
+from typing import Iterable, List, Set, Tuple
+from uuid import UUID
+
+from Entities.bulk_entity import BulkCreatedRow, BulkCreateResult, BulkRowError
 from Schema.SQL.Enums.enums import Tools
-from Utils.Exceptions.opportunities_exceptions import InvalidTools
+from Utils.error_codes import ErrorCodes
+from Utils.Exceptions.opportunities_exceptions import InvalidTools, OrganizationNotFound
+from Utils.returning import insert_values
+
+# Built once at import instead of per call
+_TOOL_VALUES = frozenset(Tools._value2member_map_)
+
+def _invalid_tools(values) -> list:
+    return [v for v in values or [] if v not in _TOOL_VALUES]
 
 def _validate_tools(values, field_name: str):
-    if values:
-        invalid = [v for v in values if v not in Tools._value2member_map_]
+    invalid = _invalid_tools(values)
+    if invalid:
+        raise InvalidTools(invalid, field_name, list(Tools))
+
+def _prepare_bulk_rows(records: list, model, existing_orgs: Set[UUID], tool_fields: Iterable[str]) -> Tuple[List[dict], List[int], List[BulkRowError]]:
+    """
+    Validates a bulk payload in one pass against a pre-fetched set of
+    organization ids. Returns the insertable rows (model defaults such as id applied,
+    timestamps left to the database), their payload indexes, and one error per rejected record.
+    """
+    rows, indexes, errors = [], [], []
+    for index, record in enumerate(records):
+        if record.organization is not None and record.organization not in existing_orgs:
+            errors.append(BulkRowError(
+                index=index,
+                code=ErrorCodes.OPPT_ORG_NF_A01,
+                error="Organization not found",
+                detail=str(OrganizationNotFound(record.organization)),
+            ))
+            continue
+
+        invalid = [(field, _invalid_tools(getattr(record, field))) for field in tool_fields]
+        invalid = [(field, values) for field, values in invalid if values]
         if invalid:
-            raise InvalidTools(invalid, field_name, list(Tools))
+            field, values = invalid[0]
+            errors.append(BulkRowError(
+                index=index,
+                code=ErrorCodes.OPPT_ORG_VAL_A01,
+                error="Invalid input",
+                detail=str(InvalidTools(values, field, list(Tools))),
+            ))
+            continue
+
+        rows.append(insert_values(model(**record.dict(exclude_unset=True))))
+        indexes.append(index)
+    return rows, indexes, errors
+
+def _bulk_result(indexes: List[int], ids: List[UUID], errors: List[BulkRowError]) -> BulkCreateResult:
+    return BulkCreateResult(
+        created=len(ids),
+        items=[BulkCreatedRow(index=index, id=row_id) for index, row_id in zip(indexes, ids)],
+        errors=errors,
+    )
@@ -0,0 +1,316 @@
+# utils/cache.py
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+from sqlalchemy import inspect
+
+from Settings.cache_config import CACHE_ENABLED
+from Utils.single_flight import register_single_flight
+
+
+class TTLCache:
+    """
+    Bounded in-process cache. Least recently used entries are evicted once
+    ``max_entries`` is reached, and entries older than their TTL are dropped
+    when next looked up. Operations take a plain lock and never await, so one
+    cache can be shared by threadpool (sync) and event loop (async) handlers.
+
+    Every invalidation bumps ``generation``. A loader that read the database
+    before an invalidation passes the generation it started with to ``set``,
+    and its now possibly stale result is dropped instead of cached.
+
+    ``flight`` is a SingleFlight named after the cache, through which loads of
+    a missing key can be coalesced.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self.flight = register_single_flight(name)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Returns (found, value); ``found`` tells a cached None apart from a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None, ttl: Optional[float] = None):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *keys: Hashable):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            self.generation += 1
+            self.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]):
+        """
+        Drops every entry for which ``predicate(key, value)`` is true. A full scan,
+        meant for write paths that cannot name every key an entry is stored under.
+        """
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+            self.generation += 1
+            self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class StaleWhileRevalidateCache(TTLCache):
+    """
+    TTLCache for slow upstream calls. A value younger than ``fresh_ttl`` is served
+    as is. For ``max_stale`` seconds after that the stale value is still served
+    immediately, while a single background task per key fetches a new one.
+
+    ``fetch`` returns ``(value, ok)``. A failed fetch (``ok`` False) is cached for
+    ``failure_ttl`` seconds so an upstream outage is retried at that pace instead
+    of once per request. If an older good value exists it is kept and served
+    instead of the failure. Fetches go through a SingleFlight named after the
+    cache, so a key never has more than one in flight.
+    """
+
+    def __init__(self, name: str, max_entries: int, fresh_ttl: float, max_stale: float, failure_ttl: float):
+        super().__init__(name, max_entries, fresh_ttl + max_stale)
+        self.fresh_ttl = fresh_ttl
+        self.max_stale = max_stale
+        self.failure_ttl = failure_ttl
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.failures = 0
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Tuple[Any, bool]]]) -> Any:
+        found, entry = self.get(key)
+        if found:
+            value, fresh_until, good, fetched_at = entry
+            if fresh_until <= time.monotonic():
+                with self._lock:
+                    self.stale_hits += 1
+                self._start_fetch(key, fetch, (value, fetched_at) if good else None)
+            return value
+        return await asyncio.shield(self._start_fetch(key, fetch, None))
+
+    def fetched_at(self, key: Hashable) -> Optional[float]:
+        """
+        When the value cached for ``key`` was fetched (epoch seconds), without
+        counting as a lookup. None when nothing is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1][3] if entry is not None else None
+
+    def _start_fetch(self, key: Hashable, fetch, stale: Optional[Tuple[Any, float]]) -> asyncio.Future:
+        # Concurrent misses and stale hits share one fetch per key
+        return self.flight.start(key, lambda: self._fetch(key, fetch, stale))
+
+    async def _fetch(self, key: Hashable, fetch, stale: Optional[Tuple[Any, float]]) -> Any:
+        with self._lock:
+            self.refreshes += 1
+        value, ok = await fetch()
+        now = time.monotonic()
+        if ok:
+            self.set(key, (value, now + self.fresh_ttl, True, time.time()))
+            return value
+        with self._lock:
+            self.failures += 1
+        if stale is not None:
+            stale_value, stale_fetched_at = stale
+            self.set(key, (stale_value, now + self.failure_ttl, True, stale_fetched_at), ttl=self.failure_ttl + self.max_stale)
+            return stale_value
+        self.set(key, (value, now + self.failure_ttl, False, time.time()), ttl=self.failure_ttl)
+        return value
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = super().snapshot()
+        with self._lock:
+            data.update({
+                "ttl_seconds": self.fresh_ttl,
+                "max_stale_seconds": self.max_stale,
+                "failure_ttl_seconds": self.failure_ttl,
+                "stale_hits": self.stale_hits,
+                "fetches": self.refreshes,
+                "fetch_failures": self.failures,
+                "fetches_in_flight": self.flight.snapshot()["in_flight"],
+            })
+        return data
+
+
+_caches: Dict[str, TTLCache] = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(name: str, max_entries: int, ttl: float, cache_class: Type[TTLCache] = TTLCache, **options: Any) -> TTLCache:
+    """
+    Returns the process-wide cache called ``name``, creating it on first use,
+    and lists it on the cache metrics endpoint.
+    """
+    with _registry_lock:
+        if name not in _caches:
+            _caches[name] = cache_class(name, max_entries, ttl, **options)
+        return _caches[name]
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    with _registry_lock:
+        caches = list(_caches.values())
+    return [cache.snapshot() for cache in caches]
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items() if v is not None))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def list_cache_key(**params: Any) -> Tuple:
+    """
+    Normalized cache key for a list query. Unset filters are dropped, ``order``
+    is lower-cased, and ``skip`` is dropped when a cursor is given (paging
+    ignores it then), so equivalent requests share one entry.
+    """
+    if params.get("cursor"):
+        params.pop("skip", None)
+    if isinstance(params.get("order"), str):
+        params["order"] = params["order"].lower()
+    return _freeze(params)
+
+
+def detached(value: Any) -> Any:
+    """
+    ``value`` with every ORM row in it (at the top level or in a list or tuple)
+    replaced by a transient copy of the row's loaded columns. A cached copy belongs
+    to no session, so no request can expire, refresh or lazy load it while others
+    are reading it, and the row its own session goes on using is never shared.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value)(detached(item) for item in value)
+    if not hasattr(value, "_sa_instance_state"):
+        return value
+    state = inspect(value)
+    copy = state.mapper.class_manager.new_instance()
+    copy.__dict__.update(
+        (attr.key, state.dict[attr.key]) for attr in state.mapper.column_attrs if attr.key in state.dict
+    )
+    return copy
+
+
+def cached(
+    cache: TTLCache,
+    key: Hashable,
+    loader: Callable[[], Any],
+    use_cache: bool = True,
+    negative_ttl: Optional[float] = None,
+    fill: bool = True,
+) -> Any:
+    """
+    Read-through lookup: returns the cached value for ``key`` or calls ``loader``
+    and caches its result. ``use_cache=False`` goes straight to the loader.
+    A None result is kept for ``negative_ttl`` seconds when given.
+
+    Concurrent misses for the same key in the threadpool share one loader call
+    through the cache's SingleFlight. Flights are keyed by the cache generation
+    too, so a lookup that starts after an invalidation never joins a load that
+    started before it.
+
+    ORM rows are cached, and returned on a miss, as ``detached`` copies that
+    every caller shares, so callers must treat what they get as read-only.
+
+    ``fill=False`` still serves hits but does not cache what the loader returns.
+    Services pass it for sessions reading from a replica: a replica that lags
+    behind a write would otherwise refill the entry the write just invalidated
+    with the old row, and keep serving it to a client pinned to the primary to
+    read its own writes. Entries are only ever filled from the primary.
+    """
+    if not (use_cache and CACHE_ENABLED):
+        return loader()
+    found, value = cache.get(key)
+    if found:
+        return value
+    if not fill:
+        # Not shared: a lagging replica's rows must not reach callers on the primary
+        return loader()
+    generation = cache.generation
+
+    def load():
+        value = detached(loader())
+        cache.set(key, value, generation, negative_ttl if value is None else None)
+        return value
+    return cache.flight.run_sync((key, generation), load)
+
+
+async def cached_async(
+    cache: TTLCache,
+    key: Hashable,
+    loader: Callable[[], Awaitable[Any]],
+    use_cache: bool = True,
+    negative_ttl: Optional[float] = None,
+    fill: bool = True,
+) -> Any:
+    if not (use_cache and CACHE_ENABLED):
+        return await loader()
+    found, value = cache.get(key)
+    if found:
+        return value
+    # Not coalesced: the loader runs on the caller's AsyncSession, which closes with its request
+    generation = cache.generation
+    value = await loader()
+    if not fill:
+        return value
+    value = detached(value)
+    cache.set(key, value, generation, negative_ttl if value is None else None)
+    return value
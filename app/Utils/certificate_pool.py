@@ -0,0 +1,74 @@
+# utils/certificate_pool.py
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from Settings.certificate_config import CERTIFICATE_BULK_NICE, CERTIFICATE_BULK_WORKERS
+from Settings.logging_config import setup_logging
+from Utils.certificate_renderer import get_certificate_renderer
+
+logger = setup_logging()
+
+# One certificate for a worker: (file name in the archive, field values, PDF title)
+CertificateJob = Tuple[str, Dict[str, Optional[str]], str]
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def render_batch(file_format: str, jobs: List[CertificateJob]) -> List[Tuple[str, bytes]]:
+    """
+    Runs in a pool worker: renders ``jobs`` with the worker's own renderer, which the
+    pool initializer compiled when the worker started.
+    """
+    renderer = get_certificate_renderer()
+    if file_format == "png":
+        return [(name, renderer.render_png(values)) for name, values, _ in jobs]
+    return [(name, renderer.render_pdf(values, title)) for name, values, title in jobs]
+
+
+def _start_worker():
+    # Lower priority first, so even compiling the template yields to request handling
+    if CERTIFICATE_BULK_NICE and hasattr(os, "nice"):
+        os.nice(CERTIFICATE_BULK_NICE)
+    get_certificate_renderer()
+
+
+def pool_workers() -> int:
+    if CERTIFICATE_BULK_WORKERS:
+        return CERTIFICATE_BULK_WORKERS
+    # The cores this process may run on, which in a container can be fewer than the machine's
+    if hasattr(os, "sched_getaffinity"):
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+    return max(1, cores - 1)
+
+
+def get_certificate_pool() -> ProcessPoolExecutor:
+    """
+    The process-wide pool for bulk certificates and certificate jobs, started on first
+    use. Workers are spawned rather than forked, so they never inherit the server's
+    threads, sockets or event loop.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = pool_workers()
+            logger.info(f"Starting certificate pool with {workers} workers")
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_start_worker,
+            )
+        return _pool
+
+
+def shutdown_certificate_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,456 @@
+# utils/certificate_renderer.py
+import hashlib
+import json
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import PIL
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from Config.certificate_template import CERTIFICATE_TEMPLATE
+from Settings.certificate_config import (
+    CERTIFICATE_BACKGROUND_PATH, CERTIFICATE_BOLD_FONT_PATH, CERTIFICATE_COMPRESS_LEVEL, CERTIFICATE_FONT_PATH,
+    CERTIFICATE_ISSUER,
+)
+from Settings.logging_config import setup_logging
+
+logger = setup_logging()
+
+PNG_MEDIA_TYPE = "image/png"
+PDF_MEDIA_TYPE = "application/pdf"
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# zlib header for a deflate stream with a 32K window
+_ZLIB_HEADER = b"\x78\x9c"
+# An empty final deflate block, closing a stream of full-flushed segments
+_DEFLATE_END = b"\x03\x00"
+_ADLER_BASE = 65521
+# Field boxes closer than this many rows are encoded as one band
+_BAND_MERGE_GAP = 16
+_FONT_SIZE_STEP = 2
+_ELLIPSIS = "…"
+# Renders of each band kept for reuse, keyed by the values of its fields
+_RECENT_BANDS = 32
+# Glyphs rasterized for every field font when the template is compiled; others on first use
+_PRELOADED_GLYPHS = "".join(chr(code) for code in range(32, 127)) + _ELLIPSIS + "·–—’"
+# Part of every cache key: bump it when a change here alters the bytes rendered from the same inputs
+_RENDER_VERSION = 1
+
+
+def _adler32_combine(adler1: int, adler2: int, length2: int) -> int:
+    # Adler-32 of A + B from the checksums of A and B (zlib's adler32_combine)
+    remainder = length2 % _ADLER_BASE
+    sum1 = adler1 & 0xFFFF
+    sum2 = (remainder * sum1) % _ADLER_BASE
+    sum1 += (adler2 & 0xFFFF) + _ADLER_BASE - 1
+    sum2 += ((adler1 >> 16) & 0xFFFF) + ((adler2 >> 16) & 0xFFFF) + _ADLER_BASE - remainder
+    sum1 %= _ADLER_BASE
+    sum2 %= _ADLER_BASE
+    return sum1 | (sum2 << 16)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)))
+
+
+def _pdf_string(text: str) -> bytes:
+    # A UTF-16 hex string, so any title is safe in the Info dictionary
+    return b"<FEFF" + text.encode("utf-16-be").hex().upper().encode() + b">"
+
+
+class _Segment:
+    """
+    A run of canvas rows in the deflate stream. A static segment is compressed once as
+    a whole. A band holds fields: each of its rows is also compressed once on its own,
+    and a render recompresses only the rows its text actually touches.
+    """
+
+    def __init__(self, top: int, bottom: int, fields: List["_Field"]):
+        self.top = top
+        self.bottom = bottom
+        self.fields = fields
+        self.image: Optional[Image.Image] = None
+        self.deflated = b""
+        self.adler = 1
+        self.length = 0
+        # Per row of a band: (deflated, adler32)
+        self.rows: List[Tuple[bytes, int]] = []
+        # Recently rendered field values of a band -> (deflated, adler32)
+        self.recent: "OrderedDict[Tuple[Optional[str], ...], Tuple[bytes, int]]" = OrderedDict()
+
+
+class _Face:
+    """
+    A font at one size with its rasterized glyphs. FreeType renders a glyph once; after
+    that, drawing text is one masked fill per character, which is what keeps a render
+    to a fraction of a millisecond per field. Kerning is not applied.
+    """
+
+    def __init__(self, font: ImageFont.FreeTypeFont, stroke: int):
+        self.font = font
+        # stroke_width stands in for a missing bold face
+        self.stroke = stroke
+        ascent, descent = font.getmetrics()
+        # From the vertical middle of the text to its baseline
+        self.middle_to_baseline = (ascent - descent) / 2
+        self._glyphs: Dict[str, Tuple[Any, int, int, int, int, float]] = {}
+
+    def glyph(self, char: str) -> Tuple[Any, int, int, int, int, float]:
+        # (mask, left, top, right and bottom of the mask from the pen position on the
+        # baseline, advance). The mask is the image core, pasted without Image.paste's checks.
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            left, top, right, bottom = self.font.getbbox(char, anchor="ls", stroke_width=self.stroke)
+            mask = None
+            if right > left and bottom > top:
+                image = Image.new("L", (right - left, bottom - top))
+                ImageDraw.Draw(image).text(
+                    (-left, -top), char, font=self.font, fill=255, anchor="ls", stroke_width=self.stroke, stroke_fill=255,
+                )
+                mask = image.im
+            glyph = self._glyphs[char] = (mask, left, top, right, bottom, self.font.getlength(char))
+        return glyph
+
+    def length(self, text: str) -> float:
+        return sum(self.glyph(char)[5] for char in text) + 2 * self.stroke
+
+    def draw(self, image: Image.Image, x: float, baseline: float, text: str, color: Tuple[int, ...]) -> Tuple[int, int]:
+        """Draws ``text`` with its pen starting at (x, baseline); returns the rows it inked."""
+        x += self.stroke
+        baseline = round(baseline)
+        ink_top, ink_bottom = image.height, 0
+        core = image.im
+        for char in text:
+            mask, left, top, right, bottom, advance = self.glyph(char)
+            if mask is not None:
+                pen = round(x)
+                core.paste(color, (pen + left, baseline + top, pen + right, baseline + bottom), mask)
+                ink_top = min(ink_top, baseline + top)
+                ink_bottom = max(ink_bottom, baseline + bottom)
+            x += advance
+        return max(0, ink_top), min(image.height, ink_bottom)
+
+
+class _Field:
+    def __init__(self, spec: Dict[str, Any], faces: List[_Face]):
+        self.name = spec["name"]
+        self.box = spec["box"]
+        self.color = ImageColor.getrgb(spec.get("color", "#000000"))
+        self.align = spec.get("align", "center")
+        self.format = spec.get("format", "{}")
+        # Largest first
+        self.faces = faces
+
+    def fit(self, text: str) -> Tuple[str, _Face, float]:
+        width = self.box[2] - self.box[0]
+        for face in self.faces:
+            length = face.length(text)
+            if length <= width:
+                return text, face, length
+        face = self.faces[-1]
+        while text and face.length(text + _ELLIPSIS) > width:
+            text = text[:-1]
+        text = text.rstrip() + _ELLIPSIS
+        return text, face, face.length(text)
+
+    def draw(self, image: Image.Image, value: str, top_offset: int) -> Tuple[int, int]:
+        text, face, length = self.fit(self.format.format(value))
+        left, top, right, bottom = self.box
+        if self.align == "left":
+            x = left
+        elif self.align == "right":
+            x = right - length
+        else:
+            x = (left + right - length) / 2
+        return face.draw(image, x, (top + bottom) / 2 + face.middle_to_baseline - top_offset, text, self.color)
+
+
+class CertificateRenderer:
+    """
+    Renders certificates from a template compiled once: fonts are loaded at every size
+    a field may need, the background and static elements are drawn, and every row is
+    filtered and deflated up front. A render draws the field values onto copies of the
+    field bands, deflates only the rows the text inked and stitches them between the
+    precompressed rows; a band whose values match a recent render is reused as is. That
+    one zlib stream is the PNG's IDAT and, with PNG predictors, the PDF's image XObject,
+    so both formats cost the same.
+    """
+
+    def __init__(
+        self,
+        template: Dict[str, Any],
+        font_path: str = "",
+        bold_font_path: str = "",
+        background_path: str = "",
+        issuer: str = "",
+        compress_level: int = 1,
+    ):
+        self.name = template["name"]
+        self.width, self.height = template["size"]
+        self.dpi = template["dpi"]
+        self.compress_level = compress_level
+        self._font_path = font_path
+        self._bold_font_path = bold_font_path
+        self._faces: Dict[Tuple[bool, int], _Face] = {}
+        self._recent_lock = threading.Lock()
+        self.version = self._fingerprint(template, (font_path, bold_font_path, background_path), issuer)
+
+        background = self._background(template["background"], background_path)
+        self._draw_static(background, template["static"], {"issuer": issuer})
+        fields = [
+            _Field(spec, self._field_faces(spec["size"], spec.get("min_size", spec["size"]), spec.get("bold", False)))
+            for spec in template["fields"]
+        ]
+        self._segments = self._compile(background, fields)
+        self._png_head = _PNG_SIGNATURE + _png_chunk(
+            b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        ) + _png_chunk(b"pHYs", struct.pack(">IIB", round(self.dpi / 0.0254), round(self.dpi / 0.0254), 1))
+        self._png_tail = _png_chunk(b"IEND", b"")
+        self._static_bytes = sum(len(segment.deflated) for segment in self._segments if segment.image is None)
+        logger.info(
+            f"Certificate template '{self.name}' compiled: {self.width}x{self.height}, {len(fields)} fields in "
+            f"{sum(1 for segment in self._segments if segment.image is not None)} bands, "
+            f"{self._static_bytes} bytes of static rows"
+        )
+
+    # ----------------------
+    # Compilation
+    # ----------------------
+    def _fingerprint(self, template: Dict[str, Any], asset_paths: Tuple[str, ...], issuer: str) -> str:
+        # Everything besides field values that shows in the output, assets by content
+        digest = hashlib.sha256(json.dumps(
+            [_RENDER_VERSION, PIL.__version__, template, issuer, self.compress_level], sort_keys=True,
+        ).encode())
+        for path in asset_paths:
+            if path:
+                with open(path, "rb") as asset:
+                    digest.update(hashlib.sha256(asset.read()).digest())
+            else:
+                digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _face(self, size: int, bold: bool) -> _Face:
+        key = (bold, size)
+        if key not in self._faces:
+            path = (self._bold_font_path if bold else "") or self._font_path
+            font = ImageFont.truetype(path, size) if path else ImageFont.load_default(size)
+            # Without a bold face, bold text is drawn with an outline of its own colour
+            self._faces[key] = _Face(font, 1 if bold and not self._bold_font_path else 0)
+        return self._faces[key]
+
+    def _field_faces(self, size: int, min_size: int, bold: bool) -> List[_Face]:
+        sizes = list(range(size, min_size, -_FONT_SIZE_STEP)) + [min_size]
+        faces = [self._face(step, bold) for step in sizes]
+        for face in faces:
+            for char in _PRELOADED_GLYPHS:
+                face.glyph(char)
+        return faces
+
+    def _background(self, color: str, path: str) -> Image.Image:
+        if not path:
+            return Image.new("RGB", (self.width, self.height), color)
+        with Image.open(path) as image:
+            return image.convert("RGB").resize((self.width, self.height), Image.Resampling.LANCZOS)
+
+    def _draw_static(self, canvas: Image.Image, elements: List[Dict[str, Any]], context: Dict[str, str]):
+        draw = ImageDraw.Draw(canvas)
+        for element in elements:
+            kind = element["type"]
+            if kind == "rect":
+                draw.rectangle(element["box"], fill=element.get("fill"), outline=element.get("outline"), width=element.get("width", 1))
+            elif kind == "line":
+                draw.line(element["points"], fill=element["color"], width=element.get("width", 1))
+            elif kind == "text":
+                face = self._face(element["size"], element.get("bold", False))
+                draw.text(
+                    element["at"], element["text"].format(**context), font=face.font, fill=element["color"],
+                    anchor=element.get("anchor", "mm"), stroke_width=face.stroke, stroke_fill=element["color"],
+                )
+            else:
+                raise ValueError(f"Unknown static element type '{kind}' in certificate template '{self.name}'")
+
+    def _compile(self, background: Image.Image, fields: List[_Field]) -> List[_Segment]:
+        bands: List[_Segment] = []
+        for field in sorted(fields, key=lambda field: field.box[1]):
+            top, bottom = max(0, field.box[1]), min(self.height, field.box[3])
+            if bands and top - bands[-1].bottom < _BAND_MERGE_GAP:
+                bands[-1].bottom = max(bands[-1].bottom, bottom)
+                bands[-1].fields.append(field)
+            else:
+                bands.append(_Segment(top, bottom, [field]))
+
+        segments: List[_Segment] = []
+        row = 0
+        for band in bands:
+            if band.top > row:
+                segments.append(_Segment(row, band.top, []))
+            band.image = background.crop((0, band.top, self.width, band.bottom))
+            segments.append(band)
+            row = band.bottom
+        if row < self.height:
+            segments.append(_Segment(row, self.height, []))
+
+        for segment in segments:
+            raw = self._filtered(background.crop((0, segment.top, self.width, segment.bottom)).tobytes())
+            segment.length = len(raw)
+            if segment.image is None:
+                segment.deflated = self._deflate(raw, 9)
+                segment.adler = zlib.adler32(raw)
+                continue
+            row_length = self.width * 3 + 1
+            for offset in range(0, len(raw), row_length):
+                row = raw[offset:offset + row_length]
+                segment.rows.append((self._deflate(row, 9), zlib.adler32(row)))
+        return segments
+
+    # ----------------------
+    # Rendering
+    # ----------------------
+    def _filtered(self, raw: bytes) -> bytes:
+        # PNG scanlines: filter type 0 (none) ahead of every row
+        stride = self.width * 3
+        return b"".join(b"\x00" + raw[offset:offset + stride] for offset in range(0, len(raw), stride))
+
+    @staticmethod
+    def _deflate(raw: bytes, level: int) -> bytes:
+        # Raw deflate, flushed to a byte boundary so segments can be concatenated
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return compressor.compress(raw) + compressor.flush(zlib.Z_FULL_FLUSH)
+
+    def _band(self, segment: _Segment, values: Tuple[Optional[str], ...], compressor) -> Tuple[bytes, int]:
+        # (deflated, adler32) of a band with ``values`` drawn into its fields
+        band = segment.image.copy()
+        inked = sorted(field.draw(band, value, segment.top) for field, value in zip(segment.fields, values) if value)
+        row_length = self.width * 3 + 1
+        parts = []
+        adler = 1
+        row = 0
+        for ink_top, ink_bottom in inked + [(segment.bottom - segment.top, 0)]:
+            # Untouched rows as compressed at startup, then the inked run compressed now
+            for deflated, row_adler in segment.rows[row:ink_top]:
+                parts.append(deflated)
+                adler = _adler32_combine(adler, row_adler, row_length)
+            row = max(row, ink_top)
+            if ink_bottom > row:
+                raw = self._filtered(band.crop((0, row, self.width, ink_bottom)).tobytes())
+                parts.append(compressor.compress(raw) + compressor.flush(zlib.Z_FULL_FLUSH))
+                adler = zlib.adler32(raw, adler)
+                row = ink_bottom
+        return b"".join(parts), adler
+
+    def _image_stream(self, values: Dict[str, Optional[str]]) -> bytes:
+        parts = [_ZLIB_HEADER]
+        adler = 1
+        # A full flush resets the history, so one compressor serves every inked run
+        compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, -15)
+        for segment in self._segments:
+            if segment.image is None:
+                deflated, segment_adler = segment.deflated, segment.adler
+            else:
+                # Certificates for one event share most fields, so their bands are reused
+                band_values = tuple(values.get(field.name) for field in segment.fields)
+                with self._recent_lock:
+                    band = segment.recent.get(band_values)
+                    if band is not None:
+                        segment.recent.move_to_end(band_values)
+                if band is None:
+                    band = self._band(segment, band_values, compressor)
+                    with self._recent_lock:
+                        segment.recent[band_values] = band
+                        if len(segment.recent) > _RECENT_BANDS:
+                            segment.recent.popitem(last=False)
+                deflated, segment_adler = band
+            parts.append(deflated)
+            adler = _adler32_combine(adler, segment_adler, segment.length)
+        parts.append(_DEFLATE_END)
+        parts.append(struct.pack(">I", adler))
+        return b"".join(parts)
+
+    def render_png(self, values: Dict[str, Optional[str]]) -> bytes:
+        """
+        A PNG certificate with ``values`` filled into the template's fields by name.
+        Missing or empty values leave their field blank.
+        """
+        return self._png_head + _png_chunk(b"IDAT", self._image_stream(values)) + self._png_tail
+
+    def render_pdf(self, values: Dict[str, Optional[str]], title: str = "") -> bytes:
+        """A one-page PDF holding the same image as ``render_png``, sized to the template's dpi."""
+        stream = self._image_stream(values)
+        page_width = self.width * 72 / self.dpi
+        page_height = self.height * 72 / self.dpi
+        content = f"q {page_width:.2f} 0 0 {page_height:.2f} 0 0 cm /Im0 Do Q".encode()
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width:.2f} {page_height:.2f}] "
+                f"/Resources << /XObject << /Im0 4 0 R >> >> /Contents 5 0 R >>"
+            ).encode(),
+            (
+                f"<< /Type /XObject /Subtype /Image /Width {self.width} /Height {self.height} "
+                f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /FlateDecode "
+                f"/DecodeParms << /Predictor 15 /Colors 3 /BitsPerComponent 8 /Columns {self.width} >> "
+                f"/Length {len(stream)} >>\nstream\n"
+            ).encode() + stream + b"\nendstream",
+            f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream",
+            b"<< /Title " + _pdf_string(title) + b" /Producer (Dijkstra) >>",
+        ]
+        out = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
+        offsets = []
+        size = len(out[0])
+        for number, body in enumerate(objects, start=1):
+            chunk = b"%d 0 obj\n" % number + body + b"\nendobj\n"
+            offsets.append(size)
+            out.append(chunk)
+            size += len(chunk)
+        out.append(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        out.extend(b"%010d 00000 n \n" % offset for offset in offsets)
+        out.append(b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1, len(objects), size,
+        ))
+        return b"".join(out)
+
+    def cache_key(self, file_format: str, values: Dict[str, Optional[str]], title: str = "") -> str:
+        """
+        Hash of everything a render depends on: equal keys mean byte-identical output.
+        """
+        payload = [self.version, file_format, values, title if file_format == "pdf" else ""]
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "template": self.name,
+            "version": self.version,
+            "size": [self.width, self.height],
+            "dpi": self.dpi,
+            "bands": [[segment.top, segment.bottom] for segment in self._segments if segment.image is not None],
+            "static_bytes": self._static_bytes,
+            "fonts_loaded": len(self._faces),
+        }
+
+
+_renderer: Optional[CertificateRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_certificate_renderer() -> CertificateRenderer:
+    """
+    The process-wide renderer for CERTIFICATE_TEMPLATE, compiled on first use. The app
+    compiles it at startup so no request pays for it.
+    """
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = CertificateRenderer(
+                    CERTIFICATE_TEMPLATE,
+                    font_path=CERTIFICATE_FONT_PATH,
+                    bold_font_path=CERTIFICATE_BOLD_FONT_PATH,
+                    background_path=CERTIFICATE_BACKGROUND_PATH,
+                    issuer=CERTIFICATE_ISSUER,
+                    compress_level=CERTIFICATE_COMPRESS_LEVEL,
+                )
+    return _renderer
@@ -0,0 +1,126 @@
+# utils/circuit_breaker.py
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# State changes kept per circuit for the metrics endpoint
+_TRANSITION_HISTORY = 20
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream that keeps failing. After ``failure_threshold``
+    failures in a row the circuit opens and ``allow`` turns callers away at once.
+    ``reset_timeout`` seconds later it goes half-open and lets a single probe
+    through: a success closes the circuit, a failure opens it again. A probe
+    that never reports back is replaced after another ``reset_timeout``.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self.transitions: Dict[str, int] = {}
+        self._history: deque = deque(maxlen=_TRANSITION_HISTORY)
+
+    def _move(self, state: str):
+        # Callers hold the lock
+        key = f"{self._state}->{state}"
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        self._history.append({"from": self._state, "to": state, "at": datetime.now(timezone.utc).isoformat()})
+        self._state = state
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def closed(self) -> bool:
+        return self._state == CLOSED
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+                self._move(HALF_OPEN)
+                self._probe_started_at = None
+            if self._state == HALF_OPEN and (
+                self._probe_started_at is None or now - self._probe_started_at >= self.reset_timeout
+            ):
+                self._probe_started_at = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            if self._state != CLOSED:
+                self._move(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._move(OPEN)
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self.consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout_seconds": self.reset_timeout,
+                "rejected": self.rejected,
+                "transitions": dict(self.transitions),
+                "recent_transitions": list(self._history),
+            }
+
+
+_circuits: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def register_circuit(name: str, failure_threshold: int, reset_timeout: float) -> CircuitBreaker:
+    """
+    Returns the process-wide circuit called ``name``, creating it on first use,
+    and lists it on the circuit metrics endpoint.
+    """
+    with _registry_lock:
+        if name not in _circuits:
+            _circuits[name] = CircuitBreaker(name, failure_threshold, reset_timeout)
+        return _circuits[name]
+
+
+def get_circuit_stats() -> List[Dict[str, Any]]:
+    with _registry_lock:
+        circuits = list(_circuits.values())
+    return [circuit.snapshot() for circuit in circuits]
+
+
+def stale_marker(source: str, as_of: Optional[datetime], reason: str) -> Dict[str, Any]:
+    """
+    The "stale" entry added to a fallback response: where the data came from
+    ("cache" or "database"), when it was fetched (UTC), and why it was served.
+    """
+    if as_of is not None and as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=timezone.utc)
+    return {"source": source, "as_of": as_of.isoformat() if as_of else None, "reason": reason}
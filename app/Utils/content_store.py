@@ -0,0 +1,147 @@
+# utils/content_store.py
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from Settings.certificate_config import CERTIFICATE_CACHE_DIR, CERTIFICATE_CACHE_MAX_BYTES
+from Settings.logging_config import setup_logging
+
+logger = setup_logging()
+
+# Eviction brings the store down to this share of its budget, so it does not run on every write
+_LOW_WATER = 0.9
+# Files read or written this recently are never evicted: a response may still be sending them
+_EVICTION_GRACE_SECONDS = 60
+
+
+class ContentStore:
+    """
+    Files on local disk keyed by a hash of what produced them, at
+    ``<root>/<key[:2]>/<key><suffix>``. Writes go to a temporary file that is renamed
+    into place, so a reader never sees a partial file and several workers can share
+    one directory. A hit touches the file's mtime, and once the store grows past
+    ``max_bytes`` the least recently used files are deleted. The size is tracked per
+    process and recounted from the directory before evicting, so other workers'
+    writes are accounted for. ``max_bytes`` 0 disables the store.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.write_errors = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def path(self, key: str, suffix: str = "") -> str:
+        return os.path.join(self.root, key[:2], key + suffix)
+
+    def _files(self) -> List[Tuple[float, int, str]]:
+        files = []
+        try:
+            shards = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return files
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def get(self, key: str, suffix: str = "") -> Optional[str]:
+        """The file's path, marked as recently used, or None."""
+        if not self.enabled:
+            return None
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key: str, data: bytes, suffix: str = "") -> Optional[str]:
+        """
+        Stores ``data`` and returns its path, or None if the store is disabled, the data
+        alone exceeds the budget or the write failed. A failed write is logged, not raised:
+        the caller still has the data.
+        """
+        if not self.enabled or len(data) > self.max_bytes:
+            return None
+        path = self.path(key, suffix)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as temp:
+                    temp.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as exc:
+            self.write_errors += 1
+            logger.warning(f"Content store write to {path} failed: {exc}")
+            return None
+        self.writes += 1
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._files())
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+        return path
+
+    def _evict(self):
+        # Called with the lock held
+        files = sorted(self._files())
+        size = sum(file_size for _, file_size, _ in files)
+        target = self.max_bytes * _LOW_WATER
+        cutoff = time.time() - _EVICTION_GRACE_SECONDS
+        evicted = 0
+        for mtime, file_size, path in files:
+            if size <= target or mtime > cutoff:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
+            evicted += 1
+        self._size = size
+        self.evictions += evicted
+        logger.info(f"Content store {self.root}: evicted {evicted} files, {size} bytes kept")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "root": self.root,
+            "enabled": self.enabled,
+            "max_bytes": self.max_bytes,
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "write_errors": self.write_errors,
+            "evictions": self.evictions,
+        }
+
+
+# Rendered certificates, shared by every worker process on the host
+certificate_store = ContentStore(CERTIFICATE_CACHE_DIR, CERTIFICATE_CACHE_MAX_BYTES)
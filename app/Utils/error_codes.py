@@ -219,4 +219,37 @@ class ErrorCodes:
     USER_WORKEXP_VAL_A02 = "USER-WORKEXP-VAL-A02"  # Required field missing
 
     # Not found errors
-    USER_WORKEXP_NF_A01 = "USER-WORKEXP-NF-A01"  # Work experience not found
\ No newline at end of file
+    USER_WORKEXP_NF_A01 = "USER-WORKEXP-NF-A01"  # Work experience not found
+
+    # -----------------------------
+    # Users → GitHub Statistics
+    # -----------------------------
+
+    # Server / Unexpected errors
+    USER_GITHUB_SRV_A01 = "USER-GITHUB-SRV-A01"  # GitHub API unreachable or returned an error
+
+    # -----------------------------
+    # Users → LeetCode Statistics
+    # -----------------------------
+
+    # Not found errors
+    USER_LEETCODE_NF_A01 = "USER-LEETCODE-NF-A01"  # No stored contest history for the user
+
+    # -----------------------------
+    # Users → Certificates
+    # -----------------------------
+
+    # Not found errors
+    USER_CERT_NF_A01 = "USER-CERT-NF-A01"  # No users in a bulk certificate cohort
+    USER_CERT_NF_A02 = "USER-CERT-NF-A02"  # Certificate job not found or expired
+
+    # Validation / Input errors
+    USER_CERT_VAL_A01 = "USER-CERT-VAL-A01"  # Certificate job result requested before the job is done
+
+    # -----------------------------
+    # Generic → Pagination
+    # -----------------------------
+
+    # Validation / Input errors
+    GEN_PAGE_VAL_A01 = "GEN-PAGE-VAL-A01"  # Malformed or mismatched cursor
+    GEN_PAGE_VAL_A02 = "GEN-PAGE-VAL-A02"  # Sort field not allowed
@@ -0,0 +1,182 @@
+# utils/github_client.py
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from Config.constants import GITHUB_GRAPHQL_API
+from Settings.http_config import (
+    GITHUB_RATE_LIMIT_BURST, GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS, GITHUB_RATE_LIMIT_RESERVE, GITHUB_TOKENS,
+)
+from Settings.logging_config import setup_logging
+from Utils.Exceptions.user_exceptions import GitHubApiError
+from Utils.http_client import RETRY_STATUS_CODES, request_with_retries
+from Utils.rate_limit import AsyncTokenBucket
+
+logger = setup_logging()
+
+# GitHub's hourly GraphQL budget per token, assumed until a response says otherwise
+_DEFAULT_LIMIT = 5_000
+_WINDOW_SECONDS = 3_600
+
+_RATE_LIMITED_STATUS_CODES = (403, 429)
+# Rate-limited responses come straight back, so the governor sees them and moves to
+# another token instead of retrying on the spent one
+_RETRY_STATUS_CODES = tuple(code for code in RETRY_STATUS_CODES if code not in _RATE_LIMITED_STATUS_CODES)
+
+
+def _iso(epoch: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat() if epoch is not None else None
+
+
+class _TokenBudget:
+    """
+    One token's GraphQL budget as last reported by GitHub (X-RateLimit-* headers),
+    and the bucket that paces calls on it so the budget lasts until it resets.
+    """
+
+    def __init__(self, token: Optional[str]):
+        self.token = token
+        self.limit = _DEFAULT_LIMIT
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.last_cost = 1
+        self.requests = 0
+        self.points_used = 0
+        self.bucket = AsyncTokenBucket(_DEFAULT_LIMIT / _WINDOW_SECONDS, GITHUB_RATE_LIMIT_BURST)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def spendable(self, now: float) -> int:
+        # An unknown or already reset budget is a full one
+        if self.remaining is None or self.reset_at is None or self.reset_at <= now:
+            return self.limit - GITHUB_RATE_LIMIT_RESERVE
+        return self.remaining - GITHUB_RATE_LIMIT_RESERVE
+
+    def observe(self, headers, cost: Optional[int], exhausted: bool = False):
+        if "X-RateLimit-Remaining" in headers:
+            self.limit = int(headers.get("X-RateLimit-Limit", self.limit))
+            self.remaining = int(headers["X-RateLimit-Remaining"])
+            self.reset_at = float(headers.get("X-RateLimit-Reset", time.time() + _WINDOW_SECONDS))
+        if exhausted:
+            self.remaining = 0
+            retry_after = headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                self.reset_at = time.time() + int(retry_after)
+            elif self.reset_at is None:
+                self.reset_at = time.time() + _WINDOW_SECONDS
+        self.requests += 1
+        if cost is not None:
+            self.last_cost = cost
+            self.points_used += cost
+
+        # Spread what is left evenly over the rest of the window
+        now = time.time()
+        spendable = self.spendable(now)
+        if spendable > 0:
+            window = max(1.0, (self.reset_at or now + _WINDOW_SECONDS) - now)
+            self.bucket.retune(spendable / window, max(1.0, min(GITHUB_RATE_LIMIT_BURST, spendable)))
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            # Enough to tell tokens apart without exposing them
+            "token": f"...{self.token[-4:]}" if self.token else None,
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "spendable": max(0, self.spendable(now)),
+            "reset_at": _iso(self.reset_at),
+            "requests": self.requests,
+            "points_used": self.points_used,
+        }
+
+
+class GitHubClient:
+    """
+    Governs GraphQL calls across a pool of tokens. Each call goes out on the token with
+    the most budget left, after that token's bucket has the points the previous call
+    cost. Buckets are retuned from every response so a token's remaining budget is
+    spread until its reset. When every token is spent, calls wait for the earliest
+    reset, or fail with GitHubApiError if that is more than
+    GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS away.
+    """
+
+    def __init__(self, tokens: List[str]):
+        # Without a token GitHub still answers (with an authentication error)
+        self._budgets = [_TokenBudget(token) for token in tokens] or [_TokenBudget(None)]
+        self.exhausted_waits = 0
+        self.exhausted_wait_seconds = 0.0
+        self.rate_limited_responses = 0
+
+    async def _budget(self) -> _TokenBudget:
+        while True:
+            now = time.time()
+            budget = max(self._budgets, key=lambda candidate: candidate.spendable(now))
+            if budget.spendable(now) > 0:
+                return budget
+            reset_at = min((candidate.reset_at for candidate in self._budgets if candidate.reset_at), default=now + _WINDOW_SECONDS)
+            wait = reset_at - now
+            if wait > GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS:
+                raise GitHubApiError(f"rate limit exhausted on every token until {_iso(reset_at)}")
+            logger.warning(f"GitHub rate limit exhausted on every token, waiting {wait:.0f}s for a reset")
+            self.exhausted_waits += 1
+            self.exhausted_wait_seconds += wait
+            await asyncio.sleep(wait + 1)
+
+    async def graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs one GraphQL query and returns the response body. A token GitHub reports
+        as rate limited is set aside and the query moves on to the next one; if the
+        last one is rate limited too, GitHubApiError is raised rather than the HTTP
+        error, since a spent budget is no sign of GitHub failing. Transport errors and
+        502/503/504 are retried on the same token, each attempt paced by its bucket.
+        """
+        for attempt in range(len(self._budgets) + 1):
+            budget = await self._budget()
+            # A read-only query, so it is safe to retry
+            response = await request_with_retries(
+                "POST",
+                GITHUB_GRAPHQL_API,
+                limiter=budget.bucket,
+                limiter_cost=budget.last_cost,
+                retry_statuses=_RETRY_STATUS_CODES,
+                headers=budget.headers,
+                json={"query": query, "variables": variables},
+            )
+            payload = response.json() if response.status_code == 200 else None
+            errors = (payload or {}).get("errors") or []
+            # Primary limit: nothing remaining; secondary limit: told to back off
+            exhausted = (
+                response.status_code in _RATE_LIMITED_STATUS_CODES
+                and (response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers)
+            ) or any(error.get("type") == "RATE_LIMITED" for error in errors)
+            cost = (((payload or {}).get("data") or {}).get("rateLimit") or {}).get("cost")
+            budget.observe(response.headers, cost, exhausted)
+            if exhausted:
+                self.rate_limited_responses += 1
+                if attempt < len(self._budgets):
+                    continue
+                raise GitHubApiError(f"rate limited on every token (HTTP {response.status_code})")
+            response.raise_for_status()
+            return payload
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.time()
+        tokens = [budget.snapshot(now) for budget in self._budgets]
+        return {
+            "points_used": sum(token["points_used"] for token in tokens),
+            "points_spendable": sum(token["spendable"] for token in tokens),
+            "requests": sum(token["requests"] for token in tokens),
+            "paced_seconds": round(sum(budget.bucket.waited_seconds for budget in self._budgets), 3),
+            "exhausted_waits": self.exhausted_waits,
+            "exhausted_wait_seconds": round(self.exhausted_wait_seconds, 3),
+            "rate_limited_responses": self.rate_limited_responses,
+            "tokens": tokens,
+        }
+
+
+github_client = GitHubClient(GITHUB_TOKENS)
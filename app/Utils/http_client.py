@@ -0,0 +1,110 @@
+# utils/http_client.py
+import asyncio
+import importlib.util
+import random
+from typing import Optional, Tuple
+
+import httpx
+
+from Settings.http_config import (
+    HTTP_CONNECT_TIMEOUT, HTTP_KEEPALIVE_EXPIRY, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_MAX_RETRIES, HTTP_POOL_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_RETRY_BACKOFF, HTTP_RETRY_BACKOFF_MAX,
+    HTTP_WRITE_TIMEOUT,
+)
+from Settings.logging_config import setup_logging
+from Utils.rate_limit import AsyncTokenBucket
+
+logger = setup_logging()
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]"); HTTP/1.1 keep-alive otherwise
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+RETRY_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(
+            connect=HTTP_CONNECT_TIMEOUT,
+            read=HTTP_READ_TIMEOUT,
+            write=HTTP_WRITE_TIMEOUT,
+            pool=HTTP_POOL_TIMEOUT,
+        ),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+async def start_http_client():
+    global _client
+    if _client is None:
+        _client = _build_client()
+        logger.info(f"Outbound HTTP client started (http2={HTTP2_AVAILABLE})")
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    The process-wide client opened at startup. Created on first use when the
+    app lifecycle did not run (scripts, the Migrations CLI).
+    """
+    global _client
+    if _client is None:
+        _client = _build_client()
+    return _client
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    # Honour a Retry-After given in seconds, otherwise full-jitter exponential backoff
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.isdigit():
+        return min(float(retry_after), HTTP_RETRY_BACKOFF_MAX)
+    return random.uniform(0, min(HTTP_RETRY_BACKOFF_MAX, HTTP_RETRY_BACKOFF * 2 ** attempt))
+
+
+async def request_with_retries(
+    method: str,
+    url: str,
+    retries: int = HTTP_MAX_RETRIES,
+    limiter: Optional[AsyncTokenBucket] = None,
+    limiter_cost: float = 1,
+    retry_statuses: Tuple[int, ...] = RETRY_STATUS_CODES,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Sends a request on the shared client. Transport errors and ``retry_statuses``
+    responses (429/502/503/504 by default) are retried up to ``retries`` times
+    with jittered backoff, so only use it for idempotent calls. Every attempt,
+    retries included, first takes ``limiter_cost`` tokens from ``limiter`` when
+    one is given. The last response is returned whatever its status; the last
+    transport error is raised.
+    """
+    client = get_http_client()
+    for attempt in range(retries + 1):
+        response = None
+        if limiter is not None:
+            await limiter.acquire(limiter_cost)
+        try:
+            response = await client.request(method, url, **kwargs)
+        except RETRY_EXCEPTIONS as e:
+            if attempt == retries:
+                raise
+            logger.warning(f"{method} {url} failed ({type(e).__name__}), retrying")
+        else:
+            if response.status_code not in retry_statuses or attempt == retries:
+                return response
+            logger.warning(f"{method} {url} returned {response.status_code}, retrying")
+        await asyncio.sleep(_retry_delay(attempt, response))
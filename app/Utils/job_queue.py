@@ -0,0 +1,174 @@
+# utils/job_queue.py
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from Settings.logging_config import setup_logging
+
+logger = setup_logging()
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Stored error messages are truncated to this many characters
+_MAX_ERROR_LENGTH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    total INTEGER,
+    result_path TEXT,
+    result_bytes INTEGER,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires REAL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, created_at);
+"""
+
+
+class JobQueue:
+    """
+    A job queue in a local SQLite file, so accepted jobs outlive the process.
+
+    A worker claims the oldest queued job, or a running one whose lease has expired
+    because its worker died, under a lease it renews with every progress update.
+    Claims run in an immediate transaction, so workers in several processes can
+    share one file. A job claimed ``max_attempts`` times without finishing is
+    failed rather than handed out again. Every call opens its own connection and
+    blocks; async callers run them in a thread.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Autocommit: every statement outside an explicit BEGIN is its own transaction
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.row_factory = sqlite3.Row
+            if not self._ready:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                self._ready = True
+            yield connection
+        finally:
+            connection.close()
+
+    def submit(self, payload: str) -> Dict[str, Any]:
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, payload, QUEUED, now, now),
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as connection:
+            row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def claim(self, owner: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._connect() as connection:
+            # Taken before the read, so two workers never claim the same job
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    row = connection.execute(
+                        "SELECT * FROM jobs WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                        "ORDER BY created_at LIMIT 1",
+                        (QUEUED, RUNNING, now),
+                    ).fetchone()
+                    if row is None or row["attempts"] < self.max_attempts:
+                        break
+                    connection.execute(
+                        "UPDATE jobs SET status = ?, error = ?, owner = NULL, finished_at = ?, updated_at = ? WHERE id = ?",
+                        (FAILED, f"Gave up after {row['attempts']} attempts", now, now, row["id"]),
+                    )
+                if row is not None:
+                    connection.execute(
+                        "UPDATE jobs SET status = ?, owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                        "progress = 0, started_at = ?, updated_at = ? WHERE id = ?",
+                        (RUNNING, owner, now + lease_seconds, now, now, row["id"]),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        if row["status"] == RUNNING:
+            logger.warning(f"Job {row['id']} reclaimed from {row['owner']} after its lease expired")
+        return self.get(row["id"])
+
+    def _update(self, job_id: str, owner: str, assignments: str, values: tuple) -> bool:
+        # Only the job's current owner may change it: a worker whose lease lapsed has lost the job
+        with self._connect() as connection:
+            cursor = connection.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ? AND owner = ? AND status = ?",
+                (*values, time.time(), job_id, owner, RUNNING),
+            )
+        return cursor.rowcount == 1
+
+    def progress(self, job_id: str, owner: str, progress: int, total: Optional[int], lease_seconds: float) -> bool:
+        """Records progress and renews the lease; False if the job is no longer this owner's."""
+        return self._update(
+            job_id, owner, "progress = ?, total = ?, lease_expires = ?", (progress, total, time.time() + lease_seconds),
+        )
+
+    def finish(self, job_id: str, owner: str, result_path: str, result_bytes: int) -> bool:
+        return self._update(
+            job_id, owner, "status = ?, progress = COALESCE(total, progress), result_path = ?, result_bytes = ?, owner = NULL, finished_at = ?",
+            (DONE, result_path, result_bytes, time.time()),
+        )
+
+    def fail(self, job_id: str, owner: str, error: str) -> bool:
+        return self._update(
+            job_id, owner, "status = ?, error = ?, owner = NULL, finished_at = ?",
+            (FAILED, error[:_MAX_ERROR_LENGTH], time.time()),
+        )
+
+    def release(self, job_id: str, owner: str) -> bool:
+        """Hands an unfinished job back to the queue, for a worker that is shutting down."""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, owner = NULL, lease_expires = NULL, attempts = attempts - 1, "
+                "updated_at = ? WHERE id = ? AND owner = ? AND status = ?",
+                (QUEUED, time.time(), job_id, owner, RUNNING),
+            )
+        return cursor.rowcount == 1
+
+    def purge(self, finished_before: float) -> List[Dict[str, Any]]:
+        """Deletes jobs that finished before ``finished_before`` and returns them."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ? RETURNING *",
+                (DONE, FAILED, finished_before),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._connect() as connection:
+            rows = connection.execute("SELECT status, COUNT(*) AS jobs FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["jobs"] for row in rows}
@@ -0,0 +1,106 @@
+# utils/pagination.py
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import asc, desc, literal, tuple_
+
+from Utils.Exceptions.pagination_exceptions import InvalidCursor, InvalidSortField
+
+
+def _encode_value(value: Any) -> Any:
+    # JSON has no datetime/date/UUID, so tag them to restore the exact type on decode
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "u" in value:
+            return UUID(value["u"])
+    return value
+
+
+def encode_cursor(sort_by: str, order: str, sort_value: Any, row_id: UUID) -> str:
+    payload = {"s": sort_by, "o": order, "k": [_encode_value(sort_value), _encode_value(row_id)]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str) -> Tuple[Any, UUID]:
+    """
+    Returns the (sort value, id) of the last row of the previous page.
+    A cursor is only valid for the sort it was issued with.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["s"] != sort_by or payload["o"] != order:
+            raise InvalidCursor(cursor)
+        sort_value, row_id = (_decode_value(v) for v in payload["k"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise InvalidCursor(cursor)
+    if not isinstance(row_id, UUID):
+        raise InvalidCursor(cursor)
+    return sort_value, row_id
+
+
+def apply_keyset(
+    statement,
+    model,
+    allowed_sorts: Iterable[str],
+    sort_by: str = "created_at",
+    order: str = "desc",
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20,
+):
+    """
+    Orders by (sort_by, id) and seeks past the cursor instead of using OFFSET,
+    so every page costs the same as the first. ``id`` breaks ties between rows
+    with equal sort values. ``skip`` is kept for legacy clients and is ignored
+    when a cursor is given. Fetches one extra row so ``build_page`` can tell
+    whether another page exists.
+    """
+    if sort_by not in allowed_sorts:
+        raise InvalidSortField(sort_by, allowed_sorts)
+    order = order.lower()
+    sort_column = getattr(model, sort_by)
+    direction = desc if order == "desc" else asc
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, sort_by, order)
+        key = tuple_(sort_column, model.id)
+        bound = tuple_(literal(sort_value, sort_column.type), literal(row_id, model.id.type))
+        statement = statement.where(key < bound if order == "desc" else key > bound)
+    elif skip:
+        statement = statement.offset(skip)
+
+    return statement.order_by(direction(sort_column), direction(model.id)).limit(limit + 1)
+
+
+def build_page(rows: List[Any], sort_by: str, order: str, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trims the look-ahead row from an ``apply_keyset`` result and returns
+    (items, next_cursor); next_cursor is None on the last page.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(sort_by, order.lower(), getattr(last, sort_by), last.id)
@@ -0,0 +1,104 @@
+# utils/pool_metrics.py
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+# QueuePool._do_get can call itself again on an overflow race; only the outermost call is measured
+_in_checkout: ContextVar[bool] = ContextVar("_in_checkout", default=False)
+
+
+class PoolStats:
+    """
+    Running counters for one connection pool.
+    Wait time is measured around the pool checkout itself, so it captures the
+    time a request spent queued for a connection, not query time.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_checkout(self, waited: float):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def record_timeout(self, waited: float):
+        with self._lock:
+            self.timeouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def record_checkin(self):
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            data = {
+                "name": self.name,
+                "pool_class": type(pool).__name__,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+        # QueuePool exposes its live sizing; NullPool (PgBouncer mode) has none
+        if hasattr(pool, "size") and hasattr(pool, "overflow"):
+            data.update({
+                "pool_size": pool.size(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "max_connections": pool.size() + max(pool._max_overflow, 0),
+            })
+        return data
+
+
+def instrumented_pool_class(base: Type[Pool], stats: PoolStats) -> Type[Pool]:
+    """
+    Builds a subclass of ``base`` that reports checkouts, checkins and
+    checkout timeouts into ``stats``. Bound at class level so the counters
+    survive ``Pool.recreate()`` after a disconnect.
+    """
+
+    class InstrumentedPool(base):
+        pool_stats = stats
+
+        def _do_get(self):
+            if _in_checkout.get():
+                return super()._do_get()
+            token = _in_checkout.set(True)
+            started = time.perf_counter()
+            try:
+                record = super()._do_get()
+            except exc.TimeoutError:
+                self.pool_stats.record_timeout(time.perf_counter() - started)
+                raise
+            finally:
+                _in_checkout.reset(token)
+            self.pool_stats.record_checkout(time.perf_counter() - started)
+            return record
+
+        def _do_return_conn(self, record):
+            self.pool_stats.record_checkin()
+            super()._do_return_conn(record)
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
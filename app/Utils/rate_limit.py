@@ -0,0 +1,46 @@
+# utils/rate_limit.py
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Caps callers at ``rate`` acquisitions per second, allowing bursts of up to
+    ``burst``. Each ``acquire`` reserves a token immediately, possibly driving
+    the balance negative, then sleeps until that token would have been earned.
+    Nothing awaits between reading and updating the balance, so no lock is
+    needed on a single event loop. ``rate <= 0`` disables the limit.
+
+    A call may cost more than one token, and ``retune`` changes the rate and
+    burst in place, for upstreams that report their remaining budget.
+    ``waited_seconds`` adds up the time callers have been held back.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self.waited_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def retune(self, rate: float, burst: float):
+        self._refill()
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = min(self._tokens, burst)
+
+    async def acquire(self, cost: float = 1):
+        if self.rate <= 0:
+            return
+        self._refill()
+        self._tokens -= cost
+        if self._tokens < 0:
+            wait = -self._tokens / self.rate
+            self.waited_seconds += wait
+            await asyncio.sleep(wait)
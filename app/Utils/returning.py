@@ -0,0 +1,70 @@
+# utils/returning.py
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import SQLModel, delete, insert, update
+
+from Schema.SQL.Models.models import utcnow
+
+# Filled in by the database; sending None would override the server default
+SERVER_GENERATED_COLUMNS = ("created_at", "updated_at")
+
+
+def insert_values(instance: SQLModel) -> Dict[str, Any]:
+    """
+    Column values for inserting ``instance``, leaving out unset
+    server-generated timestamps so the column defaults apply.
+    """
+    values = instance.model_dump()
+    for column in SERVER_GENERATED_COLUMNS:
+        if values.get(column) is None:
+            values.pop(column, None)
+    return values
+
+
+def insert_returning(instance: SQLModel):
+    """
+    INSERT ... RETURNING * for one row; the new, fully populated row is the result.
+    """
+    model = type(instance)
+    return insert(model).values(**insert_values(instance)).returning(model)
+
+
+def update_returning(model, row_id: UUID, values: Dict[str, Any]):
+    """
+    UPDATE ... SET <values> WHERE id = :row_id RETURNING *. No row back means no match.
+    updated_at is set by the column's onupdate expression. Empty ``values`` change
+    nothing, so the row is only read back with a SELECT and keeps its updated_at.
+    """
+    if not values:
+        # SQLAlchemy's select, not SQLModel's: session.exec returns a Result for both statements
+        return select(model).where(model.id == row_id).execution_options(populate_existing=True)
+    return (
+        update(model)
+        .where(model.id == row_id)
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+
+def delete_returning(model, row_id: UUID):
+    """
+    DELETE ... WHERE id = :row_id RETURNING id. No row back means no match.
+    """
+    return delete(model).where(model.id == row_id).returning(model.id)
+
+
+def upsert(dialect_name: str, model, conflict_columns: List[str], update_columns: List[str]):
+    """
+    INSERT ... ON CONFLICT (conflict_columns) DO UPDATE SET update_columns to the
+    incoming values. PostgreSQL and SQLite share the syntax; conflict_columns must be
+    covered by a unique index. updated_at is set explicitly, since the column's
+    onupdate does not fire for the conflict branch.
+    """
+    statement = (postgresql.insert if dialect_name == "postgresql" else sqlite.insert)(model)
+    values = {column: statement.excluded[column] for column in update_columns}
+    values["updated_at"] = utcnow()
+    return statement.on_conflict_do_update(index_elements=conflict_columns, set_=values)
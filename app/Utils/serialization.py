@@ -0,0 +1,55 @@
+# utils/serialization.py
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_type: Any) -> TypeAdapter:
+    """One adapter per response type, so its validator and serializer are built once."""
+    return TypeAdapter(response_type)
+
+
+@lru_cache(maxsize=None)
+def _item_fields(response_type: Any) -> Optional[FrozenSet[str]]:
+    # Fields of the row model in List[Model] or Page[Model], else None
+    if get_origin(response_type) in (list, List):
+        item = get_args(response_type)[0]
+    elif isinstance(response_type, type) and issubclass(response_type, BaseModel) and "items" in response_type.model_fields:
+        item = get_args(response_type.model_fields["items"].annotation)[0]
+    else:
+        return None
+    if isinstance(item, type) and issubclass(item, BaseModel):
+        return frozenset(item.model_fields)
+    return None
+
+
+def _loaded(rows: List[Any], fields: FrozenSet[str]) -> List[Any]:
+    # A row read by a query keeps its column values in __dict__; reading them there skips
+    # SQLAlchemy's attribute descriptors, which cost more than the validation itself. Rows
+    # missing a field (expired, deferred or not a column) are read through attributes.
+    return [
+        row.__dict__ if hasattr(row, "_sa_instance_state") and fields.issubset(row.__dict__) else row
+        for row in rows
+    ]
+
+
+def model_response(response_type: Any, content: Any, status_code: int = 200) -> Response:
+    """
+    ``content`` (ORM rows, or a page dict holding them) as a JSON response of
+    ``response_type``. The whole payload is validated in one call and encoded to JSON by
+    pydantic-core, without the intermediate dicts and stdlib encoding of FastAPI's own
+    path. Routes that return it keep ``response_model`` for the OpenAPI schema; FastAPI
+    skips its validation and encoding for a Response.
+    """
+    fields = _item_fields(response_type)
+    if fields is not None:
+        if isinstance(content, list):
+            content = _loaded(content, fields)
+        elif isinstance(content, dict) and isinstance(content.get("items"), list):
+            content = {**content, "items": _loaded(content["items"], fields)}
+    adapter = get_type_adapter(response_type)
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return Response(body, status_code=status_code, media_type="application/json")
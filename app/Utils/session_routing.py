@@ -0,0 +1,54 @@
+# utils/session_routing.py
+import itertools
+import threading
+from typing import List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+
+class ReplicaSelector:
+    """
+    Round-robin over the replica engines. Shared by every session so load is
+    spread across replicas rather than each session starting at the first one.
+    """
+
+    def __init__(self, replicas: List[Engine]):
+        self.replicas = replicas
+        self._cycle = itertools.cycle(replicas) if replicas else None
+        self._lock = threading.Lock()
+
+    def next(self) -> Optional[Engine]:
+        if self._cycle is None:
+            return None
+        with self._lock:
+            return next(self._cycle)
+
+
+class RoutingSession(Session):
+    """
+    Session that binds reads to a replica and writes to the primary.
+    A read-only session picks one replica for its lifetime so a request sees a
+    single consistent snapshot; flushes and explicit INSERT/UPDATE/DELETE always
+    go to the primary. Also used as ``sync_session_class`` for AsyncSession, in
+    which case the engines are the ``sync_engine`` of the async engines.
+    """
+
+    def __init__(self, primary: Engine, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is None or self._flushing or isinstance(clause, UpdateBase):
+            return self.primary
+        return self.replica
+
+
+def bound_to_replica(session) -> bool:
+    """
+    Whether ``session`` (a Session, or an AsyncSession over a RoutingSession) reads
+    from a replica, which may not have caught up with the latest writes yet.
+    """
+    return getattr(getattr(session, "sync_session", session), "replica", None) is not None
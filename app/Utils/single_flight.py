@@ -0,0 +1,111 @@
+# utils/single_flight.py
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller runs the call and
+    every caller that arrives while it is in flight receives the same result (or
+    exception). Each call is a concurrent.futures.Future behind a plain lock, so
+    event loop (``run``) and threadpool (``run_sync``) callers share flights.
+    Nothing is kept once a call finishes; caching results is left to the caller.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, concurrent.futures.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def _join(self, key: Hashable) -> Tuple[concurrent.futures.Future, bool]:
+        # (call, True) for the caller that has to run it
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                return call, False
+            call = self._calls[key] = concurrent.futures.Future()
+            self.calls += 1
+            return call, True
+
+    def _finish(self, key: Hashable, call: concurrent.futures.Future):
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def start(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """
+        Joins the call in flight for ``key`` or starts ``fetch()`` as a task, and returns
+        a future for its result. The task runs to completion even if every caller stops
+        waiting, so it may also be started just to refresh something in the background.
+        """
+        call, leader = self._join(key)
+        if leader:
+            def settle(task: asyncio.Task):
+                self._finish(key, call)
+                if task.cancelled():
+                    call.cancel()
+                elif task.exception() is not None:
+                    call.set_exception(task.exception())
+                else:
+                    call.set_result(task.result())
+            asyncio.ensure_future(fetch()).add_done_callback(settle)
+        return asyncio.wrap_future(call)
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        # Shielded, so a cancelled caller never cancels the call the others wait on
+        return await asyncio.shield(self.start(key, fetch))
+
+    def run_sync(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        ``run`` for threadpool callers: blocks until the call in flight for ``key`` is
+        done, or runs ``fetch()`` in this thread if there is none.
+        """
+        call, leader = self._join(key)
+        if not leader:
+            return call.result()
+        try:
+            result = fetch()
+        except BaseException as e:
+            self._finish(key, call)
+            call.set_exception(e)
+            raise
+        self._finish(key, call)
+        call.set_result(result)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = self.calls + self.coalesced
+            return {
+                "name": self.name,
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "coalesced_ratio": round(self.coalesced / requests, 4) if requests else 0.0,
+                "in_flight": len(self._calls),
+            }
+
+
+_flights: Dict[str, SingleFlight] = {}
+_registry_lock = threading.Lock()
+
+
+def register_single_flight(name: str) -> SingleFlight:
+    """
+    Returns the process-wide SingleFlight called ``name``, creating it on first use,
+    and lists it on the single-flight metrics endpoint.
+    """
+    with _registry_lock:
+        if name not in _flights:
+            _flights[name] = SingleFlight(name)
+        return _flights[name]
+
+
+def get_single_flight_stats() -> List[Dict[str, Any]]:
+    with _registry_lock:
+        flights = list(_flights.values())
+    return [flight.snapshot() for flight in flights]
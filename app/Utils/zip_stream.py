@@ -0,0 +1,47 @@
+# utils/zip_stream.py
+import time
+import zipfile
+from typing import List
+
+
+class _Sink:
+    # A write-only file without tell(), so zipfile writes the archive strictly in order
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+class ZipStream:
+    """
+    Builds a ZIP archive as a sequence of byte chunks: ``add`` returns the bytes of one
+    member as soon as it is added and ``close`` the central directory, so an archive can
+    be streamed without ever being held whole. Only the central directory entries are
+    kept until the end. Members are stored, not deflated: PNG and PDF are already
+    compressed.
+    """
+
+    def __init__(self):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=zipfile.ZIP_STORED)
+        self.members = 0
+
+    def _drain(self) -> bytes:
+        data = b"".join(self._sink.chunks)
+        self._sink.chunks.clear()
+        return data
+
+    def add(self, name: str, data: bytes) -> bytes:
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        self._zip.writestr(info, data)
+        self.members += 1
+        return self._drain()
+
+    def close(self) -> bytes:
+        self._zip.close()
+        return self._drain()
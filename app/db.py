@@ -1,20 +1,178 @@
 # database.py
 import os
+import time
+import anyio
 from dotenv import load_dotenv
-from sqlmodel import SQLModel, create_engine, Session
+from fastapi import Request, Response
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from contextlib import contextmanager
+from uuid import uuid4
+
+from Config.constants import READ_YOUR_WRITES_HEADER, STICKY_PRIMARY_COOKIE
+from Settings.database_config import (
+    DB_AUTO_MIGRATE, DB_ECHO, DB_MAX_OVERFLOW, DB_PGBOUNCER, DB_POOL_PRE_PING, DB_POOL_RECYCLE,
+    DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_REPLICA_URLS, DB_STICKY_PRIMARY_SECONDS,
+)
+from Utils.pool_metrics import PoolStats, instrumented_pool_class
+from Utils.session_routing import ReplicaSelector, RoutingSession
 
 load_dotenv()
 
+# "sync" keeps the blocking Session + threadpool routers, "async" switches the
+# routers over to AsyncSession on an asyncpg engine.
+DB_MODE = os.getenv("DB_MODE", "sync").lower()
+ASYNC_DB = DB_MODE == "async"
+
+
+def _async_url(url: str) -> str:
+    # Reuse a sync PostgreSQL URL with the asyncio driver
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def _engine_kwargs(url: str, queue_pool, stats: PoolStats) -> dict:
+    kwargs = {"echo": DB_ECHO, "pool_pre_ping": DB_POOL_PRE_PING}
+    if DB_PGBOUNCER:
+        # PgBouncer does the pooling; hold nothing open between checkouts
+        kwargs["poolclass"] = instrumented_pool_class(NullPool, stats)
+        if "+asyncpg" in url:
+            # Transaction pooling can hand us a different server per transaction,
+            # so asyncpg's named prepared statements must be disabled/unique
+            kwargs["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return kwargs
+    if url.startswith("sqlite"):
+        return kwargs
+    kwargs.update(
+        poolclass=instrumented_pool_class(queue_pool, stats),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return kwargs
+
+
+sync_pool_stats = PoolStats("sync")
+async_pool_stats = PoolStats("async")
+
 # Create the engine
-engine = create_engine(os.getenv("POSTGRES_URL"), echo=True)
+engine = create_engine(
+    os.getenv("POSTGRES_URL"),
+    **_engine_kwargs(os.getenv("POSTGRES_URL"), QueuePool, sync_pool_stats),
+)
+
+# The async engine is only built in async mode so the sync deployment does not need asyncpg.
+# POSTGRES_ASYNC_URL overrides the URL derived from POSTGRES_URL.
+ASYNC_URL = os.getenv("POSTGRES_ASYNC_URL") or _async_url(os.getenv("POSTGRES_URL"))
+async_engine = create_async_engine(
+    ASYNC_URL,
+    **_engine_kwargs(ASYNC_URL, AsyncAdaptedQueuePool, async_pool_stats),
+) if ASYNC_DB else None
+
+# Read replicas, each with its own pool and stats
+replica_pool_stats = [PoolStats(f"replica-{i}") for i in range(len(DB_REPLICA_URLS))]
+replica_engines = [
+    create_engine(url, **_engine_kwargs(url, QueuePool, stats))
+    for url, stats in zip(DB_REPLICA_URLS, replica_pool_stats)
+] if not ASYNC_DB else []
+async_replica_engines = [
+    create_async_engine(_async_url(url), **_engine_kwargs(_async_url(url), AsyncAdaptedQueuePool, stats))
+    for url, stats in zip(DB_REPLICA_URLS, replica_pool_stats)
+] if ASYNC_DB else []
+
+replica_selector = ReplicaSelector(replica_engines)
+async_replica_selector = ReplicaSelector([replica.sync_engine for replica in async_replica_engines])
+
+# Schema changes live in Migrations/versions; startup only checks the recorded version
+def _prepare_schema(connection):
+    from Migrations.runner import ensure_schema_version, upgrade
+    if DB_AUTO_MIGRATE:
+        upgrade(connection)
+    ensure_schema_version(connection)
 
-# Create all tables (optional, usually at app startup)
 def init_db():
-    from Schema.SQL.Models import models  # Import your models here
-    SQLModel.metadata.create_all(engine)
+    with engine.connect() as connection:
+        _prepare_schema(connection)
+
+async def init_async_db():
+    async with async_engine.connect() as connection:
+        await connection.run_sync(_prepare_schema)
+
+def get_pool_stats() -> dict:
+    stats = {
+        "mode": DB_MODE,
+        "pgbouncer": DB_PGBOUNCER,
+        "sync": sync_pool_stats.snapshot(engine.pool),
+    }
+    if async_engine is not None:
+        stats["async"] = async_pool_stats.snapshot(async_engine.pool)
+    replicas = replica_engines or [replica.sync_engine for replica in async_replica_engines]
+    if replicas:
+        stats["replicas"] = [
+            replica_stats.snapshot(replica.pool)
+            for replica_stats, replica in zip(replica_pool_stats, replicas)
+        ]
+    return stats
+
+def _reads_from_replica(request: Request, response: Response) -> bool:
+    """
+    GET/HEAD requests may read from a replica. Writes always use the primary and,
+    when the client opts in with the read-your-writes header, pin that client to
+    the primary for DB_STICKY_PRIMARY_SECONDS through a short-lived cookie.
+    """
+    if request.method not in ("GET", "HEAD"):
+        if request.headers.get(READ_YOUR_WRITES_HEADER, "").lower() in ("1", "true", "yes"):
+            until = int(time.time()) + DB_STICKY_PRIMARY_SECONDS
+            response.set_cookie(
+                STICKY_PRIMARY_COOKIE, str(until),
+                max_age=DB_STICKY_PRIMARY_SECONDS, httponly=True, samesite="lax",
+            )
+        return False
+    sticky_until = request.cookies.get(STICKY_PRIMARY_COOKIE)
+    if sticky_until and sticky_until.isdigit() and int(sticky_until) > time.time():
+        return False
+    return True
+
+async def call_in_session(classes, method: str, *args):
+    """
+    Runs one repository or service call outside a request, in its own short-lived
+    session on the primary: AsyncSession or (in the threadpool) Session, depending
+    on DB_MODE. ``classes`` is the (sync class, async class) pair to instantiate.
+    """
+    sync_class, async_class = classes
+    if ASYNC_DB:
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            return await getattr(async_class(session), method)(*args)
+
+    def call():
+        with Session(engine, expire_on_commit=False) as session:
+            return getattr(sync_class(session), method)(*args)
+    return await anyio.to_thread.run_sync(call)
 
 # Dependency for FastAPI
-def get_session():
-    with Session(engine) as session:
+def get_session(request: Request, response: Response):
+    replica = replica_selector.next() if _reads_from_replica(request, response) else None
+    # expire_on_commit=False: rows read back with RETURNING stay loaded after the commit
+    with RoutingSession(primary=engine, replica=replica, expire_on_commit=False) as session:
+        yield session
+
+# Async dependency for FastAPI
+async def get_async_session(request: Request, response: Response):
+    replica = async_replica_selector.next() if _reads_from_replica(request, response) else None
+    # expire_on_commit=False so returned objects can be serialized without lazy refreshes
+    async with AsyncSession(
+        sync_session_class=RoutingSession,
+        primary=async_engine.sync_engine,
+        replica=replica,
+        expire_on_commit=False,
+    ) as session:
         yield session
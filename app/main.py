@@ -1,38 +1,70 @@
 from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from Settings.logging_config import setup_logging
 from Controllers import main_controller
 from Controllers.Opportunities import job_controller
 from Controllers.User import certificate_controller, workexperience_controller, profile_controller, user_controller
 from Controllers.Opportunities import fellowships_controller, organization_controller, projects_opportunities_controller
-from Controllers.User import location_controller
+from Controllers.User import github_controller, leetcode_controller, location_controller, statistics_controller
 from Controllers.error_handlers import register_exception_handlers
-from db import init_db
+from db import ASYNC_DB, DB_MODE, init_async_db, init_db
+from Services.User.certificate_job_service import certificate_jobs
+from Services.User.Statistics.sync_scheduler import statistics_sync_scheduler
+from Settings.scheduler_config import STATS_SYNC_ENABLED
+from Utils.certificate_pool import shutdown_certificate_pool
+from Utils.certificate_renderer import get_certificate_renderer
+from Utils.http_client import close_http_client, start_http_client
 
-app = FastAPI()
+# orjson encodes responses several times faster than the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Initialize logging
 logger = setup_logging()
 
 @app.on_event("startup")
-def on_startup():
-    logger.info("Starting up the application...")
-    init_db()
+async def on_startup():
+    logger.info(f"Starting up the application in {DB_MODE} database mode...")
+    if ASYNC_DB:
+        await init_async_db()
+    else:
+        init_db()
     logger.info("Database initialized successfully.")
+    await start_http_client()
+    # Fonts, background and static rows are prepared once, before the first download
+    get_certificate_renderer()
+    if STATS_SYNC_ENABLED:
+        statistics_sync_scheduler.start()
+    certificate_jobs.start()
 
 @app.on_event("shutdown")
-def on_shutdown():
+async def on_shutdown():
     logger.info("Shutting down the application...")
+    # Before the HTTP client goes away; interrupted users are picked up on the next start
+    await statistics_sync_scheduler.stop()
+    # Before the pool goes away; interrupted certificate jobs go back to the queue
+    await certificate_jobs.stop()
+    await close_http_client()
+    shutdown_certificate_pool()
 
 register_exception_handlers(app)
 app.include_router(main_controller.router)
 
-app.include_router(user_controller.router)
-app.include_router(workexperience_controller.router)
-app.include_router(location_controller.router)
-app.include_router(profile_controller.router)
-app.include_router(certificate_controller.router)
+# DB_MODE=async swaps every database-backed router for its AsyncSession twin
+db_routers = [
+    user_controller,
+    workexperience_controller,
+    location_controller,
+    profile_controller,
+    job_controller,
+    fellowships_controller,
+    organization_controller,
+    projects_opportunities_controller,
+    github_controller,
+    leetcode_controller,
+    certificate_controller,
+]
 
-app.include_router(job_controller.router)
-app.include_router(fellowships_controller.router)
-app.include_router(organization_controller.router)
-app.include_router(projects_opportunities_controller.router)
\ No newline at end of file
+for controller in db_routers:
+    app.include_router(controller.async_router if ASYNC_DB else controller.router)
+
+app.include_router(statistics_controller.router)
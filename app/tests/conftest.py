@@ -0,0 +1,129 @@
+# tests/conftest.py
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Modules import each other relative to app/, and db.py builds its engines from the
+# environment when it is first imported, so both are set up before any app import.
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+_WORK_DIR = tempfile.mkdtemp(prefix="dijkstra-tests-")
+os.environ.update({
+    "DB_MODE": "sync",
+    "POSTGRES_URL": f"sqlite:///{_WORK_DIR}/test.db",
+    "POSTGRES_ASYNC_URL": f"sqlite+aiosqlite:///{_WORK_DIR}/test.db",
+    "POSTGRES_REPLICA_URLS": "",
+    "DB_AUTO_MIGRATE": "true",
+    "STATS_SYNC_ENABLED": "false",
+    "CERTIFICATE_JOB_WORKERS": "0",
+    "CERTIFICATE_JOB_DIR": os.path.join(_WORK_DIR, "certificate-jobs"),
+    "CERTIFICATE_CACHE_DIR": os.path.join(_WORK_DIR, "certificates"),
+})
+
+# The models use PostgreSQL ARRAY columns; SQLite stores them as JSON text instead
+from sqlalchemy import ARRAY  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+
+
+@compiles(ARRAY, "sqlite")
+def _array_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+_array_bind_processor = ARRAY.bind_processor
+_array_result_processor = ARRAY.result_processor
+
+
+def _bind_processor(self, dialect):
+    if dialect.name != "sqlite":
+        return _array_bind_processor(self, dialect)
+    return lambda value: None if value is None else json.dumps(value)
+
+
+def _result_processor(self, dialect, coltype):
+    if dialect.name != "sqlite":
+        return _array_result_processor(self, dialect, coltype)
+    return lambda value: None if value is None else json.loads(value)
+
+
+ARRAY.bind_processor = _bind_processor
+ARRAY.result_processor = _result_processor
+
+import db  # noqa: E402
+import httpx  # noqa: E402
+from sqlmodel import Session, SQLModel  # noqa: E402
+from Utils import http_client  # noqa: E402
+from Utils.cache import _caches  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """The SQLite test database, migrated to the latest version once per run."""
+    db.init_db()
+    yield db.engine
+    db.engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clean_state(database):
+    """Every test starts with empty tables and empty caches."""
+    yield
+    with database.begin() as connection:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            connection.execute(table.delete())
+    for cache in list(_caches.values()):
+        cache.clear()
+
+
+@pytest.fixture
+def session(database):
+    with Session(database, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def anyio_backend():
+    """The app runs on asyncio only."""
+    return "asyncio"
+
+
+class FakeUpstream:
+    """
+    Answers outbound requests from ``responses`` in order: an httpx.Response, an
+    exception to raise, or a callable taking the request. Requests are kept in ``requests``.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.responses = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if callable(response):
+            response = response(request)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """The shared outbound HTTP client, answering from a FakeUpstream with no retry backoff."""
+    fake = FakeUpstream()
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(fake.handle)))
+    monkeypatch.setattr(http_client, "HTTP_RETRY_BACKOFF_MAX", 0.0)
+    return fake
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
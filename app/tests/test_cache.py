@@ -0,0 +1,277 @@
+# tests/test_cache.py
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import inspect
+
+from Schema.SQL.Models.models import User
+from Utils.cache import StaleWhileRevalidateCache, TTLCache, cached, cached_async, detached, list_cache_key
+
+
+@pytest.fixture
+def cache():
+    return TTLCache("tests.cache", max_entries=3, ttl=60)
+
+
+def test_a_cached_none_is_told_apart_from_a_miss(cache):
+    cache.set("missing", None)
+
+    assert cache.get("missing") == (True, None)
+    assert cache.get("other") == (False, None)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_their_ttl(cache):
+    cache.set("short", 1, ttl=0.01)
+    cache.set("long", 2)
+    time.sleep(0.02)
+
+    assert cache.get("short") == (False, None)
+    assert cache.get("long") == (True, 2)
+    assert cache.expirations == 1
+
+
+def test_the_least_recently_used_entry_is_evicted(cache):
+    for key in "abc":
+        cache.set(key, key)
+    cache.get("a")
+
+    cache.set("d", "d")
+
+    assert cache.get("b") == (False, None)
+    assert all(cache.get(key)[0] for key in "acd")
+    assert cache.evictions == 1
+
+
+def test_a_cache_without_room_stores_nothing():
+    cache = TTLCache("tests.disabled", max_entries=0, ttl=60)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == (False, None)
+
+
+def test_invalidation_drops_keys_and_bumps_the_generation(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") == (False, None) and cache.get("b") == (True, 2)
+    cache.clear()
+    assert cache.get("b") == (False, None)
+    assert cache.generation == cache.invalidations == 2
+
+
+def test_invalidate_where_matches_keys_and_values(cache):
+    cache.set(("id", 1), {"id": 1, "name": "a"})
+    cache.set(("name", "a"), {"id": 1, "name": "a"})
+    cache.set(("id", 2), {"id": 2, "name": "b"})
+
+    cache.invalidate_where(lambda key, value: value["id"] == 1)
+
+    assert cache.snapshot()["entries"] == 1
+    assert cache.get(("id", 2))[0]
+
+
+def test_a_load_that_started_before_an_invalidation_is_not_cached(cache):
+    generation = cache.generation
+    cache.invalidate("a")
+
+    cache.set("a", "read before the write", generation)
+
+    assert cache.get("a") == (False, None)
+    cache.set("a", "read after the write", cache.generation)
+    assert cache.get("a") == (True, "read after the write")
+
+
+def test_list_cache_keys_normalize_equivalent_queries():
+    key = list_cache_key(skip=0, limit=20, order="DESC", title=None, tags=["a", "b"], cursor=None)
+
+    assert key == list_cache_key(limit=20, skip=0, order="desc", tags=("a", "b"))
+    assert key != list_cache_key(skip=20, limit=20, order="desc", tags=["a", "b"])
+    # skip is ignored by keyset paging, so it does not split entries once a cursor is given
+    assert list_cache_key(skip=0, cursor="abc") == list_cache_key(skip=40, cursor="abc")
+
+
+def test_cached_loads_once_and_serves_hits(cache):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return ["row"]
+
+    assert cached(cache, "key", loader) == ["row"]
+    assert cached(cache, "key", loader) == ["row"]
+    assert len(calls) == 1
+
+
+def test_cached_bypasses_the_cache_when_asked(cache):
+    cache.set("key", "cached")
+
+    assert cached(cache, "key", lambda: "fresh", use_cache=False) == "fresh"
+    assert cache.get("key") == (True, "cached")
+
+
+def test_cached_without_fill_serves_hits_but_stores_nothing(cache):
+    assert cached(cache, "new", lambda: "from the replica", fill=False) == "from the replica"
+    assert cache.get("new") == (False, None)
+
+    cache.set("old", "from the primary")
+    assert cached(cache, "old", lambda: "from the replica", fill=False) == "from the primary"
+
+
+@pytest.fixture
+def user(session):
+    user = User(github_user_name="octocat", first_name="Octo", last_name="Cat")
+    session.add(user)
+    session.commit()
+    return user
+
+
+def test_detached_copies_the_loaded_columns_of_a_row(session, user):
+    copy = detached(user)
+
+    assert copy is not user and isinstance(copy, User)
+    assert inspect(copy).transient and inspect(user).persistent
+    assert (copy.id, copy.github_user_name, copy.created_at) == (user.id, user.github_user_name, user.created_at)
+    # Changing the session's row leaves the copy alone
+    user.first_name = "Mona"
+    assert copy.first_name == "Octo"
+
+
+def test_detached_leaves_out_columns_that_were_not_loaded(session, user):
+    session.expire(user, ["first_name"])
+
+    copy = detached(user)
+
+    assert "first_name" not in copy.__dict__
+    assert copy.last_name == "Cat"
+
+
+def test_detached_handles_lists_tuples_and_plain_values(session, user):
+    rows, cursor = detached(([user], "next"))
+
+    assert inspect(rows[0]).transient and rows[0].id == user.id
+    assert cursor == "next"
+    assert detached(None) is None and detached({"a": 1}) == {"a": 1}
+
+
+def test_cached_stores_and_returns_detached_rows(cache, session, user):
+    first = cached(cache, "user", lambda: user)
+
+    assert first is not user and inspect(first).transient
+    assert cached(cache, "user", lambda: user) is first
+
+
+def test_a_missing_row_is_cached_for_the_negative_ttl(cache):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None
+
+    assert cached(cache, "missing", loader, negative_ttl=0.01) is None
+    assert cached(cache, "missing", loader, negative_ttl=0.01) is None
+    time.sleep(0.02)
+    cached(cache, "missing", loader, negative_ttl=0.01)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_cached_async_fills_from_the_primary_only(cache, session, user):
+    async def loader():
+        return user
+
+    assert inspect(await cached_async(cache, "replica", loader, fill=False)).persistent
+    assert cache.get("replica") == (False, None)
+
+    value = await cached_async(cache, "primary", loader)
+    assert inspect(value).transient
+    assert cache.get("primary") == (True, value)
+
+
+class _Upstream:
+    """A fetch for StaleWhileRevalidateCache answering from ``results``, in order."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def swr():
+    return StaleWhileRevalidateCache("tests.swr", 10, fresh_ttl=0.1, max_stale=60, failure_ttl=0.1)
+
+
+@pytest.mark.anyio
+async def test_swr_serves_fresh_values_without_fetching(swr):
+    fetch = _Upstream(("v1", True))
+
+    assert await swr.get_or_fetch("user", fetch) == "v1"
+    assert await swr.get_or_fetch("user", fetch) == "v1"
+    assert fetch.calls == 1
+
+
+@pytest.mark.anyio
+async def test_swr_concurrent_misses_share_one_fetch(swr):
+    fetch = _Upstream(("v1", True))
+
+    results = await asyncio.gather(*(swr.get_or_fetch("user", fetch) for _ in range(5)))
+
+    assert results == ["v1"] * 5
+    assert fetch.calls == 1
+
+
+@pytest.mark.anyio
+async def test_swr_serves_a_stale_value_while_one_background_fetch_refreshes_it(swr):
+    fetch = _Upstream(("v1", True), ("v2", True))
+    await swr.get_or_fetch("user", fetch)
+    await asyncio.sleep(0.15)
+
+    stale = await asyncio.gather(*(swr.get_or_fetch("user", fetch) for _ in range(3)))
+    assert stale == ["v1"] * 3
+    await asyncio.sleep(0.05)
+
+    assert await swr.get_or_fetch("user", fetch) == "v2"
+    assert fetch.calls == 2
+    assert swr.stale_hits == 3
+
+
+@pytest.mark.anyio
+async def test_swr_caches_a_failure_for_the_failure_ttl(swr):
+    fetch = _Upstream((None, False), ("v1", True))
+
+    assert await swr.get_or_fetch("user", fetch) is None
+    assert await swr.get_or_fetch("user", fetch) is None
+    assert fetch.calls == 1
+    await asyncio.sleep(0.15)
+
+    assert await swr.get_or_fetch("user", fetch) == "v1"
+    assert fetch.calls == 2 and swr.failures == 1
+
+
+@pytest.mark.anyio
+async def test_swr_keeps_the_last_good_value_when_a_refresh_fails(swr):
+    fetch = _Upstream(("v1", True), (None, False), ("v2", True))
+    await swr.get_or_fetch("user", fetch)
+    fetched_at = swr.fetched_at("user")
+    await asyncio.sleep(0.15)
+
+    assert await swr.get_or_fetch("user", fetch) == "v1"
+    await asyncio.sleep(0.05)
+    # The failed refresh left the good value in place, not retried until the failure TTL passes
+    assert await swr.get_or_fetch("user", fetch) == "v1"
+    assert fetch.calls == 2
+    assert swr.fetched_at("user") == fetched_at
+
+    await asyncio.sleep(0.15)
+    await swr.get_or_fetch("user", fetch)
+    await asyncio.sleep(0.05)
+    assert await swr.get_or_fetch("user", fetch) == "v2"
@@ -0,0 +1,116 @@
+# tests/test_circuit_breaker.py
+import time
+from datetime import datetime, timezone
+
+from Utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_circuit_stats, register_circuit, stale_marker,
+)
+
+
+def _tripped(reset_timeout: float = 0.05) -> CircuitBreaker:
+    circuit = CircuitBreaker("tests", failure_threshold=3, reset_timeout=reset_timeout)
+    for _ in range(3):
+        circuit.record_failure()
+    return circuit
+
+
+def test_the_circuit_opens_after_the_threshold_of_failures_in_a_row():
+    circuit = CircuitBreaker("tests", failure_threshold=3, reset_timeout=60)
+
+    circuit.record_failure()
+    circuit.record_failure()
+    assert circuit.closed and circuit.allow()
+
+    circuit.record_failure()
+    assert circuit.state == OPEN
+    assert not circuit.allow() and not circuit.allow()
+    assert circuit.rejected == 2
+
+
+def test_a_success_resets_the_failure_count():
+    circuit = CircuitBreaker("tests", failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        circuit.record_failure()
+    circuit.record_success()
+    for _ in range(2):
+        circuit.record_failure()
+
+    assert circuit.closed and circuit.consecutive_failures == 2
+
+
+def test_one_probe_is_let_through_once_the_reset_timeout_passes():
+    circuit = _tripped()
+    time.sleep(0.06)
+
+    assert circuit.allow()
+    assert circuit.state == HALF_OPEN
+    # Everyone else is turned away while the probe is out
+    assert not circuit.allow() and not circuit.allow()
+
+
+def test_a_successful_probe_closes_the_circuit():
+    circuit = _tripped()
+    time.sleep(0.06)
+    circuit.allow()
+
+    circuit.record_success()
+
+    assert circuit.closed and circuit.allow() and circuit.allow()
+    assert circuit.consecutive_failures == 0
+
+
+def test_a_failed_probe_opens_the_circuit_for_another_reset_timeout():
+    circuit = _tripped()
+    time.sleep(0.06)
+    circuit.allow()
+
+    circuit.record_failure()
+
+    assert circuit.state == OPEN and not circuit.allow()
+    time.sleep(0.06)
+    assert circuit.allow() and circuit.state == HALF_OPEN
+
+
+def test_a_probe_that_never_reports_back_is_replaced():
+    circuit = _tripped()
+    time.sleep(0.06)
+    assert circuit.allow()
+    assert not circuit.allow()
+
+    time.sleep(0.06)
+
+    assert circuit.allow()
+    assert not circuit.allow()
+
+
+def test_the_snapshot_counts_rejections_and_transitions():
+    circuit = _tripped()
+    circuit.allow()
+    time.sleep(0.06)
+    circuit.allow()
+    circuit.record_success()
+
+    snapshot = circuit.snapshot()
+
+    assert snapshot["state"] == CLOSED and snapshot["rejected"] == 1
+    assert snapshot["transitions"] == {"closed->open": 1, "open->half_open": 1, "half_open->closed": 1}
+    assert [(t["from"], t["to"]) for t in snapshot["recent_transitions"]] == [
+        (CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED),
+    ]
+
+
+def test_circuits_are_registered_once_by_name():
+    circuit = register_circuit("tests.registry", failure_threshold=3, reset_timeout=60)
+
+    assert register_circuit("tests.registry", failure_threshold=10, reset_timeout=1) is circuit
+    assert circuit.failure_threshold == 3
+    assert "tests.registry" in {stats["name"] for stats in get_circuit_stats()}
+
+
+def test_stale_markers_report_naive_times_as_utc():
+    marker = stale_marker("cache", datetime(2026, 1, 2, 3, 4, 5), "circuit open")
+
+    assert marker == {"source": "cache", "as_of": "2026-01-02T03:04:05+00:00", "reason": "circuit open"}
+    assert stale_marker("database", None, "timeout")["as_of"] is None
+    assert stale_marker("cache", datetime(2026, 1, 2, tzinfo=timezone.utc), "x")["as_of"].endswith("+00:00")
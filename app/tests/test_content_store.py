@@ -0,0 +1,98 @@
+# tests/test_content_store.py
+import os
+import time
+
+import pytest
+
+from Utils.content_store import ContentStore
+
+
+def _age(store: ContentStore, key: str, seconds: float):
+    """Backdates a stored file as if it was last used ``seconds`` ago."""
+    then = time.time() - seconds
+    os.utime(store.path(key), (then, then))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(str(tmp_path / "store"), max_bytes=100)
+
+
+def test_put_then_get_returns_the_sharded_path(store):
+    path = store.put("abcdef", b"pdf", suffix=".pdf")
+
+    assert path == os.path.join(store.root, "ab", "abcdef.pdf")
+    assert store.get("abcdef", suffix=".pdf") == path
+    with open(path, "rb") as f:
+        assert f.read() == b"pdf"
+    assert store.get("missing") is None
+    assert (store.hits, store.misses, store.writes) == (1, 1, 1)
+
+
+def test_a_write_leaves_no_temporary_files(store):
+    store.put("abcdef", b"x" * 10)
+
+    assert os.listdir(os.path.join(store.root, "ab")) == ["abcdef"]
+
+
+def test_a_disabled_store_reads_and_writes_nothing(tmp_path):
+    store = ContentStore(str(tmp_path / "store"), max_bytes=0)
+
+    assert store.put("abcdef", b"pdf") is None
+    assert store.get("abcdef") is None
+    assert not os.path.exists(store.root)
+
+
+def test_data_larger_than_the_budget_is_not_stored(store):
+    assert store.put("abcdef", b"x" * 101) is None
+    assert store.writes == 0
+
+
+def test_the_least_recently_used_files_are_evicted_down_to_the_low_water_mark(store):
+    for age, key in [(300, "aa1"), (200, "bb2"), (100, "cc3")]:
+        store.put(key, b"x" * 30)
+        _age(store, key, age)
+    # A hit makes the oldest file the most recently used
+    store.get("aa1")
+    _age(store, "aa1", 90)
+
+    store.put("dd4", b"x" * 30)
+
+    # 120 bytes is over the budget of 100: dropping the oldest file reaches 90, the low-water mark
+    assert store.get("bb2") is None
+    assert store.get("aa1") and store.get("cc3") and store.get("dd4")
+    assert store.evictions == 1 and store.snapshot()["bytes"] == 90
+
+
+def test_files_used_within_the_grace_period_are_kept(store):
+    for key in ["aa1", "bb2", "cc3"]:
+        store.put(key, b"x" * 30)
+
+    store.put("dd4", b"x" * 30)
+
+    assert all(store.get(key) for key in ["aa1", "bb2", "cc3", "dd4"])
+    assert store.evictions == 0 and store.snapshot()["bytes"] == 120
+
+
+def test_files_written_by_other_workers_count_towards_the_budget(store):
+    store.put("aa1", b"x" * 30)
+    _age(store, "aa1", 300)
+    # Another worker sharing the directory writes a file this process never saw
+    other = ContentStore(store.root, max_bytes=100)
+    other.put("bb2", b"x" * 60)
+    _age(other, "bb2", 200)
+
+    # This process thinks it holds 110 bytes; the directory holds 170
+    store.put("cc3", b"x" * 80)
+
+    assert store.get("aa1") is None and store.get("bb2") is None
+    assert store.get("cc3") and store.snapshot()["bytes"] == 80
+
+
+def test_a_failed_write_is_counted_not_raised(tmp_path):
+    blocker = tmp_path / "store"
+    blocker.write_bytes(b"not a directory")
+    store = ContentStore(str(blocker), max_bytes=100)
+
+    assert store.put("abcdef", b"pdf") is None
+    assert store.write_errors == 1 and store.writes == 0
@@ -0,0 +1,67 @@
+# tests/test_entity_cache.py
+import pytest
+from sqlalchemy import inspect
+
+from Entities.UserDTOs.user_entity import CreateUser, UpdateUser
+from Services.User.user_service import UserService, _entity_cache, _list_cache
+from Utils.Exceptions.user_exceptions import GitHubUsernameNotFound, UserNotFound
+
+
+def _entries(cache) -> int:
+    return cache.snapshot()["entries"]
+
+
+def test_cached_users_are_detached_copies(session):
+    service = UserService(session)
+    user = service.create_user(CreateUser(github_user_name="octocat", first_name="Octo", last_name="Cat"))
+
+    cached = service.get_user(user.id)
+
+    assert inspect(cached).transient
+    assert service.get_user(user.id) is cached
+
+
+def test_writes_invalidate_the_user_caches(session):
+    service = UserService(session)
+    user = service.create_user(CreateUser(github_user_name="octocat", first_name="Octo", last_name="Cat"))
+    assert service.get_user_by_github_username("octocat").first_name == "Octo"
+    assert service.list_users()[0][0].first_name == "Octo"
+    assert _entries(_entity_cache) == _entries(_list_cache) == 1
+
+    service.update_user(user.id, UpdateUser(first_name="Mona"))
+
+    assert _entries(_entity_cache) == _entries(_list_cache) == 0
+    assert service.get_user(user.id).first_name == "Mona"
+    assert service.list_users()[0][0].first_name == "Mona"
+
+
+def test_a_cached_miss_is_dropped_when_the_user_is_created(session):
+    service = UserService(session)
+    with pytest.raises(GitHubUsernameNotFound):
+        service.get_user_by_github_username("octocat")
+
+    service.create_user(CreateUser(github_user_name="octocat", first_name="Octo", last_name="Cat"))
+
+    assert service.get_user_by_github_username("octocat").first_name == "Octo"
+
+
+def test_a_deleted_user_is_not_served_from_the_cache(session):
+    service = UserService(session)
+    user = service.create_user(CreateUser(github_user_name="octocat", first_name="Octo", last_name="Cat"))
+    service.get_user(user.id)
+
+    service.delete_user(user.id)
+
+    with pytest.raises(UserNotFound):
+        service.get_user(user.id)
+
+
+def test_a_replica_bound_session_reads_through_without_filling(session):
+    session.replica = "replica-0"
+    service = UserService(session)
+    user = service.create_user(CreateUser(github_user_name="octocat", first_name="Octo", last_name="Cat"))
+
+    assert not service.fill_cache
+    assert service.get_user(user.id).first_name == "Octo"
+    assert service.list_users()[0][0].first_name == "Octo"
+    assert _entries(_entity_cache) == _entries(_list_cache) == 0
@@ -0,0 +1,124 @@
+# tests/test_github_client.py
+import time
+
+import httpx
+import pytest
+
+from Utils.Exceptions.user_exceptions import GitHubApiError
+from Utils.github_client import GitHubClient
+
+pytestmark = pytest.mark.anyio
+
+DATA = {"data": {"rateLimit": {"cost": 2}, "user": {"login": "octocat"}}}
+
+
+def _ok(remaining: int = 4_000, cost: int = 2) -> httpx.Response:
+    return httpx.Response(200, json={"data": {"rateLimit": {"cost": cost}, "user": {"login": "octocat"}}}, headers={
+        "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time()) + 1_800),
+    })
+
+
+def _secondary_limit(retry_after: int) -> httpx.Response:
+    return httpx.Response(429, json={"message": "secondary rate limit"}, headers={"Retry-After": str(retry_after)})
+
+
+def _tokens(upstream) -> list:
+    return [request.headers["Authorization"].removeprefix("Bearer ") for request in upstream.requests]
+
+
+async def test_a_rate_limited_token_is_set_aside_without_retrying_it(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    upstream.responses = [_secondary_limit(600), _ok()]
+
+    assert await github.graphql("query", {}) == DATA
+
+    assert _tokens(upstream) == ["token-a", "token-b"]
+    assert github.rate_limited_responses == 1
+    assert github.snapshot()["tokens"][0]["spendable"] == 0
+
+
+async def test_a_spent_primary_limit_moves_to_the_next_token(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    reset = str(int(time.time()) + 600)
+    upstream.responses = [
+        httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}),
+        _ok(),
+    ]
+
+    assert await github.graphql("query", {}) == DATA
+    assert _tokens(upstream) == ["token-a", "token-b"]
+
+
+async def test_a_rate_limited_graphql_error_moves_to_the_next_token(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    upstream.responses = [httpx.Response(200, json={"errors": [{"type": "RATE_LIMITED"}]}), _ok()]
+
+    assert await github.graphql("query", {}) == DATA
+    assert _tokens(upstream) == ["token-a", "token-b"]
+
+
+async def test_every_token_rate_limited_raises_github_api_error(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    upstream.responses = [_secondary_limit(3_600), _secondary_limit(3_600)]
+
+    with pytest.raises(GitHubApiError):
+        await github.graphql("query", {})
+
+    # One request per token: nothing is retried on a token already known to be spent
+    assert _tokens(upstream) == ["token-a", "token-b"]
+    assert github.rate_limited_responses == 2
+
+
+async def test_a_token_limited_again_after_its_reset_raises_github_api_error(upstream):
+    github = GitHubClient(["token-a"])
+    upstream.responses = [_secondary_limit(0), _secondary_limit(0)]
+
+    with pytest.raises(GitHubApiError, match="rate limited on every token"):
+        await github.graphql("query", {})
+
+    assert _tokens(upstream) == ["token-a", "token-a"]
+
+
+async def test_server_errors_are_retried_on_the_same_token_each_paced_by_its_bucket(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    budget = github._budgets[0]
+    budget.last_cost = 3
+    costs = []
+    acquire = budget.bucket.acquire
+
+    async def counting_acquire(cost: float = 1):
+        costs.append(cost)
+        await acquire(cost)
+
+    budget.bucket.acquire = counting_acquire
+    upstream.responses = [httpx.Response(502), httpx.ConnectError("reset"), _ok()]
+
+    assert await github.graphql("query", {}) == DATA
+
+    assert _tokens(upstream) == ["token-a"] * 3
+    assert costs == [3, 3, 3]
+    assert budget.last_cost == 2
+
+
+async def test_calls_go_to_the_token_with_the_most_budget_left(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    upstream.responses = [_ok(remaining=150), _ok(remaining=4_000), _ok(remaining=3_999)]
+
+    for _ in range(3):
+        await github.graphql("query", {})
+
+    # token-a reported 50 spendable points past the reserve, token-b still has its full budget
+    assert _tokens(upstream) == ["token-a", "token-b", "token-b"]
+    snapshot = github.snapshot()
+    assert snapshot["requests"] == 3 and snapshot["points_used"] == 6
+
+
+async def test_a_forbidden_response_that_is_not_a_rate_limit_is_an_http_error(upstream):
+    github = GitHubClient(["token-a", "token-b"])
+    upstream.responses = [httpx.Response(403, json={"message": "Resource not accessible"})]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await github.graphql("query", {})
+
+    assert github.rate_limited_responses == 0
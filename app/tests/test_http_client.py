@@ -0,0 +1,84 @@
+# tests/test_http_client.py
+import httpx
+import pytest
+
+from Utils import http_client
+from Utils.http_client import _retry_delay, request_with_retries
+
+URL = "https://upstream.test/graphql"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("status", [429, 502, 503, 504])
+async def test_retryable_statuses_are_retried(upstream, status):
+    upstream.responses = [httpx.Response(status), httpx.Response(200, json={"ok": True})]
+
+    response = await request_with_retries("POST", URL, json={})
+
+    assert response.json() == {"ok": True}
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.anyio
+async def test_other_statuses_are_returned_at_once(upstream):
+    upstream.responses = [httpx.Response(404)]
+
+    assert (await request_with_retries("GET", URL)).status_code == 404
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.anyio
+async def test_the_last_response_is_returned_once_retries_run_out(upstream):
+    upstream.responses = [httpx.Response(503)] * 3
+
+    assert (await request_with_retries("GET", URL, retries=2)).status_code == 503
+    assert len(upstream.requests) == 3
+
+
+@pytest.mark.anyio
+async def test_transport_errors_are_retried_and_the_last_one_raised(upstream):
+    upstream.responses = [httpx.ConnectError("refused"), httpx.ReadTimeout("slow"), httpx.Response(200)]
+    assert (await request_with_retries("GET", URL)).status_code == 200
+
+    upstream.responses = [httpx.ConnectError("refused")] * 2
+    with pytest.raises(httpx.ConnectError):
+        await request_with_retries("GET", URL, retries=1)
+
+
+@pytest.mark.anyio
+async def test_retry_statuses_can_be_narrowed(upstream):
+    upstream.responses = [httpx.Response(429), httpx.Response(502), httpx.Response(200)]
+
+    assert (await request_with_retries("GET", URL, retry_statuses=(502,))).status_code == 429
+    assert (await request_with_retries("GET", URL, retry_statuses=(502,))).status_code == 200
+
+
+def test_retry_after_in_seconds_is_honoured_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP_RETRY_BACKOFF_MAX", 8.0)
+
+    assert _retry_delay(0, httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    assert _retry_delay(0, httpx.Response(429, headers={"Retry-After": "120"})) == 8.0
+
+
+def test_backoff_is_jittered_and_grows_exponentially_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP_RETRY_BACKOFF", 0.5)
+    monkeypatch.setattr(http_client, "HTTP_RETRY_BACKOFF_MAX", 8.0)
+
+    for attempt, ceiling in [(0, 0.5), (1, 1.0), (3, 4.0), (10, 8.0)]:
+        delays = [_retry_delay(attempt, None) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert max(delays) > ceiling / 2
+
+    # An HTTP-date Retry-After is not parsed, so it falls back to backoff
+    assert _retry_delay(0, httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})) <= 0.5
+
+
+@pytest.mark.anyio
+async def test_the_shared_client_is_created_on_first_use_and_closed(monkeypatch):
+    monkeypatch.setattr(http_client, "_client", None)
+
+    client = http_client.get_http_client()
+    assert http_client.get_http_client() is client
+
+    await http_client.close_http_client()
+    assert client.is_closed and http_client._client is None
@@ -0,0 +1,129 @@
+# tests/test_job_queue.py
+import os
+import time
+
+import pytest
+
+from Utils.job_queue import DONE, FAILED, QUEUED, RUNNING, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(os.path.join(tmp_path, "jobs.sqlite3"), max_attempts=2)
+
+
+def test_jobs_are_claimed_oldest_first_and_once(queue):
+    first = queue.submit('{"n": 1}')
+    second = queue.submit('{"n": 2}')
+
+    claimed = queue.claim("worker-a", 60)
+    assert claimed["id"] == first["id"]
+    assert claimed["status"] == RUNNING and claimed["owner"] == "worker-a" and claimed["attempts"] == 1
+    assert queue.claim("worker-b", 60)["id"] == second["id"]
+    assert queue.claim("worker-c", 60) is None
+
+
+def test_owner_reports_progress_and_finishes(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 60)
+
+    assert queue.progress(job["id"], "worker-a", 3, 10, 60)
+    assert queue.get(job["id"])["progress"] == 3
+    assert queue.finish(job["id"], "worker-a", "/tmp/result.zip", 1234)
+
+    done = queue.get(job["id"])
+    assert done["status"] == DONE
+    assert done["progress"] == done["total"] == 10
+    assert done["result_path"] == "/tmp/result.zip" and done["result_bytes"] == 1234
+    assert done["owner"] is None
+    assert queue.claim("worker-b", 60) is None
+
+
+def test_only_the_owner_may_update_a_job(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 60)
+
+    assert not queue.progress(job["id"], "worker-b", 1, 10, 60)
+    assert not queue.finish(job["id"], "worker-b", "/tmp/x.zip", 1)
+    assert not queue.fail(job["id"], "worker-b", "nope")
+    assert queue.get(job["id"])["status"] == RUNNING
+
+
+def test_an_expired_lease_is_reclaimed_and_the_old_owner_loses_the_job(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 0.05)
+    assert queue.claim("worker-b", 60) is None
+
+    time.sleep(0.1)
+    reclaimed = queue.claim("worker-b", 60)
+
+    assert reclaimed["id"] == job["id"]
+    assert reclaimed["owner"] == "worker-b" and reclaimed["attempts"] == 2 and reclaimed["progress"] == 0
+    assert not queue.progress(job["id"], "worker-a", 5, 10, 60)
+    assert not queue.finish(job["id"], "worker-a", "/tmp/stale.zip", 1)
+    assert queue.progress(job["id"], "worker-b", 5, 10, 60)
+
+
+def test_progress_renews_the_lease(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 0.05)
+
+    assert queue.progress(job["id"], "worker-a", 1, 10, 60)
+    time.sleep(0.1)
+
+    assert queue.claim("worker-b", 60) is None
+
+
+def test_a_job_is_failed_after_max_attempts(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 0.01)
+    time.sleep(0.05)
+    queue.claim("worker-b", 0.01)
+    time.sleep(0.05)
+
+    assert queue.claim("worker-c", 60) is None
+    failed = queue.get(job["id"])
+    assert failed["status"] == FAILED
+    assert failed["error"] == "Gave up after 2 attempts"
+
+
+def test_a_released_job_is_queued_again_without_using_an_attempt(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 60)
+
+    assert queue.release(job["id"], "worker-a")
+    released = queue.get(job["id"])
+    assert released["status"] == QUEUED and released["owner"] is None and released["attempts"] == 0
+    assert queue.claim("worker-b", 60)["attempts"] == 1
+
+
+def test_fail_truncates_the_error(queue):
+    job = queue.submit("{}")
+    queue.claim("worker-a", 60)
+
+    assert queue.fail(job["id"], "worker-a", "x" * 2000)
+    assert len(queue.get(job["id"])["error"]) == 500
+
+
+def test_purge_removes_only_finished_jobs_older_than_the_cutoff(queue):
+    done = queue.submit("{}")
+    queue.claim("worker-a", 60)
+    queue.finish(done["id"], "worker-a", "/tmp/done.zip", 1)
+    waiting = queue.submit("{}")
+
+    assert queue.purge(time.time() - 3600) == []
+    purged = queue.purge(time.time() + 1)
+
+    assert [job["id"] for job in purged] == [done["id"]]
+    assert queue.get(done["id"]) is None
+    assert queue.get(waiting["id"])["status"] == QUEUED
+    assert queue.counts() == {QUEUED: 1}
+
+
+def test_jobs_survive_a_new_queue_on_the_same_file(queue):
+    job = queue.submit('{"names": ["alice"]}')
+
+    reopened = JobQueue(queue.path)
+
+    assert reopened.get(job["id"])["payload"] == '{"names": ["alice"]}'
+    assert reopened.claim("worker-a", 60)["id"] == job["id"]
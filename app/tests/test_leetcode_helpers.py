@@ -0,0 +1,196 @@
+# tests/test_leetcode_helpers.py
+import copy
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from Repository.User.leetcode_repository import LeetcodeRepository, _plan_stats
+from Schema.SQL.Enums.enums import LeetcodeTagCategory
+from Schema.SQL.Models.models import LeetcodeTags, Profile, User
+from Services.User.leetcode_service import _stats_entries
+from Utils.Helpers.leetcode_helpers import (
+    LEETCODE_SECTIONS, _badge_rows, _contest_points, _diff_badges, _diff_tags, _history_values, _leetcode_row,
+    _section_hashes, _tag_rows,
+)
+
+
+def _matched_user() -> dict:
+    return {
+        "username": "octocat",
+        "profile": {
+            "realName": "Octo Cat", "aboutMe": "", "school": None, "websites": ["https://octo.cat"],
+            "countryName": "Netherlands", "company": "GitHub", "jobTitle": None, "skillTags": ["python"],
+            "ranking": 12345, "userAvatar": "https://octo.cat/a.png", "reputation": 3, "solutionCount": 1,
+        },
+        "submitStatsGlobal": {"acSubmissionNum": [
+            {"difficulty": "All", "count": 30}, {"difficulty": "Easy", "count": 20},
+            {"difficulty": "Medium", "count": 9}, {"difficulty": "Hard", "count": 1},
+        ]},
+        "languageProblemCount": [{"languageName": "Python3", "problemsSolved": 30}],
+        "badges": [
+            {"name": "50 Days", "icon": "50.png", "hoverText": "50 days"},
+            {"name": "100 Days", "icon": "100.png", "hoverText": "100 days"},
+        ],
+        "tagProblemCounts": {
+            "fundamental": [{"tagName": "Array", "problemsSolved": 12}, {"tagName": "String", "problemsSolved": 5}],
+            "intermediate": [{"tagName": "Hash Table", "problemsSolved": 4}],
+            "advanced": [],
+        },
+    }
+
+
+def _contest() -> dict:
+    return {
+        "attendedContestsCount": 2, "rating": 1550.5, "globalRanking": 80000, "totalParticipants": 500000,
+        "topPercentage": 16.0, "badge": None,
+    }
+
+
+def _history() -> list:
+    return [
+        {"attended": True, "contest": {"startTime": 200}, "rating": 1550.5, "ranking": 900, "problemsSolved": 3, "finishTimeInSeconds": 4000},
+        {"attended": False, "contest": {"startTime": 150}, "rating": 1500, "ranking": 0, "problemsSolved": 0, "finishTimeInSeconds": 0},
+        {"attended": True, "contest": {"startTime": 100}, "rating": 1500.0, "ranking": 1200, "problemsSolved": 2, "finishTimeInSeconds": 5000},
+    ]
+
+
+def _entry(user: dict = None, contest: dict = None, history: list = None, profile_id=None) -> dict:
+    user = user or _matched_user()
+    return {
+        "profile_id": profile_id or uuid4(),
+        "leetcode": _leetcode_row(user, contest if contest is not None else _contest()),
+        "badges": _badge_rows(user),
+        "tags": _tag_rows(user),
+        "history": _contest_points(history) if history is not None else None,
+    }
+
+
+def test_section_hashes_ignore_badge_and_tag_order():
+    user = _matched_user()
+    shuffled = copy.deepcopy(user)
+    shuffled["badges"].reverse()
+    shuffled["tagProblemCounts"]["fundamental"].reverse()
+
+    assert _section_hashes(_entry(shuffled)) == _section_hashes(_entry(user))
+
+
+@pytest.mark.parametrize("change, section", [
+    (lambda user, contest: user["profile"].update(ranking=999), "profile"),
+    (lambda user, contest: user["submitStatsGlobal"]["acSubmissionNum"][0].update(count=31), "submissions"),
+    (lambda user, contest: contest.update(rating=1600.0), "contest"),
+    (lambda user, contest: user["badges"].pop(), "badges"),
+    (lambda user, contest: user["tagProblemCounts"]["fundamental"][0].update(problemsSolved=13), "tags"),
+])
+def test_a_change_only_moves_its_own_section_hash(change, section):
+    user, contest = _matched_user(), _contest()
+    before = _section_hashes(_entry(user, contest))
+    change(user, contest)
+    after = _section_hashes(_entry(user, contest))
+
+    assert {name for name in before if before[name] != after[name]} == {section}
+
+
+def test_history_is_hashed_only_when_fetched():
+    assert "history" not in _section_hashes(_entry())
+    assert "history" in _section_hashes(_entry(history=_history()))
+
+
+def test_contest_points_keep_attended_contests_oldest_first():
+    assert _contest_points(_history()) == [[100, 1500.0, 1200, 2, 5000], [200, 1550.5, 900, 3, 4000]]
+
+
+def test_plan_stats_inserts_new_profiles_and_skips_unchanged_ones():
+    entry = _entry(history=_history())
+
+    inserts, updates, badges, tags, history = _plan_stats([entry], {})
+    assert len(inserts) == 1 and not updates
+    leetcode_id = inserts[0]["id"]
+    assert set(badges) == set(tags) == set(history) == {leetcode_id}
+    assert inserts[0]["sync_hashes"] == _section_hashes(entry)
+
+    existing = {entry["profile_id"]: (leetcode_id, _section_hashes(entry))}
+    assert _plan_stats([entry], existing) == ([], [], {}, {}, {})
+
+
+def test_plan_stats_updates_only_the_changed_section():
+    user = _matched_user()
+    stored_entry = _entry(user, history=_history())
+    leetcode_id = uuid4()
+    existing = {stored_entry["profile_id"]: (leetcode_id, _section_hashes(stored_entry))}
+    user["submitStatsGlobal"]["acSubmissionNum"][1].update(count=21)
+    # Fetched without contest history this time
+    entry = _entry(user, profile_id=stored_entry["profile_id"])
+
+    inserts, updates, badges, tags, history = _plan_stats([entry], existing)
+
+    assert not inserts and not badges and not tags and not history
+    [values] = updates
+    assert set(values) == {"id", "sync_hashes", *LEETCODE_SECTIONS["submissions"]}
+    assert values["id"] == leetcode_id
+    assert values["easy_problems_solved"] == 21
+    # The stored history hash survives a fetch that did not include history
+    assert values["sync_hashes"]["history"] == _section_hashes(stored_entry)["history"]
+    assert values["sync_hashes"]["submissions"] == _section_hashes(entry)["submissions"]
+
+
+def test_diff_badges_keeps_matching_rows():
+    stored = [
+        SimpleNamespace(id=1, name="50 Days", icon="50.png", hover_text="50 days"),
+        SimpleNamespace(id=2, name="Old", icon="old.png", hover_text="gone"),
+        SimpleNamespace(id=3, name="50 Days", icon="50.png", hover_text="50 days"),
+    ]
+
+    deletes, inserts = _diff_badges(stored, _badge_rows(_matched_user()))
+
+    assert deletes == [2, 3]
+    assert [badge["name"] for badge in inserts] == ["100 Days"]
+
+
+def test_diff_tags_upserts_new_and_changed_counts_only():
+    stored = [
+        SimpleNamespace(id=1, tag_category=LeetcodeTagCategory.FUNDAMENTAL, tag_name="Array", problems_solved=12),
+        SimpleNamespace(id=2, tag_category=LeetcodeTagCategory.FUNDAMENTAL, tag_name="String", problems_solved=4),
+        SimpleNamespace(id=3, tag_category=LeetcodeTagCategory.ADVANCED, tag_name="Trie", problems_solved=1),
+    ]
+
+    deletes, upserts = _diff_tags(stored, _tag_rows(_matched_user()))
+
+    assert deletes == [3]
+    assert sorted(tag["tag_name"] for tag in upserts) == ["Hash Table", "String"]
+
+
+def test_history_values_append_only_newer_contests():
+    points = _contest_points(_history())
+    assert _history_values(None, points)["start_times"] == [100, 200]
+
+    stored = SimpleNamespace(
+        start_times=[100], ratings=[1500.0], rankings=[1200], problems_solved=[2], finish_times=[5000], last_start_time=100,
+    )
+    values = _history_values(stored, points)
+    assert values["start_times"] == [100, 200]
+    assert values["ratings"] == [1500.0, 1550.5]
+    assert values["last_start_time"] == 200
+
+    stored.last_start_time = 200
+    assert _history_values(stored, points) is None
+
+
+def test_save_stats_writes_only_what_changed(session):
+    user = User(github_user_name="octocat", first_name="Octo", last_name="Cat")
+    session.add(user)
+    session.commit()
+    profile = Profile(user_id=user.id)
+    session.add(profile)
+    session.commit()
+    repo = LeetcodeRepository(session)
+    data = {"profile": _matched_user(), "contestRanking": _contest(), "contestHistory": _contest_points(_history())}
+
+    assert repo.save_stats(_stats_entries({profile.id: data})) == 1
+    assert repo.save_stats(_stats_entries({profile.id: copy.deepcopy(data)})) == 0
+
+    data["profile"]["tagProblemCounts"]["fundamental"][0]["problemsSolved"] = 13
+    assert repo.save_stats(_stats_entries({profile.id: data})) == 1
+    tags = {tag.tag_name: tag.problems_solved for tag in session.exec(select(LeetcodeTags)).all()}
+    assert tags == {"Array": 13, "String": 5, "Hash Table": 4}
@@ -0,0 +1,74 @@
+# tests/test_leetcode_stream.py
+import asyncio
+
+import pytest
+
+from Services.User import leetcode_service
+from Services.User.leetcode_service import LeetCodeService
+
+pytestmark = pytest.mark.anyio
+
+
+class _Lookups:
+    """Stands in for getAllLeetcodeData, tracking how many lookups run at once."""
+
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.names = []
+
+    async def __call__(self, name):
+        self.names.append(name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.01))
+            if name in self.fail:
+                raise RuntimeError(f"lookup failed for {name}")
+            return {"leetcode": {"profile": {"username": name}}}
+        finally:
+            self.active -= 1
+
+
+async def _stream(monkeypatch, names, concurrency, lookups):
+    monkeypatch.setattr(leetcode_service, "LEETCODE_BATCH_CONCURRENCY", concurrency)
+    monkeypatch.setattr(LeetCodeService, "getAllLeetcodeData", staticmethod(lookups))
+    return [item async for item in LeetCodeService.streamLeetcodeData(names)]
+
+
+async def test_every_name_is_looked_up_once_within_the_concurrency_cap(monkeypatch):
+    lookups = _Lookups()
+    names = [f"user-{index}" for index in range(10)]
+
+    results = await _stream(monkeypatch, names + names[:3], 3, lookups)
+
+    assert sorted(item["username"] for item in results) == sorted(names)
+    assert sorted(lookups.names) == sorted(names)
+    assert lookups.peak == 3
+
+
+async def test_results_arrive_as_they_finish(monkeypatch):
+    lookups = _Lookups(delays={"slow": 0.1})
+
+    results = await _stream(monkeypatch, ["slow", "fast"], 2, lookups)
+
+    assert [item["username"] for item in results] == ["fast", "slow"]
+
+
+async def test_a_failed_lookup_is_reported_in_place(monkeypatch):
+    results = await _stream(monkeypatch, ["ok", "broken"], 2, _Lookups(fail={"broken"}))
+
+    by_name = {item["username"]: item for item in results}
+    assert by_name["broken"]["leetcode"] == {"error": "lookup failed for broken"}
+    assert by_name["ok"]["leetcode"]["profile"] == {"username": "ok"}
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_a_non_positive_concurrency_still_runs_one_worker(monkeypatch, concurrency):
+    lookups = _Lookups()
+
+    results = await asyncio.wait_for(_stream(monkeypatch, ["a", "b", "c"], concurrency, lookups), timeout=2)
+
+    assert len(results) == 3 and lookups.peak == 1
@@ -0,0 +1,73 @@
+# tests/test_migrations.py
+import pytest
+from sqlalchemy import create_engine, func, inspect, select, text
+
+from Migrations.runner import latest_version, load_migrations, schema_version, upgrade
+
+
+def _schema(connection) -> dict:
+    inspector = inspect(connection)
+    return {
+        table: (
+            sorted(column["name"] for column in inspector.get_columns(table)),
+            sorted(index["name"] for index in inspector.get_indexes(table)),
+        )
+        for table in inspector.get_table_names()
+    }
+
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/fresh.db")
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("migration", load_migrations(), ids=lambda migration: migration.__name__.rsplit(".", 1)[-1])
+def test_each_migration_can_run_again_on_a_migrated_database(database, migration):
+    with database.connect() as connection:
+        before = _schema(connection)
+
+    with database.begin() as connection:
+        migration.upgrade(connection)
+
+    with database.connect() as connection:
+        assert _schema(connection) == before
+
+
+def test_upgrade_at_the_latest_version_applies_nothing(database):
+    with database.connect() as connection:
+        applied = connection.execute(select(func.count()).select_from(schema_version)).scalar()
+
+        assert upgrade(connection) == latest_version()
+        assert connection.execute(select(func.count()).select_from(schema_version)).scalar() == applied
+
+
+def test_a_baseline_database_from_the_current_models_upgrades_to_latest(fresh_engine):
+    with fresh_engine.connect() as connection:
+        assert upgrade(connection, target=1) == 1
+        baseline = _schema(connection)
+
+        assert upgrade(connection) == latest_version()
+        # v0001 already created everything the later versions add, except their indexes
+        upgraded = _schema(connection)
+        assert {table: columns for table, (columns, _) in upgraded.items()} == {
+            table: columns for table, (columns, _) in baseline.items()
+        }
+
+
+def test_a_database_stamped_by_an_older_build_upgrades_to_latest(fresh_engine):
+    with fresh_engine.connect() as connection:
+        upgrade(connection, target=2)
+        connection.commit()
+        # As left by a build from before the statistics sync, incremental sync and contest history
+        with connection.begin():
+            connection.execute(text('DROP TABLE "StatisticsSync"'))
+            connection.execute(text('DROP TABLE "LeetcodeContestHistory"'))
+            connection.execute(text('ALTER TABLE "Leetcode" DROP COLUMN sync_hashes'))
+
+        assert upgrade(connection) == latest_version()
+
+        inspector = inspect(connection)
+        assert inspector.has_table("StatisticsSync") and inspector.has_table("LeetcodeContestHistory")
+        assert "sync_hashes" in {column["name"] for column in inspector.get_columns("Leetcode")}
@@ -0,0 +1,30 @@
+# tests/test_not_found.py
+from uuid import uuid4
+
+import pytest
+
+from Utils.error_codes import ErrorCodes
+
+RESOURCES = [
+    ("/Dijkstra/v1/u/", {"first_name": "Mona"}, ErrorCodes.USER_USER_NF_A01),
+    ("/Dijkstra/v1/profile/", {}, ErrorCodes.USER_PROFILE_NF_A01),
+    ("/Dijkstra/v1/location/", {"city": "Delft"}, ErrorCodes.USER_LOCATION_NF_A01),
+]
+
+
+@pytest.mark.parametrize("prefix, body, code", RESOURCES)
+@pytest.mark.parametrize("method", ["get", "put", "delete"])
+def test_a_missing_row_is_a_404(client, method, prefix, body, code):
+    kwargs = {"json": body} if method == "put" else {}
+
+    response = client.request(method.upper(), f"{prefix}{uuid4()}", **kwargs)
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == code
+
+
+def test_an_unknown_github_username_is_a_404(client):
+    response = client.get("/Dijkstra/v1/u/github/nobody")
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == ErrorCodes.USER_USER_NF_A01
@@ -0,0 +1,126 @@
+# tests/test_pagination.py
+import base64
+import json
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from Schema.SQL.Enums.enums import Rank
+from Schema.SQL.Models.models import User
+from Utils.Exceptions.pagination_exceptions import InvalidCursor, InvalidSortField
+from Utils.error_codes import ErrorCodes
+from Utils.pagination import apply_keyset, decode_cursor, encode_cursor
+
+USERS = "/Dijkstra/v1/u/"
+
+
+@pytest.mark.parametrize("sort_value", [
+    datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    datetime(2026, 3, 1, 12, 30, 15),
+    date(2026, 3, 1),
+    uuid4(),
+    "octocat",
+    42,
+    2.5,
+])
+def test_cursor_round_trips_sort_value_and_id(sort_value):
+    row_id = uuid4()
+    cursor = encode_cursor("created_at", "desc", sort_value, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "created_at", "desc") == (sort_value, row_id)
+
+
+def test_cursor_stores_enums_by_value():
+    row_id = uuid4()
+    cursor = encode_cursor("rank", "asc", Rank.GOLD, row_id)
+
+    assert decode_cursor(cursor, "rank", "asc") == ("GOLD", row_id)
+
+
+@pytest.mark.parametrize("sort_by, order", [("updated_at", "desc"), ("created_at", "asc")])
+def test_cursor_is_only_valid_for_its_sort(sort_by, order):
+    cursor = encode_cursor("created_at", "desc", datetime(2026, 1, 1), uuid4())
+
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, sort_by, order)
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    "%%%",
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+    _raw_cursor(["created_at", "desc"]),
+    _raw_cursor({"s": "created_at", "o": "desc"}),
+    _raw_cursor({"s": "created_at", "o": "desc", "k": [1]}),
+    _raw_cursor({"s": "created_at", "o": "desc", "k": [1, "not-a-tagged-uuid"]}),
+    _raw_cursor({"s": "created_at", "o": "desc", "k": [{"dt": "yesterday"}, {"u": str(uuid4())}]}),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, "created_at", "desc")
+
+
+def test_apply_keyset_rejects_unknown_sort_field():
+    with pytest.raises(InvalidSortField) as exc_info:
+        apply_keyset(select(User), User, ("created_at",), sort_by="password")
+
+    assert exc_info.value.sort_by == "password"
+
+
+def _create_users(client, count: int):
+    for index in range(count):
+        response = client.post(USERS, json={
+            "github_user_name": f"user-{index:02d}", "first_name": "Ada", "last_name": f"Lovelace {index % 3}",
+        })
+        assert response.status_code == 200
+
+
+@pytest.mark.parametrize("sort_by, order", [("created_at", "desc"), ("last_name", "asc"), ("github_user_name", "desc")])
+def test_cursor_pages_cover_every_row_once(client, sort_by, order):
+    _create_users(client, 7)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3, "sort_by": sort_by, "order": order, "use_cache": False}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get(USERS, params=params).json()
+        seen.extend(user["github_user_name"] for user in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == [f"user-{index:02d}" for index in range(7)]
+    everything = client.get(USERS, params={"limit": 20, "sort_by": sort_by, "order": order}).json()
+    assert seen == [user["github_user_name"] for user in everything["items"]]
+
+
+def test_malformed_cursor_is_a_400(client):
+    response = client.get(USERS, params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == ErrorCodes.GEN_PAGE_VAL_A01
+
+
+def test_cursor_from_another_sort_is_a_400(client):
+    _create_users(client, 3)
+    cursor = client.get(USERS, params={"limit": 1, "sort_by": "last_name"}).json()["next_cursor"]
+
+    response = client.get(USERS, params={"cursor": cursor, "sort_by": "first_name"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == ErrorCodes.GEN_PAGE_VAL_A01
+
+
+def test_unknown_sort_field_is_a_400(client):
+    response = client.get(USERS, params={"sort_by": "streak"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == ErrorCodes.GEN_PAGE_VAL_A02
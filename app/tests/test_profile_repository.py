@@ -0,0 +1,143 @@
+# tests/test_profile_repository.py
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from Repository.User.profile_repository import ProfileRepository
+from Schema.SQL.Enums.enums import (
+    Cause, CertificationType, Domain, EmploymentType, LeetcodeTagCategory, TestScoreType, Tools, WorkLocationType,
+)
+from Schema.SQL.Models.models import (
+    Certifications, Education, Github, Leetcode, LeetcodeBadges, LeetcodeTags, Location, Profile, Projects,
+    Publications, Resume, TestScores, User, Volunteering, WorkExperience,
+)
+
+PROFILES = "/Dijkstra/v1/profile/"
+
+# One for the profile with its user, leetcode and resume, one per collection, one each for badges and tags
+FULL_PROFILE_QUERIES = 10
+
+
+@contextmanager
+def _count_queries(engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _seed_profile(session, name: str, children: int) -> Profile:
+    """A profile with ``children`` rows in every collection it has, each on its own location."""
+    user = User(github_user_name=name, first_name="Octo", last_name="Cat")
+    github = Github(user_name=name)
+    session.add_all([user, github])
+    session.flush()
+    profile = Profile(user_id=user.id)
+    session.add(profile)
+    session.flush()
+    leetcode = Leetcode(profile_id=profile.id, lc_username=name)
+    session.add_all([leetcode, Resume(profile_id=profile.id)])
+    session.flush()
+
+    for index in range(children):
+        location = Location(city=f"City {index}", country="Netherlands")
+        session.add(location)
+        session.flush()
+        session.add_all([
+            Education(
+                profile_id=profile.id, school="TU Delft", school_type="University", degree="BSc", field="CS",
+                currently_studying=False, location=location.id, location_type=WorkLocationType.HYBRID,
+                start_date=date(2020, 9, 1), description_general="Studied",
+            ),
+            WorkExperience(
+                profile_id=profile.id, title="Engineer", employment_type=next(iter(EmploymentType)),
+                company_name="GitHub", currently_working=True, location=location.id,
+                location_type=WorkLocationType.REMOTE, start_date=date(2024, 1, 1), description_general="Built",
+                work_done=["Things"],
+            ),
+            Certifications(
+                profile_id=profile.id, name=f"Cert {index}", type=next(iter(CertificationType)),
+                issuing_organization="AWS", issue_date=date(2025, 1, 1), credential_id=f"c-{index}",
+                credential_url="https://example.com",
+            ),
+            TestScores(
+                profile_id=profile.id, title="GRE", type=next(iter(TestScoreType)), score="330",
+                test_date=date(2023, 1, 1),
+            ),
+            Volunteering(
+                profile_id=profile.id, organization="Red Cross", role="Helper", cause=next(iter(Cause)),
+                start_date=date(2022, 1, 1), currently_volunteering=False,
+            ),
+            Publications(
+                profile_id=profile.id, title=f"Paper {index}", publisher="ACM", authors=["Octo Cat"],
+                publication_date=date(2024, 6, 1), publication_url="https://example.com", description="Results",
+            ),
+            Projects(
+                profile_id=profile.id, name=f"project-{index}", owner=name, private=False, github_stars=index,
+                github_open_issues=0, github_forks=0, description="A project", domain=next(iter(Domain)),
+                tools=[next(iter(Tools))], readme=True, license=True, landing_page=False, docs_page=False,
+                own_domain_name=False, testing_framework_present=False,
+            ),
+            LeetcodeBadges(leetcode_id=leetcode.id, name=f"Badge {index}"),
+            LeetcodeTags(
+                leetcode_id=leetcode.id, tag_category=LeetcodeTagCategory.FUNDAMENTAL, tag_name=f"Tag {index}",
+                problems_solved=index,
+            ),
+        ])
+    session.commit()
+    return profile
+
+
+@pytest.mark.parametrize("children", [0, 1, 5, 20])
+def test_full_profile_loads_in_a_fixed_number_of_queries(session, database, children):
+    profile = _seed_profile(session, f"user-{children}", children)
+    session.expunge_all()
+
+    with _count_queries(database) as statements:
+        full = ProfileRepository(session).get_full(profile.id)
+
+    assert len(statements) == FULL_PROFILE_QUERIES
+    assert full.user_rel.github_user_name == f"user-{children}"
+    assert full.resume is not None
+    assert len(full.work_experience) == len(full.projects) == len(full.leetcode.tags) == children
+    assert all(education.location_rel.city for education in full.education)
+
+
+def test_full_profile_queries_search_by_index(session, database):
+    profile = _seed_profile(session, "indexed", 3)
+    session.expunge_all()
+
+    with _count_queries(database) as statements:
+        ProfileRepository(session).get_full(profile.id)
+
+    with database.connect() as connection:
+        plans = [
+            detail
+            for statement, parameters in statements
+            for *_, detail in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        ]
+    # Every table is reached through an index on its key, never by a full scan
+    assert plans and all(detail.startswith("SEARCH ") and " USING " in detail for detail in plans)
+
+
+def test_full_profile_route_issues_the_same_queries_for_small_and_large_profiles(session, database, client):
+    small = _seed_profile(session, "small", 1)
+    large = _seed_profile(session, "large", 25)
+
+    counts = {}
+    for profile in (small, large):
+        with _count_queries(database) as statements:
+            response = client.get(f"{PROFILES}{profile.id}/full")
+        assert response.status_code == 200
+        counts[profile.id] = len(statements)
+
+    assert counts[small.id] == counts[large.id]
+    assert len(response.json()["projects"]) == 25
@@ -0,0 +1,81 @@
+# tests/test_rate_limit.py
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from Utils.http_client import request_with_retries
+from Utils.rate_limit import AsyncTokenBucket
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_a_burst_goes_through_at_once_and_the_rest_is_paced():
+    bucket = AsyncTokenBucket(rate=50, burst=3)
+    started = time.monotonic()
+
+    for _ in range(3):
+        await bucket.acquire()
+    assert bucket.waited_seconds == 0
+    for _ in range(2):
+        await bucket.acquire()
+
+    # Each call past the burst waits for the one token it is short
+    assert bucket.waited_seconds == pytest.approx(0.04, abs=0.01)
+    assert time.monotonic() - started >= 0.035
+
+
+async def test_concurrent_callers_queue_up_behind_each_other():
+    bucket = AsyncTokenBucket(rate=50, burst=1)
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    # Reservations stack: the later callers wait one, two and three tokens' time
+    assert bucket.waited_seconds == pytest.approx(0.02 + 0.04 + 0.06, abs=0.01)
+
+
+async def test_a_call_can_cost_several_tokens():
+    bucket = AsyncTokenBucket(rate=100, burst=5)
+
+    await bucket.acquire(5)
+    await bucket.acquire(2)
+
+    assert bucket.waited_seconds == pytest.approx(0.02, abs=0.005)
+
+
+async def test_a_rate_of_zero_disables_the_limit():
+    bucket = AsyncTokenBucket(rate=0)
+
+    for _ in range(1_000):
+        await bucket.acquire()
+
+    assert bucket.waited_seconds == 0
+
+
+async def test_retune_changes_the_rate_and_caps_the_balance():
+    bucket = AsyncTokenBucket(rate=1, burst=100)
+
+    bucket.retune(rate=100, burst=2)
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert bucket.capacity == 2
+    assert bucket.waited_seconds == pytest.approx(0.01, abs=0.005)
+
+
+async def test_every_attempt_takes_a_token_from_the_limiter(upstream):
+    bucket = AsyncTokenBucket(rate=1_000, burst=10)
+    costs = []
+    acquire = bucket.acquire
+
+    async def counting_acquire(cost: float = 1):
+        costs.append(cost)
+        await acquire(cost)
+
+    bucket.acquire = counting_acquire
+    upstream.responses = [httpx.Response(503), httpx.ConnectError("refused"), httpx.Response(200)]
+
+    await request_with_retries("GET", "https://upstream.test", limiter=bucket, limiter_cost=4)
+
+    assert costs == [4, 4, 4]
@@ -0,0 +1,69 @@
+# tests/test_returning.py
+import time
+from uuid import uuid4
+
+from Repository.User.user_repository import UserRepository
+from Schema.SQL.Models.models import User
+
+USERS = "/Dijkstra/v1/u/"
+
+
+def _user(name: str = "octocat") -> User:
+    return User(github_user_name=name, first_name="Octo", last_name="Cat")
+
+
+def test_create_returns_the_row_with_server_defaults(session):
+    user = UserRepository(session).create(_user())
+
+    assert user.id is not None
+    assert user.created_at is not None and user.updated_at is not None
+    assert user.github_user_name == "octocat"
+
+
+def test_update_returns_the_new_row_and_bumps_updated_at(session):
+    repo = UserRepository(session)
+    user = repo.create(_user())
+    before = user.updated_at
+    time.sleep(0.01)
+
+    updated = repo.update(user.id, {"first_name": "Mona"})
+
+    assert updated.first_name == "Mona" and updated.last_name == "Cat"
+    assert updated.updated_at > before
+
+
+def test_an_empty_update_reads_the_row_back_unchanged(session):
+    repo = UserRepository(session)
+    user = repo.create(_user())
+    before = user.updated_at
+    time.sleep(0.01)
+
+    unchanged = repo.update(user.id, {})
+
+    assert unchanged.id == user.id and unchanged.first_name == "Octo"
+    assert unchanged.updated_at == before
+
+
+def test_writes_to_a_missing_row_match_nothing(session):
+    repo = UserRepository(session)
+
+    assert repo.update(uuid4(), {"first_name": "Mona"}) is None
+    assert repo.update(uuid4(), {}) is None
+    assert repo.delete(uuid4()) is False
+
+
+def test_delete_reports_whether_a_row_was_removed(session):
+    repo = UserRepository(session)
+    user = repo.create(_user())
+
+    assert repo.delete(user.id) is True
+    assert repo.get(user.id) is None
+    assert repo.delete(user.id) is False
+
+
+def test_updates_are_visible_over_the_api(client):
+    created = client.post(USERS, json={"github_user_name": "octocat", "first_name": "Octo", "last_name": "Cat"}).json()
+
+    assert client.get(f"{USERS}{created['id']}").json()["github_user_name"] == "octocat"
+    assert client.put(f"{USERS}{created['id']}", json={"last_name": "Dog"}).json()["last_name"] == "Dog"
+    assert client.get(f"{USERS}{created['id']}").json()["last_name"] == "Dog"
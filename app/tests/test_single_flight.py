@@ -0,0 +1,174 @@
+# tests/test_single_flight.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from Utils.cache import TTLCache, cached
+from Utils.single_flight import SingleFlight, get_single_flight_stats, register_single_flight
+
+
+class _Fetch:
+    """A slow call that counts how often it actually runs."""
+
+    def __init__(self, result="value", error=None, delay=0.05):
+        self.result, self.error, self.delay = result, error, delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+    def sync(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.anyio
+async def test_concurrent_runs_share_one_call():
+    flight, fetch = SingleFlight("tests"), _Fetch()
+
+    results = await asyncio.gather(*(flight.run("user", fetch) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert fetch.calls == 1
+    assert flight.snapshot() == {
+        "name": "tests", "calls": 1, "coalesced": 4, "coalesced_ratio": 0.8, "in_flight": 0,
+    }
+
+
+@pytest.mark.anyio
+async def test_different_keys_do_not_share_a_call():
+    flight, fetch = SingleFlight("tests"), _Fetch()
+
+    await asyncio.gather(flight.run("a", fetch), flight.run("b", fetch))
+
+    assert fetch.calls == 2
+
+
+@pytest.mark.anyio
+async def test_every_waiter_gets_the_exception_and_the_next_run_starts_afresh():
+    flight, fetch = SingleFlight("tests"), _Fetch(error=ValueError("upstream down"))
+
+    results = await asyncio.gather(*(flight.run("user", fetch) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    fetch.error = None
+    assert await flight.run("user", fetch) == "value"
+    assert fetch.calls == 2
+
+
+@pytest.mark.anyio
+async def test_a_cancelled_caller_does_not_cancel_the_call_others_wait_on():
+    flight, fetch = SingleFlight("tests"), _Fetch()
+    impatient = asyncio.ensure_future(flight.run("user", fetch))
+    patient = asyncio.ensure_future(flight.run("user", fetch))
+    await asyncio.sleep(0.01)
+
+    impatient.cancel()
+
+    assert await patient == "value"
+    assert impatient.cancelled() and fetch.calls == 1
+
+
+@pytest.mark.anyio
+async def test_a_started_call_finishes_with_no_one_waiting():
+    flight, fetch = SingleFlight("tests"), _Fetch(delay=0.01)
+
+    flight.start("refresh", fetch)
+    await asyncio.sleep(0.05)
+
+    assert fetch.calls == 1 and flight.snapshot()["in_flight"] == 0
+
+
+def test_threads_share_one_call_through_run_sync():
+    flight, fetch = SingleFlight("tests"), _Fetch()
+    barrier = threading.Barrier(8)
+
+    def lookup():
+        barrier.wait()
+        return flight.run_sync("user", fetch.sync)
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: lookup(), range(8)))
+
+    assert results == ["value"] * 8
+    assert fetch.calls == 1
+
+
+def test_run_sync_raises_the_exception_in_every_thread():
+    flight, fetch = SingleFlight("tests"), _Fetch(error=KeyError("missing"))
+    barrier = threading.Barrier(4)
+
+    def lookup():
+        barrier.wait()
+        try:
+            flight.run_sync("user", fetch.sync)
+        except KeyError as e:
+            return e
+
+    with ThreadPoolExecutor(4) as pool:
+        errors = list(pool.map(lambda _: lookup(), range(4)))
+
+    assert all(isinstance(error, KeyError) for error in errors)
+    assert fetch.calls == 1 and flight.snapshot()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_a_thread_joins_a_call_started_on_the_event_loop():
+    flight, fetch = SingleFlight("tests"), _Fetch()
+    running = asyncio.ensure_future(flight.run("user", fetch))
+    await asyncio.sleep(0.01)
+
+    from_thread = await asyncio.to_thread(flight.run_sync, "user", fetch.sync)
+
+    assert from_thread == await running == "value"
+    assert fetch.calls == 1
+
+
+def test_cached_misses_in_the_threadpool_share_one_load():
+    cache, fetch = TTLCache("tests.flight", 10, 60), _Fetch()
+    barrier = threading.Barrier(8)
+
+    def lookup():
+        barrier.wait()
+        return cached(cache, "user", fetch.sync)
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: lookup(), range(8)))
+
+    assert results == ["value"] * 8
+    assert fetch.calls == 1
+    assert cache.flight.snapshot()["coalesced"] == 7
+
+
+def test_a_lookup_after_an_invalidation_does_not_join_the_older_load():
+    cache = TTLCache("tests.flight.generation", 10, 60)
+    old = _Fetch(result="before the write", delay=0.1)
+    new = _Fetch(result="after the write", delay=0.01)
+
+    with ThreadPoolExecutor(1) as pool:
+        before = pool.submit(cached, cache, "user", old.sync)
+        time.sleep(0.02)
+        cache.invalidate("user")
+        after = cached(cache, "user", new.sync)
+
+        assert before.result() == "before the write"
+    assert after == "after the write" and new.calls == 1
+    # The older load finished last, but its result was read before the write and is not cached
+    assert cache.get("user") == (True, "after the write")
+
+
+def test_flights_are_registered_once_by_name():
+    flight = register_single_flight("tests.registry")
+
+    assert register_single_flight("tests.registry") is flight
+    assert "tests.registry" in {stats["name"] for stats in get_single_flight_stats()}
@@ -0,0 +1,41 @@
+# tests/test_zip_stream.py
+import io
+import zipfile
+
+from Utils.zip_stream import ZipStream
+
+
+def test_chunks_form_a_valid_archive():
+    stream = ZipStream()
+    members = {"alice.pdf": b"%PDF-1.4 alice", "bob.png": b"\x89PNG bob" * 1000, "empty.txt": b""}
+
+    chunks = [stream.add(name, data) for name, data in members.items()]
+    chunks.append(stream.close())
+
+    assert stream.members == 3
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == list(members)
+        assert {name: archive.read(name) for name in archive.namelist()} == members
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+
+
+def test_each_member_is_emitted_as_soon_as_it_is_added():
+    stream = ZipStream()
+
+    first = stream.add("a.txt", b"a" * 100)
+    second = stream.add("b.txt", b"b" * 100)
+
+    # Local header, data and data descriptor of each member; only the central directory waits for close()
+    assert first.startswith(b"PK\x03\x04") and b"a" * 100 + b"PK\x07\x08" in first
+    assert second.startswith(b"PK\x03\x04") and b"b" * 100 + b"PK\x07\x08" in second
+    assert stream.close().startswith(b"PK\x01\x02")
+
+
+def test_an_empty_archive_is_just_the_end_record():
+    stream = ZipStream()
+
+    data = stream.close()
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == []